@@ -0,0 +1,61 @@
+"""Benchmark of the sparse NetMF and GraRep embedders against the dense Karate Club ones.
+
+The script reports, for each model, the time required by the sparse Ensmallen
+implementation and by the dense Karate Club one, and the correlation of the
+dot products of the two embeddings. It requires the `karateclub` package.
+
+Usage: python benchmarks/sparse_matrix_factorization.py [edge_list_path]
+"""
+import sys
+from time import time
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.embedders.ensmallen_embedders.grarep import GraRepEnsmallen
+from embiggen.embedders.ensmallen_embedders.netmf import NetMFEnsmallen
+from embiggen.embedders.karateclub_embedders import GraRepKarateClub, NetMFKarateClub
+
+
+def get_gram_correlation(first: np.ndarray, second: np.ndarray) -> float:
+    """Returns the correlation of the dot products of the provided embeddings."""
+    return np.corrcoef(
+        (first @ first.T).ravel(),
+        (second @ second.T).ravel()
+    )[0, 1]
+
+
+def benchmark(graph: Graph):
+    """Prints the timings and Gram correlations of the sparse and dense models on the graph."""
+    for sparse_model, dense_model in (
+        (
+            NetMFEnsmallen(embedding_size=32, order=2),
+            NetMFKarateClub(embedding_size=32, order=2)
+        ),
+        (
+            GraRepEnsmallen(embedding_size=30, order=5),
+            GraRepKarateClub(embedding_size=30, order=5)
+        ),
+    ):
+        timings = []
+        embeddings = []
+        for model in (sparse_model, dense_model):
+            start = time()
+            embeddings.append(model.fit_transform(
+                graph
+            ).get_node_embedding_from_index(0).loc[graph.get_node_names()].to_numpy())
+            timings.append(time() - start)
+        print(
+            f"{sparse_model.model_name()}: {timings[0]:.2f}s with Ensmallen, "
+            f"{timings[1]:.2f}s with Karate Club, Gram correlation "
+            f"{get_gram_correlation(*embeddings):.2f}."
+        )
+
+
+if __name__ == "__main__":
+    benchmark(Graph.from_csv(
+        edge_path=sys.argv[1] if len(sys.argv) > 1 else "tests/data/small_ppi.tsv",
+        sources_column_number=0,
+        destinations_column_number=1,
+        directed=False,
+        name="Benchmark",
+    ).remove_disconnected_nodes())
@@ -8,6 +8,7 @@ from embiggen.utils import (
     get_available_models_for_edge_embedding,
     get_available_models_for_edge_label_prediction,
     get_available_models_for_node_embedding,
+    hyperparameter_search,
 )
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     "get_available_models_for_edge_prediction",
     "get_available_models_for_edge_label_prediction",
     "get_available_models_for_node_embedding",
+    "hyperparameter_search",
 ]
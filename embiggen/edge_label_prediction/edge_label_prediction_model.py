@@ -145,13 +145,14 @@ class AbstractEdgeLabelPredictionModel(AbstractClassifierModel):
             else:
                 mask = evaluation_graph.get_upper_triangular_known_edge_types_mask()
 
-            prediction_probabilities = self.predict_proba(
-                evaluation_graph,
-                support=support,
-                node_features=node_features,
-                node_type_features=node_type_features,
-                edge_features=edge_features
-            )
+            with self._profile("predicting"):
+                prediction_probabilities = self.predict_proba(
+                    evaluation_graph,
+                    support=support,
+                    node_features=node_features,
+                    node_type_features=node_type_features,
+                    edge_features=edge_features
+                )
 
             if prediction_probabilities.shape[0] != mask.shape[0]:
                 raise RuntimeError(
@@ -181,19 +182,20 @@ class AbstractEdgeLabelPredictionModel(AbstractClassifierModel):
             else:
                 predictions = prediction_probabilities.argmax(axis=-1)
 
-            performance.append({
-                "evaluation_mode": evaluation_mode,
-                "train_size": train_size,
-                "known_edges_number": graph.get_number_of_known_edge_types(),
-                **self.evaluate_predictions(
-                    labels,
-                    predictions,
-                ),
-                **self.evaluate_prediction_probabilities(
-                    labels,
-                    prediction_probabilities,
-                ),
-            })
+            with self._profile("computing_metrics"):
+                performance.append({
+                    "evaluation_mode": evaluation_mode,
+                    "train_size": train_size,
+                    "known_edges_number": graph.get_number_of_known_edge_types(),
+                    **self.evaluate_predictions(
+                        labels,
+                        predictions,
+                    ),
+                    **self.evaluate_prediction_probabilities(
+                        labels,
+                        prediction_probabilities,
+                    ),
+                })
 
         return performance
 
@@ -85,3 +85,8 @@ class HistGradientBoostingEdgeLabelPrediction(SklearnEdgeLabelPredictionAdapter)
     @classmethod
     def model_name(cls) -> str:
         return "Hist Gradient Boosting Classifier"
+
+    @classmethod
+    def can_use_sparse_features(cls) -> bool:
+        """Returns whether the model accepts the features as scipy sparse matrices."""
+        return False
@@ -5,6 +5,7 @@ import copy
 import compress_pickle
 from ensmallen import Graph
 from embiggen.utils.abstract_edge_feature import AbstractEdgeFeature
+from embiggen.utils.sklearn_utils import densify_unsupported_sparse_features
 from embiggen.embedding_transformers import (
     EdgeLabelPredictionTransformer,
     GraphTransformer,
@@ -136,7 +137,8 @@ class SklearnLikeEdgeLabelPredictionAdapter(AbstractEdgeLabelPredictionModel):
 
         for edge_feature in edge_features:
             if issubclass(type(edge_feature), AbstractEdgeFeature):
-                for feature in edge_feature.get_edge_feature_from_graph(
+                for feature in self._get_edge_feature_from_graph(
+                    edge_feature=edge_feature,
                     graph=graph,
                     support=support,
                 ).values():
@@ -215,7 +217,8 @@ class SklearnLikeEdgeLabelPredictionAdapter(AbstractEdgeLabelPredictionModel):
 
         for edge_feature in edge_features:
             if issubclass(type(edge_feature), AbstractEdgeFeature):
-                for feature in edge_feature.get_edge_feature_from_graph(
+                for feature in self._get_edge_feature_from_graph(
+                    edge_feature=edge_feature,
                     graph=graph,
                     support=support,
                 ).values():
@@ -280,7 +283,10 @@ class SklearnLikeEdgeLabelPredictionAdapter(AbstractEdgeLabelPredictionModel):
                 ],
             )
 
-        self._model_instance.fit(x, y)
+        self._model_instance.fit(
+            densify_unsupported_sparse_features(x, self.can_use_sparse_features()),
+            y
+        )
 
     def _predict_proba(
         self,
@@ -327,6 +333,10 @@ class SklearnLikeEdgeLabelPredictionAdapter(AbstractEdgeLabelPredictionModel):
             edge_type_features=edge_type_features,
             edge_features=edge_features,
         )
+        features = densify_unsupported_sparse_features(
+            features,
+            self.can_use_sparse_features()
+        )
 
         if hasattr(self._model_instance, "predict_proba"):
             prediction_probabilities = self._model_instance.predict_proba(
@@ -386,16 +396,24 @@ class SklearnLikeEdgeLabelPredictionAdapter(AbstractEdgeLabelPredictionModel):
             If the two graphs do not share the same node vocabulary.
         """
         return self._model_instance.predict(
-            self._trasform_graph_into_edge_embedding(
-                graph=graph,
-                support=support,
-                node_features=node_features,
-                node_type_features=node_type_features,
-                edge_type_features=edge_type_features,
-                edge_features=edge_features,
+            densify_unsupported_sparse_features(
+                self._trasform_graph_into_edge_embedding(
+                    graph=graph,
+                    support=support,
+                    node_features=node_features,
+                    node_type_features=node_type_features,
+                    edge_type_features=edge_type_features,
+                    edge_features=edge_features,
+                ),
+                self.can_use_sparse_features()
             )
         )
 
+    @classmethod
+    def can_use_sparse_features(cls) -> bool:
+        """Returns whether the model accepts the features as scipy sparse matrices."""
+        return True
+
     @classmethod
     def can_use_edge_weights(cls) -> bool:
         """Returns whether the model can optionally use edge weights."""
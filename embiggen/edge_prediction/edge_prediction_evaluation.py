@@ -35,6 +35,8 @@ def edge_prediction_evaluation(
     destination_nodes_prefixes: Optional[List[str]] = None,
     validation_unbalance_rates: Union[float, Tuple[float]] = (1.0, ),
     use_scale_free_distribution: bool = True,
+    nested_negative_sampling: bool = False,
+    train_evaluation_sample_size: Optional[int] = None,
     enable_cache: bool = False,
     precompute_constant_stocastic_features: bool = False,
     smoke_test: bool = False,
@@ -137,6 +139,19 @@ def edge_prediction_evaluation(
         Please DO BE ADVISED that not using a scale free sampling for the negative
         edges is a poor choice and will cause a significant positive bias
         in the model performance.
+    nested_negative_sampling: bool = False
+        Whether to sample and predict the negative edges only once, for the
+        largest of the validation unbalance rates, and to evaluate the smaller
+        rates on deterministic prefixes of proportional size of them.
+        This reduces the number of negative edges to predict from the one of
+        the sum of the rates to the one of the largest rate.
+    train_evaluation_sample_size: Optional[int] = None
+        Number of train edges on which to estimate the train performance.
+        The train performance is estimated on a seeded sample of the train
+        edges and on a sample of the negative train edges of the same
+        proportion, so that the overfitting diagnostics remain available
+        at a fraction of the cost of predicting the whole train graph.
+        By default, the whole train graph is used.
     enable_cache: bool = False
         Whether to enable the cache.
     precompute_constant_stocastic_features: bool = False
@@ -196,5 +211,7 @@ def edge_prediction_evaluation(
         source_nodes_prefixes=source_nodes_prefixes,
         destination_nodes_prefixes=destination_nodes_prefixes,
         validation_unbalance_rates=validation_unbalance_rates,
-        use_scale_free_distribution=use_scale_free_distribution
+        use_scale_free_distribution=use_scale_free_distribution,
+        nested_negative_sampling=nested_negative_sampling,
+        train_evaluation_sample_size=train_evaluation_sample_size,
     )
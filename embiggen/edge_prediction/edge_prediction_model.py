@@ -37,6 +37,11 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
         """Returns available evaluation schemas for this task."""
         return ["Connected Monte Carlo", "Monte Carlo", "Kfold"]
 
+    @classmethod
+    def can_cache_holdout_splits(cls) -> bool:
+        """Returns whether the holdouts of this task can be rebuilt from the edge ids of the original graph."""
+        return True
+
     @classmethod
     def edge_features_check(
         cls,
@@ -116,6 +121,39 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
             **holdouts_kwargs,
         )
 
+    @staticmethod
+    def __get_train_evaluation_sample_rate(
+        train: Graph,
+        train_evaluation_sample_size: Optional[int],
+    ) -> Optional[float]:
+        """Return the rate of the train edges used to evaluate the train performance, if sampled.
+
+        Parameters
+        ----------------------
+        train: Graph
+            The train graph.
+        train_evaluation_sample_size: Optional[int]
+            Number of train edges on which to estimate the train performance.
+
+        Raises
+        ----------------------
+        ValueError
+            If the provided sample size is not a strictly positive integer.
+        """
+        if train_evaluation_sample_size is None:
+            return None
+        if (
+            not isinstance(train_evaluation_sample_size, int)
+            or train_evaluation_sample_size <= 0
+        ):
+            raise ValueError(
+                "The train evaluation sample size should be a strictly positive "
+                f"integer, but {train_evaluation_sample_size} was provided."
+            )
+        if train_evaluation_sample_size >= train.get_number_of_edges():
+            return None
+        return train_evaluation_sample_size / train.get_number_of_edges()
+
     @staticmethod
     def __iterate_negative_graphs(
         graph: Graph,
@@ -133,8 +171,17 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
         destination_nodes_prefixes: Optional[List[str]],
         validation_unbalance_rates: Tuple[float],
         use_scale_free_distribution: bool,
+        train_sample_rate: Optional[float],
     ) -> Iterator[Tuple[Graph]]:
-        """Return iterator over the negative graphs for evaluation."""
+        """Return iterator over the negative graphs for evaluation.
+
+        Implementation details
+        ----------------------
+        When the train performance is estimated on a sample of the train
+        edges, the negative train graph is directly sampled with the same
+        proportion of its full size, rather than being sampled at full size
+        and subsampled afterwards.
+        """
         if subgraph_of_interest is None:
             sampler_graph = graph
         else:
@@ -156,11 +203,32 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
             train.get_number_of_edges() + test.get_number_of_edges()
         )
 
+        def get_number_of_negative_samples_and_train_size(
+            unbalance_rate: float
+        ) -> Tuple[int, float]:
+            number_of_negative_samples = int(
+                math.ceil(sampler_graph.get_number_of_edges() * unbalance_rate)
+            )
+            if train_sample_rate is None:
+                return number_of_negative_samples, train_size
+            number_of_negative_train_samples = (
+                number_of_negative_samples * train_size * train_sample_rate
+            )
+            number_of_negative_test_samples = (
+                number_of_negative_samples * (1.0 - train_size)
+            )
+            return (
+                int(math.ceil(
+                    number_of_negative_train_samples + number_of_negative_test_samples
+                )),
+                number_of_negative_train_samples / (
+                    number_of_negative_train_samples + number_of_negative_test_samples
+                )
+            )
+
         return (
             sampler_graph.sample_negative_graph(
-                number_of_negative_samples=int(
-                    math.ceil(sampler_graph.get_number_of_edges() * unbalance_rate)
-                ),
+                number_of_negative_samples=number_of_negative_samples,
                 random_state=random_state * (i + 1),
                 use_scale_free_distribution=use_scale_free_distribution,
                 source_node_types_names=source_node_types_names,
@@ -172,12 +240,15 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
                 support=support,
                 graph_to_avoid=graph,
             ).random_holdout(
-                train_size=train_size,
+                train_size=negative_train_size,
                 random_state=random_state,
                 verbose=False,
             )
-            for i, unbalance_rate in tqdm(
-                enumerate(validation_unbalance_rates),
+            for i, (number_of_negative_samples, negative_train_size) in tqdm(
+                enumerate(map(
+                    get_number_of_negative_samples_and_train_size,
+                    validation_unbalance_rates
+                )),
                 disable=not verbose or len(validation_unbalance_rates) == 1,
                 total=len(validation_unbalance_rates),
                 leave=False,
@@ -204,8 +275,14 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
         destination_nodes_prefixes: Optional[List[str]] = None,
         validation_unbalance_rates: Tuple[float] = (1.0,),
         use_scale_free_distribution: bool = True,
+        nested_negative_sampling: bool = False,
+        train_evaluation_sample_size: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Return additional custom parameters for the current holdout."""
+        if nested_negative_sampling:
+            # The negative graphs of the smaller unbalance rates
+            # are prefixes of the one sampled for the largest rate.
+            validation_unbalance_rates = (max(validation_unbalance_rates),)
         return dict(
             negative_graphs=list(
                 cls.__iterate_negative_graphs(
@@ -224,6 +301,10 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
                     destination_nodes_prefixes=destination_nodes_prefixes,
                     validation_unbalance_rates=validation_unbalance_rates,
                     use_scale_free_distribution=use_scale_free_distribution,
+                    train_sample_rate=cls.__get_train_evaluation_sample_rate(
+                        train,
+                        train_evaluation_sample_size
+                    ),
                 )
             )
         )
@@ -258,31 +339,73 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
         destination_nodes_prefixes: Optional[List[str]] = None,
         validation_unbalance_rates: Tuple[float] = (1.0,),
         use_scale_free_distribution: bool = True,
+        nested_negative_sampling: bool = False,
+        train_evaluation_sample_size: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Return model evaluation on the provided graphs."""
+        """Return model evaluation on the provided graphs.
+
+        Implementation details
+        ----------------------
+        When the nested negative sampling is enabled, the negative graphs are
+        sampled and predicted only once, for the largest of the validation
+        unbalance rates. The negative predictions are then shuffled
+        deterministically, and the metrics of each smaller unbalance rate
+        are computed on the prefix of proportional size. The total number of
+        negative edges to predict is thus the one of the largest rate, rather
+        than the one of the sum of the rates.
+
+        When a train evaluation sample size is provided and the train graph
+        has more edges than it, the train metrics are estimated on a seeded
+        sample of that many train edges, and on a negative train graph
+        directly sampled at the same proportion of its full size, so that
+        the unbalance rate of the train evaluation is preserved. The provided
+        negative graphs must therefore have been prepared with the same
+        train evaluation sample size. The number of positive and negative
+        edges actually scored is reported for each evaluation mode.
+        """
         performance = []
 
         train_size = (
             train.get_number_of_directed_edges() / graph.get_number_of_directed_edges()
         )
 
-        train_predict_proba = self.predict_proba(
+        train_sample_rate = self.__get_train_evaluation_sample_rate(
             train,
-            support=support,
-            node_features=node_features,
-            node_type_features=node_type_features,
-            edge_type_features=edge_type_features,
-            edge_features=edge_features,
+            train_evaluation_sample_size
         )
 
-        test_predict_proba = self.predict_proba(
-            test,
-            support=support,
-            node_features=node_features,
-            node_type_features=node_type_features,
-            edge_type_features=edge_type_features,
-            edge_features=edge_features,
-        )
+        if train_sample_rate is None:
+            evaluation_train = train
+        else:
+            evaluation_train = train.sample_positive_graph(
+                number_of_samples=train_evaluation_sample_size,
+                random_state=random_state,
+            )
+
+        with self._profile("predicting_positive_edges"):
+            train_predict_proba = self.predict_proba(
+                evaluation_train,
+                support=support,
+                node_features=node_features,
+                node_type_features=node_type_features,
+                edge_type_features=edge_type_features,
+                edge_features=edge_features,
+            )
+
+            test_predict_proba = self.predict_proba(
+                test,
+                support=support,
+                node_features=node_features,
+                node_type_features=node_type_features,
+                edge_type_features=edge_type_features,
+                edge_features=edge_features,
+            )
+
+        if nested_negative_sampling:
+            largest_unbalance_rate = max(validation_unbalance_rates)
+            negative_graphs_unbalance_rates = (largest_unbalance_rate,)
+        else:
+            negative_graphs_unbalance_rates = validation_unbalance_rates
 
         negative_graph_iterator = (
             self.__iterate_negative_graphs(
@@ -299,13 +422,60 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
                 destination_edge_types_names=destination_edge_types_names,
                 source_nodes_prefixes=source_nodes_prefixes,
                 destination_nodes_prefixes=destination_nodes_prefixes,
-                validation_unbalance_rates=validation_unbalance_rates,
+                validation_unbalance_rates=negative_graphs_unbalance_rates,
                 use_scale_free_distribution=use_scale_free_distribution,
+                train_sample_rate=train_sample_rate,
             )
             if negative_graphs is None
             else negative_graphs
         )
 
+        def predict_non_existent(
+            non_existent_graph: Graph,
+            unbalance_rate: float,
+        ) -> np.ndarray:
+            # Each unbalance rate has its own phase, as the number
+            # of negative edges to predict grows with the rate.
+            with self._profile(
+                f"predicting_negative_edges_at_unbalance_rate_{unbalance_rate:g}",
+                unbalance_rate=unbalance_rate
+            ):
+                non_existent_predict_proba = self.predict_proba(
+                    non_existent_graph,
+                    support=support,
+                    node_features=node_features,
+                    node_type_features=node_type_features,
+                    edge_type_features=edge_type_features,
+                    edge_features=edge_features,
+                )
+
+            if (
+                len(non_existent_predict_proba.shape) > 1
+                and non_existent_predict_proba.shape[1] > 1
+            ):
+                non_existent_predict_proba = non_existent_predict_proba[:, 1]
+
+            return non_existent_predict_proba
+
+        if nested_negative_sampling:
+            negative_train, negative_test = next(iter(negative_graph_iterator))
+            permutation_random_state = np.random.RandomState(random_state)
+            nested_non_existent_predict_proba = {
+                evaluation_mode: permutation_random_state.permutation(
+                    predict_non_existent(
+                        non_existent_graph,
+                        unbalance_rate=largest_unbalance_rate,
+                    )
+                )
+                for evaluation_mode, non_existent_graph in (
+                    ("train", negative_train),
+                    ("test", negative_test),
+                )
+            }
+            negative_graph_iterator = [
+                (negative_train, negative_test)
+            ] * len(validation_unbalance_rates)
+
         for unbalance_rate, (negative_train, negative_test) in tqdm(
             zip(validation_unbalance_rates, negative_graph_iterator),
             disable=not verbose or len(validation_unbalance_rates) == 1,
@@ -318,20 +488,22 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
                 ("train", (train_predict_proba, negative_train)),
                 ("test", (test_predict_proba, negative_test)),
             ):
-                non_existent_predict_proba = self.predict_proba(
-                    non_existent_graph,
-                    support=support,
-                    node_features=node_features,
-                    node_type_features=node_type_features,
-                    edge_type_features=edge_type_features,
-                    edge_features=edge_features,
-                )
-
-                if (
-                    len(non_existent_predict_proba.shape) > 1
-                    and non_existent_predict_proba.shape[1] > 1
-                ):
-                    non_existent_predict_proba = non_existent_predict_proba[:, 1]
+                if nested_negative_sampling:
+                    non_existent_predict_proba = nested_non_existent_predict_proba[
+                        evaluation_mode
+                    ]
+                    non_existent_predict_proba = non_existent_predict_proba[
+                        :int(math.ceil(
+                            non_existent_predict_proba.size
+                            * unbalance_rate
+                            / largest_unbalance_rate
+                        ))
+                    ]
+                else:
+                    non_existent_predict_proba = predict_non_existent(
+                        non_existent_graph,
+                        unbalance_rate=unbalance_rate,
+                    )
 
                 predict_proba = np.concatenate(
                     (existent_predict_proba, non_existent_predict_proba)
@@ -344,22 +516,31 @@ class AbstractEdgePredictionModel(AbstractClassifierModel):
                     )
                 )
 
-                performance.append(
-                    {
-                        "evaluation_mode": evaluation_mode,
-                        "train_size": train_size,
-                        "validation_unbalance_rate": unbalance_rate,
-                        "use_scale_free_distribution": use_scale_free_distribution,
-                        **self.evaluate_predictions(
-                            labels,
-                            predict_proba,
-                        ),
-                        **self.evaluate_prediction_probabilities(
-                            labels,
-                            predict_proba,
-                        ),
-                    }
-                )
+                with self._profile("computing_metrics"):
+                    performance.append(
+                        {
+                            "evaluation_mode": evaluation_mode,
+                            "train_size": train_size,
+                            "validation_unbalance_rate": unbalance_rate,
+                            "use_scale_free_distribution": use_scale_free_distribution,
+                            "nested_negative_sampling": nested_negative_sampling,
+                            "train_evaluation_sample_size": (
+                                None
+                                if train_sample_rate is None
+                                else train_evaluation_sample_size
+                            ),
+                            "number_of_positive_edges": existent_predict_proba.size,
+                            "number_of_negative_edges": non_existent_predict_proba.size,
+                            **self.evaluate_predictions(
+                                labels,
+                                predict_proba,
+                            ),
+                            **self.evaluate_prediction_probabilities(
+                                labels,
+                                predict_proba,
+                            ),
+                        }
+                    )
 
         return performance
 
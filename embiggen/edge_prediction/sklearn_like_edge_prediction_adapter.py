@@ -1,5 +1,6 @@
 """Module providing adapter class making edge prediction possible in sklearn models."""
 from typing import Type, List, Optional, Dict, Any, Union, Tuple
+import functools
 import numpy as np
 import math
 import compress_pickle
@@ -10,6 +11,7 @@ from embiggen.embedding_transformers import EdgePredictionTransformer, GraphTran
 from embiggen.edge_prediction.edge_prediction_model import AbstractEdgePredictionModel
 from embiggen.utils.abstract_models import abstract_class
 from embiggen.utils import AbstractEdgeFeature
+from embiggen.utils.sklearn_utils import densify_unsupported_sparse_features
 from tqdm.auto import tqdm
 
 
@@ -101,6 +103,71 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
         """Return copy of self."""
         return copy.deepcopy(self)
 
+    def _get_holdout_cache_key(
+        self,
+        purpose: str,
+        graph: Graph,
+        support: Optional[Graph],
+        node_features: Optional[List[np.ndarray]],
+        node_type_features: Optional[List[np.ndarray]],
+        edge_type_features: Optional[List[np.ndarray]],
+        edge_features: Optional[
+            Union[Type[AbstractEdgeFeature], List[Type[AbstractEdgeFeature]]]
+        ],
+    ) -> Tuple[Tuple, Tuple]:
+        """Return key identifying the matrices built from the provided graph and features, and the objects it references.
+
+        Parameters
+        ------------------
+        purpose: str
+            Whether the matrices are used for training or for prediction.
+        graph: Graph,
+            The graph whose edges are embedded.
+        support: Optional[Graph] = None
+            The graph describiding the topological structure that
+            includes also the above graph.
+        node_features: Optional[List[np.ndarray]]
+            The node features to use.
+        node_type_features: Optional[List[np.ndarray]] = None
+            The node type features to use.
+        edge_type_features: Optional[List[np.ndarray]] = None
+            The edge type features to use.
+        edge_features: Optional[Union[Type[AbstractEdgeFeature], List[Type[AbstractEdgeFeature]]]] = None
+            The edge features to use.
+
+        Implementation details
+        ------------------
+        Within a holdout, the graphs and features provided to the
+        different models are the very same objects, and are therefore
+        identified by their ids, which are stable while they are alive.
+        """
+        referenced_objects = [graph, support]
+        for features in (node_features, node_type_features, edge_type_features, edge_features):
+            if features is None:
+                features = []
+            if not isinstance(features, list):
+                features = [features]
+            referenced_objects.append(tuple(features))
+
+        edge_embedding_methods = self._edge_embedding_methods
+        if isinstance(edge_embedding_methods, list):
+            edge_embedding_methods = tuple(edge_embedding_methods)
+
+        key = (
+            purpose,
+            id(graph),
+            id(support),
+            *[
+                tuple(id(feature) for feature in features)
+                for features in referenced_objects[2:]
+            ],
+            edge_embedding_methods,
+            self._use_edge_metrics,
+            self.is_using_edge_types(),
+        )
+
+        return key, tuple(referenced_objects)
+
     def _trasform_graph_into_edge_embedding(
         self,
         graph: Union[Graph, Tuple[np.ndarray]],
@@ -179,7 +246,8 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
 
         for edge_feature in edge_features:
             if isinstance(graph, Graph):
-                for rasterized_edge_feature in edge_feature.get_edge_feature_from_graph(
+                for rasterized_edge_feature in self._get_edge_feature_from_graph(
+                    edge_feature=edge_feature,
                     graph=graph,
                     support=support,
                 ).values():
@@ -194,7 +262,8 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
             elif isinstance(graph, tuple):
                 for (
                     rasterized_edge_feature
-                ) in edge_feature.get_edge_feature_from_edge_node_ids(
+                ) in self._get_edge_feature_from_edge_node_ids(
+                    edge_feature=edge_feature,
                     support=support,
                     sources=graph[0],
                     destinations=graph[1],
@@ -314,90 +383,116 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
                     "We currently only support edge features of type AbstractEdgeFeature."
                 )
 
-        number_of_negative_samples = int(
-            math.ceil(
-                graph.get_number_of_directed_edges() * self._training_unbalance_rate
+        def build_training_matrices() -> Tuple[np.ndarray, np.ndarray]:
+            number_of_negative_samples = int(
+                math.ceil(
+                    graph.get_number_of_directed_edges() * self._training_unbalance_rate
+                )
+            )
+            negative_graph = graph.sample_negative_graph(
+                number_of_negative_samples=number_of_negative_samples,
+                only_from_same_component=True,
+                random_state=self._random_state,
+                use_scale_free_distribution=self._use_scale_free_distribution,
+                sample_edge_types=len(edge_type_features) > 0,
             )
-        )
-        negative_graph = graph.sample_negative_graph(
-            number_of_negative_samples=number_of_negative_samples,
-            only_from_same_component=True,
-            random_state=self._random_state,
-            use_scale_free_distribution=self._use_scale_free_distribution,
-            sample_edge_types=len(edge_type_features) > 0,
-        )
 
-        assert negative_graph.has_edges()
+            assert negative_graph.has_edges()
 
-        if negative_graph.has_selfloops():
-            assert graph.has_selfloops(), (
-                "The negative graph contains self loops, "
-                "but the positive graph does not."
-            )
+            if negative_graph.has_selfloops():
+                assert graph.has_selfloops(), (
+                    "The negative graph contains self loops, "
+                    "but the positive graph does not."
+                )
 
-        if self._training_unbalance_rate == 1.0:
-            number_of_negative_edges = negative_graph.get_number_of_directed_edges()
-            number_of_positive_edges = graph.get_number_of_directed_edges()
-            self_loop_message = (
-                ("The graph contains self loops.")
-                if negative_graph.has_selfloops()
-                else ("The graph does not contain self loops.")
-            )
-            assert (
-                number_of_negative_edges in (
-                    number_of_positive_edges + 1,
-                    number_of_positive_edges,
+            if self._training_unbalance_rate == 1.0:
+                number_of_negative_edges = negative_graph.get_number_of_directed_edges()
+                number_of_positive_edges = graph.get_number_of_directed_edges()
+                self_loop_message = (
+                    ("The graph contains self loops.")
+                    if negative_graph.has_selfloops()
+                    else ("The graph does not contain self loops.")
+                )
+                assert (
+                    number_of_negative_edges in (
+                        number_of_positive_edges + 1,
+                        number_of_positive_edges,
+                    )
+                ), (
+                    "The negative graph should have the same number of edges as the "
+                    "positive graph when using a training unbalance rate of 1.0. "
+                    "We expect the negative graph to have "
+                    f"{number_of_positive_edges} or {number_of_positive_edges + 1} edges, but found "
+                    f"{number_of_negative_edges}. {self_loop_message} "
+                    f"The exact number requested was {number_of_negative_samples}"
                 )
-            ), (
-                "The negative graph should have the same number of edges as the "
-                "positive graph when using a training unbalance rate of 1.0. "
-                "We expect the negative graph to have "
-                f"{number_of_positive_edges} or {number_of_positive_edges + 1} edges, but found "
-                f"{number_of_negative_edges}. {self_loop_message} "
-                f"The exact number requested was {number_of_negative_samples}"
-            )
 
-        rasterized_edge_features = []
+            rasterized_edge_features = []
+
+            for edge_feature in edge_features:
+                for positive_edge_features, negative_edge_features in zip(
+                    self._get_edge_feature_from_graph(
+                        edge_feature=edge_feature,
+                        graph=graph,
+                        support=support,
+                    ).values(),
+                    self._get_edge_feature_from_graph(
+                        edge_feature=edge_feature,
+                        graph=negative_graph,
+                        support=support,
+                    ).values(),
+                ):
+                    rasterized_edge_features.append(
+                        np.vstack((positive_edge_features, negative_edge_features))
+                    )
 
-        for edge_feature in edge_features:
-            for positive_edge_features, negative_edge_features in zip(
-                edge_feature.get_edge_feature_from_graph(
-                    graph=graph,
-                    support=support,
-                ).values(),
-                edge_feature.get_edge_feature_from_graph(
-                    graph=negative_graph,
-                    support=support,
-                ).values(),
-            ):
+            if self._use_edge_metrics:
                 rasterized_edge_features.append(
-                    np.vstack((positive_edge_features, negative_edge_features))
-                )
-
-        if self._use_edge_metrics:
-            rasterized_edge_features.append(
-                np.vstack(
-                    (
-                        support.get_all_edge_metrics(
-                            normalize=True,
-                            subgraph=graph,
-                        ),
-                        support.get_all_edge_metrics(
-                            normalize=True,
-                            subgraph=negative_graph,
-                        ),
+                    np.vstack(
+                        (
+                            support.get_all_edge_metrics(
+                                normalize=True,
+                                subgraph=graph,
+                            ),
+                            support.get_all_edge_metrics(
+                                normalize=True,
+                                subgraph=negative_graph,
+                            ),
+                        )
                     )
                 )
-            )
 
-        self._model_instance.fit(
-            *lpt.transform(
+            return lpt.transform(
                 positive_graph=graph,
                 negative_graph=negative_graph,
                 edge_features=rasterized_edge_features,
                 shuffle=True,
                 random_state=self._random_state,
             )
+
+        holdout_cache_key, referenced_objects = self._get_holdout_cache_key(
+            "fit",
+            graph=graph,
+            support=support,
+            node_features=node_features,
+            node_type_features=node_type_features,
+            edge_type_features=edge_type_features,
+            edge_features=edge_features,
+        )
+
+        x, y = self._get_from_holdout_cache(
+            key=holdout_cache_key + (
+                self._training_unbalance_rate,
+                self._use_scale_free_distribution,
+                self._random_state,
+            ),
+            builder=build_training_matrices,
+            referenced_objects=referenced_objects,
+        )
+
+        self._model_instance.fit(
+            densify_unsupported_sparse_features(x, self.can_use_sparse_features()),
+            y
         )
 
     def _predict(
@@ -492,6 +587,10 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
         )
 
         def predict(features):
+            features = densify_unsupported_sparse_features(
+                features,
+                self.can_use_sparse_features()
+            )
             if hasattr(self._model_instance, "predict_proba"):
                 prediction_probabilities = self._model_instance.predict_proba(features)
             else:
@@ -515,21 +614,40 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
 
             return prediction_probabilities
 
+        holdout_cache_key, referenced_objects = self._get_holdout_cache_key(
+            "predict",
+            graph=graph,
+            support=support,
+            node_features=node_features,
+            node_type_features=node_type_features,
+            edge_type_features=edge_type_features,
+            edge_features=edge_features,
+        )
+
+        def get_batch_features(i: int) -> np.ndarray:
+            edges = sequence[i]
+            return self._trasform_graph_into_edge_embedding(
+                graph=(edges[0][0], edges[0][1]),
+                support=support,
+                node_features=node_features,
+                node_types=graph,
+                edge_types=edges[0][2] if self.is_using_edge_types() else None,
+                node_type_features=node_type_features,
+                edge_type_features=edge_type_features,
+                edge_features=edge_features,
+            )
+
         return (
             predict(
-                self._trasform_graph_into_edge_embedding(
-                    graph=(edges[0][0], edges[0][1]),
-                    support=support,
-                    node_features=node_features,
-                    node_types=graph,
-                    edge_types=edges[0][2] if self.is_using_edge_types() else None,
-                    node_type_features=node_type_features,
-                    edge_type_features=edge_type_features,
-                    edge_features=edge_features,
+                self._get_from_holdout_cache(
+                    key=holdout_cache_key + (self._prediction_batch_size, i),
+                    builder=functools.partial(get_batch_features, i),
+                    referenced_objects=referenced_objects,
+                    is_prediction_batch=True,
                 )
             )
-            for edges in tqdm(
-                (sequence[i] for i in range(len(sequence))),
+            for i in tqdm(
+                range(len(sequence)),
                 total=len(sequence),
                 dynamic_ncols=True,
                 desc="Running edge predictions",
@@ -537,6 +655,11 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
             )
         )
 
+    @classmethod
+    def can_use_sparse_features(cls) -> bool:
+        """Returns whether the model accepts the features as scipy sparse matrices."""
+        return True
+
     @classmethod
     def can_use_edge_weights(cls) -> bool:
         """Returns whether the model can optionally use edge weights."""
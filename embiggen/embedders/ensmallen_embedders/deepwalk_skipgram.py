@@ -137,4 +137,8 @@ class DeepWalkSkipGramEnsmallen(Node2VecEnsmallen):
     @classmethod
     def model_name(cls) -> str:
         """Returns name of the model."""
-        return "DeepWalk SkipGram"
\ No newline at end of file
+        return "DeepWalk SkipGram"
+
+    @classmethod
+    def can_fold_in_by_local_sgd(cls) -> bool:
+        return True
\ No newline at end of file
@@ -140,4 +140,8 @@ class FirstOrderLINEEnsmallen(EnsmallenEmbedder):
     @classmethod
     def is_stocastic(cls) -> bool:
         """Returns whether the model is stocastic and has therefore a random state."""
+        return True
+
+    @classmethod
+    def can_fold_in_by_local_sgd(cls) -> bool:
         return True
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""Module providing a sparse randomized GraRep implementation."""
+from typing import Any, Dict
+from ensmallen import Graph
+import pandas as pd
+import numpy as np
+from embiggen.embedders.ensmallen_embedders.ensmallen_embedder import EnsmallenEmbedder
+from embiggen.utils import EmbeddingResult
+from embiggen.utils.sparse_matrix_factorization import (
+    factorize_sparse_matrix,
+    get_adjacency_matrix,
+    get_low_rank_entries,
+    get_reciprocal_sqrt_degrees,
+    get_top_eigenpairs,
+    sample_walk_pairs,
+)
+
+
+class GraRepEnsmallen(EnsmallenEmbedder):
+    """Class implementing a sparse randomized version of the GraRep algorithm."""
+
+    def __init__(
+        self,
+        embedding_size: int = 100,
+        order: int = 5,
+        rank: int = 256,
+        samples_per_edge: int = 10,
+        iteration: int = 10,
+        random_state: int = 42,
+        ring_bell: bool = False,
+        enable_cache: bool = False
+    ):
+        """Create new GraRep method.
+
+        Parameters
+        --------------------------
+        embedding_size: int = 100
+            Dimension of the embedding, split evenly among the orders.
+        order: int = 5
+            Number of powers of the transition matrix.
+        rank: int = 256
+            The number of eigenpairs of the normalized adjacency matrix
+            used to approximate the powers of the transition matrix.
+        samples_per_edge: int = 10
+            The number of walks sampled for each edge and for each order
+            to choose the node pairs where the matrices are evaluated.
+        iteration: int = 10
+            Number of power iterations of the randomized SVD.
+        random_state: int = 42
+            Random state to reproduce the embeddings.
+        ring_bell: bool = False,
+            Whether to play a sound when embedding completes.
+        enable_cache: bool = False
+            Whether to enable the cache, that is to
+            store the computed embedding.
+        """
+        for name, value in (
+            ("order", order),
+            ("rank", rank),
+            ("samples_per_edge", samples_per_edge),
+            ("iteration", iteration),
+        ):
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(
+                    f"The parameter `{name}` should be a strictly positive "
+                    f"integer, but {value} was provided."
+                )
+        if embedding_size < order:
+            raise ValueError(
+                f"The embedding size {embedding_size} is split among the "
+                f"{order} orders, so it cannot be smaller than the order."
+            )
+        self._order = order
+        self._rank = rank
+        self._samples_per_edge = samples_per_edge
+        self._iteration = iteration
+        super().__init__(
+            embedding_size=embedding_size,
+            random_state=random_state,
+            ring_bell=ring_bell,
+            enable_cache=enable_cache,
+        )
+
+    def parameters(self) -> Dict[str, Any]:
+        """Returns parameters of the model."""
+        return dict(
+            **super().parameters(),
+            **dict(
+                order=self._order,
+                rank=self._rank,
+                samples_per_edge=self._samples_per_edge,
+                iteration=self._iteration,
+            )
+        )
+
+    def _fit_transform(
+        self,
+        graph: Graph,
+        return_dataframe: bool = True,
+    ) -> EmbeddingResult:
+        """Return node embedding.
+
+        Implementation details
+        --------------------------
+        The k-th power of the transition matrix P = D^-1 A equals
+        D^-1/2 U L^k U^T D^1/2, where U L U^T is the eigen-decomposition
+        of the symmetric normalized adjacency matrix, which is truncated
+        to the largest eigenpairs. The first power is the sparse transition
+        matrix itself, while the higher ones are only evaluated on the
+        pairs joined by the walks of that length sampled from the edges.
+        The column sums of each power are computed exactly with sparse
+        products, and the truncated logarithms of the normalized powers
+        are factorized with randomized SVD and concatenated.
+        """
+        adjacency = get_adjacency_matrix(graph)
+        number_of_nodes = graph.get_number_of_nodes()
+        reciprocal_sqrt_degrees = get_reciprocal_sqrt_degrees(adjacency)
+        eigenvalues, eigenvectors = get_top_eigenpairs(
+            adjacency,
+            reciprocal_sqrt_degrees,
+            rank=self._rank,
+            random_state=self._random_state
+        )
+        left_eigenvectors = eigenvectors * reciprocal_sqrt_degrees[:, None]
+        right_eigenvectors = eigenvectors / np.where(
+            reciprocal_sqrt_degrees > 0,
+            reciprocal_sqrt_degrees,
+            1.0
+        )[:, None]
+
+        transition = adjacency.multiply(reciprocal_sqrt_degrees[:, None] ** 2).tocsr()
+        column_sums = np.ones(number_of_nodes)
+        power = np.ones_like(eigenvalues)
+        embeddings = []
+
+        for order, embedding_size in enumerate(
+            np.diff(np.linspace(0, self._embedding_size, self._order + 1).astype(int)),
+            start=1
+        ):
+            # The column sums of P^k are the ones of P^(k-1) times P.
+            column_sums = transition.T @ column_sums
+            power = power * eigenvalues
+
+            if order == 1:
+                transition_entries = transition.tocoo()
+                rows = transition_entries.row.astype(np.int64)
+                columns = transition_entries.col.astype(np.int64)
+                transitions = transition_entries.data
+            else:
+                rows, columns = sample_walk_pairs(
+                    adjacency,
+                    number_of_samples=self._samples_per_edge * adjacency.nnz,
+                    minimum_length=order,
+                    maximum_length=order,
+                    random_state=self._random_state + order
+                )
+                transitions = get_low_rank_entries(
+                    left_eigenvectors * power,
+                    right_eigenvectors,
+                    rows,
+                    columns
+                )
+
+            # log(P^k_ij / sum_i P^k_ij) - log(1 / n), truncated at zero.
+            values = np.log(np.maximum(
+                number_of_nodes * transitions / np.maximum(column_sums[columns], 1e-12),
+                1.0
+            ))
+
+            embeddings.append(factorize_sparse_matrix(
+                rows,
+                columns,
+                values,
+                number_of_nodes=number_of_nodes,
+                embedding_size=embedding_size,
+                iterations=self._iteration,
+                random_state=self._random_state
+            ))
+
+        embedding = np.hstack(embeddings)
+
+        if return_dataframe:
+            embedding = pd.DataFrame(
+                embedding,
+                index=graph.get_node_names()
+            )
+        return EmbeddingResult(
+            embedding_method_name=self.model_name(),
+            node_embeddings=embedding
+        )
+
+    @classmethod
+    def smoke_test_parameters(cls) -> Dict[str, Any]:
+        return dict(
+            embedding_size=4,
+            order=2,
+            rank=8,
+            samples_per_edge=1,
+            iteration=1,
+        )
+
+    @classmethod
+    def model_name(cls) -> str:
+        """Returns name of the model."""
+        return "GraRep"
+
+    @classmethod
+    def can_use_edge_weights(cls) -> bool:
+        """Returns whether the model can optionally use edge weights."""
+        return False
+
+    @classmethod
+    def can_use_node_types(cls) -> bool:
+        """Returns whether the model can optionally use node types."""
+        return False
+
+    @classmethod
+    def can_use_edge_types(cls) -> bool:
+        """Returns whether the model can optionally use edge types."""
+        return False
+
+    @classmethod
+    def is_stocastic(cls) -> bool:
+        """Returns whether the model is stocastic and has therefore a random state."""
+        return True
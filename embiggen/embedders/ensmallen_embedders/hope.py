@@ -1,5 +1,5 @@
 """Module providing HOPE implementation."""
-from typing import Optional,  Dict, Any, List
+from typing import Optional,  Dict, Any, List, Tuple
 from ensmallen import Graph
 import pandas as pd
 import numpy as np
@@ -7,8 +7,10 @@ from scipy.sparse import coo_matrix
 from scipy.sparse.linalg import svds as sparse_svds
 from sklearn.utils.extmath import randomized_svd
 from userinput.utils import must_be_in_set
+from embiggen.utils.abstract_models import format_list
 from embiggen.embedders.ensmallen_embedders.ensmallen_embedder import EnsmallenEmbedder
 from embiggen.utils import EmbeddingResult
+from embiggen.utils.fold_in import get_projection
 
 
 class HOPEEnsmallen(EnsmallenEmbedder):
@@ -190,6 +192,140 @@ class HOPEEnsmallen(EnsmallenEmbedder):
             embedding_method_name=self.model_name(),
             node_embeddings=[left_embedding, right_embedding]
         )
+
+    @classmethod
+    def get_projectable_metrics(cls) -> List[str]:
+        """Returns list of the metrics whose rows of the new nodes can be computed locally."""
+        return [
+            "Jaccard",
+            "Neighbours Intersection size",
+            "Adamic-Adar",
+            "Adjacency",
+            "Laplacian",
+            "Left Normalized Laplacian",
+            "Symmetric Normalized Laplacian",
+        ]
+
+    @classmethod
+    def can_fold_in_by_projection(cls) -> bool:
+        return True
+
+    def _get_metric_row(self, graph: Graph, node_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the non-zero values of the row of the metric of the provided node.
+
+        Parameters
+        --------------------------
+        graph: Graph
+            The graph with the new nodes.
+        node_id: int
+            The node whose row is computed.
+        """
+        neighbour_ids = graph.get_neighbour_node_ids_from_node_id(node_id)
+        neighbour_ids = neighbour_ids[neighbour_ids != node_id]
+
+        if self._metric in ("Adjacency", "Laplacian"):
+            sign = 1.0 if self._metric == "Adjacency" else -1.0
+            return neighbour_ids, np.full(len(neighbour_ids), sign)
+
+        if self._metric == "Left Normalized Laplacian":
+            return neighbour_ids, np.full(
+                len(neighbour_ids),
+                -1.0 / graph.get_node_degree_from_node_id(node_id)
+            )
+
+        if self._metric == "Symmetric Normalized Laplacian":
+            return neighbour_ids, -np.array([
+                graph.get_reciprocal_sqrt_degree_from_node_id(node_id)
+                * graph.get_reciprocal_sqrt_degree_from_node_id(neighbour_id)
+                for neighbour_id in neighbour_ids.tolist()
+            ])
+
+        # The remaining metrics are non-zero on the neighbours of the neighbours.
+        second_order_neighbour_ids = np.unique(np.concatenate([
+            neighbour_ids,
+            *[
+                graph.get_neighbour_node_ids_from_node_id(neighbour_id)
+                for neighbour_id in neighbour_ids.tolist()
+            ]
+        ])).astype(np.int64)
+        second_order_neighbour_ids = second_order_neighbour_ids[
+            second_order_neighbour_ids != node_id
+        ]
+        metric = {
+            "Jaccard": graph.get_jaccard_coefficient_from_node_ids,
+            "Neighbours Intersection size": graph.get_unchecked_neighbours_intersection_size_from_node_ids,
+            "Adamic-Adar": graph.get_adamic_adar_index_from_node_ids,
+        }[self._metric]
+        return second_order_neighbour_ids, np.array([
+            metric(node_id, neighbour_id)
+            for neighbour_id in second_order_neighbour_ids.tolist()
+        ])
+
+    def _fold_in_by_projection(
+        self,
+        graph: Graph,
+        node_embeddings: List[pd.DataFrame],
+        new_node_ids: np.ndarray,
+    ) -> List[np.ndarray]:
+        """Returns the vectors of the new nodes projected onto the left and right embeddings.
+
+        Parameters
+        --------------------------
+        graph: Graph
+            The graph with the new nodes.
+        node_embeddings: List[pd.DataFrame]
+            The left and right embeddings computed by the model.
+        new_node_ids: np.ndarray
+            The ids of the new nodes.
+
+        Raises
+        --------------------------
+        ValueError
+            If the metric of the model is not local.
+
+        Implementation details
+        --------------------------
+        As the left and right embeddings factorize the metric matrix, the left
+        vector of a new node is the least-squares solution whose products with
+        the right vectors approximate its row of the metric, and vice versa.
+        The metrics are symmetric, so the row is also used as the column.
+        """
+        if self._metric not in self.get_projectable_metrics():
+            raise ValueError(
+                f"The metric `{self._metric}` is not local, so the rows of the new "
+                "nodes cannot be computed from their neighbourhoods. The metrics "
+                f"supporting the projection are {format_list(self.get_projectable_metrics())}."
+            )
+
+        left_embedding, right_embedding = [
+            node_embedding.to_numpy() for node_embedding in node_embeddings
+        ]
+        left_gram = left_embedding.T @ left_embedding
+        right_gram = right_embedding.T @ right_embedding
+        new_left_embedding = np.zeros((len(new_node_ids), left_embedding.shape[1]))
+        new_right_embedding = np.zeros((len(new_node_ids), right_embedding.shape[1]))
+
+        for position, node_id in enumerate(new_node_ids.tolist()):
+            metric_node_ids, values = self._get_metric_row(graph, node_id)
+            rows = node_embeddings[0].index.get_indexer(
+                graph.get_node_names_from_node_ids(metric_node_ids)
+            )
+            known = rows != -1
+            new_left_embedding[position] = get_projection(
+                right_gram,
+                right_embedding[rows[known]],
+                values[known]
+            )
+            new_right_embedding[position] = get_projection(
+                left_gram,
+                left_embedding[rows[known]],
+                values[known]
+            )
+
+        return [
+            new_left_embedding.astype(left_embedding.dtype),
+            new_right_embedding.astype(right_embedding.dtype),
+        ]
     
     @classmethod
     def smoke_test_parameters(cls) -> Dict[str, Any]:
@@ -1,5 +1,5 @@
 """Module providing Laplacian Eigenmaps implementation."""
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 from ensmallen import Graph
 import pandas as pd
 import numpy as np
@@ -72,6 +72,104 @@ class LaplacianEigenmapsEnsmallen(EnsmallenEmbedder):
             node_embeddings=embedding
         )
 
+    @classmethod
+    def can_fold_in_by_projection(cls) -> bool:
+        return True
+
+    @staticmethod
+    def _get_normalized_adjacency_row(
+        graph: Graph,
+        node_id: int,
+        node_embedding: pd.DataFrame,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the embedding rows and the values of the normalized adjacency of the existing neighbours.
+
+        Parameters
+        --------------------------
+        graph: Graph
+            The graph with the new nodes.
+        node_id: int
+            The node whose row is computed.
+        node_embedding: pd.DataFrame
+            The embedding of the existing nodes.
+        """
+        neighbour_ids = graph.get_neighbour_node_ids_from_node_id(node_id)
+        neighbour_ids = neighbour_ids[neighbour_ids != node_id]
+        rows = node_embedding.index.get_indexer(
+            graph.get_node_names_from_node_ids(neighbour_ids)
+        )
+        known = rows != -1
+        values = np.array([
+            graph.get_reciprocal_sqrt_degree_from_node_id(node_id)
+            * graph.get_reciprocal_sqrt_degree_from_node_id(neighbour_id)
+            for neighbour_id in neighbour_ids[known].tolist()
+        ])
+        return rows[known], values
+
+    def _fold_in_by_projection(
+        self,
+        graph: Graph,
+        node_embeddings: List[pd.DataFrame],
+        new_node_ids: np.ndarray,
+    ) -> List[np.ndarray]:
+        """Returns the vectors of the new nodes by the Nystrom extension of the eigenvectors.
+
+        Parameters
+        --------------------------
+        graph: Graph
+            The graph with the new nodes.
+        node_embeddings: List[pd.DataFrame]
+            The eigenvectors computed by the model.
+        new_node_ids: np.ndarray
+            The ids of the new nodes.
+
+        Implementation details
+        --------------------------
+        The eigenvectors of the symmetric normalized Laplacian are the ones of
+        the normalized adjacency matrix, with eigenvalues one minus the ones of
+        the Laplacian. The component of a new node is therefore the product of
+        its row of the normalized adjacency matrix with the eigenvectors,
+        divided by the eigenvalues. The eigenvalues are not stored in the
+        embedding, so they are estimated by the Rayleigh quotients on the rows
+        of the existing neighbours of the new nodes.
+        """
+        node_embedding = node_embeddings[0]
+        eigenvectors = node_embedding.to_numpy()
+        dimension = eigenvectors.shape[1]
+
+        new_node_rows = [
+            self._get_normalized_adjacency_row(graph, node_id, node_embedding)
+            for node_id in new_node_ids.tolist()
+        ]
+
+        # Rayleigh quotients of the eigenvectors on the existing neighbours.
+        numerator = np.zeros(dimension)
+        denominator = np.zeros(dimension)
+        neighbour_rows = np.unique(np.concatenate([
+            np.zeros(0, dtype=np.int64),
+            *[rows for rows, _ in new_node_rows]
+        ])).astype(np.int64)
+        neighbour_node_ids = graph.get_node_ids_from_node_names(
+            node_embedding.index[neighbour_rows].tolist()
+        )
+        for row, node_id in zip(neighbour_rows.tolist(), neighbour_node_ids.tolist()):
+            rows, values = self._get_normalized_adjacency_row(graph, node_id, node_embedding)
+            numerator += eigenvectors[row] * (values @ eigenvectors[rows])
+            denominator += eigenvectors[row] ** 2
+        eigenvalues = np.where(denominator > 0, numerator / np.maximum(denominator, 1e-12), 1.0)
+        # Eigenvalues close to zero would amplify the noise of the estimates.
+        eigenvalues = np.where(
+            np.abs(eigenvalues) < 1e-3,
+            np.copysign(1e-3, eigenvalues),
+            eigenvalues
+        )
+
+        new_node_embedding = np.zeros((len(new_node_ids), dimension))
+        for position, (rows, values) in enumerate(new_node_rows):
+            new_node_embedding[position] = (values @ eigenvectors[rows]) / eigenvalues
+
+        return [new_node_embedding.astype(eigenvectors.dtype)]
+
     @classmethod
     def smoke_test_parameters(cls) -> Dict[str, Any]:
         return dict(
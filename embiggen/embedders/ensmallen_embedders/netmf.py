@@ -0,0 +1,209 @@
+"""Module providing a sparse randomized NetMF implementation."""
+from typing import Any, Dict
+from ensmallen import Graph
+import pandas as pd
+import numpy as np
+from embiggen.embedders.ensmallen_embedders.ensmallen_embedder import EnsmallenEmbedder
+from embiggen.utils import EmbeddingResult
+from embiggen.utils.sparse_matrix_factorization import (
+    factorize_sparse_matrix,
+    get_adjacency_matrix,
+    get_low_rank_entries,
+    get_reciprocal_sqrt_degrees,
+    get_top_eigenpairs,
+    sample_walk_pairs,
+)
+
+
+class NetMFEnsmallen(EnsmallenEmbedder):
+    """Class implementing a sparse randomized version of the NetMF algorithm."""
+
+    def __init__(
+        self,
+        embedding_size: int = 100,
+        order: int = 10,
+        negative_samples: float = 1.0,
+        rank: int = 256,
+        samples_per_edge: int = 10,
+        iteration: int = 10,
+        random_state: int = 42,
+        ring_bell: bool = False,
+        enable_cache: bool = False
+    ):
+        """Create new NetMF method.
+
+        Parameters
+        --------------------------
+        embedding_size: int = 100
+            Dimension of the embedding.
+        order: int = 10
+            The window size, that is the maximum length of the walks.
+        negative_samples: float = 1.0
+            The number of negative samples of the equivalent skip-gram model.
+        rank: int = 256
+            The number of eigenpairs of the normalized adjacency matrix
+            used to approximate the powers of the transition matrix.
+        samples_per_edge: int = 10
+            The number of walks sampled for each edge to choose
+            the node pairs where the NetMF matrix is evaluated.
+        iteration: int = 10
+            Number of power iterations of the randomized SVD.
+        random_state: int = 42
+            Random state to reproduce the embeddings.
+        ring_bell: bool = False,
+            Whether to play a sound when embedding completes.
+        enable_cache: bool = False
+            Whether to enable the cache, that is to
+            store the computed embedding.
+        """
+        for name, value in (
+            ("order", order),
+            ("rank", rank),
+            ("samples_per_edge", samples_per_edge),
+            ("iteration", iteration),
+        ):
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(
+                    f"The parameter `{name}` should be a strictly positive "
+                    f"integer, but {value} was provided."
+                )
+        if negative_samples <= 0:
+            raise ValueError(
+                "The number of negative samples should be strictly positive, "
+                f"but {negative_samples} was provided."
+            )
+        self._order = order
+        self._negative_samples = negative_samples
+        self._rank = rank
+        self._samples_per_edge = samples_per_edge
+        self._iteration = iteration
+        super().__init__(
+            embedding_size=embedding_size,
+            random_state=random_state,
+            ring_bell=ring_bell,
+            enable_cache=enable_cache,
+        )
+
+    def parameters(self) -> Dict[str, Any]:
+        """Returns parameters of the model."""
+        return dict(
+            **super().parameters(),
+            **dict(
+                order=self._order,
+                negative_samples=self._negative_samples,
+                rank=self._rank,
+                samples_per_edge=self._samples_per_edge,
+                iteration=self._iteration,
+            )
+        )
+
+    def _fit_transform(
+        self,
+        graph: Graph,
+        return_dataframe: bool = True,
+    ) -> EmbeddingResult:
+        """Return node embedding.
+
+        Implementation details
+        --------------------------
+        The NetMF matrix vol(G) / (b T) (P + ... + P^T) D^-1 equals
+        vol(G) / b D^-1/2 U F(L) U^T D^-1/2, where U L U^T is the
+        eigen-decomposition of the symmetric normalized adjacency matrix and
+        F(L) is the average of its first T powers. The decomposition is
+        truncated to the largest eigenpairs, and the truncated logarithm
+        of the matrix is only evaluated on the edges and on the pairs joined
+        by the walks sampled from the edges, which are the pairs with
+        the largest entries. The resulting sparse matrix is then factorized
+        with randomized SVD.
+        """
+        adjacency = get_adjacency_matrix(graph)
+        reciprocal_sqrt_degrees = get_reciprocal_sqrt_degrees(adjacency)
+        eigenvalues, eigenvectors = get_top_eigenpairs(
+            adjacency,
+            reciprocal_sqrt_degrees,
+            rank=self._rank,
+            random_state=self._random_state
+        )
+
+        filtered_eigenvalues = np.zeros_like(eigenvalues)
+        power = np.ones_like(eigenvalues)
+        for _ in range(self._order):
+            power = power * eigenvalues
+            filtered_eigenvalues += power
+        filtered_eigenvalues /= self._order
+
+        scaled_eigenvectors = eigenvectors * reciprocal_sqrt_degrees[:, None]
+
+        rows, columns = sample_walk_pairs(
+            adjacency,
+            number_of_samples=self._samples_per_edge * adjacency.nnz,
+            minimum_length=1,
+            maximum_length=self._order,
+            random_state=self._random_state,
+            include_edges=True
+        )
+        volume = adjacency.nnz
+        values = np.log(np.maximum(
+            volume / self._negative_samples * get_low_rank_entries(
+                scaled_eigenvectors * filtered_eigenvalues,
+                scaled_eigenvectors,
+                rows,
+                columns
+            ),
+            1.0
+        ))
+
+        embedding = factorize_sparse_matrix(
+            rows,
+            columns,
+            values,
+            number_of_nodes=graph.get_number_of_nodes(),
+            embedding_size=self._embedding_size,
+            iterations=self._iteration,
+            random_state=self._random_state
+        )
+
+        if return_dataframe:
+            embedding = pd.DataFrame(
+                embedding,
+                index=graph.get_node_names()
+            )
+        return EmbeddingResult(
+            embedding_method_name=self.model_name(),
+            node_embeddings=embedding
+        )
+
+    @classmethod
+    def smoke_test_parameters(cls) -> Dict[str, Any]:
+        return dict(
+            embedding_size=5,
+            order=2,
+            rank=8,
+            samples_per_edge=1,
+            iteration=1,
+        )
+
+    @classmethod
+    def model_name(cls) -> str:
+        """Returns name of the model."""
+        return "NetMF"
+
+    @classmethod
+    def can_use_edge_weights(cls) -> bool:
+        """Returns whether the model can optionally use edge weights."""
+        return False
+
+    @classmethod
+    def can_use_node_types(cls) -> bool:
+        """Returns whether the model can optionally use node types."""
+        return False
+
+    @classmethod
+    def can_use_edge_types(cls) -> bool:
+        """Returns whether the model can optionally use edge types."""
+        return False
+
+    @classmethod
+    def is_stocastic(cls) -> bool:
+        """Returns whether the model is stocastic and has therefore a random state."""
+        return True
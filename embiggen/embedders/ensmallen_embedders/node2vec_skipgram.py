@@ -163,4 +163,8 @@ class Node2VecSkipGramEnsmallen(Node2VecEnsmallen):
     @classmethod
     def model_name(cls) -> str:
         """Returns name of the model."""
-        return "Node2Vec SkipGram"
\ No newline at end of file
+        return "Node2Vec SkipGram"
+
+    @classmethod
+    def can_fold_in_by_local_sgd(cls) -> bool:
+        return True
\ No newline at end of file
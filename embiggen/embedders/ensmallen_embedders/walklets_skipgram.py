@@ -147,3 +147,7 @@ class WalkletsSkipGramEnsmallen(WalkletsEnsmallen):
     def model_name(cls) -> str:
         """Returns name of the model."""
         return "Walklets SkipGram"
+
+    @classmethod
+    def can_fold_in_by_local_sgd(cls) -> bool:
+        return True
@@ -1,17 +1,85 @@
 """Node2Vec wrapper for FastNode2Vec numba-based node embedding library."""
-from typing import Dict, Union, Any
+from typing import Dict, Optional, Union, Any
 
 import numpy as np
 import pandas as pd
 from ensmallen import Graph
+from scipy.sparse import csr_matrix
 
 from embiggen.utils.abstract_models import AbstractEmbeddingModel, EmbeddingResult
+from embiggen.utils.warm_start import get_warm_start_epochs, get_warm_start_node_ids
 from fastnode2vec import Graph as FNGraph
 from fastnode2vec import Node2Vec
+from gensim.models import Word2Vec
 from multiprocessing import cpu_count
 from time import time
 
 
+def _build_fastnode2vec_graph(graph: Graph) -> FNGraph:
+    """Return the FastNode2Vec graph with the same CSR structure of the provided graph.
+
+    Parameters
+    -------------------------
+    graph: Graph
+        The graph to convert.
+
+    Implementation details
+    -------------------------
+    The FastNode2Vec graph constructor only accepts an iterable of tuples
+    of node names, which it hashes one at a time. Instead, we hand off the
+    CSR arrays of the graph, which are obtained in bulk from the node ids,
+    and name the nodes after their node ids, so that the embedding can be
+    gathered back by node id without looking up the node names.
+    The walk probabilities are the same ones of the FastNode2Vec constructor:
+    the weights of the parallel edges of multigraphs are summed, and the
+    weights of the edges of each node are stored as cumulative probabilities.
+    """
+    number_of_nodes = graph.get_number_of_nodes()
+    edge_node_ids = graph.get_directed_edge_node_ids()
+
+    if graph.has_edge_weights():
+        weights = graph.get_directed_edge_weights().astype(np.float64)
+    else:
+        weights = np.ones(edge_node_ids.shape[0], dtype=np.float64)
+
+    if graph.is_multigraph():
+        adjacency = csr_matrix(
+            (weights, (edge_node_ids[:, 0], edge_node_ids[:, 1])),
+            shape=(number_of_nodes, number_of_nodes)
+        )
+        adjacency.sum_duplicates()
+        indptr, indices, weights = adjacency.indptr, adjacency.indices, adjacency.data
+    else:
+        # The edges of Ensmallen graphs are already sorted by source and destination.
+        indptr = np.concatenate((
+            np.zeros(1, dtype=np.int64),
+            graph.get_cumulative_node_degrees().astype(np.int64)
+        ))
+        indices = edge_node_ids[:, 1].astype(np.int32)
+
+    fn_graph: FNGraph = FNGraph.__new__(FNGraph)
+    fn_graph.weighted = graph.has_edge_weights()
+    fn_graph.indptr = indptr
+    fn_graph.indices = indices
+    fn_graph.node_names = np.arange(number_of_nodes).astype(str)
+
+    if fn_graph.weighted:
+        degrees = np.diff(indptr)
+        row_weights = np.bincount(
+            np.repeat(np.arange(number_of_nodes), degrees),
+            weights=weights,
+            minlength=number_of_nodes
+        )
+        cumulative_weights = np.cumsum(weights / np.repeat(row_weights, degrees))
+        row_offsets = np.concatenate(([0.0], cumulative_weights))[indptr[:-1]]
+        cumulative_weights -= np.repeat(row_offsets, degrees)
+        # The last neighbour of each node must be always reachable.
+        cumulative_weights[indptr[1:][degrees > 0] - 1] = 1.0
+        fn_graph.data = cumulative_weights
+
+    return fn_graph
+
+
 class Node2VecFastNode2Vec(AbstractEmbeddingModel):
     """Node2Vec wrapper for FastNode2Vec numba-based node embedding library."""
 
@@ -114,38 +182,10 @@ class Node2VecFastNode2Vec(AbstractEmbeddingModel):
             raise ValueError("You have not yet run an embedding.")
         return self._time_required_by_last_embedding
 
-    def _fit_transform(
-        self,
-        graph: Graph,
-        return_dataframe: bool = True,
-    ) -> Union[np.ndarray, pd.DataFrame, Dict[str, np.ndarray], Dict[str, pd.DataFrame]]:
-        """Return node embedding"""
-
-        if graph.has_edge_weights():
-            edges_iterator = (
-                (
-                    *graph.get_node_names_from_edge_id(edge_id),
-                    graph.get_edge_weight_from_edge_id(edge_id)
-                )
-                for edge_id in range(graph.get_number_of_directed_edges())
-            )
-        else:
-            edges_iterator = (
-                graph.get_node_names_from_edge_id(edge_id)
-                for edge_id in range(graph.get_number_of_directed_edges())
-            )
-
-        fn_graph: FNGraph = FNGraph(
-            edges_iterator,
-            directed=True,
-            weighted=graph.has_edge_weights(),
-            number_of_edges=graph.get_number_of_directed_edges()
-        )
-
-        start = time()
-
-        model: Node2Vec = Node2Vec(
-            graph=fn_graph,
+    def _build_model(self, graph: Graph) -> Node2Vec:
+        """Returns the FastNode2Vec model for the provided graph."""
+        return Node2Vec(
+            graph=_build_fastnode2vec_graph(graph),
             dim=self._embedding_size,
             walk_length=self._walk_length,
             window=self._window_size,
@@ -156,26 +196,25 @@ class Node2VecFastNode2Vec(AbstractEmbeddingModel):
             seed=self._random_state,
         )
 
-        model.train(
-            epochs=self._epochs * self._iterations,
-            verbose=self._verbose
+    def _get_embedding_result(
+        self,
+        model: Node2Vec,
+        graph: Graph,
+        return_dataframe: bool,
+    ) -> EmbeddingResult:
+        """Returns the node embedding of the trained model."""
+        # The nodes are named after their node ids, so the rows of the
+        # embedding are gathered with a single index. The singleton
+        # nodes, which are never visited by the walks, are zeroed.
+        node_embedding = np.zeros(
+            shape=(graph.get_number_of_nodes(), self._embedding_size),
+            dtype=model.wv.vectors.dtype,
         )
-
-        self._time_required_by_last_embedding = time() - start
-
-        # This library does not provide node embedding
-        # for disconnected nodes, so we need to patch it up
-        # if the graph contains disconnected nodes.
+        node_embedding[
+            np.array(model.wv.index_to_key, dtype=np.int64)
+        ] = model.wv.vectors
         if graph.has_singleton_nodes():
-            node_embedding = np.zeros(
-                shape=(graph.get_number_of_nodes(), self._embedding_size),
-            )
-            for node_id in range(graph.get_number_of_nodes()):
-                node_name = graph.get_node_name_from_node_id(node_id)
-                if node_name in model.wv:
-                    node_embedding[node_id] = model.wv[node_name]
-        else:
-            node_embedding = model.wv[graph.get_node_names()]
+            node_embedding[graph.get_singleton_node_ids()] = 0.0
 
         if return_dataframe:
             node_embedding = pd.DataFrame(
@@ -188,6 +227,82 @@ class Node2VecFastNode2Vec(AbstractEmbeddingModel):
             node_embeddings=node_embedding
         )
 
+    def _fit_transform(
+        self,
+        graph: Graph,
+        return_dataframe: bool = True,
+    ) -> Union[np.ndarray, pd.DataFrame, Dict[str, np.ndarray], Dict[str, pd.DataFrame]]:
+        """Return node embedding"""
+        start = time()
+
+        model = self._build_model(graph)
+
+        model.train(
+            epochs=self._epochs * self._iterations,
+            verbose=self._verbose
+        )
+
+        self._time_required_by_last_embedding = time() - start
+
+        return self._get_embedding_result(model, graph, return_dataframe)
+
+    @classmethod
+    def can_warm_start(cls) -> bool:
+        return True
+
+    def _warm_start_fit_transform(
+        self,
+        graph: Graph,
+        initial_node_embedding: np.ndarray,
+        known_nodes: np.ndarray,
+        epochs: Optional[int],
+        return_dataframe: bool = True,
+    ) -> EmbeddingResult:
+        """Return node embedding warm-started from the provided one.
+
+        Implementation details
+        -------------------------
+        The vectors of the known nodes are initialized from the provided
+        embedding, while the ones of the new nodes keep the random
+        initialization of gensim. The walks start only from the new nodes
+        and from their neighbours, so the cost of the warm start scales with
+        the part of the graph that changed rather than with the whole graph.
+        """
+        start = time()
+
+        model = self._build_model(graph)
+
+        # The rows of the gensim vocabulary are not sorted by node id.
+        vocabulary_node_ids = np.array(model.wv.index_to_key, dtype=np.int64)
+        known_rows = known_nodes[vocabulary_node_ids]
+        model.wv.vectors[known_rows] = initial_node_embedding[
+            vocabulary_node_ids[known_rows]
+        ]
+
+        source_node_ids = get_warm_start_node_ids(graph, known_nodes)
+        epochs = get_warm_start_epochs(self._epochs, epochs) * self._iterations
+
+        def gen_nodes():
+            """Yields the dummy walks of the source nodes, as FastNode2Vec."""
+            random_state = np.random.RandomState(self._random_state)
+            for _ in range(epochs):
+                for node_id in random_state.permutation(source_node_ids):
+                    yield [node_id] * self._walk_length
+
+        if source_node_ids.size > 0:
+            # We call the gensim training directly, as the FastNode2Vec one
+            # always starts the walks from all of the nodes of the graph.
+            Word2Vec.train(
+                model,
+                gen_nodes(),
+                total_examples=epochs * source_node_ids.size,
+                epochs=1,
+            )
+
+        self._time_required_by_last_embedding = time() - start
+
+        return self._get_embedding_result(model, graph, return_dataframe)
+
     @classmethod
     def requires_nodes_sorted_by_decreasing_node_degree(cls) -> bool:
         return False
@@ -218,3 +333,7 @@ class Node2VecFastNode2Vec(AbstractEmbeddingModel):
     def is_stocastic(cls) -> bool:
         """Returns whether the model is stocastic and has therefore a random state."""
         return True
+
+    @classmethod
+    def can_fold_in_by_local_sgd(cls) -> bool:
+        return True
@@ -21,7 +21,10 @@ class BoxEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
         verbose: bool = False,
         random_state: int = 42,
         ring_bell: bool = False,
-        enable_cache: bool = False
+        enable_cache: bool = False,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_frequency_minutes: int = 0,
+        checkpoint_retention: int = 1
     ):
         """Create new PyKEEN BoxE model.
 
@@ -65,6 +68,17 @@ class BoxEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        checkpoint_directory: Optional[str] = None
+            Directory where to store the checkpoints of the training.
+            The checkpoints are stored in a sub-directory keyed by the hash of
+            the model parameters and of the graph, and the training resumes
+            from the latest of them. By default, no checkpoint is stored.
+        checkpoint_frequency_minutes: int = 0
+            Number of minutes between the checkpoints, as in PyKEEN.
+            With zero, a checkpoint is stored after every epoch.
+        checkpoint_retention: int = 1
+            Number of the latest checkpoints to keep, which can only
+            be one, as PyKEEN overwrites its checkpoint.
         """
         self._tanh_map=tanh_map
         self._p=p
@@ -77,7 +91,10 @@ class BoxEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
             verbose=verbose,
             random_state=random_state,
             ring_bell=ring_bell,
-            enable_cache=enable_cache
+            enable_cache=enable_cache,
+            checkpoint_directory=checkpoint_directory,
+            checkpoint_frequency_minutes=checkpoint_frequency_minutes,
+            checkpoint_retention=checkpoint_retention
         )
 
     def parameters(self) -> Dict[str, Any]:
@@ -19,7 +19,10 @@ class CrossEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
         verbose: bool = False,
         random_state: int = 42,
         ring_bell: bool = False,
-        enable_cache: bool = False
+        enable_cache: bool = False,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_frequency_minutes: int = 0,
+        checkpoint_retention: int = 1
     ):
         """Create new PyKEEN CrossE model.
 
@@ -57,6 +60,17 @@ class CrossEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        checkpoint_directory: Optional[str] = None
+            Directory where to store the checkpoints of the training.
+            The checkpoints are stored in a sub-directory keyed by the hash of
+            the model parameters and of the graph, and the training resumes
+            from the latest of them. By default, no checkpoint is stored.
+        checkpoint_frequency_minutes: int = 0
+            Number of minutes between the checkpoints, as in PyKEEN.
+            With zero, a checkpoint is stored after every epoch.
+        checkpoint_retention: int = 1
+            Number of the latest checkpoints to keep, which can only
+            be one, as PyKEEN overwrites its checkpoint.
         """
         self._combination_dropout = combination_dropout
         super().__init__(
@@ -67,7 +81,10 @@ class CrossEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
             verbose=verbose,
             random_state=random_state,
             ring_bell=ring_bell,
-            enable_cache=enable_cache
+            enable_cache=enable_cache,
+            checkpoint_directory=checkpoint_directory,
+            checkpoint_frequency_minutes=checkpoint_frequency_minutes,
+            checkpoint_retention=checkpoint_retention
         )
 
     def parameters(self) -> Dict[str, Any]:
@@ -1,5 +1,7 @@
 """Submodule providing wrapper for PyKEEN's TransE model."""
 from typing import Union, Type, List
+import numpy as np
+import torch
 from ensmallen import Graph
 from pykeen.models import ERModel
 from pykeen.nn.representation import Representation
@@ -18,6 +20,53 @@ except ImportError:
 @abstract_class
 class EntityRelationEmbeddingModelPyKEEN(PyKEENEmbedder):
 
+    @classmethod
+    def can_warm_start(cls) -> bool:
+        return True
+
+    def _set_initial_node_embedding(
+        self,
+        model: Union[EntityRelationEmbeddingModel, ERModel],
+        initial_node_embedding: np.ndarray,
+        known_nodes: np.ndarray,
+    ):
+        """Sets the rows of the known nodes of the entity representation.
+
+        Parameters
+        ------------------
+        model: Union[EntityRelationEmbeddingModel, ERModel]
+            The PyKEEN model to initialize.
+        initial_node_embedding: np.ndarray
+            The initial embedding of the nodes, aligned to the node ids.
+        known_nodes: np.ndarray
+            The mask of the nodes whose initial embedding is known.
+        """
+        if isinstance(model, EntityRelationEmbeddingModel):
+            node_embedding = model.entity_embeddings
+        else:
+            node_embedding = model.entity_representations[0]
+
+        embedding = getattr(node_embedding, "_embeddings", None)
+        if (
+            embedding is None
+            or embedding.weight.is_complex()
+            or tuple(embedding.weight.shape) != initial_node_embedding.shape
+        ):
+            raise ValueError(
+                f"The entity representation of the {self.model_name()} model "
+                "is not a real-valued embedding with one row of size "
+                f"{initial_node_embedding.shape[1]} per node, so it cannot be "
+                "initialized from the previous node embedding."
+            )
+
+        with torch.no_grad():
+            known_node_ids = torch.from_numpy(np.flatnonzero(known_nodes)).to(
+                embedding.weight.device
+            )
+            embedding.weight[known_node_ids] = torch.from_numpy(
+                initial_node_embedding[known_nodes]
+            ).to(embedding.weight)
+
     def _extract_embeddings(
         self,
         graph: Graph,
@@ -1,5 +1,5 @@
 """Abstract Torch/PyKEEN Model wrapper for embedding models."""
-from typing import Dict, Union, Tuple, Any, Type
+from typing import Dict, Union, Tuple, Any, Type, Optional
 
 import numpy as np
 import pandas as pd
@@ -10,6 +10,7 @@ from inspect import getfullargspec
 from embiggen.utils.pytorch_utils import validate_torch_device
 from embiggen.utils.abstract_models import AbstractEmbeddingModel, abstract_class, EmbeddingResult
 from embiggen.utils.abstract_models import format_list
+from embiggen.utils.warm_start import get_warm_start_epochs
 import torch
 from pykeen.models import Model
 from pykeen.triples import CoreTriplesFactory
@@ -36,7 +37,10 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
         verbose: bool = False,
         random_state: int = 42,
         ring_bell: bool = False,
-        enable_cache: bool = False
+        enable_cache: bool = False,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_frequency_minutes: int = 0,
+        checkpoint_retention: int = 1
     ):
         """Create new PyKEEN Abstract Embedder model.
         
@@ -66,7 +70,29 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        checkpoint_directory: Optional[str] = None
+            Directory where to store the checkpoints of the training.
+            The checkpoints are stored in a sub-directory keyed by the hash of
+            the model parameters and of the graph, and the training resumes
+            from the latest of them. By default, no checkpoint is stored.
+        checkpoint_frequency_minutes: int = 0
+            Number of minutes between the checkpoints, as in PyKEEN.
+            With zero, a checkpoint is stored after every epoch.
+        checkpoint_retention: int = 1
+            Number of the latest checkpoints to keep, which can only
+            be one, as PyKEEN overwrites its checkpoint.
+
+        Raises
+        -------------------------
+        ValueError
+            If the checkpoint retention is not one.
         """
+        if checkpoint_retention != 1:
+            raise ValueError(
+                "PyKEEN overwrites its checkpoint, so only the latest one can be kept, "
+                f"but a checkpoint retention of {checkpoint_retention} was provided."
+            )
+
         if isinstance(training_loop, str):
             if training_loop in PyKEENEmbedder.SUPPORTED_TRAINING_LOOPS:
                 training_loop = PyKEENEmbedder.SUPPORTED_TRAINING_LOOPS[training_loop]
@@ -96,6 +122,9 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
         super().__init__(
             embedding_size=embedding_size,
             enable_cache=enable_cache,
+            checkpoint_directory=checkpoint_directory,
+            checkpoint_frequency=checkpoint_frequency_minutes,
+            checkpoint_retention=checkpoint_retention,
             ring_bell=ring_bell,
             random_state=random_state
         )
@@ -109,8 +138,15 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
         )
 
     def parameters(self) -> Dict[str, Any]:
+        parameters = super().parameters()
+        # The frequency of the PyKEEN checkpoints is in minutes
+        # rather than in epochs, so it has its own name.
+        if "checkpoint_frequency" in parameters:
+            parameters["checkpoint_frequency_minutes"] = parameters.pop(
+                "checkpoint_frequency"
+            )
         return dict(
-            **super().parameters(),
+            **parameters,
             **dict(
                 epochs=self._epochs,
                 batch_size=self._batch_size,
@@ -177,12 +213,71 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
         """Returns whether the class is expected to create inverse triples."""
         return False
 
+    def _set_initial_node_embedding(
+        self,
+        model: Model,
+        initial_node_embedding: np.ndarray,
+        known_nodes: np.ndarray,
+    ):
+        """Sets the rows of the known nodes of the entity representation.
+
+        Parameters
+        ------------------
+        model: Model
+            The PyKEEN model to initialize.
+        initial_node_embedding: np.ndarray
+            The initial embedding of the nodes, aligned to the node ids.
+        known_nodes: np.ndarray
+            The mask of the nodes whose initial embedding is known.
+        """
+        raise NotImplementedError(
+            f"In the child class {self.__class__.__name__} of {super().__class__.__name__} "
+            f"implementing the model {self.model_name()} we could not find the method "
+            "called `_set_initial_node_embedding`. Please do implement it."
+        )
+
+    def _warm_start_fit_transform(
+        self,
+        graph: Graph,
+        initial_node_embedding: np.ndarray,
+        known_nodes: np.ndarray,
+        epochs: Optional[int],
+        return_dataframe: bool = True,
+    ) -> EmbeddingResult:
+        """Return node embedding warm-started from the provided one."""
+        return self._fit_transform(
+            graph,
+            return_dataframe=return_dataframe,
+            initial_node_embedding=initial_node_embedding,
+            known_nodes=known_nodes,
+            epochs=get_warm_start_epochs(self._epochs, epochs),
+        )
+
     def _fit_transform(
         self,
         graph: Graph,
         return_dataframe: bool = True,
+        initial_node_embedding: Optional[np.ndarray] = None,
+        known_nodes: Optional[np.ndarray] = None,
+        epochs: Optional[int] = None,
     ) -> Union[np.ndarray, pd.DataFrame, Dict[str, np.ndarray], Dict[str, pd.DataFrame]]:
-        """Return node embedding"""
+        """Return node embedding
+
+        Parameters
+        ------------------
+        graph: Graph
+            The graph to embed.
+        return_dataframe: bool = True
+            Whether to return a dataframe of a numpy array.
+        initial_node_embedding: Optional[np.ndarray] = None
+            The initial embedding of the nodes when warm-starting the model.
+        known_nodes: Optional[np.ndarray] = None
+            The mask of the nodes whose initial embedding is known.
+        epochs: Optional[int] = None
+            The number of epochs to train for. By default, the ones of the model.
+        """
+        if epochs is None:
+            epochs = self._epochs
 
         torch_device = torch.device(self._device)
 
@@ -221,14 +316,35 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
         # Move the model to gpu if we need to
         model.to(torch_device)
 
+        if initial_node_embedding is not None:
+            self._set_initial_node_embedding(
+                model,
+                initial_node_embedding,
+                known_nodes
+            )
+
         training_loop = SLCWATrainingLoop(
             model=model,
             triples_factory=triples_factory,
         )
 
+        checkpoint_path = self._get_checkpoint_path(graph)
+        checkpoint_kwargs = dict()
+        # The warm starts are short and never resumed from checkpoints.
+        if checkpoint_path is not None and initial_node_embedding is None:
+            # PyKEEN stores the model, the optimizer, the epoch and the
+            # random states in the checkpoint, and resumes from it when
+            # the training is started again with the same checkpoint.
+            checkpoint_kwargs = dict(
+                checkpoint_directory=checkpoint_path,
+                checkpoint_name="checkpoint.pt",
+                checkpoint_frequency=self._checkpoint_frequency,
+                checkpoint_on_failure=True,
+            )
+
         training_loop.train(
             triples_factory=triples_factory,
-            num_epochs=self._epochs,
+            num_epochs=epochs,
             batch_size=batch_size,
             use_tqdm=self._verbose,
             use_tqdm_batch=self._verbose,
@@ -236,7 +352,8 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
                 disable=not self._verbose,
                 dynamic_ncols=True,
                 leave=False
-            )
+            ),
+            **checkpoint_kwargs
         )
 
         # Extract and return the embedding
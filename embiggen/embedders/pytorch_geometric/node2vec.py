@@ -1,8 +1,10 @@
 """Abstract class for graph embedding models."""
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from embiggen.embedders.pytorch_geometric.pytorch_geometric_embedder import PyTorchGeometricEmbedder
+import numpy as np
 from torch_geometric.nn import Node2Vec
+from torch.utils.data import DataLoader
 from torch import Tensor
 from torch.nn import Module
 from torch.optim import Optimizer
@@ -29,7 +31,10 @@ class Node2VecPyTorchGeometric(PyTorchGeometricEmbedder):
         optimizer: str = "adam",
         verbose: bool = False,
         ring_bell: bool = False,
-        enable_cache: bool = False
+        enable_cache: bool = False,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_frequency: int = 1,
+        checkpoint_retention: int = 1
     ):
         """Create new PyTorch Geometric Node2Vec model.
 
@@ -56,7 +61,10 @@ class Node2VecPyTorchGeometric(PyTorchGeometricEmbedder):
             optimizer=optimizer,
             verbose=verbose,
             ring_bell=ring_bell,
-            enable_cache=enable_cache
+            enable_cache=enable_cache,
+            checkpoint_directory=checkpoint_directory,
+            checkpoint_frequency=checkpoint_frequency,
+            checkpoint_retention=checkpoint_retention
         )
 
     def _build_model(
@@ -84,6 +92,25 @@ class Node2VecPyTorchGeometric(PyTorchGeometricEmbedder):
 
         return model
 
+    def _focus_training_on_nodes(self, model: Module, node_ids: np.ndarray):
+        """Restricts the walks to the ones starting from the provided nodes.
+
+        Parameters
+        ------------------
+        model: Module
+            The model to be trained.
+        node_ids: np.ndarray
+            The ids of the nodes to start the walks from.
+        """
+        # Same loader of `Node2Vec.loader`, on a subset of the nodes.
+        self._loader = DataLoader(
+            node_ids.tolist(),
+            collate_fn=model.sample,
+            batch_size=self._batch_size,
+            shuffle=True,
+            num_workers=self._number_of_workers
+        )
+
     @classmethod
     def model_name(cls) -> str:
         """Returns name of the model"""
@@ -140,3 +167,7 @@ class Node2VecPyTorchGeometric(PyTorchGeometricEmbedder):
             loss = model.loss(pos_rw.to(device), neg_rw.to(device))
             loss.backward()
             optimizer.step()
+
+    @classmethod
+    def can_fold_in_by_local_sgd(cls) -> bool:
+        return True
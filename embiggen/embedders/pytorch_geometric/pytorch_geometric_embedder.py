@@ -1,12 +1,20 @@
 """Abstract Torch/PyTorch Geometric Model wrapper for embedding models."""
-from typing import Dict, Union, Any, Type
+import os
+import random
+from typing import Dict, Union, Any, Type, Optional
 
 import numpy as np
 import pandas as pd
 from ensmallen import Graph
 
 from embiggen.utils.pytorch_utils import validate_torch_device
+from embiggen.utils.checkpoints import (
+    get_epoch_checkpoint_file_name,
+    get_epoch_checkpoints,
+    remove_old_epoch_checkpoints,
+)
 from embiggen.utils.abstract_models import AbstractEmbeddingModel, abstract_class, EmbeddingResult
+from embiggen.utils.warm_start import get_warm_start_epochs, get_warm_start_node_ids
 import torch
 
 from tqdm.auto import trange
@@ -23,6 +31,8 @@ from torch import DeviceObjType
 class PyTorchGeometricEmbedder(AbstractEmbeddingModel):
     """Abstract PyTorch Geometric Model wrapper for embedding models."""
 
+    CHECKPOINT_EXTENSION = ".pt"
+
     def __init__(
         self,
         embedding_size: int = 100,
@@ -35,7 +45,10 @@ class PyTorchGeometricEmbedder(AbstractEmbeddingModel):
         random_state: int = 42,
         optimizer: str = "adam",
         ring_bell: bool = False,
-        enable_cache: bool = False
+        enable_cache: bool = False,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_frequency: int = 1,
+        checkpoint_retention: int = 1
     ):
         """Create new PyTorch Geometric Abstract Embedder model.
         
@@ -61,6 +74,15 @@ class PyTorchGeometricEmbedder(AbstractEmbeddingModel):
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        checkpoint_directory: Optional[str] = None
+            Directory where to store the checkpoints of the training.
+            The checkpoints are stored in a sub-directory keyed by the hash of
+            the model parameters and of the graph, and the training resumes
+            from the latest of them. By default, no checkpoint is stored.
+        checkpoint_frequency: int = 1
+            Number of epochs between the checkpoints.
+        checkpoint_retention: int = 1
+            Number of the latest checkpoints to keep.
         """
         self._epochs = epochs
         self._verbose = verbose
@@ -75,6 +97,9 @@ class PyTorchGeometricEmbedder(AbstractEmbeddingModel):
         super().__init__(
             embedding_size=embedding_size,
             enable_cache=enable_cache,
+            checkpoint_directory=checkpoint_directory,
+            checkpoint_frequency=checkpoint_frequency,
+            checkpoint_retention=checkpoint_retention,
             ring_bell=ring_bell,
             random_state=random_state
         )
@@ -147,12 +172,63 @@ class PyTorchGeometricEmbedder(AbstractEmbeddingModel):
             "called `_train_model_step`. Please do implement it."
         )
 
+    def _focus_training_on_nodes(self, model: Module, node_ids: np.ndarray):
+        """Restricts the training samples to the provided nodes, where supported.
+
+        Parameters
+        ------------------
+        model: Module
+            The model to be trained.
+        node_ids: np.ndarray
+            The ids of the nodes to focus the training on.
+        """
+
+    @classmethod
+    def can_warm_start(cls) -> bool:
+        return True
+
+    def _warm_start_fit_transform(
+        self,
+        graph: Graph,
+        initial_node_embedding: np.ndarray,
+        known_nodes: np.ndarray,
+        epochs: Optional[int],
+        return_dataframe: bool = True,
+    ) -> EmbeddingResult:
+        """Return node embedding warm-started from the provided one."""
+        return self._fit_transform(
+            graph,
+            return_dataframe=return_dataframe,
+            initial_node_embedding=initial_node_embedding,
+            known_nodes=known_nodes,
+            epochs=get_warm_start_epochs(self._epochs, epochs),
+        )
+
     def _fit_transform(
         self,
         graph: Graph,
         return_dataframe: bool = True,
+        initial_node_embedding: Optional[np.ndarray] = None,
+        known_nodes: Optional[np.ndarray] = None,
+        epochs: Optional[int] = None,
     ) -> Union[np.ndarray, pd.DataFrame, Dict[str, np.ndarray], Dict[str, pd.DataFrame]]:
-        """Return node embedding"""
+        """Return node embedding
+
+        Parameters
+        ------------------
+        graph: Graph
+            The graph to embed.
+        return_dataframe: bool = True
+            Whether to return a dataframe of a numpy array.
+        initial_node_embedding: Optional[np.ndarray] = None
+            The initial embedding of the nodes when warm-starting the model.
+        known_nodes: Optional[np.ndarray] = None
+            The mask of the nodes whose initial embedding is known.
+        epochs: Optional[int] = None
+            The number of epochs to train for. By default, the ones of the model.
+        """
+        if epochs is None:
+            epochs = self._epochs
 
         torch_device = torch.device(self._device)
 
@@ -173,14 +249,55 @@ class PyTorchGeometricEmbedder(AbstractEmbeddingModel):
                 f"in the library {self.library_name()} did not return a "
                 f"PyTorch Geometric model but an object of type {type(model)}."
             )
-        
+
+        if initial_node_embedding is not None:
+            with torch.no_grad():
+                known_node_ids = torch.from_numpy(np.flatnonzero(known_nodes)).to(torch_device)
+                model.embedding.weight[known_node_ids] = torch.from_numpy(
+                    initial_node_embedding[known_nodes]
+                ).to(torch_device)
+            self._focus_training_on_nodes(
+                model,
+                get_warm_start_node_ids(graph, known_nodes)
+            )
+
         optimizer = torch.optim.Adam(
             list(model.parameters()),
             lr=self._learning_rate
         )
 
-        for _ in trange(
-            self._epochs,
+        # The warm starts are short and never resumed from checkpoints.
+        checkpoint_path = (
+            self._get_checkpoint_path(graph)
+            if initial_node_embedding is None
+            else None
+        )
+        initial_epoch = 0
+
+        if checkpoint_path is not None:
+            checkpoint_epochs = get_epoch_checkpoints(checkpoint_path, self.CHECKPOINT_EXTENSION)
+            if checkpoint_epochs:
+                checkpoint = torch.load(
+                    os.path.join(
+                        checkpoint_path,
+                        get_epoch_checkpoint_file_name(
+                            checkpoint_epochs[-1],
+                            self.CHECKPOINT_EXTENSION
+                        )
+                    ),
+                    map_location=torch_device,
+                    weights_only=False,
+                )
+                model.load_state_dict(checkpoint["model"])
+                optimizer.load_state_dict(checkpoint["optimizer"])
+                torch.set_rng_state(checkpoint["torch_random_state"])
+                np.random.set_state(checkpoint["numpy_random_state"])
+                random.setstate(checkpoint["python_random_state"])
+                initial_epoch = min(checkpoint["epoch"], epochs)
+
+        for epoch in trange(
+            initial_epoch,
+            epochs,
             dynamic_ncols=True,
             desc="Epochs",
             disable=not self._verbose,
@@ -191,6 +308,36 @@ class PyTorchGeometricEmbedder(AbstractEmbeddingModel):
                 optimizer=optimizer,
                 device=torch_device
             )
+            if checkpoint_path is not None and (
+                (epoch + 1) % max(self._checkpoint_frequency, 1) == 0
+                or epoch + 1 == epochs
+            ):
+                # The checkpoint is first written to a temporary file, so that
+                # a job interrupted while writing it does not corrupt it.
+                path = os.path.join(
+                    checkpoint_path,
+                    get_epoch_checkpoint_file_name(
+                        epoch + 1,
+                        self.CHECKPOINT_EXTENSION
+                    )
+                )
+                torch.save(
+                    dict(
+                        model=model.state_dict(),
+                        optimizer=optimizer.state_dict(),
+                        epoch=epoch + 1,
+                        torch_random_state=torch.get_rng_state(),
+                        numpy_random_state=np.random.get_state(),
+                        python_random_state=random.getstate(),
+                    ),
+                    f"{path}.tmp"
+                )
+                os.replace(f"{path}.tmp", path)
+                remove_old_epoch_checkpoints(
+                    checkpoint_path,
+                    self.CHECKPOINT_EXTENSION,
+                    self._checkpoint_retention
+                )
 
         # Extract and return the embedding
         node_embedding = model(torch.arange(
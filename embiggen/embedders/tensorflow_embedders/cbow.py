@@ -8,6 +8,7 @@ from tensorflow.keras.models import Model  # pylint: disable=import-error,no-nam
 
 from embiggen.embedders.tensorflow_embedders.node2vec import Node2Vec
 from embiggen.layers.tensorflow import SampledSoftmax
+from embiggen.utils.tensorflow_optimizers import get_tensorflow_optimizer
 
 
 class CBOWTensorFlow(Node2Vec):
@@ -38,7 +39,7 @@ class CBOWTensorFlow(Node2Vec):
             input_dim=graph.get_number_of_nodes(),
             output_dim=self._embedding_size,
             input_length=self._window_size*2,
-            name="node_embedding",
+            name=self.NODE_EMBEDDING,
         )(contextual_terms))
 
         # Adding layer that also executes the loss function
@@ -46,6 +47,7 @@ class CBOWTensorFlow(Node2Vec):
             vocabulary_size=graph.get_number_of_nodes(),
             embedding_size=self._embedding_size,
             number_of_negative_samples=self._number_of_negative_samples,
+            **self._get_negative_sampler_kwargs(graph),
         )((average_context_embedding, central_terms))
 
         # Creating the actual model
@@ -55,6 +57,6 @@ class CBOWTensorFlow(Node2Vec):
             name=self.model_name().replace(" ", "")
         )
 
-        model.compile(optimizer=self._optimizer)
+        model.compile(optimizer=get_tensorflow_optimizer(self._optimizer))
 
         return model
@@ -11,6 +11,7 @@ from tensorflow.keras.models import Model
 from embiggen.utils.abstract_models import abstract_class
 from embiggen.sequences.tensorflow_sequences import EdgePredictionTrainingSequence
 from embiggen.embedders.tensorflow_embedders.tensorflow_embedder import TensorFlowEmbedder
+from embiggen.utils.tensorflow_optimizers import get_tensorflow_optimizer
 
 
 @abstract_class
@@ -28,12 +29,16 @@ class EdgePredictionBasedTensorFlowEmbedders(TensorFlowEmbedder):
         learning_rate_plateau_min_delta: float = 0.001,
         learning_rate_plateau_patience: int = 5,
         use_mirrored_strategy: bool = False,
+        number_of_cpu_workers: int = 1,
         activation: str = "sigmoid",
         loss: str = "binary_crossentropy",
         optimizer: str = "adam",
         verbose: bool = False,
         ring_bell: bool = False,
         enable_cache: bool = False,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_frequency: int = 1,
+        checkpoint_retention: int = 1,
         random_state: int = 42
     ):
         """Create new Edge-predicton based model.
@@ -66,6 +71,13 @@ class EdgePredictionBasedTensorFlowEmbedders(TensorFlowEmbedder):
             performance without decreasing the learning rate.
         use_mirrored_strategy: bool = False
             Whether to use mirrored strategy.
+        number_of_cpu_workers: int = 1
+            Number of worker processes to train the model on, in a data-parallel
+            fashion. Each worker trains its own copy of the model on separate
+            batches with its share of the cores, and the parameters of the
+            workers are averaged at the end of every epoch. This is meant for
+            machines without GPUs, where a single process does not use all
+            of the available cores. By default, a single process is used.
         activation: str = "sigmoid"
             The activation to be used.
             For LINE models, this is the Sigmoid, while
@@ -76,6 +88,9 @@ class EdgePredictionBasedTensorFlowEmbedders(TensorFlowEmbedder):
             while for the HOPE models this is an Mean squared error.
         optimizer: str = "nadam"
             The optimizer to be used during the training of the model.
+            The names `sgd` and `adagrad` refer to the Keras optimizers, which
+            only update the rows of the embedding tables gathered in the batch,
+            as does `lazy_adam`, while the other Adam variants update all rows.
         verbose: bool = False
             Whether to show the loading bar while training the model.
         ring_bell: bool = False,
@@ -83,6 +98,15 @@ class EdgePredictionBasedTensorFlowEmbedders(TensorFlowEmbedder):
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        checkpoint_directory: Optional[str] = None
+            Directory where to store the checkpoints of the training.
+            The checkpoints are stored in a sub-directory keyed by the hash of
+            the model parameters and of the graph, and the training resumes
+            from the latest of them. By default, no checkpoint is stored.
+        checkpoint_frequency: int = 1
+            Number of epochs between the checkpoints.
+        checkpoint_retention: int = 1
+            Number of the latest checkpoints to keep.
         random_state: Optional[int] = None
             The random state to use if the model is stocastic.
         """
@@ -101,7 +125,11 @@ class EdgePredictionBasedTensorFlowEmbedders(TensorFlowEmbedder):
             optimizer=optimizer,
             verbose=verbose,
             use_mirrored_strategy=use_mirrored_strategy,
+            number_of_cpu_workers=number_of_cpu_workers,
             enable_cache=enable_cache,
+            checkpoint_directory=checkpoint_directory,
+            checkpoint_frequency=checkpoint_frequency,
+            checkpoint_retention=checkpoint_retention,
             ring_bell=ring_bell,
             random_state=random_state
         )
@@ -164,7 +192,7 @@ class EdgePredictionBasedTensorFlowEmbedders(TensorFlowEmbedder):
         )
 
         model.compile(
-            optimizer=self._optimizer,
+            optimizer=get_tensorflow_optimizer(self._optimizer),
             loss=self._loss,
         )
 
@@ -200,6 +228,7 @@ class EdgePredictionBasedTensorFlowEmbedders(TensorFlowEmbedder):
     def _build_input(
         self,
         graph: Graph,
+        number_of_skipped_batches: int = 0,
     ) -> Tuple[np.ndarray]:
         """Returns values to be fed as input into the model.
 
@@ -207,6 +236,9 @@ class EdgePredictionBasedTensorFlowEmbedders(TensorFlowEmbedder):
         ------------------
         graph: Graph
             The graph to build the model for.
+        number_of_skipped_batches: int = 0
+            Ignored, as the Keras sequences restart from their
+            first batch at every epoch.
         """
         return (self._build_sequence(graph), )
 
@@ -15,6 +15,8 @@ from embiggen.embedders.tensorflow_embedders.edge_prediction_based_tensorflow_em
 class FirstOrderLINETensorFlow(EdgePredictionBasedTensorFlowEmbedders):
     """First order LINE TensorFlow model."""
 
+    NODE_EMBEDDING = "node_embeddings"
+
     def _build_edge_prediction_based_model(
         self,
         graph: Graph,
@@ -34,7 +36,7 @@ class FirstOrderLINETensorFlow(EdgePredictionBasedTensorFlowEmbedders):
             input_dim=graph.get_number_of_nodes(),
             output_dim=self._embedding_size,
             input_length=1,
-            name="node_embeddings"
+            name=self.NODE_EMBEDDING
         )
         return Activation(self._activation)(Dot(axes=-1)([
             Flatten()(node_embedding(sources)),
@@ -64,7 +66,7 @@ class FirstOrderLINETensorFlow(EdgePredictionBasedTensorFlowEmbedders):
             Whether to return a dataframe of a numpy array.
         """
         node_embeddings = self.get_layer_weights(
-            "node_embeddings",
+            self.NODE_EMBEDDING,
             model,
         )
         if return_dataframe:
@@ -76,4 +78,8 @@ class FirstOrderLINETensorFlow(EdgePredictionBasedTensorFlowEmbedders):
         return EmbeddingResult(
             embedding_method_name=self.model_name(),
             node_embeddings=node_embeddings
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def can_fold_in_by_local_sgd(cls) -> bool:
+        return True
\ No newline at end of file
@@ -4,7 +4,7 @@ from typing import Dict, Union, Optional, Tuple, Any
 import numpy as np
 import pandas as pd
 from ensmallen import Graph
-import tensorflow as tf
+from userinput.utils import must_be_in_set
 from tensorflow.keras import Model
 from embiggen.sequences.tensorflow_sequences import Node2VecSequence
 from embiggen.embedders.tensorflow_embedders.abstract_random_walked_based_embedder_model import AbstractRandomWalkBasedEmbedderModel
@@ -15,9 +15,13 @@ from embiggen.utils.abstract_models import abstract_class, EmbeddingResult
 class Node2Vec(AbstractRandomWalkBasedEmbedderModel):
     """Abstract class for sequence embedding models."""
 
+    NEGATIVE_SAMPLERS = ("log_uniform", "unigram")
+    NODE_EMBEDDING = "node_embedding"
+
     def __init__(
         self,
         number_of_negative_samples: int = 10,
+        negative_sampler: str = "log_uniform",
         batch_size: int = 128,
         embedding_size: int = 100,
         epochs: int = 10,
@@ -38,8 +42,12 @@ class Node2Vec(AbstractRandomWalkBasedEmbedderModel):
         optimizer: str = "nadam",
         verbose: bool = False,
         use_mirrored_strategy: bool = False,
+        number_of_cpu_workers: int = 1,
         ring_bell: bool = False,
-        enable_cache: bool = False
+        enable_cache: bool = False,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_frequency: int = 1,
+        checkpoint_retention: int = 1
     ):
         """Create new abstract Node2Vec model.
 
@@ -48,6 +56,13 @@ class Node2Vec(AbstractRandomWalkBasedEmbedderModel):
         number_of_negative_samples: int = 10
             The number of negative classes to randomly sample per batch.
             This single sample of negative classes is evaluated for each element in the batch.
+        negative_sampler: str = "log_uniform"
+            The distribution the negative classes are sampled from.
+            With `log_uniform`, the default log-uniform sampler of TensorFlow
+            is used, which requires the nodes to be sorted by decreasing
+            node degree. With `unigram`, the nodes are sampled with an alias
+            table from their node degrees raised to 0.75, so the graph
+            does not need to be sorted, and each draw requires constant time.
         batch_size: int = 128
             The number of nodes to consider for each walk.
         embedding_size: int = 100
@@ -106,17 +121,41 @@ class Node2Vec(AbstractRandomWalkBasedEmbedderModel):
             The random state to reproduce the training sequence.
         optimizer: str = "nadam"
             Optimizer to use during the training.
+            The names `sgd` and `adagrad` refer to the Keras optimizers, which
+            only update the rows of the embedding tables gathered in the batch,
+            as does `lazy_adam`, while the other Adam variants update all rows.
         verbose: bool = False
             Whether to show loading bars.
         use_mirrored_strategy: bool = False
             Whether to use mirrored strategy.
+        number_of_cpu_workers: int = 1
+            Number of worker processes to train the model on, in a data-parallel
+            fashion. Each worker trains its own copy of the model on separate
+            batches with its share of the cores, and the parameters of the
+            workers are averaged at the end of every epoch. This is meant for
+            machines without GPUs, where a single process does not use all
+            of the available cores. By default, a single process is used.
         ring_bell: bool = False,
             Whether to play a sound when embedding completes.
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        checkpoint_directory: Optional[str] = None
+            Directory where to store the checkpoints of the training.
+            The checkpoints are stored in a sub-directory keyed by the hash of
+            the model parameters and of the graph, and the training resumes
+            from the latest of them. By default, no checkpoint is stored.
+        checkpoint_frequency: int = 1
+            Number of epochs between the checkpoints.
+        checkpoint_retention: int = 1
+            Number of the latest checkpoints to keep.
         """
         self._number_of_negative_samples = number_of_negative_samples
+        self._negative_sampler = must_be_in_set(
+            negative_sampler,
+            self.NEGATIVE_SAMPLERS,
+            "negative sampler"
+        )
 
         super().__init__(
             window_size=window_size,
@@ -139,8 +178,12 @@ class Node2Vec(AbstractRandomWalkBasedEmbedderModel):
             optimizer=optimizer,
             verbose=verbose,
             use_mirrored_strategy=use_mirrored_strategy,
+            number_of_cpu_workers=number_of_cpu_workers,
             ring_bell=ring_bell,
-            enable_cache=enable_cache
+            enable_cache=enable_cache,
+            checkpoint_directory=checkpoint_directory,
+            checkpoint_frequency=checkpoint_frequency,
+            checkpoint_retention=checkpoint_retention
         )
 
     def parameters(self) -> Dict[str, Any]:
@@ -148,6 +191,7 @@ class Node2Vec(AbstractRandomWalkBasedEmbedderModel):
         return dict(
             **super().parameters(),
             number_of_negative_samples=self._number_of_negative_samples,
+            negative_sampler=self._negative_sampler,
         )
 
     @classmethod
@@ -171,6 +215,7 @@ class Node2Vec(AbstractRandomWalkBasedEmbedderModel):
     def _build_input(
         self,
         graph: Graph,
+        number_of_skipped_batches: int = 0,
     ) -> Tuple[np.ndarray]:
         """Returns values to be fed as input into the model.
 
@@ -178,12 +223,10 @@ class Node2Vec(AbstractRandomWalkBasedEmbedderModel):
         ------------------
         graph: Graph
             The graph to build the model for.
+        number_of_skipped_batches: int = 0
+            The number of leading batches not to produce, as when
+            resuming the training after the completed epochs.
         """
-        try:
-            AUTOTUNE = tf.data.AUTOTUNE
-        except:
-            AUTOTUNE = tf.data.experimental.AUTOTUNE
-
         return (Node2VecSequence(
             graph,
             walk_length=self._walk_length,
@@ -196,13 +239,25 @@ class Node2Vec(AbstractRandomWalkBasedEmbedderModel):
             change_edge_type_weight=self._change_edge_type_weight,
             max_neighbours=self._max_neighbours,
             random_state=self._random_state,
-        ).into_dataset()\
-            .repeat()\
-            .prefetch(AUTOTUNE), )
+        ).into_dataset(
+            number_of_skipped_batches=number_of_skipped_batches
+        ), )
 
-    @classmethod
-    def requires_nodes_sorted_by_decreasing_node_degree(cls) -> bool:
-        return True
+    def _get_negative_sampler_kwargs(self, graph: Graph) -> Dict[str, Any]:
+        """Returns the kwargs of the negative sampling layer.
+
+        Parameters
+        ------------------
+        graph: Graph
+            The graph to build the model for.
+        """
+        if self._negative_sampler == "unigram":
+            return dict(unigram_frequencies=graph.get_node_degrees())
+        return dict()
+
+    def requires_nodes_sorted_by_decreasing_node_degree(self) -> bool:
+        """Returns whether the log-uniform negative sampler is used."""
+        return self._negative_sampler == "log_uniform"
 
     def _extract_embeddings(
         self,
@@ -222,7 +277,7 @@ class Node2Vec(AbstractRandomWalkBasedEmbedderModel):
             Whether to return a dataframe of a numpy array.
         """
         node_embedding = self.get_layer_weights(
-            "node_embedding",
+            self.NODE_EMBEDDING,
             model
         )
         if return_dataframe:
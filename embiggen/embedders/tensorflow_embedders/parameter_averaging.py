@@ -0,0 +1,334 @@
+"""Module providing the CPU data-parallel training of the TensorFlow embedders.
+
+The logical CPU devices of a single TensorFlow process share the same thread
+pools, so splitting the CPU into several of them adds replicas without adding
+cores. The CPU data-parallel training instead runs each worker in its own
+process, with its own TensorFlow runtime restricted to its share of the cores.
+Each worker trains its own copy of the model on a disjoint subset of the
+batches, as the batches are seeded by their index and each worker only
+produces the indices assigned to it. At the end of every epoch, the parameters
+of the workers are averaged through shared memory and loaded back into every
+worker, while the optimizer states are kept local to each worker.
+
+The workers are spawned rather than forked, as the TensorFlow runtime is not
+fork-safe, and the graph is passed to them through TSV files, as Ensmallen
+graphs cannot be pickled. Since the workers are spawned, scripts training
+with multiple CPU workers must guard their entry point with the usual
+`if __name__ == "__main__":`.
+"""
+import math
+import multiprocessing
+import os
+from multiprocessing.connection import wait
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List, Type
+
+import numpy as np
+import tensorflow as tf
+from ensmallen import Graph
+from tensorflow.keras.callbacks import Callback  # pylint: disable=import-error,no-name-in-module
+from tensorflow.keras.models import Model  # pylint: disable=import-error,no-name-in-module
+from tensorflow.keras.utils import Sequence  # pylint: disable=import-error,no-name-in-module
+
+from embiggen.utils.graph_serialization import dump_graph_to_csv
+from embiggen.utils.shared_parameters import SharedParameters
+from embiggen.utils.tensorflow_utils import set_batch_index_shard
+
+
+class ParameterAveraging(Callback):
+    """Keras callback averaging the parameters of the workers at the end of every epoch."""
+
+    def __init__(
+        self,
+        shared_parameters: SharedParameters,
+        worker_number: int,
+        barrier: "multiprocessing.synchronize.Barrier",
+        losses: "multiprocessing.Array",
+        numbers_of_batches: "multiprocessing.Array",
+    ):
+        """Create new ParameterAveraging callback.
+
+        Parameters
+        ------------------
+        shared_parameters: SharedParameters
+            The parameters shared among the workers, with a slot for each of them.
+        worker_number: int
+            The number of this worker, which is also the number of its slot.
+        barrier: Barrier
+            The barrier synchronizing the workers.
+        losses: multiprocessing.Array
+            The losses of the last epoch of each worker.
+        numbers_of_batches: multiprocessing.Array
+            The number of batches trained on by each worker.
+        """
+        super().__init__()
+        self._shared_parameters = shared_parameters
+        self._worker_number = worker_number
+        self._barrier = barrier
+        self._losses = losses
+        self._numbers_of_batches = numbers_of_batches
+        self._number_of_batches = 0
+
+    def on_train_begin(self, logs=None):
+        """Loads the initial parameters, which are the same for every worker."""
+        self.model.set_weights(self._shared_parameters.read(self._worker_number))
+
+    def on_train_batch_end(self, batch: int, logs=None):
+        """Counts the batches trained on by this worker."""
+        self._number_of_batches += 1
+
+    def on_epoch_end(self, epoch: int, logs=None):
+        """Replaces the parameters and the loss of this worker with the average of the workers.
+
+        Implementation details
+        ------------------
+        The workers wait for each other both before reading the slots, so
+        that all of them have been written, and after having read them, so
+        that none is overwritten by the next epoch while still being read.
+        As every worker then sees the same average loss, the early stopping
+        and the learning rate reductions stop and reduce the learning rate
+        of all of the workers at the same epoch.
+        """
+        self._shared_parameters.write(self._worker_number, self.model.get_weights())
+        if logs is not None and "loss" in logs:
+            self._losses[self._worker_number] = logs["loss"]
+        self._numbers_of_batches[self._worker_number] = self._number_of_batches
+        self._barrier.wait()
+        weights = self._shared_parameters.average()
+        loss = float(np.mean(self._losses[:]))
+        self._barrier.wait()
+        self.model.set_weights(weights)
+        if logs is not None and "loss" in logs:
+            logs["loss"] = loss
+
+
+class WorkerSequence(Sequence):
+    """Keras sequence producing the batches of a worker out of those of another sequence."""
+
+    def __init__(self, sequence: Sequence, worker_number: int, number_of_workers: int):
+        """Create new WorkerSequence.
+
+        Parameters
+        ------------------
+        sequence: Sequence
+            The sequence whose batches are split among the workers.
+        worker_number: int
+            The number of this worker.
+        number_of_workers: int
+            The number of workers.
+        """
+        super().__init__()
+        self._sequence = sequence
+        self._worker_number = worker_number
+        self._number_of_workers = number_of_workers
+
+    def __len__(self) -> int:
+        """Returns the number of batches of the worker, which is the same for every worker."""
+        return math.ceil(len(self._sequence) / self._number_of_workers)
+
+    def __getitem__(self, idx: int):
+        """Returns the batch of the wrapped sequence assigned to the worker."""
+        return self._sequence[
+            (self._worker_number + idx * self._number_of_workers) % len(self._sequence)
+        ]
+
+    def on_epoch_end(self):
+        """Forwards the end of the epoch to the wrapped sequence."""
+        self._sequence.on_epoch_end()
+
+
+def _train_worker(
+    embedder_class: Type,
+    parameters: Dict[str, Any],
+    graph_kwargs: Dict[str, Any],
+    worker_number: int,
+    number_of_workers: int,
+    number_of_threads: int,
+    epochs: int,
+    shared_parameters_kwargs: Dict[str, Any],
+    barrier: "multiprocessing.synchronize.Barrier",
+    losses: "multiprocessing.Array",
+    numbers_of_batches: "multiprocessing.Array",
+):
+    """Trains the model of a worker process on its share of the batches.
+
+    Parameters
+    ------------------
+    embedder_class: Type
+        The class of the embedder to train.
+    parameters: Dict[str, Any]
+        The parameters of the embedder of the worker.
+    graph_kwargs: Dict[str, Any]
+        The arguments of `Graph.from_csv` to load the graph.
+    worker_number: int
+        The number of this worker.
+    number_of_workers: int
+        The number of workers.
+    number_of_threads: int
+        The number of threads of the TensorFlow runtime of this worker.
+    epochs: int
+        The number of epochs to train for.
+    shared_parameters_kwargs: Dict[str, Any]
+        The arguments to attach to the shared parameters.
+    barrier: Barrier
+        The barrier synchronizing the workers.
+    losses: multiprocessing.Array
+        The losses of the last epoch of each worker.
+    numbers_of_batches: multiprocessing.Array
+        The number of batches trained on by each worker.
+    """
+    tf.config.threading.set_intra_op_parallelism_threads(number_of_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(number_of_threads)
+    set_batch_index_shard(worker_number, number_of_workers)
+    shared_parameters = SharedParameters(**shared_parameters_kwargs)
+    try:
+        graph = Graph.from_csv(**graph_kwargs)
+        embedder = embedder_class(**parameters)
+        model = embedder._build_model(graph)
+        training_input, steps_per_epoch = embedder._build_training_input(graph)
+        if steps_per_epoch is not None:
+            steps_per_epoch = math.ceil(steps_per_epoch / number_of_workers)
+        # The datasets already only produce the batches of this worker.
+        if not isinstance(training_input[0], tf.data.Dataset):
+            training_input = (
+                WorkerSequence(training_input[0], worker_number, number_of_workers),
+                *training_input[1:]
+            )
+        embedder._fit_model(
+            model,
+            training_input,
+            steps_per_epoch=steps_per_epoch,
+            epochs=epochs,
+            callbacks=(ParameterAveraging(
+                shared_parameters,
+                worker_number=worker_number,
+                barrier=barrier,
+                losses=losses,
+                numbers_of_batches=numbers_of_batches,
+            ),),
+        )
+    except BaseException:
+        # The other workers would otherwise wait forever for this one.
+        barrier.abort()
+        raise
+    finally:
+        shared_parameters.close()
+
+
+def _join_workers(processes: List[multiprocessing.Process], barrier: "multiprocessing.synchronize.Barrier"):
+    """Waits for the workers to complete, stopping all of them as soon as one fails.
+
+    Parameters
+    ------------------
+    processes: List[multiprocessing.Process]
+        The processes of the workers.
+    barrier: Barrier
+        The barrier synchronizing the workers.
+
+    Raises
+    ------------------
+    RuntimeError
+        If any of the workers fails.
+    """
+    running = {process.sentinel: process for process in processes}
+    while running:
+        for sentinel in wait(list(running)):
+            process = running.pop(sentinel)
+            process.join()
+            if process.exitcode != 0:
+                barrier.abort()
+                for other in running.values():
+                    other.terminate()
+                    other.join()
+                raise RuntimeError(
+                    f"The CPU worker {processes.index(process)} of {len(processes)} "
+                    f"exited with code {process.exitcode}: please check its "
+                    "traceback above for the cause of the failure."
+                )
+
+
+def fit_with_parameter_averaging(
+    embedder: "TensorFlowEmbedder",
+    graph: Graph,
+    model: Model,
+    epochs: int,
+    number_of_workers: int,
+) -> int:
+    """Trains the model on worker processes averaging their parameters, and returns the number of batches.
+
+    Parameters
+    ------------------
+    embedder: TensorFlowEmbedder
+        The embedder whose model is trained.
+    graph: Graph
+        The graph to embed.
+    model: Model
+        The model to train, whose parameters are the initial ones of every
+        worker and are set to the average of the workers once they complete.
+    epochs: int
+        The number of epochs to train for.
+    number_of_workers: int
+        The number of worker processes.
+
+    Raises
+    ------------------
+    RuntimeError
+        If any of the workers fails.
+    """
+    context = multiprocessing.get_context("spawn")
+    parameters = dict(
+        embedder.parameters(),
+        number_of_cpu_workers=1,
+        use_mirrored_strategy=False,
+    )
+    number_of_threads = max((os.cpu_count() or 1) // number_of_workers, 1)
+    shared_parameters = SharedParameters.from_arrays(model.get_weights(), number_of_workers)
+    barrier = context.Barrier(number_of_workers)
+    losses = context.Array("d", number_of_workers)
+    numbers_of_batches = context.Array("q", number_of_workers)
+
+    try:
+        with TemporaryDirectory() as directory:
+            graph_kwargs = dump_graph_to_csv(graph, directory)
+            processes = [
+                context.Process(
+                    target=_train_worker,
+                    kwargs=dict(
+                        embedder_class=embedder.__class__,
+                        # Only the first worker shows the loading bars.
+                        parameters=dict(
+                            parameters,
+                            verbose=parameters.get("verbose", False) and worker_number == 0
+                        ),
+                        graph_kwargs=graph_kwargs,
+                        worker_number=worker_number,
+                        number_of_workers=number_of_workers,
+                        number_of_threads=number_of_threads,
+                        epochs=epochs,
+                        shared_parameters_kwargs=shared_parameters.get_attach_kwargs(),
+                        barrier=barrier,
+                        losses=losses,
+                        numbers_of_batches=numbers_of_batches,
+                    ),
+                    daemon=True,
+                )
+                for worker_number in range(number_of_workers)
+            ]
+            # The spawned workers inherit the environment, so that the
+            # Ensmallen batch generators of each of them are also
+            # restricted to their share of the cores.
+            user_rayon_threads = os.environ.get("RAYON_NUM_THREADS")
+            if user_rayon_threads is None:
+                os.environ["RAYON_NUM_THREADS"] = str(number_of_threads)
+            try:
+                for process in processes:
+                    process.start()
+            finally:
+                if user_rayon_threads is None:
+                    del os.environ["RAYON_NUM_THREADS"]
+            _join_workers(processes, barrier)
+        model.set_weights(shared_parameters.average())
+    finally:
+        shared_parameters.unlink()
+
+    return int(sum(numbers_of_batches[:]))
@@ -16,6 +16,8 @@ from embiggen.embedders.tensorflow_embedders.edge_prediction_based_tensorflow_em
 class SecondOrderLINETensorFlow(EdgePredictionBasedTensorFlowEmbedders):
     """Second order LINE TensorFlow model."""
 
+    NODE_EMBEDDING = "node_embeddings"
+
     def _build_edge_prediction_based_model(
         self,
         graph: Graph,
@@ -35,7 +37,7 @@ class SecondOrderLINETensorFlow(EdgePredictionBasedTensorFlowEmbedders):
             input_dim=graph.get_number_of_nodes(),
             output_dim=self._embedding_size,
             input_length=1,
-            name="node_embeddings"
+            name=self.NODE_EMBEDDING
         )
         context_embedding = Embedding(
             input_dim=graph.get_number_of_nodes(),
@@ -71,7 +73,7 @@ class SecondOrderLINETensorFlow(EdgePredictionBasedTensorFlowEmbedders):
             Whether to return a dataframe of a numpy array.
         """
         node_embeddings = self.get_layer_weights(
-            "node_embeddings",
+            self.NODE_EMBEDDING,
             model,
         )
         context_embeddings = self.get_layer_weights(
@@ -92,4 +94,8 @@ class SecondOrderLINETensorFlow(EdgePredictionBasedTensorFlowEmbedders):
         return EmbeddingResult(
             embedding_method_name=self.model_name(),
             node_embeddings=[node_embeddings, context_embeddings]
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def can_fold_in_by_local_sgd(cls) -> bool:
+        return True
\ No newline at end of file
@@ -14,12 +14,15 @@ from embiggen.layers.tensorflow import FlatEmbedding, ElementWiseL2, ElementWise
 from embiggen.utils.abstract_models import abstract_class
 from embiggen.sequences.tensorflow_sequences import SiameseSequence
 from embiggen.embedders.tensorflow_embedders.tensorflow_embedder import TensorFlowEmbedder
+from embiggen.utils.tensorflow_optimizers import get_tensorflow_optimizer
 
 
 @abstract_class
 class Siamese(TensorFlowEmbedder):
     """Siamese network for node-embedding including optionally node types and edge types."""
 
+    NODE_EMBEDDING = "NodeEmbedding"
+
     def __init__(
         self,
         embedding_size: int = 100,
@@ -32,10 +35,14 @@ class Siamese(TensorFlowEmbedder):
         learning_rate_plateau_patience: int = 5,
         use_euclidean_norm: bool = True,
         use_mirrored_strategy: bool = False,
+        number_of_cpu_workers: int = 1,
         optimizer: str = "adam",
         verbose: bool = False,
         ring_bell: bool = False,
         enable_cache: bool = False,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_frequency: int = 1,
+        checkpoint_retention: int = 1,
         random_state: int = 42
     ):
         """Create new sequence Siamese model.
@@ -68,8 +75,18 @@ class Siamese(TensorFlowEmbedder):
             If true, we use the L2 norm, otherwise L1.
         use_mirrored_strategy: bool = False
             Whether to use mirrored strategy.
+        number_of_cpu_workers: int = 1
+            Number of worker processes to train the model on, in a data-parallel
+            fashion. Each worker trains its own copy of the model on separate
+            batches with its share of the cores, and the parameters of the
+            workers are averaged at the end of every epoch. This is meant for
+            machines without GPUs, where a single process does not use all
+            of the available cores. By default, a single process is used.
         optimizer: str = "nadam"
             The optimizer to be used during the training of the model.
+            The names `sgd` and `adagrad` refer to the Keras optimizers, which
+            only update the rows of the embedding tables gathered in the batch,
+            as does `lazy_adam`, while the other Adam variants update all rows.
         verbose: bool = False
             Whether to show loading bars.
         ring_bell: bool = False,
@@ -77,6 +94,15 @@ class Siamese(TensorFlowEmbedder):
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        checkpoint_directory: Optional[str] = None
+            Directory where to store the checkpoints of the training.
+            The checkpoints are stored in a sub-directory keyed by the hash of
+            the model parameters and of the graph, and the training resumes
+            from the latest of them. By default, no checkpoint is stored.
+        checkpoint_frequency: int = 1
+            Number of epochs between the checkpoints.
+        checkpoint_retention: int = 1
+            Number of the latest checkpoints to keep.
         random_state: Optional[int] = None
             The random state to use if the model is stocastic.
         """
@@ -93,7 +119,11 @@ class Siamese(TensorFlowEmbedder):
             optimizer=optimizer,
             verbose=verbose,
             use_mirrored_strategy=use_mirrored_strategy,
+            number_of_cpu_workers=number_of_cpu_workers,
             enable_cache=enable_cache,
+            checkpoint_directory=checkpoint_directory,
+            checkpoint_frequency=checkpoint_frequency,
+            checkpoint_retention=checkpoint_retention,
             ring_bell=ring_bell,
             random_state=random_state
         )
@@ -125,7 +155,7 @@ class Siamese(TensorFlowEmbedder):
             vocabulary_size=graph.get_number_of_nodes(),
             dimension=self._embedding_size,
             input_length=1,
-            name="NodeEmbedding"
+            name=self.NODE_EMBEDDING
         )
 
         # Get the node embedding
@@ -178,7 +208,7 @@ class Siamese(TensorFlowEmbedder):
         )
 
         model.add_loss(loss)
-        model.compile(optimizer=self._optimizer)
+        model.compile(optimizer=get_tensorflow_optimizer(self._optimizer))
 
         return model
 
@@ -225,6 +255,7 @@ class Siamese(TensorFlowEmbedder):
     def _build_input(
         self,
         graph: Graph,
+        number_of_skipped_batches: int = 0,
     ) -> Tuple[np.ndarray]:
         """Returns values to be fed as input into the model.
 
@@ -232,16 +263,18 @@ class Siamese(TensorFlowEmbedder):
         ------------------
         graph: Graph
             The graph to build the model for.
+        number_of_skipped_batches: int = 0
+            The number of leading batches not to produce, as when
+            resuming the training after the completed epochs.
         """
         sequence = SiameseSequence(
             graph=graph,
             batch_size=self._batch_size,
             return_edge_types=self.requires_edge_types()
         )
-        return (
-            sequence.into_dataset()
-            .repeat()
-            .prefetch(tf.data.AUTOTUNE), )
+        return (sequence.into_dataset(
+            number_of_skipped_batches=number_of_skipped_batches
+        ), )
 
     @classmethod
     def requires_nodes_sorted_by_decreasing_node_degree(cls) -> bool:
@@ -8,6 +8,7 @@ from tensorflow.keras.models import Model  # pylint: disable=import-error,no-nam
 
 from embiggen.embedders.tensorflow_embedders.node2vec import Node2Vec
 from embiggen.layers.tensorflow import NoiseContrastiveEstimation
+from embiggen.utils.tensorflow_optimizers import get_tensorflow_optimizer
 
 
 class SkipGramTensorFlow(Node2Vec):
@@ -18,8 +19,6 @@ class SkipGramTensorFlow(Node2Vec):
     during the training process to generate the negatives.
     """
 
-    NODE_EMBEDDING = "node_embedding"
-
     @classmethod
     def model_name(cls) -> str:
         """Returns name of the model."""
@@ -47,6 +46,7 @@ class SkipGramTensorFlow(Node2Vec):
             embedding_size=self._embedding_size,
             number_of_negative_samples=self._number_of_negative_samples,
             positive_samples=self._window_size*2,
+            **self._get_negative_sampler_kwargs(graph),
         )((central_term_embedding, contextual_terms))
 
         # Creating the actual model
@@ -56,6 +56,10 @@ class SkipGramTensorFlow(Node2Vec):
             name=self.model_name().replace(" ", "")
         )
 
-        model.compile(optimizer=self._optimizer)
+        model.compile(optimizer=get_tensorflow_optimizer(self._optimizer))
+
+        return model
 
-        return model
\ No newline at end of file
+    @classmethod
+    def can_fold_in_by_local_sgd(cls) -> bool:
+        return True
\ No newline at end of file
@@ -1,23 +1,101 @@
 """Abstract Keras Model wrapper for embedding models."""
-from typing import Dict, Sequence, Tuple, Any
+from time import time
+from typing import Dict, Sequence, Tuple, Any, Optional
 
 import numpy as np
 import pandas as pd
 import tensorflow as tf
 from ensmallen import Graph
 from tensorflow.keras.callbacks import (  # pylint: disable=import-error,no-name-in-module
-    EarlyStopping, ReduceLROnPlateau)
+    Callback, EarlyStopping, ReduceLROnPlateau)
 from tensorflow.keras.models import \
     Model  # pylint: disable=import-error,no-name-in-module
 
-from embiggen.utils.tensorflow_utils import execute_gpu_checks, get_available_gpus_number, has_gpus
+from embiggen.utils.tensorflow_utils import (
+    execute_gpu_checks,
+    get_available_gpus_number,
+    has_gpus,
+)
+from embiggen.embedders.tensorflow_embedders.parameter_averaging import fit_with_parameter_averaging
 from embiggen.utils.abstract_models import AbstractEmbeddingModel, abstract_class, EmbeddingResult
+from embiggen.utils.warm_start import get_warm_start_epochs
+
+
+class EpochCheckpoint(Callback):
+    """Keras callback storing the model, the optimizer and the epoch in a checkpoint."""
+
+    def __init__(
+        self,
+        checkpoint_path: str,
+        model: Model,
+        epochs: int,
+        checkpoint_frequency: int = 1,
+        checkpoint_retention: int = 1,
+    ):
+        """Create new EpochCheckpoint callback.
+
+        Parameters
+        ------------------
+        checkpoint_path: str
+            The directory of the checkpoints.
+        model: Model
+            The model whose weights and optimizer state are stored.
+        epochs: int
+            The number of epochs of the training.
+        checkpoint_frequency: int = 1
+            Number of epochs between the checkpoints.
+        checkpoint_retention: int = 1
+            Number of the latest checkpoints to keep.
+        """
+        super().__init__()
+        self._epochs = epochs
+        self._checkpoint_frequency = max(checkpoint_frequency, 1)
+        self._completed_epochs = tf.Variable(0, dtype=tf.int64, trainable=False)
+        self._checkpoint = tf.train.Checkpoint(
+            model=model,
+            optimizer=model.optimizer,
+            completed_epochs=self._completed_epochs,
+        )
+        self._manager = tf.train.CheckpointManager(
+            self._checkpoint,
+            checkpoint_path,
+            max_to_keep=checkpoint_retention,
+        )
+
+    def restore(self) -> int:
+        """Restores the latest checkpoint, if any, and returns the number of completed epochs."""
+        if self._manager.latest_checkpoint is None:
+            return 0
+        # The optimizer slots are restored as soon as they are created.
+        self._checkpoint.restore(self._manager.latest_checkpoint)
+        return int(self._completed_epochs.numpy())
+
+    def _save(self, completed_epochs: int):
+        """Stores a checkpoint after the provided number of epochs."""
+        self._completed_epochs.assign(completed_epochs)
+        self._manager.save(checkpoint_number=completed_epochs)
+
+    def on_epoch_end(self, epoch: int, logs=None):
+        """Stores a checkpoint every checkpoint frequency epochs."""
+        if (epoch + 1) % self._checkpoint_frequency == 0:
+            self._save(epoch + 1)
+
+    def on_train_end(self, logs=None):
+        """Stores the final checkpoint, marking the training as completed.
+
+        When the training is stopped early, the checkpoint is marked as
+        completed as well, so that resuming it does not train any further.
+        """
+        self._save(self._epochs)
 
 
 @abstract_class
 class TensorFlowEmbedder(AbstractEmbeddingModel):
     """Abstract Keras Model wrapper for embedding models."""
 
+    # Name of the layer with the node embedding, if the model has one.
+    NODE_EMBEDDING: Optional[str] = None
+
     def __init__(
         self,
         embedding_size: int = 100,
@@ -30,8 +108,12 @@ class TensorFlowEmbedder(AbstractEmbeddingModel):
         optimizer: str = "adam",
         verbose: bool = False,
         use_mirrored_strategy: bool = False,
+        number_of_cpu_workers: int = 1,
         ring_bell: bool = False,
         enable_cache: bool = False,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_frequency: int = 1,
+        checkpoint_retention: int = 1,
         random_state: int = 42
     ):
         """Create new TensorFlowEmbedder object.
@@ -58,15 +140,34 @@ class TensorFlowEmbedder(AbstractEmbeddingModel):
             Batch size to use during the training.
         optimizer: str = "nadam"
             Optimizer to use during the training.
+            The names `sgd` and `adagrad` refer to the Keras optimizers, which
+            only update the rows of the embedding tables gathered in the batch,
+            as does `lazy_adam`, while the other Adam variants update all rows.
         verbose: bool = False
             Whether to show loading bars.
         use_mirrored_strategy: bool = False
             Whether to use mirrored strategy.
+        number_of_cpu_workers: int = 1
+            Number of worker processes to train the model on, in a data-parallel
+            fashion. Each worker trains its own copy of the model on separate
+            batches with its share of the cores, and the parameters of the
+            workers are averaged at the end of every epoch. This is meant for
+            machines without GPUs, where a single process does not use all
+            of the available cores. By default, a single process is used.
         ring_bell: bool = False,
             Whether to play a sound when embedding completes.
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        checkpoint_directory: Optional[str] = None
+            Directory where to store the checkpoints of the training.
+            The checkpoints are stored in a sub-directory keyed by the hash of
+            the model parameters and of the graph, and the training resumes
+            from the latest of them. By default, no checkpoint is stored.
+        checkpoint_frequency: int = 1
+            Number of epochs between the checkpoints.
+        checkpoint_retention: int = 1
+            Number of the latest checkpoints to keep.
         random_state: Optional[int] = None
             The random state to use if the model is stocastic.
         """
@@ -76,7 +177,27 @@ class TensorFlowEmbedder(AbstractEmbeddingModel):
                 "Mirrored strategy was requested, one "
                 "or less GPUs where detected."
             )
+        if not isinstance(number_of_cpu_workers, int) or number_of_cpu_workers < 1:
+            raise ValueError(
+                "The number of CPU workers should be a strictly positive integer, "
+                f"but {number_of_cpu_workers} was provided."
+            )
+        if use_mirrored_strategy and number_of_cpu_workers > 1:
+            raise ValueError(
+                "Both the mirrored strategy over the GPUs and "
+                f"{number_of_cpu_workers} CPU workers were requested, "
+                "but only one of the two data-parallel modes can be used."
+            )
+        if checkpoint_directory is not None and number_of_cpu_workers > 1:
+            raise ValueError(
+                f"Both the checkpoints and {number_of_cpu_workers} CPU workers "
+                "were requested, but the training on multiple CPU workers "
+                "cannot currently be resumed from the checkpoints."
+            )
         self._use_mirrored_strategy = use_mirrored_strategy
+        self._number_of_cpu_workers = number_of_cpu_workers
+        self._time_required_by_last_embedding = None
+        self._training_throughput_of_last_embedding = None
         self._epochs = epochs
         self._batch_size = batch_size
         self._optimizer = optimizer
@@ -88,6 +209,9 @@ class TensorFlowEmbedder(AbstractEmbeddingModel):
         super().__init__(
             embedding_size=embedding_size,
             enable_cache=enable_cache,
+            checkpoint_directory=checkpoint_directory,
+            checkpoint_frequency=checkpoint_frequency,
+            checkpoint_retention=checkpoint_retention,
             ring_bell=ring_bell,
             random_state=random_state,
         )
@@ -105,6 +229,7 @@ class TensorFlowEmbedder(AbstractEmbeddingModel):
             **super().parameters(),
             **dict(
                 use_mirrored_strategy=self._use_mirrored_strategy,
+                number_of_cpu_workers=self._number_of_cpu_workers,
                 epochs=self._epochs,
                 batch_size=self._batch_size,
                 optimizer=self._optimizer,
@@ -134,15 +259,16 @@ class TensorFlowEmbedder(AbstractEmbeddingModel):
             "called `_build_model`. Please do implement it."
         )
 
-    def _build_input(self, graph: Graph) -> Tuple[Any]:
+    def _build_input(self, graph: Graph, number_of_skipped_batches: int = 0) -> Tuple[Any]:
         """Returns values to be fed as input into the model.
 
         Parameters
         ------------------
         graph: Graph
             The graph to build the model for.
-        verbose: bool
-            Whether to show loading bars while building input.
+        number_of_skipped_batches: int = 0
+            The number of leading batches not to produce, as when
+            resuming the training after the completed epochs.
         """
         raise NotImplementedError(
             f"In the child class {self.__class__.__name__} of {super().__class__.__name__} "
@@ -219,17 +345,97 @@ class TensorFlowEmbedder(AbstractEmbeddingModel):
             f"does not have a layer called {layer_name}."
         )
 
+    def get_time_required_by_last_embedding(self) -> float:
+        """Returns the time required by the training of the last embedding."""
+        if self._time_required_by_last_embedding is None:
+            raise ValueError("You have not yet run an embedding.")
+        return self._time_required_by_last_embedding
+
+    def get_training_throughput_of_last_embedding(self) -> float:
+        """Returns the batches per second processed by the training of the last embedding.
+
+        Implementation details
+        ----------------------
+        The batches processed by all of the CPU workers are counted, and the
+        time includes the start of the worker processes, so the throughputs
+        obtained with different numbers of CPU workers can be compared to
+        measure the scaling of the data-parallel training.
+        """
+        if self._training_throughput_of_last_embedding is None:
+            raise ValueError(
+                "You have not yet run an embedding, or the number "
+                "of batches of the last embedding is not known."
+            )
+        return self._training_throughput_of_last_embedding
+
+    @classmethod
+    def can_warm_start(cls) -> bool:
+        return cls.NODE_EMBEDDING is not None
+
+    def _warm_start_fit_transform(
+        self,
+        graph: Graph,
+        initial_node_embedding: np.ndarray,
+        known_nodes: np.ndarray,
+        epochs: Optional[int],
+        return_dataframe: bool = True,
+    ) -> EmbeddingResult:
+        """Return node embedding warm-started from the provided one."""
+        return self._fit_transform(
+            graph,
+            return_dataframe=return_dataframe,
+            initial_node_embedding=initial_node_embedding,
+            known_nodes=known_nodes,
+            epochs=get_warm_start_epochs(self._epochs, epochs),
+        )
+
+    def _set_initial_node_embedding(
+        self,
+        model: Model,
+        initial_node_embedding: np.ndarray,
+        known_nodes: np.ndarray,
+    ):
+        """Sets the rows of the known nodes of the node embedding layer.
+
+        Parameters
+        ------------------
+        model: Model
+            The Keras model to initialize.
+        initial_node_embedding: np.ndarray
+            The initial embedding of the nodes, aligned to the node ids.
+        known_nodes: np.ndarray
+            The mask of the nodes whose initial embedding is known.
+        """
+        layer = model.get_layer(self.NODE_EMBEDDING)
+        weights = layer.get_weights()
+        weights[0][known_nodes] = initial_node_embedding[known_nodes]
+        layer.set_weights(weights)
+
     def _fit_transform(
         self,
         graph: Graph,
         return_dataframe: bool = True,
+        initial_node_embedding: Optional[np.ndarray] = None,
+        known_nodes: Optional[np.ndarray] = None,
+        epochs: Optional[int] = None,
     ) -> EmbeddingResult:
-        """Return node embedding"""
-        try:
-            from tqdm.keras import TqdmCallback
-            traditional_verbose = False
-        except AttributeError:
-            traditional_verbose = True
+        """Return node embedding
+
+        Parameters
+        ------------------
+        graph: Graph
+            The graph to embed.
+        return_dataframe: bool = True
+            Whether to return a dataframe of a numpy array.
+        initial_node_embedding: Optional[np.ndarray] = None
+            The initial embedding of the nodes when warm-starting the model.
+        known_nodes: Optional[np.ndarray] = None
+            The mask of the nodes whose initial embedding is known.
+        epochs: Optional[int] = None
+            The number of epochs to train for. By default, the ones of the model.
+        """
+        if epochs is None:
+            epochs = self._epochs
 
         if has_gpus() and self._use_mirrored_strategy:
             strategy = tf.distribute.experimental.MultiWorkerMirroredStrategy()
@@ -240,9 +446,109 @@ class TensorFlowEmbedder(AbstractEmbeddingModel):
         with strategy.scope():
             model = self._build_model(graph)
 
-        # Get the model input
+        if initial_node_embedding is not None:
+            self._set_initial_node_embedding(
+                model,
+                initial_node_embedding,
+                known_nodes
+            )
+
+        if self._number_of_cpu_workers > 1:
+            start = time()
+            number_of_batches = fit_with_parameter_averaging(
+                self,
+                graph,
+                model,
+                epochs=epochs,
+                number_of_workers=self._number_of_cpu_workers,
+            )
+            self._time_required_by_last_embedding = time() - start
+            self._training_throughput_of_last_embedding = (
+                number_of_batches / self._time_required_by_last_embedding
+            )
+            return self._extract_embeddings(
+                graph,
+                model,
+                return_dataframe=return_dataframe
+            )
+
+        checkpoint_path = self._get_checkpoint_path(graph)
+        initial_epoch = 0
+        checkpoint_callbacks = ()
+
+        # The warm starts are short and never resumed from checkpoints.
+        if checkpoint_path is not None and initial_node_embedding is None:
+            with strategy.scope():
+                checkpoint = EpochCheckpoint(
+                    checkpoint_path,
+                    model=model,
+                    epochs=epochs,
+                    checkpoint_frequency=self._checkpoint_frequency,
+                    checkpoint_retention=self._checkpoint_retention,
+                )
+                initial_epoch = min(checkpoint.restore(), epochs)
+            checkpoint_callbacks = (checkpoint,)
+
+        training_input, steps_per_epoch = self._build_training_input(
+            graph,
+            initial_epoch=initial_epoch
+        )
+
+        start = time()
+
+        history = self._fit_model(
+            model,
+            training_input,
+            steps_per_epoch=steps_per_epoch,
+            epochs=epochs,
+            initial_epoch=initial_epoch,
+            callbacks=checkpoint_callbacks,
+        )
+
+        self._time_required_by_last_embedding = time() - start
+        number_of_steps = history.params.get("steps")
+        self._training_throughput_of_last_embedding = (
+            number_of_steps * len(history.epoch)
+            / self._time_required_by_last_embedding
+            if number_of_steps is not None and history.epoch
+            else None
+        )
+
+        # Extract and return the embedding
+        return self._extract_embeddings(
+            graph,
+            model,
+            return_dataframe=return_dataframe
+        )
+
+    def _build_training_input(
+        self,
+        graph: Graph,
+        initial_epoch: int = 0
+    ) -> Tuple[Tuple[Any], Optional[int]]:
+        """Returns the input of the model and the number of steps per epoch.
+
+        Parameters
+        ------------------
+        graph: Graph
+            The graph to embed.
+        initial_epoch: int = 0
+            The epoch the training starts from, when resuming it.
+
+        Implementation details
+        ------------------
+        The batches of the datasets are seeded by their index, so when
+        resuming the training the datasets start from the first batch of
+        the initial epoch, and the batches of the completed epochs are
+        never sampled.
+        """
+        steps_per_epoch = self._get_steps_per_epoch(graph)
         training_input = self._build_input(
             graph,
+            number_of_skipped_batches=(
+                0 if steps_per_epoch is None
+                else initial_epoch * steps_per_epoch
+            ),
         )
 
         if not isinstance(training_input, tuple):
@@ -250,18 +556,54 @@ class TensorFlowEmbedder(AbstractEmbeddingModel):
                 "The provided input data is not a tuple."
             )
 
-        # Fit the model
-        model.fit(
+        return training_input, steps_per_epoch
+
+    def _fit_model(
+        self,
+        model: Model,
+        training_input: Tuple[Any],
+        steps_per_epoch: Optional[int],
+        epochs: int,
+        initial_epoch: int = 0,
+        callbacks: Sequence[Callback] = (),
+    ) -> tf.keras.callbacks.History:
+        """Fits the model on the provided input and returns its history.
+
+        Parameters
+        ------------------
+        model: Model
+            The model to fit.
+        training_input: Tuple[Any]
+            The input of the model.
+        steps_per_epoch: Optional[int]
+            The number of steps per epoch, if not given by the input.
+        epochs: int
+            The number of epochs to train for.
+        initial_epoch: int = 0
+            The epoch to resume the training from.
+        callbacks: Sequence[Callback] = ()
+            Callbacks to run before the early stopping and the learning
+            rate reductions, which therefore see the losses they log.
+        """
+        try:
+            from tqdm.keras import TqdmCallback
+            traditional_verbose = False
+        except AttributeError:
+            traditional_verbose = True
+
+        return model.fit(
             *training_input,
-            epochs=self._epochs,
+            epochs=epochs,
+            initial_epoch=initial_epoch,
             verbose=traditional_verbose and self._verbose > 0,
             batch_size=(
                 self._batch_size
                 if issubclass(training_input[0].__class__, Sequence)
                 else None
             ),
-            steps_per_epoch=self._get_steps_per_epoch(graph),
+            steps_per_epoch=steps_per_epoch,
             callbacks=[
+                *callbacks,
                 EarlyStopping(
                     monitor="loss",
                     min_delta=self._early_stopping_min_delta,
@@ -280,13 +622,6 @@ class TensorFlowEmbedder(AbstractEmbeddingModel):
             ],
         )
 
-        # Extract and return the embedding
-        return self._extract_embeddings(
-            graph,
-            model,
-            return_dataframe=return_dataframe
-        )
-
     @classmethod
     def is_stocastic(cls) -> bool:
         """Returns whether the model is stocastic and has therefore a random state."""
@@ -2,6 +2,7 @@
 from typing import Tuple, Union, List, Optional
 import pandas as pd
 import numpy as np
+from scipy.sparse import issparse, vstack
 from ensmallen import Graph  # pylint: disable=no-name-in-module
 
 from embiggen.embedding_transformers.graph_transformer import GraphTransformer
@@ -181,10 +182,16 @@ class EdgePredictionTransformer:
             edge_features=negative_edge_features
         )
 
-        edge_embeddings = np.vstack([
-            positive_edge_embedding,
-            negative_edge_embedding
-        ])
+        if issparse(positive_edge_embedding):
+            edge_embeddings = vstack([
+                positive_edge_embedding,
+                negative_edge_embedding
+            ], format="csr")
+        else:
+            edge_embeddings = np.vstack([
+                positive_edge_embedding,
+                negative_edge_embedding
+            ])
 
         edge_labels = np.concatenate([
             np.ones(positive_edge_embedding.shape[0]),
@@ -3,6 +3,7 @@ from typing import List, Optional, Union, Optional
 
 import numpy as np
 import pandas as pd
+from scipy.sparse import hstack, issparse
 from ensmallen import express_measures
 from userinput.utils import must_be_in_set
 
@@ -26,6 +27,10 @@ def get_hadamard_edge_embedding(
     --------------------------
     Numpy array with the Hadamard edge embedding.
     """
+    if issparse(source_node_embedding):
+        return source_node_embedding.multiply(
+            destination_node_embedding
+        ).tocsr()
     return np.multiply(
         source_node_embedding,
         destination_node_embedding
@@ -49,6 +54,8 @@ def get_sum_edge_embedding(
     --------------------------
     Numpy array with the sum edge embedding.
     """
+    if issparse(source_node_embedding):
+        return source_node_embedding + destination_node_embedding
     return np.add(
         source_node_embedding,
         destination_node_embedding
@@ -72,6 +79,11 @@ def get_average_edge_embedding(
     --------------------------
     Numpy array with the average edge embedding.
     """
+    if issparse(source_node_embedding):
+        return get_sum_edge_embedding(
+            source_node_embedding,
+            destination_node_embedding
+        ) / 2.0
     return np.divide(
         get_sum_edge_embedding(
             source_node_embedding,
@@ -98,6 +110,8 @@ def get_l1_edge_embedding(
     --------------------------
     Numpy array with the L1 edge embedding.
     """
+    if issparse(source_node_embedding):
+        return source_node_embedding - destination_node_embedding
     return np.subtract(
         source_node_embedding,
         destination_node_embedding
@@ -119,6 +133,8 @@ def get_l1_norm_edge_embedding(
     Numpy array with the L1 norm scalar scores.
     """
     assert edge_embedding.ndim == 2
+    if issparse(edge_embedding):
+        return np.asarray(abs(edge_embedding).sum(axis=1)).reshape((-1, 1))
     return np.abs(edge_embedding).sum(axis=1, keepdims=True)
 
 
@@ -139,6 +155,11 @@ def get_absolute_l1_edge_embedding(
     --------------------------
     Numpy array with the Absolute L1 edge embedding.
     """
+    if issparse(source_node_embedding):
+        return abs(get_l1_edge_embedding(
+            source_node_embedding,
+            destination_node_embedding
+        ))
     return np.abs(
         get_l1_edge_embedding(
             source_node_embedding,
@@ -164,6 +185,11 @@ def get_squared_l2_edge_embedding(
     --------------------------
     Numpy array with the Squared L2 edge embedding.
     """
+    if issparse(source_node_embedding):
+        return get_l1_edge_embedding(
+            source_node_embedding,
+            destination_node_embedding
+        ).power(2.0)
     return np.power(
         get_l1_edge_embedding(
             source_node_embedding,
@@ -188,6 +214,10 @@ def get_l2_norm_edge_embedding(
     Numpy array with the L2 norm scalar scores.
     """
     assert edge_embedding.ndim == 2
+    if issparse(edge_embedding):
+        return np.sqrt(np.asarray(
+            edge_embedding.power(2.0).sum(axis=1)
+        )).reshape((-1, 1))
     return np.sqrt(np.power(edge_embedding, 2.0).sum(axis=1, keepdims=True))
 
 
@@ -208,6 +238,11 @@ def get_l2_edge_embedding(
     --------------------------
     Numpy array with the L2 edge embedding.
     """
+    if issparse(source_node_embedding):
+        return get_squared_l2_edge_embedding(
+            source_node_embedding,
+            destination_node_embedding
+        ).sqrt()
     return np.sqrt(
         get_squared_l2_edge_embedding(
             source_node_embedding,
@@ -233,6 +268,10 @@ def get_l2_distance(
     --------------------------
     Numpy array with the L2 distance.
     """
+    if issparse(source_node_embedding):
+        return get_l2_norm_edge_embedding(
+            source_node_embedding - destination_node_embedding
+        )
     return np.sqrt(np.sum(np.power(
         source_node_embedding - destination_node_embedding,
         2.0
@@ -258,12 +297,17 @@ def get_cosine_similarity(
     """
     assert source_node_embedding.dtype == destination_node_embedding.dtype
     assert source_node_embedding.shape == destination_node_embedding.shape
-    hadamard_product = source_node_embedding * destination_node_embedding
+    hadamard_product = get_hadamard_edge_embedding(
+        source_node_embedding,
+        destination_node_embedding
+    )
     norm = (
         get_l2_norm_edge_embedding(source_node_embedding) *
         get_l2_norm_edge_embedding(destination_node_embedding)
     )
     norm[norm < 1e-6] = 1e-6
+    if issparse(hadamard_product):
+        return np.asarray(hadamard_product.sum(axis=1)).reshape((-1, 1)) / norm
     return np.sum(hadamard_product, axis=1, keepdims=True) / norm
 
 
@@ -284,6 +328,11 @@ def get_concatenate_edge_embedding(
     --------------------------
     Numpy array with the Concatenate edge embedding.
     """
+    if issparse(source_node_embedding):
+        return hstack((
+            source_node_embedding,
+            destination_node_embedding
+        ), format="csr")
     return np.hstack((
         source_node_embedding,
         destination_node_embedding
@@ -307,6 +356,8 @@ def get_min_edge_embedding(
     --------------------------
     Numpy array with the min edge embedding.
     """
+    if issparse(source_node_embedding):
+        return source_node_embedding.minimum(destination_node_embedding)
     return np.min(
         [
             source_node_embedding,
@@ -333,6 +384,8 @@ def get_max_edge_embedding(
     --------------------------
     Numpy array with the max edge embedding.
     """
+    if issparse(source_node_embedding):
+        return source_node_embedding.maximum(destination_node_embedding)
     return np.max(
         [
             source_node_embedding,
@@ -342,6 +395,20 @@ def get_max_edge_embedding(
     )
 
 
+def has_nan(feature: np.ndarray) -> bool:
+    """Return whether the provided dense or sparse feature contains NaN values.
+
+    Parameters
+    --------------------------
+    feature: np.ndarray
+        Numpy array or scipy sparse matrix to check.
+        For sparse matrices, only the stored values are checked.
+    """
+    if issparse(feature):
+        return np.isnan(feature.data).any()
+    return np.isnan(feature).any()
+
+
 class EdgeTransformer:
     """EdgeTransformer class to convert edges to edge embeddings."""
 
@@ -557,7 +624,8 @@ class EdgeTransformer:
 
         Returns
         --------------------------
-        Numpy array of embeddings.
+        Numpy array of embeddings, or a CSR matrix when the
+        node features were provided as sparse matrices.
         """
         if self.has_edge_type_features() and edge_types is None:
             raise ValueError(
@@ -636,7 +704,7 @@ class EdgeTransformer:
                         node_types=destination_node_types
                     )
                 )
-                assert not np.isnan(edge_embedding).any(), (
+                assert not has_nan(edge_embedding), (
                     "The provided edge embedding should not have NaN values, but we got "
                     f"a numpy array with shape {edge_embedding.shape} and NaN values. "
                     f"The object was obtained using the method {method}."
@@ -688,7 +756,7 @@ class EdgeTransformer:
                 expected_shape = features[0].shape[0]
             # We check that all the features have the same first dimension.
             for feature in features:
-                assert not np.isnan(feature).any(), (
+                assert not has_nan(feature), (
                     "The provided edge features should not have NaN values, but we got "
                     f"a numpy array with shape {feature.shape} and NaN values. "
                     f"It is a {feature_kind}."
@@ -700,19 +768,20 @@ class EdgeTransformer:
                     )
 
 
-        result = np.hstack([
-            *[
-                edge_embedding.reshape((expected_shape, -1))
-                for edge_embedding in edge_embeddings
-            ],
-            *[
-                edge_feature.reshape((expected_shape, -1))
-                for edge_feature in edge_features
-            ],
-            *[
-                edge_type_feature.reshape((expected_shape, -1))
-                for edge_type_feature in edge_type_features
-            ]
-        ])
+        features = [
+            feature if issparse(feature) else feature.reshape((expected_shape, -1))
+            for feature in (
+                *edge_embeddings,
+                *edge_features,
+                *edge_type_features,
+            )
+        ]
+
+        # When the node features are sparse, the edge embeddings are
+        # kept sparse as well, so to avoid densifying wide features.
+        if any(issparse(feature) for feature in features):
+            return hstack(features, format="csr")
+
+        result = np.hstack(features)
 
         return result
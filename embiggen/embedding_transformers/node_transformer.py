@@ -2,6 +2,7 @@
 from typing import List, Union, Optional
 import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix, hstack, issparse
 from ensmallen import Graph
 
 
@@ -57,11 +58,12 @@ class NodeTransformer:
             (node_feature, "node"),
         ):
             for feature in features:
-                if not isinstance(feature, (pd.DataFrame, np.ndarray)):
+                if not isinstance(feature, (pd.DataFrame, np.ndarray)) and not issparse(feature):
                     raise ValueError(
                         (
                             f"One of the provided {feature_name} features is not "
-                            "neither a pandas DataFrame nor a numpy array, but "
+                            "neither a pandas DataFrame, a numpy array nor a "
+                            "scipy sparse matrix, but "
                             f"of type {type(feature)}. It is not clear "
                             "what to do with this feature."
                         )
@@ -86,18 +88,28 @@ class NodeTransformer:
                             f"{feature[:5]}"
                         )
                     )
-                
+
+                # For sparse matrices we only need to check the
+                # explicitly stored values, without densifying them.
+                if issparse(feature) and np.isnan(feature.data).any():
+                    raise ValueError(
+                        (
+                            f"One of the provided {feature_name} features contains NaNs. "
+                            "This is not supported. The sparse matrix has shape "
+                            f"{feature.shape} and {feature.nnz} stored values."
+                        )
+                    )
 
             # We check if, while the parameters for alignment
             # has not been provided, numpy arrays were provided.
             # This would be an issue as we cannot check for alignment
             # in numpy arrays.
             if not self._aligned_mapping and any(
-                isinstance(nf, np.ndarray)
+                isinstance(nf, np.ndarray) or issparse(nf)
                 for nf in features
             ):
                 raise ValueError(
-                    "A numpy array feature was provided while the "
+                    "A numpy array or sparse feature was provided while the "
                     f"aligned mapping parameter was set to false. "
                     "If you intend to specify that you are providing a numpy "
                     f"array {feature_name} feature that is aligned with the vocabulary "
@@ -106,7 +118,15 @@ class NodeTransformer:
                 )
 
         if self._aligned_mapping:
-            if len(node_feature) > 1:
+            if any(issparse(nf) for nf in node_feature):
+                # When at least one of the features is sparse, we keep the
+                # stacked features sparse, as densifying wide one-hot or
+                # bag-of-words features is generally not feasible.
+                self._node_feature = hstack([
+                    nf.to_numpy() if isinstance(nf, pd.DataFrame) else nf
+                    for nf in node_feature
+                ], format="csr")
+            elif len(node_feature) > 1:
                 self._node_feature = np.hstack([
                     nf.to_numpy() if isinstance(nf, pd.DataFrame) else nf
                     for nf in node_feature
@@ -114,6 +134,13 @@ class NodeTransformer:
             elif len(node_feature) == 1:
                 self._node_feature = node_feature[0]
 
+            # Node type features are averaged per node type, and are
+            # therefore handled as dense arrays.
+            node_type_feature = [
+                nf.toarray() if issparse(nf) else nf
+                for nf in node_type_feature
+            ]
+
             if len(node_type_feature) > 1:
                 self._node_type_feature = np.hstack([
                     nf.to_numpy() if isinstance(nf, pd.DataFrame) else nf
@@ -133,15 +160,21 @@ class NodeTransformer:
     
     def has_node_features(self) -> bool:
         """Return whether the transformer has node feature."""
+        if issparse(self._node_feature):
+            return self._node_feature.shape[0] > 0
         return len(self._node_feature) > 0
 
+    def has_sparse_node_features(self) -> bool:
+        """Return whether the node features are stored as a sparse matrix."""
+        return issparse(self._node_feature)
+
     def is_aligned_mapping(self) -> bool:
         """Return whether the transformer can assume aligned mapping."""
         return self._aligned_mapping
 
     def is_fit(self) -> bool:
         """Return whether the transformer is fitted."""
-        return len(self._node_feature) + len(self._node_type_feature) > 0
+        return self.has_node_features() or self.has_node_type_features()
 
     def transform(
         self,
@@ -170,7 +203,8 @@ class NodeTransformer:
 
         Returns
         --------------------------
-        Numpy array of embeddings.
+        Numpy array of embeddings, or a CSR matrix when the
+        node features were provided as sparse matrices.
         """
         if not self.is_fit():
             raise ValueError(
@@ -234,6 +268,11 @@ class NodeTransformer:
 
         if node_features is None:
             node_features = node_type_features
+        elif node_type_features is not None and issparse(node_features):
+            node_features = hstack([
+                node_features,
+                csr_matrix(node_type_features)
+            ], format="csr")
         elif node_type_features is not None:
             node_features = np.hstack([
                 node_features,
@@ -1,19 +1,87 @@
-"""This module provides the Graph Convolution feature preprocessor class."""
+"""This module provides the Graph Convolution feature preprocessor class.
+
+The preprocessor precomputes, in a SIGN/SGC fashion, the propagated node
+features A X, A^2 X, ..., A^k X for one or more kernels A, so that they can
+be fed as constant node features to fast tabular models without having to
+run any convolution at training time.
+
+The propagation is executed in chunks of feature columns, each hop reusing
+the previous one, so that the peak memory requirements are bounded by the
+size of the chunk and not by the number of features times the number of hops.
+"""
 import warnings
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
-from ensmallen import Graph, models
+from ensmallen import Graph
+from scipy.sparse import csr_matrix, issparse
+from userinput.utils import must_be_in_set
 
 from embiggen.utils.abstract_models.abstract_feature_preprocessor import \
     AbstractFeaturePreprocessor
 from embiggen.utils.abstract_models.embedding_result import EmbeddingResult
+from embiggen.utils.graph_kernels import get_kernel_coo_matrix
+
+
+def graph_to_sparse_kernel(
+    graph: Graph,
+    kernel: str,
+    dtype: np.dtype = np.float32,
+) -> csr_matrix:
+    """Returns the provided graph as a sparse CSR kernel matrix.
+
+    Parameters
+    -------------------
+    graph: Graph,
+        The graph to convert.
+    kernel: str
+        The type of normalization to use, as supported by
+        `get_kernel_coo_matrix`, which also builds the kernels
+        of the GCN models.
+    dtype: np.dtype = np.float32
+        The dtype of the kernel weights.
+    """
+    edge_node_ids, kernel_weights = get_kernel_coo_matrix(
+        graph,
+        kernel=kernel,
+        handling_multi_graph="drop",
+    )
+    return csr_matrix(
+        (
+            kernel_weights.astype(dtype),
+            (edge_node_ids[:, 0], edge_node_ids[:, 1])
+        ),
+        shape=(graph.get_number_of_nodes(), graph.get_number_of_nodes()),
+        dtype=dtype,
+    )
 
 
 class GraphConvolution(AbstractFeaturePreprocessor):
     """Graph Convolution feature preprocessor class."""
 
+    supported_kernels = [
+        "Weights",
+        "Left Normalized Laplacian",
+        "Right Normalized Laplacian",
+        "Symmetric Normalized Laplacian",
+        "Transposed Left Normalized Laplacian",
+        "Transposed Right Normalized Laplacian",
+        "Transposed Symmetric Normalized Laplacian",
+        "Weighted Left Normalized Laplacian",
+        "Weighted Right Normalized Laplacian",
+        "Weighted Symmetric Normalized Laplacian",
+        "Transposed Weighted Left Normalized Laplacian",
+        "Transposed Weighted Right Normalized Laplacian",
+        "Transposed Weighted Symmetric Normalized Laplacian",
+    ]
+
+    supported_dtypes = {
+        "f16": np.float16,
+        "f32": np.float32,
+        "f64": np.float64,
+    }
+
     def __init__(
         self,
         number_of_convolutions: int = 2,
@@ -21,43 +89,92 @@ class GraphConvolution(AbstractFeaturePreprocessor):
         transpose: bool = False,
         normalize_rows: bool = False,
         dtype: str = "f32",
-        path: Union[str, List[str]] = None,
+        path: Optional[Union[str, List[str]]] = None,
+        kernels: Union[str, List[str]] = "Symmetric Normalized Laplacian",
+        number_of_columns_per_chunk: int = 256,
     ):
         """Create new Graph Convolution feature preprocessor.
 
         Parameters
         -------------------------
         number_of_convolutions: int = 2
-            The number of convolutions to execute.
+            The number of convolutions (hops) to execute.
             By default, `2`.
         concatenate_features: bool = False
-            Whether to Concatenate the features at each convolution.
+            Whether to concatenate the features obtained at each convolution,
+            including the input features, in the SIGN fashion, that is
+            `[X, A X, A^2 X, ..., A^k X]`. When false, only the features
+            from the last convolution, `A^k X`, are returned.
             By default, `false`.
         transpose: bool = False
-            Whether to transpose the features before convolving them.
+            Whether to transpose the graph before convolving the features.
+            It cannot be combined with the "Transposed" kernels, which
+            already transpose the graph.
+            By default, `false`.
+        normalize_rows: bool = False
+            Whether to L2-normalize the rows of the features before convolving them.
             By default, `false`.
-        normalize_rows: bool = True
-            Whether to normalize the rows of the features before convolving them.
-            By default, `true`.
         dtype: str = "f32"
             The data type to use for the convolved features.
             The supported values are `f16`, `f32` and `f64`.
+            The convolutions are computed in `f32` when `f16` is requested.
             By default, `f32`.
-        path: Union[str, List[str]] = None
-            The path(s) were to MMAP the processed features to.
+        path: Optional[Union[str, List[str]]] = None
+            The path(s) were to MMAP the processed features to,
+            one for each of the provided node features.
             By default, `None`.
+        kernels: Union[str, List[str]] = "Symmetric Normalized Laplacian"
+            The kernel(s) to use for the convolutions. When multiple kernels
+            are provided, the convolved features of each kernel are concatenated.
+            By default, `Symmetric Normalized Laplacian`.
+        number_of_columns_per_chunk: int = 256
+            The number of feature columns to propagate at once.
+            The peak memory used by the propagation, besides the output,
+            is proportional to the number of nodes times this value.
+            By default, `256`.
         """
-        self._kwargs = dict(
-            number_of_convolutions=number_of_convolutions,
-            concatenate_features=concatenate_features,
-            normalize_rows=normalize_rows,
-            dtype=dtype,
-        )
+        if not isinstance(number_of_convolutions, int) or number_of_convolutions <= 0:
+            raise ValueError(
+                "The number of convolutions must be a strictly positive integer, "
+                f"but {number_of_convolutions} was provided."
+            )
+        if (
+            not isinstance(number_of_columns_per_chunk, int)
+            or number_of_columns_per_chunk <= 0
+        ):
+            raise ValueError(
+                "The number of columns per chunk must be a strictly positive integer, "
+                f"but {number_of_columns_per_chunk} was provided."
+            )
+        if isinstance(kernels, str):
+            kernels = [kernels]
+        if len(kernels) == 0:
+            raise ValueError("At least a kernel must be provided.")
+        if isinstance(path, str):
+            path = [path]
+        if transpose:
+            transposed_kernels = [
+                kernel for kernel in kernels if "Transposed" in kernel
+            ]
+            if transposed_kernels:
+                raise ValueError(
+                    "The graph is transposed by the kernels "
+                    f"{', '.join(transposed_kernels)}, and it would be "
+                    "transposed back by also setting `transpose` to true. "
+                    "Please use the kernels without the Transposed prefix instead."
+                )
+
+        self._number_of_convolutions = number_of_convolutions
+        self._concatenate_features = concatenate_features
         self._transpose = transpose
+        self._normalize_rows = normalize_rows
+        self._dtype = must_be_in_set(dtype, self.supported_dtypes.keys(), "dtype")
         self._path = path
-        self._graph_convolution = models.GraphConvolution(
-            **self._kwargs
-        )
+        self._kernels = [
+            must_be_in_set(kernel, self.supported_kernels, "kernel")
+            for kernel in kernels
+        ]
+        self._number_of_columns_per_chunk = number_of_columns_per_chunk
         super().__init__()
 
     @classmethod
@@ -84,14 +201,112 @@ class GraphConvolution(AbstractFeaturePreprocessor):
     def requires_edge_weights(cls) -> bool:
         """Return whether the model requires edge weights."""
         return False
-    
+
+    @classmethod
+    def smoke_test_parameters(cls) -> Dict[str, Any]:
+        """Return parameters to create a model with minimal configuration to test execution."""
+        return dict(
+            number_of_convolutions=1,
+        )
+
     def parameters(self) -> Dict[str, Any]:
         return dict(
-            **self._kwargs,
+            number_of_convolutions=self._number_of_convolutions,
+            concatenate_features=self._concatenate_features,
             transpose=self._transpose,
-            path=self._path
+            normalize_rows=self._normalize_rows,
+            dtype=self._dtype,
+            path=self._path,
+            kernels=self._kernels,
+            number_of_columns_per_chunk=self._number_of_columns_per_chunk,
+        )
+
+    def get_number_of_output_blocks(self) -> int:
+        """Return the number of blocks of features produced for each input feature."""
+        hops_per_kernel = (
+            self._number_of_convolutions if self._concatenate_features else 1
+        )
+        return int(self._concatenate_features) + hops_per_kernel * len(self._kernels)
+
+    def _convolve(
+        self,
+        kernels: List[csr_matrix],
+        node_feature: Union[np.ndarray, csr_matrix],
+        path: Optional[str],
+    ) -> np.ndarray:
+        """Return the convolved node feature.
+
+        Parameters
+        -------------------------
+        kernels: List[csr_matrix]
+            The sparse kernels to convolve the features with.
+        node_feature: Union[np.ndarray, csr_matrix]
+            The node feature to convolve. Sparse features are
+            densified one chunk of columns at a time.
+        path: Optional[str]
+            The path where to MMAP the convolved features.
+        """
+        number_of_nodes, number_of_features = node_feature.shape
+        output_dtype = self.supported_dtypes[self._dtype]
+        # Sparse-dense products are not available for half precision,
+        # so in that case we compute the hops in single precision.
+        compute_dtype = np.float64 if self._dtype == "f64" else np.float32
+        output_shape = (
+            number_of_nodes,
+            number_of_features * self.get_number_of_output_blocks(),
         )
 
+        if path is None:
+            convolved = np.empty(output_shape, dtype=output_dtype)
+        else:
+            convolved = np.lib.format.open_memmap(
+                path, mode="w+", dtype=output_dtype, shape=output_shape
+            )
+
+        if self._normalize_rows and issparse(node_feature):
+            norms = np.sqrt(
+                np.asarray(node_feature.power(2).sum(axis=1))
+            ).astype(compute_dtype)
+            norms[norms == 0] = 1.0
+        elif self._normalize_rows:
+            norms = np.linalg.norm(node_feature, axis=1, keepdims=True).astype(
+                compute_dtype
+            )
+            norms[norms == 0] = 1.0
+
+        for start in range(0, number_of_features, self._number_of_columns_per_chunk):
+            end = min(start + self._number_of_columns_per_chunk, number_of_features)
+            chunk = node_feature[:, start:end]
+            if issparse(chunk):
+                chunk = chunk.toarray()
+            chunk = chunk.astype(compute_dtype)
+            if self._normalize_rows:
+                chunk /= norms
+
+            block = 0
+            if self._concatenate_features:
+                convolved[:, start:end] = chunk
+                block += 1
+
+            for kernel in kernels:
+                hop = chunk
+                for convolution in range(self._number_of_convolutions):
+                    # Each hop is obtained from the previous one, so the
+                    # intermediate propagations are computed only once.
+                    hop = kernel @ hop
+                    if (
+                        self._concatenate_features
+                        or convolution == self._number_of_convolutions - 1
+                    ):
+                        offset = block * number_of_features
+                        convolved[:, offset + start : offset + end] = hop
+                        block += 1
+
+        if path is not None:
+            convolved.flush()
+
+        return convolved
+
     def _transform(
         self,
         support: Graph,
@@ -111,13 +326,12 @@ class GraphConvolution(AbstractFeaturePreprocessor):
                 "The number of paths should be the same as the number of node features."
                 f"Got {len(self._path)} paths and {len(node_features)} node features."
             )
-        
-        new_node_features = []
 
         for node_feature in node_features:
-            if not isinstance(node_feature, np.ndarray):
+            if not isinstance(node_feature, np.ndarray) and not issparse(node_feature):
                 raise NotImplementedError(
-                    "The node features should be provided as a numpy array. "
+                    "The node features should be provided as a numpy array "
+                    "or as a scipy sparse matrix. "
                     f"Got {type(node_feature)} instead."
                 )
             if len(node_feature.shape) != 2:
@@ -126,28 +340,19 @@ class GraphConvolution(AbstractFeaturePreprocessor):
                     "shape (number_of_nodes, number_of_features). "
                     f"Got {node_feature.shape} instead."
                 )
-            
-            if not node_feature.data.c_contiguous:
-                warnings.warn(
-                    "One of the provided node features is not C contiguous. "
-                    f"Specifically, the one with shape {node_feature.shape} "
-                    f"and dtype {node_feature.dtype}. "
-                    "This forces us to copy the data, which may be slow and "
-                    "consume a lot of memory. Consider using np.ascontiguousarray "
-                    "to make the array C contiguous before passing it to the "
-                    "feature preprocessor."
+            if node_feature.shape[0] != support.get_number_of_nodes():
+                raise ValueError(
+                    f"The provided node features have {node_feature.shape[0]} rows, "
+                    f"but the support graph {support.get_name()} has "
+                    f"{support.get_number_of_nodes()} nodes."
                 )
-                node_feature = np.ascontiguousarray(node_feature)
-            new_node_features.append(node_feature)
-
-        node_features = new_node_features
 
         # We transpose the graph if requested, though the operation is skipped
         # if we are computing the transposed of an undirected graph. A warning
         # is raised in this case.
         if self._transpose:
-            if graph.is_directed():
-                graph = graph.to_transposed()
+            if support.is_directed():
+                support = support.to_transposed()
             else:
                 warnings.warn(
                     "You are trying to compute the transposed of an undirected graph. "
@@ -155,26 +360,28 @@ class GraphConvolution(AbstractFeaturePreprocessor):
                     "This operation is skipped."
                 )
 
-        if self._path is None:
-            transposed_features = [
-                self._graph_convolution.transform(
-                    support=support,
-                    node_features=node_feature,
-                )
-                for node_feature in node_features
-            ]
-        else:
-            transposed_features = [
-                self._graph_convolution.transform(
-                    support=support,
-                    node_feature=node_feature,
-                    path=path
-                )
-                for node_feature, path in zip(node_features, self._path)
-            ]
+        # The kernels are computed once and shared across all of the node features.
+        kernels = [
+            graph_to_sparse_kernel(
+                support,
+                kernel,
+                dtype=np.float64 if self._dtype == "f64" else np.float32,
+            )
+            for kernel in self._kernels
+        ]
+
+        paths = self._path if self._path is not None else [None] * len(node_features)
+
         return EmbeddingResult(
             embedding_method_name=self.model_name(),
-            node_embeddings=transposed_features,
+            node_embeddings=[
+                self._convolve(
+                    kernels=kernels,
+                    node_feature=node_feature.tocsc() if issparse(node_feature) else node_feature,
+                    path=path
+                )
+                for node_feature, path in zip(node_features, paths)
+            ],
         )
 
     @classmethod
@@ -185,7 +392,7 @@ class GraphConvolution(AbstractFeaturePreprocessor):
     @classmethod
     def can_use_edge_type_features(cls) -> bool:
         return False
-    
+
     @classmethod
     def can_use_edge_features(cls) -> bool:
-        return False
\ No newline at end of file
+        return False
@@ -2,6 +2,7 @@
 from embiggen.layers.tensorflow.graph_convolution_layer import GraphConvolution
 from embiggen.layers.tensorflow.noise_contrastive_estimation import NoiseContrastiveEstimation
 from embiggen.layers.tensorflow.sampled_softmax import SampledSoftmax
+from embiggen.layers.tensorflow.unigram_candidate_sampler import UnigramCandidateSampler
 from embiggen.layers.tensorflow.embedding_lookup import EmbeddingLookup
 from embiggen.layers.tensorflow.flat_embedding import FlatEmbedding
 from embiggen.layers.tensorflow.l2_norm import L2Norm
@@ -12,6 +13,7 @@ __all__ = [
     "GraphConvolution",
     "NoiseContrastiveEstimation",
     "SampledSoftmax",
+    "UnigramCandidateSampler",
     "EmbeddingLookup",
     "FlatEmbedding",
     "L2Norm",
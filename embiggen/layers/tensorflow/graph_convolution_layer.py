@@ -158,12 +158,12 @@ class GraphConvolution(Layer):
             )
 
         return [
-            l2_norm(dropout(dense(embedding_ops.embedding_lookup_sparse_v2(
+            l2_norm(dropout(self._convolve(
+                dense,
                 node_feature,
                 ids,
-                adjacency,
-                combiner=self._combiner
-            ))))
+                adjacency
+            )))
             for dense, dropout, l2_norm, node_feature in zip(
                 self._dense_layers,
                 self._dropout_layers,
@@ -172,3 +172,49 @@ class GraphConvolution(Layer):
             )
         ]
 
+    def _convolve(
+        self,
+        dense: Dense,
+        node_feature: Union[tf.Tensor, tf.SparseTensor],
+        ids: tf.SparseTensor,
+        adjacency: tf.SparseTensor,
+    ) -> tf.Tensor:
+        """Returns the node feature aggregated over the adjacency and projected by the dense layer.
+
+        Parameters
+        ---------------------------
+        dense: Dense
+            The dense layer to project the node feature with.
+        node_feature: Union[tf.Tensor, tf.SparseTensor]
+            The node feature to convolve.
+        ids: tf.SparseTensor
+            The neighbour ids to aggregate.
+        adjacency: tf.SparseTensor
+            The weights of the neighbours to aggregate.
+
+        Implementation details
+        ---------------------------
+        Sparse node features, such as wide bag-of-words or one-hot features,
+        are first projected with a sparse-dense matmul and only then aggregated,
+        as the aggregation is linear and the projected features are much smaller.
+        The bias and activation of the dense layer are applied after the aggregation,
+        so the result is the same as for the dense node features.
+        """
+        if not isinstance(node_feature, tf.SparseTensor):
+            return dense(embedding_ops.embedding_lookup_sparse_v2(
+                node_feature,
+                ids,
+                adjacency,
+                combiner=self._combiner
+            ))
+
+        hidden = embedding_ops.embedding_lookup_sparse_v2(
+            tf.sparse.sparse_dense_matmul(node_feature, dense.kernel),
+            ids,
+            adjacency,
+            combiner=self._combiner
+        )
+        if dense.use_bias:
+            hidden = tf.nn.bias_add(hidden, dense.bias)
+        return dense.activation(hidden)
+
@@ -1,9 +1,12 @@
 """Layer for executing NCE loss in Keras models."""
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import tensorflow as tf
 from tensorflow.keras.layers import Layer   # pylint: disable=import-error
 
+from embiggen.layers.tensorflow.unigram_candidate_sampler import UnigramCandidateSampler
+
 
 class NoiseContrastiveEstimation(Layer):
     """Layer for executing NCE loss in Keras models."""
@@ -14,6 +17,8 @@ class NoiseContrastiveEstimation(Layer):
         embedding_size: int,
         number_of_negative_samples: int,
         positive_samples: int,
+        unigram_frequencies: Optional[np.ndarray] = None,
+        distortion: float = 0.75,
         **kwargs: Dict
     ):
         """Create new NoiseContrastiveEstimation layer.
@@ -34,6 +39,15 @@ class NoiseContrastiveEstimation(Layer):
             This single sample of negative classes is evaluated for each element in the batch.
         positive_samples: int
             The number of target classes per training example.
+        unigram_frequencies: Optional[np.ndarray] = None
+            The frequency of each of the classes, such as the node degrees.
+            When provided, the negative classes are sampled from the distorted
+            unigram distribution of these frequencies with an alias table,
+            and the classes do not need to be sorted by decreasing frequency.
+            By default, the log-uniform sampler of TensorFlow is used, which
+            requires the classes to be sorted by decreasing frequency.
+        distortion: float = 0.75
+            The exponent the unigram frequencies are raised to.
         """
         self._vocabulary_size = vocabulary_size
         self._embedding_size = embedding_size
@@ -41,6 +55,11 @@ class NoiseContrastiveEstimation(Layer):
         self._positive_samples = positive_samples
         self._weights = None
         self._biases = None
+        self._candidate_sampler = (
+            UnigramCandidateSampler(unigram_frequencies, distortion=distortion)
+            if unigram_frequencies is not None
+            else None
+        )
         super().__init__(**kwargs)
 
     def build(self, input_shape: Tuple[int, int]):
@@ -84,7 +103,15 @@ class NoiseContrastiveEstimation(Layer):
             inputs=predictions,
             num_sampled=self._number_of_negative_samples,
             num_classes=self._vocabulary_size,
-            num_true=self._positive_samples
+            num_true=self._positive_samples,
+            sampled_values=(
+                self._candidate_sampler(
+                    labels,
+                    self._number_of_negative_samples
+                )
+                if self._candidate_sampler is not None
+                else None
+            )
         ), axis=0)
 
         self.add_loss(loss)
@@ -1,10 +1,13 @@
 """Layer for executing Sampled Softmax in Keras models."""
 from typing import Dict, Tuple, Optional
 
+import numpy as np
 import tensorflow as tf
 import tensorflow.keras.backend as K   # pylint: disable=import-error
 from tensorflow.keras.layers import Layer   # pylint: disable=import-error
 
+from embiggen.layers.tensorflow.unigram_candidate_sampler import UnigramCandidateSampler
+
 
 class SampledSoftmax(Layer):
     """Layer for executing Sampled Softmax in Keras models."""
@@ -15,6 +18,8 @@ class SampledSoftmax(Layer):
         embedding_size: int,
         number_of_negative_samples: int,
         remove_accidental_hits: bool = False,
+        unigram_frequencies: Optional[np.ndarray] = None,
+        distortion: float = 0.75,
         **kwargs: Dict
     ):
         """Create new SampledSoftmax layer.
@@ -38,6 +43,15 @@ class SampledSoftmax(Layer):
         embedding: Optional[Layer]
             The embedding layer from which to extract the weights
             when training this model in a siamese mode.
+        unigram_frequencies: Optional[np.ndarray] = None
+            The frequency of each of the classes, such as the node degrees.
+            When provided, the negative classes are sampled from the distorted
+            unigram distribution of these frequencies with an alias table,
+            and the classes do not need to be sorted by decreasing frequency.
+            By default, the log-uniform sampler of TensorFlow is used, which
+            requires the classes to be sorted by decreasing frequency.
+        distortion: float = 0.75
+            The exponent the unigram frequencies are raised to.
         """
         self._vocabulary_size = vocabulary_size
         self._embedding_size = embedding_size
@@ -45,6 +59,11 @@ class SampledSoftmax(Layer):
         self._remove_accidental_hits = remove_accidental_hits
         self._weights = None
         self._biases = None
+        self._candidate_sampler = (
+            UnigramCandidateSampler(unigram_frequencies, distortion=distortion)
+            if unigram_frequencies is not None
+            else None
+        )
         super().__init__(**kwargs)
 
     def build(self, input_shape: Tuple[int, int]):
@@ -88,7 +107,15 @@ class SampledSoftmax(Layer):
             inputs=predictions,
             num_sampled=self._number_of_negative_samples,
             num_classes=self._vocabulary_size,
-            remove_accidental_hits=self._remove_accidental_hits
+            remove_accidental_hits=self._remove_accidental_hits,
+            sampled_values=(
+                self._candidate_sampler(
+                    labels,
+                    self._number_of_negative_samples
+                )
+                if self._candidate_sampler is not None
+                else None
+            )
         ), axis=0)
 
         self.add_loss(loss)
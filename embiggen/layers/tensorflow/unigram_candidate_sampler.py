@@ -0,0 +1,98 @@
+"""Candidate sampler drawing the negative classes from an alias table."""
+from typing import Optional, Tuple
+
+import numpy as np
+import tensorflow as tf
+
+from embiggen.utils.alias_table import get_unigram_alias_table
+
+
+class UnigramCandidateSampler:
+    """Candidate sampler drawing the negative classes from an alias table.
+
+    The default candidate sampler of the TensorFlow sampled losses follows
+    a log-uniform distribution, which only approximates the frequency of the
+    classes when these are sorted by decreasing frequency. This sampler
+    instead draws the classes from the distorted unigram distribution of the
+    provided frequencies, so the classes may be in any order, and each draw
+    requires constant time. The alias tables are cached, so the samplers
+    built for the same frequencies share the same table.
+    """
+
+    def __init__(
+        self,
+        unigram_frequencies: np.ndarray,
+        distortion: float = 0.75,
+    ):
+        """Create new UnigramCandidateSampler.
+
+        Parameters
+        -------------------------
+        unigram_frequencies: np.ndarray
+            The frequency of each of the classes, such as the node degrees.
+        distortion: float = 0.75
+            The exponent the frequencies are raised to.
+        """
+        distribution, probabilities, aliases = get_unigram_alias_table(
+            unigram_frequencies,
+            distortion=distortion
+        )
+        self._distribution = tf.constant(distribution, dtype=tf.float32)
+        self._probabilities = tf.constant(probabilities, dtype=tf.float32)
+        self._aliases = tf.constant(aliases, dtype=tf.int64)
+        self._number_of_classes = distribution.size
+
+    def __call__(
+        self,
+        labels: tf.Tensor,
+        number_of_negative_samples: int,
+        seed: Optional[int] = None,
+    ) -> Tuple[tf.Tensor, tf.Tensor, tf.Tensor]:
+        """Return the sampled classes and their expected counts.
+
+        Parameters
+        -------------------------
+        labels: tf.Tensor
+            The target classes of the batch.
+        number_of_negative_samples: int
+            The number of negative classes to sample for the batch.
+        seed: Optional[int] = None
+            The seed of the sampling.
+
+        Returns
+        -------------------------
+        Tuple in the format of the `sampled_values` argument of the
+        TensorFlow sampled losses, with the sampled classes and
+        the expected counts of the labels and of the sampled classes.
+        """
+        columns = tf.random.uniform(
+            (number_of_negative_samples,),
+            maxval=self._number_of_classes,
+            dtype=tf.int64,
+            seed=seed,
+        )
+        coins = tf.random.uniform(
+            (number_of_negative_samples,),
+            dtype=tf.float32,
+            seed=seed,
+        )
+        sampled = tf.where(
+            coins < tf.gather(self._probabilities, columns),
+            columns,
+            tf.gather(self._aliases, columns),
+        )
+        # The classes are sampled with replacement, so the expected count
+        # of a class is the number of draws times its probability.
+        true_expected_count = tf.gather(
+            self._distribution,
+            tf.cast(labels, tf.int64)
+        ) * number_of_negative_samples
+        sampled_expected_count = tf.gather(
+            self._distribution,
+            sampled
+        ) * number_of_negative_samples
+        return (
+            tf.stop_gradient(sampled),
+            tf.stop_gradient(true_expected_count),
+            tf.stop_gradient(sampled_expected_count),
+        )
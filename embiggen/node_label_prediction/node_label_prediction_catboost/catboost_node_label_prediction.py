@@ -106,6 +106,8 @@ class CatBoostNodeLabelPrediction(SklearnLikeNodeLabelPredictionAdapter):
         embedding_features=None,
         callback=None,
         eval_fraction=None,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Build a CatBoost node-label prediction model."""
         self._kwargs = dict(
@@ -211,6 +213,8 @@ class CatBoostNodeLabelPrediction(SklearnLikeNodeLabelPredictionAdapter):
                 random_state=random_state,
             ),
             random_state=random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     @classmethod
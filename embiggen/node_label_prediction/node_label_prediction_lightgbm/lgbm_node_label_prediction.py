@@ -30,6 +30,8 @@ class LightGBMNodeLabelPrediction(SklearnLikeNodeLabelPredictionAdapter):
         random_state: int = 42,
         n_jobs: int = -1,
         importance_type: str = "split",
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
         **kwargs: Dict,
     ):
         """Build a LightGBM node-label prediction model.
@@ -72,6 +74,10 @@ class LightGBMNodeLabelPrediction(SklearnLikeNodeLabelPredictionAdapter):
             The number of jobs to use.
         importance_type: str = "split",
             The importance type to use.
+        prediction_batch_size: int = 2**16,
+            Number of nodes to embed and predict at once.
+        prediction_number_of_threads: int = 1,
+            Number of batches to predict concurrently.
         **kwargs: Dict,
             Additional keyword arguments to pass to the model.
         """
@@ -105,6 +111,8 @@ class LightGBMNodeLabelPrediction(SklearnLikeNodeLabelPredictionAdapter):
                 random_state=random_state,
             ),
             random_state=random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     @classmethod
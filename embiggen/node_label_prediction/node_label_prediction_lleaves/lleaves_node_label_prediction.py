@@ -32,6 +32,8 @@ class LLeavesNodeLabelPrediction(SklearnLikeNodeLabelPredictionAdapter):
         random_state: int = 42,
         n_jobs: int = -1,
         importance_type: str = "split",
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
         **kwargs: Dict,
     ):
         """Build a LightGBM node-label prediction model.
@@ -76,6 +78,10 @@ class LLeavesNodeLabelPrediction(SklearnLikeNodeLabelPredictionAdapter):
             The number of jobs to use.
         importance_type: str = "split",
             The importance type to use.
+        prediction_batch_size: int = 2**16,
+            Number of nodes to embed and predict at once.
+        prediction_number_of_threads: int = 1,
+            Number of batches to predict concurrently.
         **kwargs: Dict,
             Additional keyword arguments to pass to the model.
         """
@@ -114,6 +120,8 @@ class LLeavesNodeLabelPrediction(SklearnLikeNodeLabelPredictionAdapter):
         super().__init__(
             model_instance=LLeavesClassifier(path),
             random_state=random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     @classmethod
@@ -1,9 +1,10 @@
 """Module providing abstract node label prediction model."""
-from typing import Optional, Union, List, Dict, Any, Tuple
+from typing import Optional, Union, List, Dict, Any, Tuple, Type, Iterator
 import pandas as pd
 import numpy as np
 import warnings
 from ensmallen import Graph
+from embiggen.utils import AbstractEdgeFeature
 from embiggen.utils.abstract_models import AbstractClassifierModel, abstract_class
 
 
@@ -47,6 +48,20 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
             "Kfold",
         ]
 
+    @classmethod
+    def can_predict_node_subsets(cls) -> bool:
+        """Returns whether the model can natively run predictions on a subset of the nodes.
+
+        Implementation details
+        ----------------------
+        Models that return True receive the node IDs to restrict their
+        predictions to as the `node_ids` argument of `_predict_proba`,
+        which is None when all of the nodes are to be predicted.
+        All other models are run on all of the nodes, and the
+        predictions are then subsetted.
+        """
+        return False
+
     def is_binary_prediction_task(self) -> bool:
         """Returns whether the model was fit on a binary prediction task."""
         return self._is_binary_prediction_task
@@ -137,6 +152,25 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
         train_size = train.get_number_of_known_node_types(
         ) / graph.get_number_of_known_node_types()
 
+        train_mask = train.get_known_node_types_mask()
+        test_mask = test.get_known_node_types_mask()
+
+        # The train and test graphs share the same nodes and are only used
+        # to align the nodes with the features, so we can score the labeled
+        # nodes of both partitions at once, instead of scoring all of the
+        # nodes twice.
+        labeled_node_ids = np.where(train_mask | test_mask)[0]
+        with self._profile("predicting"):
+            labeled_prediction_probabilities = self.predict_proba(
+                test,
+                support=support,
+                node_features=node_features,
+                node_type_features=node_type_features,
+                edge_type_features=edge_type_features,
+                edge_features=edge_features,
+                node_ids=labeled_node_ids,
+            )
+
         if self.is_multilabel_prediction_task():
             labels = graph.get_one_hot_encoded_node_types()
         elif self.is_binary_prediction_task():
@@ -145,18 +179,13 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
             labels = graph.get_single_label_node_type_ids()
 
         performance = []
-        for evaluation_mode, evaluation_graph in (
-            ("train", train),
-            ("test", test),
+        for evaluation_mode, evaluation_graph, mask in (
+            ("train", train, train_mask),
+            ("test", test, test_mask),
         ):
-            prediction_probabilities = self.predict_proba(
-                evaluation_graph,
-                support=support,
-                node_features=node_features,
-                node_type_features=node_type_features,
-                edge_type_features=edge_type_features,
-                edge_features=edge_features
-            )
+            prediction_probabilities = labeled_prediction_probabilities[
+                np.searchsorted(labeled_node_ids, np.where(mask)[0])
+            ]
 
             if self.is_binary_prediction_task():
                 if prediction_probabilities.shape[1] == 1:
@@ -179,24 +208,22 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
             else:
                 predictions = prediction_probabilities.argmax(axis=-1)
 
-            mask = evaluation_graph.get_known_node_types_mask()
-            prediction_probabilities = prediction_probabilities[mask]
-            predictions = predictions[mask]
             labels_subset = labels[mask]
 
-            performance.append({
-                "evaluation_mode": evaluation_mode,
-                "train_size": train_size,
-                "known_nodes_number": evaluation_graph.get_number_of_known_node_types(),
-                **self.evaluate_predictions(
-                    labels_subset,
-                    predictions,
-                ),
-                **self.evaluate_prediction_probabilities(
-                    labels_subset,
-                    prediction_probabilities,
-                ),
-            })
+            with self._profile("computing_metrics"):
+                performance.append({
+                    "evaluation_mode": evaluation_mode,
+                    "train_size": train_size,
+                    "known_nodes_number": evaluation_graph.get_number_of_known_node_types(),
+                    **self.evaluate_predictions(
+                        labels_subset,
+                        predictions,
+                    ),
+                    **self.evaluate_prediction_probabilities(
+                        labels_subset,
+                        prediction_probabilities,
+                    ),
+                })
 
         return performance
 
@@ -281,6 +308,160 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
             edge_features=edge_features,
         )
 
+    def predict_proba(
+        self,
+        graph: Graph,
+        support: Optional[Graph] = None,
+        node_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None,
+        node_type_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None,
+        edge_type_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None,
+        edge_features: Optional[Union[Type[AbstractEdgeFeature], List[Type[AbstractEdgeFeature]]]] = None,
+        node_ids: Optional[np.ndarray] = None,
+        path: Optional[str] = None,
+        consume_predictions: bool = False,
+    ) -> Optional[np.ndarray]:
+        """Execute predictions probabilities on the provided graph.
+
+        Parameters
+        --------------------
+        graph: Graph
+            The graph to run predictions on.
+        support: Optional[Graph] = None
+            The graph describiding the topological structure that
+            includes also the above graph. This parameter
+            is mostly useful for topological classifiers
+            such as Graph Convolutional Networks.
+        node_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None
+            The node features to use.
+        node_type_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None
+            The node type features to use.
+        edge_type_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None
+            The edge type features to use.
+        edge_features: Optional[Union[Type[AbstractEdgeFeature], List[Type[AbstractEdgeFeature]]]] = None
+            The edge features to use.
+        node_ids: Optional[np.ndarray] = None
+            The IDs of the nodes to run the predictions on.
+            By default, the predictions are run on all of the nodes
+            of the provided graph. The rows of the returned predictions
+            follow the order of the provided node IDs.
+        path: Optional[str] = None
+            The path to the file where to save the predictions.
+            The supported extensions are csv, tsv, ssv and txt.
+            Models that predict the nodes batch-wise write each batch
+            as soon as it is computed.
+        consume_predictions: bool = False
+            Whether to discard the predictions once they are written to
+            the provided path, instead of returning them. This is useful
+            to keep the memory requirements bounded by the batch size.
+
+        Raises
+        --------------------
+        ValueError
+            If the provided node IDs are not a vector of node IDs of the graph.
+        ValueError
+            If the predictions should be consumed but no path is provided.
+        ValueError
+            If the provided path has an unsupported extension.
+        """
+        if consume_predictions and path is None:
+            raise ValueError(
+                "The predictions can only be consumed when a path "
+                "where to write them is provided."
+            )
+
+        if path is not None:
+            extension = path.split(".")[-1]
+            if extension == "csv":
+                separator = ","
+            elif extension == "tsv":
+                separator = "\t"
+            elif extension in ("txt", "ssv"):
+                separator = " "
+            else:
+                raise ValueError(
+                    f"Unsupported file extension {extension}. "
+                    "Please use either csv, tsv, ssv or txt."
+                )
+
+        if node_ids is not None:
+            node_ids = np.asarray(node_ids)
+            if len(node_ids.shape) != 1 or not np.issubdtype(node_ids.dtype, np.integer):
+                raise ValueError(
+                    "The provided node IDs should be a vector of integers, "
+                    f"but we got an array with shape {node_ids.shape} "
+                    f"and dtype {node_ids.dtype}."
+                )
+            if node_ids.size > 0 and (
+                node_ids.min() < 0 or node_ids.max() >= graph.get_number_of_nodes()
+            ):
+                raise ValueError(
+                    "The provided node IDs should be between 0 and "
+                    f"{graph.get_number_of_nodes() - 1}, as the graph {graph.get_name()} "
+                    f"has {graph.get_number_of_nodes()} nodes, but we got node IDs "
+                    f"between {node_ids.min()} and {node_ids.max()}."
+                )
+
+        # Only the models that can natively predict a subset of the
+        # nodes receive the node IDs in their `_predict_proba` method.
+        predict_proba_kwargs = {}
+        if self.can_predict_node_subsets():
+            predict_proba_kwargs["node_ids"] = node_ids
+
+        prediction_probabilities: Union[np.ndarray, Iterator[np.ndarray]] = self._predict_proba_with_checks(
+            graph,
+            support=support,
+            node_features=node_features,
+            node_type_features=node_type_features,
+            edge_type_features=edge_type_features,
+            edge_features=edge_features,
+            **predict_proba_kwargs,
+        )
+
+        if isinstance(prediction_probabilities, np.ndarray):
+            if node_ids is not None and not self.can_predict_node_subsets():
+                prediction_probabilities = prediction_probabilities[node_ids]
+            prediction_probabilities = [prediction_probabilities]
+
+        prediction_mini_batches = []
+        if path is not None:
+            with open(path, "w", encoding="utf8") as file:
+                offset = 0
+                for prediction_mini_batch in prediction_probabilities:
+                    batch_node_ids = (
+                        np.arange(offset, offset + prediction_mini_batch.shape[0])
+                        if node_ids is None
+                        else node_ids[offset:offset + prediction_mini_batch.shape[0]]
+                    )
+                    rows = prediction_mini_batch.reshape((batch_node_ids.size, -1))
+                    dimensionality = rows.shape[1]
+                    pd.DataFrame(
+                        rows,
+                        columns=[
+                            f"prediction_{i}"
+                            for i in range(dimensionality)
+                        ] if dimensionality > 1 else ["prediction"],
+                        index=pd.Index(
+                            [
+                                graph.get_node_name_from_node_id(node_id)
+                                for node_id in batch_node_ids
+                            ],
+                            name="node_name"
+                        ),
+                    ).to_csv(file, sep=separator, header=offset == 0)
+                    offset += prediction_mini_batch.shape[0]
+                    if not consume_predictions:
+                        prediction_mini_batches.append(prediction_mini_batch)
+        else:
+            prediction_mini_batches = list(prediction_probabilities)
+
+        if consume_predictions:
+            return None
+
+        if len(prediction_mini_batches) == 1:
+            return prediction_mini_batches[0]
+
+        return np.concatenate(prediction_mini_batches)
+
     @classmethod
     def task_involves_edge_weights(cls) -> bool:
         """Returns whether the model task involves edge weights."""
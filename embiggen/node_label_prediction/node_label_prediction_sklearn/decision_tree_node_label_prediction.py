@@ -20,7 +20,9 @@ class DecisionTreeNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         min_impurity_decrease=0.,
         class_weight="balanced",
         ccp_alpha=0.0,
-        random_state: int = 42
+        random_state: int = 42,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Decision Tree for Node-label prediction."""
         self._criterion = criterion
@@ -51,7 +53,9 @@ class DecisionTreeNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
                 class_weight=class_weight,
                 ccp_alpha=ccp_alpha,
             ),
-            random_state
+            random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     def parameters(self) -> Dict[str, Any]:
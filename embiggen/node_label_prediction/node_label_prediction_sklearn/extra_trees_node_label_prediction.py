@@ -27,7 +27,9 @@ class ExtraTreesNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         class_weight="balanced",
         ccp_alpha=0.0,
         max_samples=None,
-        random_state: int = 42
+        random_state: int = 42,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Extra Trees for Edge  Prediction."""
         self._n_estimators = n_estimators
@@ -69,7 +71,9 @@ class ExtraTreesNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
                 ccp_alpha=ccp_alpha,
                 max_samples=max_samples
             ),
-            random_state
+            random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     @classmethod
@@ -28,7 +28,9 @@ class GradientBoostingNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         n_iter_no_change=None,
         tol=1e-4,
         ccp_alpha=0.0,
-        random_state: int = 42
+        random_state: int = 42,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Gradient Boosting for node label Prediction."""
         self._loss=loss
@@ -63,7 +65,9 @@ class GradientBoostingNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
                 warm_start=warm_start, validation_fraction=validation_fraction,
                 n_iter_no_change=n_iter_no_change, tol=tol, ccp_alpha=ccp_alpha
             ),
-            random_state
+            random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     def parameters(self) -> Dict[str, Any]:
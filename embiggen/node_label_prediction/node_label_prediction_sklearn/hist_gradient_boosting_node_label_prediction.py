@@ -29,7 +29,9 @@ class HistGradientBoostingNodeLabelPrediction(SklearnNodeLabelPredictionAdapter)
         tol=1e-7,
         verbose=0,
         class_weight=None,
-        random_state: int = 42
+        random_state: int = 42,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Hist Gradient Boosting for node label Prediction."""
         self._kwargs = normalize_kwargs(
@@ -61,7 +63,9 @@ class HistGradientBoostingNodeLabelPrediction(SklearnNodeLabelPredictionAdapter)
                 **self._kwargs,
                 random_state=random_state
             ),
-            random_state
+            random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     def parameters(self) -> Dict[str, Any]:
@@ -83,6 +87,11 @@ class HistGradientBoostingNodeLabelPrediction(SklearnNodeLabelPredictionAdapter)
     def model_name(cls) -> str:
         return "Hist Gradient Boosting Classifier"
 
+    @classmethod
+    def can_use_sparse_features(cls) -> bool:
+        """Returns whether the model accepts the features as scipy sparse matrices."""
+        return False
+
     @classmethod
     def supports_multilabel_prediction(cls) -> bool:
         """Returns whether the model supports multilabel prediction."""
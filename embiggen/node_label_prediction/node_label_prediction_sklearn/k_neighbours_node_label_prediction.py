@@ -20,6 +20,8 @@ class KNeighborsClassifierNodeLabelPrediction(SklearnNodeLabelPredictionAdapter)
         metric: str = "minkowski",
         metric_params: Dict[str, Any] = None,
         n_jobs: int = -1,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Decision Tree for Node-label prediction."""
         self._kwargs = normalize_kwargs(
@@ -36,7 +38,11 @@ class KNeighborsClassifierNodeLabelPrediction(SklearnNodeLabelPredictionAdapter)
             )
         )
 
-        super().__init__(KNeighborsClassifier(**self._kwargs))
+        super().__init__(
+            KNeighborsClassifier(**self._kwargs),
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
+        )
 
     def parameters(self) -> Dict[str, Any]:
         """Returns parameters used for this model."""
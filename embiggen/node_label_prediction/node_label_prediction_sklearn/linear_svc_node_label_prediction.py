@@ -25,6 +25,8 @@ class LinearSVCNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         verbose: int = 0,
         random_state: int = 42,
         max_iter: int = 1000,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Linear Support Vector Machine for Node-label prediction."""
         self._kwargs = normalize_kwargs(
@@ -47,6 +49,8 @@ class LinearSVCNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         super().__init__(
             LinearSVC(**self._kwargs, random_state=random_state),
             random_state=random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     def parameters(self) -> Dict[str, Any]:
@@ -29,6 +29,8 @@ class LogisticRegressionCVNodeLabelPrediction(SklearnNodeLabelPredictionAdapter)
         multi_class: str = "auto",
         random_state: int = 42,
         l1_ratios=None,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Logistic Regression Cross Validator for Node-label prediction."""
         self._kwargs = normalize_kwargs(
@@ -56,6 +58,8 @@ class LogisticRegressionCVNodeLabelPrediction(SklearnNodeLabelPredictionAdapter)
         super().__init__(
             LogisticRegressionCV(**self._kwargs, random_state=random_state),
             random_state=random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     def parameters(self) -> Dict[str, Any]:
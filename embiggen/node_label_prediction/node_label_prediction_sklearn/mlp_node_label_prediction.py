@@ -31,7 +31,9 @@ class MLPNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         epsilon=1e-8,
         n_iter_no_change=10,
         max_fun=15000,
-        random_state:int=42
+        random_state:int=42,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the MLP for node label Prediction."""
         self._activation = activation
@@ -81,7 +83,9 @@ class MLPNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
                 n_iter_no_change=n_iter_no_change,
                 max_fun=max_fun
             ),
-            random_state
+            random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     @classmethod
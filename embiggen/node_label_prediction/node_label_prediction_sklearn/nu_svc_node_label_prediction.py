@@ -27,6 +27,8 @@ class NuSVCNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         decision_function_shape: str = "ovr",
         break_ties: bool = False,
         random_state: int = 42,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Nu SVC for Node-label prediction."""
         self._kwargs = normalize_kwargs(
@@ -52,6 +54,8 @@ class NuSVCNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         super().__init__(
             NuSVC(**self._kwargs, random_state=random_state),
             random_state=random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     def parameters(self) -> Dict[str, Any]:
@@ -21,6 +21,8 @@ class RadiusNeighborsClassifierNodeLabelPrediction(SklearnNodeLabelPredictionAda
         outlier_label: Optional[str] = "most_frequent",
         metric_params: Dict[str, Any] = None,
         n_jobs: int = -1,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Decision Tree for Node-label prediction."""
         self._kwargs = normalize_kwargs(
@@ -38,7 +40,11 @@ class RadiusNeighborsClassifierNodeLabelPrediction(SklearnNodeLabelPredictionAda
             )
         )
 
-        super().__init__(RadiusNeighborsClassifier(**self._kwargs))
+        super().__init__(
+            RadiusNeighborsClassifier(**self._kwargs),
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
+        )
 
     def parameters(self) -> Dict[str, Any]:
         """Returns parameters used for this model."""
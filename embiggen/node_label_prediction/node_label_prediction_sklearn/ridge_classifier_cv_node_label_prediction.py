@@ -18,6 +18,8 @@ class RidgeClassifierCVNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         cv: int=10,
         class_weight: Union[Dict, str] = "balanced",
         store_cv_values: bool = False,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Ridge Classifier Cross Validator for Node-label prediction."""
         self._kwargs = normalize_kwargs(
@@ -34,6 +36,8 @@ class RidgeClassifierCVNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
 
         super().__init__(
             RidgeClassifierCV(**self._kwargs),
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     def parameters(self) -> Dict[str, Any]:
@@ -21,6 +21,8 @@ class RidgeClassifierNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         solver: str = "auto",
         positive: bool = False,
         random_state: int = 323,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the Ridge Classifier for Node-label prediction."""
         self._kwargs = normalize_kwargs(
@@ -40,6 +42,8 @@ class RidgeClassifierNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         super().__init__(
             RidgeClassifier(**self._kwargs, random_state=random_state),
             random_state=random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     def parameters(self) -> Dict[str, Any]:
@@ -14,7 +14,11 @@ class SklearnNodeLabelPredictionAdapter(SklearnLikeNodeLabelPredictionAdapter):
     """Class wrapping Sklearn models for running node-label predictions."""
 
     def __init__(
-        self, model_instance: Type[ClassifierMixin], random_state: Optional[int] = None
+        self,
+        model_instance: Type[ClassifierMixin],
+        random_state: Optional[int] = None,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the adapter for Sklearn object.
 
@@ -24,6 +28,10 @@ class SklearnNodeLabelPredictionAdapter(SklearnLikeNodeLabelPredictionAdapter):
             The class instance to be adapted into node-label prediction.
         random_state: Optional[int] = None
             The random state to use to reproduce the training.
+        prediction_batch_size: int = 2**16
+            Number of nodes to embed and predict at once.
+        prediction_number_of_threads: int = 1
+            Number of batches to predict concurrently.
 
         Raises
         ----------------
@@ -36,7 +44,9 @@ class SklearnNodeLabelPredictionAdapter(SklearnLikeNodeLabelPredictionAdapter):
         self.__class__.__doc__ = model_instance.__class__.__doc__
         super().__init__(
             model_instance=model_instance,
-            random_state=random_state
+            random_state=random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     @classmethod
@@ -2,6 +2,7 @@
 from typing import List, Union, Optional, Dict, Type, Tuple, Any
 
 import numpy as np
+from scipy.sparse import issparse
 from tensorflow.keras.layers import Dense, Concatenate  # pylint: disable=import-error,no-name-in-module
 from tensorflow.keras.models import Model  # pylint: disable=import-error,no-name-in-module
 from tensorflow.keras.optimizers import \
@@ -13,6 +14,8 @@ from embiggen.utils.abstract_gcn import AbstractGCN, abstract_class
 from embiggen.utils.normalize_model_structural_parameters import normalize_model_list_parameter
 from embiggen.node_label_prediction.node_label_prediction_model import AbstractNodeLabelPredictionModel
 from embiggen.utils.number_to_ordinal import number_to_ordinal
+from embiggen.utils.tensorflow_utils import sparse_node_feature_to_tensor
+from embiggen.utils.tensorflow_optimizers import get_tensorflow_optimizer
 
 @abstract_class
 class GCNNodeLabelPrediction(AbstractGCN, AbstractNodeLabelPredictionModel):
@@ -228,7 +231,7 @@ class GCNNodeLabelPrediction(AbstractGCN, AbstractNodeLabelPredictionModel):
 
         model.compile(
             loss=self.get_loss_name(),
-            optimizer=self._optimizer,
+            optimizer=get_tensorflow_optimizer(self._optimizer),
             weighted_metrics="accuracy"
         )
 
@@ -284,7 +287,12 @@ class GCNNodeLabelPrediction(AbstractGCN, AbstractNodeLabelPredictionModel):
             *(
                 ()
                 if node_features is None
-                else node_features
+                else [
+                    sparse_node_feature_to_tensor(node_feature)
+                    if issparse(node_feature)
+                    else node_feature
+                    for node_feature in node_features
+                ]
             ),
             *(
                 (graph.get_node_ids(),)
@@ -47,7 +47,9 @@ class XGBNodeLabelPrediction(SklearnLikeNodeLabelPredictionAdapter):
         max_cat_threshold: Optional[int] = None,
         eval_metric: Optional[Union[str, List[str]]] = None,
         early_stopping_rounds: Optional[int] = None,
-        random_state: int = 42
+        random_state: int = 42,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Build a XGB node-label prediction model."""
         self._kwargs = dict(
@@ -94,6 +96,8 @@ class XGBNodeLabelPrediction(SklearnLikeNodeLabelPredictionAdapter):
                 random_state=random_state,
             ),
             random_state=random_state,
+            prediction_batch_size=prediction_batch_size,
+            prediction_number_of_threads=prediction_number_of_threads,
         )
 
     @classmethod
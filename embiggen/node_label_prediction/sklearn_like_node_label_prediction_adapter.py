@@ -1,5 +1,6 @@
 """Module providing adapter class making node-label prediction possible in sklearn models."""
-from typing import Type, List, Dict, Optional
+from typing import Type, List, Dict, Optional, Any, Iterator, Union
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import compress_pickle
 import copy
@@ -12,6 +13,7 @@ from embiggen.node_label_prediction.node_label_prediction_model import (
     AbstractNodeLabelPredictionModel,
 )
 from embiggen.utils.abstract_models import abstract_class
+from embiggen.utils.sklearn_utils import densify_unsupported_sparse_features
 
 
 @abstract_class
@@ -19,7 +21,11 @@ class SklearnLikeNodeLabelPredictionAdapter(AbstractNodeLabelPredictionModel):
     """Class wrapping Sklearn models for running node-label predictions."""
 
     def __init__(
-        self, model_instance, random_state: Optional[int] = None
+        self,
+        model_instance,
+        random_state: Optional[int] = None,
+        prediction_batch_size: int = 2**16,
+        prediction_number_of_threads: int = 1,
     ):
         """Create the adapter for Sklearn object.
 
@@ -29,14 +35,46 @@ class SklearnLikeNodeLabelPredictionAdapter(AbstractNodeLabelPredictionModel):
             The class instance to be adapted into node-label prediction.
         random_state: Optional[int] = None
             The random state to use to reproduce the training.
+        prediction_batch_size: int = 2**16
+            Number of nodes to embed and predict at once.
+            When the nodes to predict are more than the batch size,
+            the predictions are computed batch-wise, so that the memory
+            requirements are bounded by the batch size times the number
+            of features and classes, rather than by the number of nodes.
+        prediction_number_of_threads: int = 1
+            Number of batches to predict concurrently.
+            Note that only models releasing the GIL while predicting
+            will benefit from more than a single thread.
 
         Raises
         ----------------
         ValueError
             If the provided model_instance is not a subclass of `ClassifierMixin`.
+        ValueError
+            If the prediction batch size or number of threads are not strictly positive integers.
         """
+        if not isinstance(prediction_batch_size, int) or prediction_batch_size <= 0:
+            raise ValueError(
+                "The prediction batch size should be a strictly positive integer, "
+                f"but you have provided {prediction_batch_size}."
+            )
+        if not isinstance(prediction_number_of_threads, int) or prediction_number_of_threads <= 0:
+            raise ValueError(
+                "The prediction number of threads should be a strictly positive integer, "
+                f"but you have provided {prediction_number_of_threads}."
+            )
         super().__init__(random_state=random_state)
         self._model_instance = model_instance
+        self._prediction_batch_size = prediction_batch_size
+        self._prediction_number_of_threads = prediction_number_of_threads
+
+    def parameters(self) -> Dict[str, Any]:
+        """Returns parameters used for this model."""
+        return {
+            "prediction_batch_size": self._prediction_batch_size,
+            "prediction_number_of_threads": self._prediction_number_of_threads,
+            **super().parameters(),
+        }
 
     def clone(self):
         """Return copy of self."""
@@ -46,6 +84,7 @@ class SklearnLikeNodeLabelPredictionAdapter(AbstractNodeLabelPredictionModel):
         self,
         graph: Graph,
         node_features: List[np.ndarray],
+        node_ids: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Transforms the provided data into an Sklearn-compatible numpy array.
 
@@ -56,6 +95,9 @@ class SklearnLikeNodeLabelPredictionAdapter(AbstractNodeLabelPredictionModel):
             It can either be an Graph or a list of lists of edges.
         node_features: List[np.ndarray]
             The node features to be used in the training of the model.
+        node_ids: Optional[np.ndarray] = None
+            The IDs of the nodes to embed. By default, all of the
+            nodes of the provided graph are embedded.
 
         Raises
         ------------------
@@ -65,7 +107,7 @@ class SklearnLikeNodeLabelPredictionAdapter(AbstractNodeLabelPredictionModel):
         gt = NodeTransformer(aligned_mapping=True)
         gt.fit(node_features)
         return gt.transform(
-            graph,
+            graph if node_ids is None else node_ids,
         )
 
     def _fit(
@@ -109,14 +151,123 @@ class SklearnLikeNodeLabelPredictionAdapter(AbstractNodeLabelPredictionModel):
 
         nlpt.fit(node_features)
 
+        x, y = nlpt.transform(
+            graph=graph,
+            behaviour_for_unknown_node_labels="drop",
+            shuffle=True,
+            random_state=self._random_state,
+        )
+
         self._model_instance.fit(
-            *nlpt.transform(
+            densify_unsupported_sparse_features(x, self.can_use_sparse_features()),
+            y
+        )
+
+    def _predict_proba_from_features(self, features: np.ndarray) -> np.ndarray:
+        """Return the prediction probabilities of the model on the provided features.
+
+        Parameters
+        ------------------
+        features: np.ndarray
+            The node features to predict, as returned by the node transformer.
+        """
+        features = densify_unsupported_sparse_features(
+            features,
+            self.can_use_sparse_features()
+        )
+        if hasattr(self._model_instance, "predict_proba"):
+            predictions_probabilities = self._model_instance.predict_proba(features)
+        elif self.is_multilabel_prediction_task():
+            predictions_probabilities = self._model_instance.predict(features)
+        else:
+            predictions = self._model_instance.predict(features).astype(np.int32)
+            predictions_probabilities = np.zeros(
+                (predictions.shape[0], len(self._model_instance.classes_)),
+                dtype=np.float32,
+            )
+            predictions_probabilities[np.arange(predictions.size), predictions] = 1
+
+        if self.is_multilabel_prediction_task():
+            if isinstance(predictions_probabilities, np.ndarray):
+                return predictions_probabilities
+            if isinstance(predictions_probabilities, list):
+                return np.array(
+                    [
+                        class_predictions[:, 1]
+                        for class_predictions in predictions_probabilities
+                    ]
+                ).T
+            raise NotImplementedError(
+                f"The model {self.model_name()} from library {self.library_name()} "
+                f"returned an object of type {type(predictions_probabilities)} during "
+                "the execution of the predict proba method."
+            )
+
+        return predictions_probabilities
+
+    def _predict_batch_wise(
+        self,
+        graph: Graph,
+        node_features: List[np.ndarray],
+        node_ids: Optional[np.ndarray],
+        predict,
+    ) -> Union[np.ndarray, Iterator[np.ndarray]]:
+        """Return the predictions of the provided callback on the nodes, batch-wise if necessary.
+
+        Parameters
+        ------------------
+        graph: Graph,
+            The graph whose nodes are to be predicted.
+        node_features: List[np.ndarray]
+            The node features to be used in prediction.
+        node_ids: Optional[np.ndarray]
+            The IDs of the nodes to predict. By default, all of the nodes are predicted.
+        predict: Callable[[np.ndarray], np.ndarray]
+            The callback to run on the features of each batch.
+
+        Implementation details
+        ------------------
+        When the nodes to predict fit in a single batch, the predictions are
+        returned as a numpy array. Otherwise, a generator yielding the predictions
+        of each batch, in the order of the nodes, is returned.
+        """
+        number_of_nodes = graph.get_number_of_nodes() if node_ids is None else node_ids.size
+
+        if number_of_nodes <= self._prediction_batch_size:
+            return predict(self._trasform_graph_into_node_embedding(
                 graph=graph,
-                behaviour_for_unknown_node_labels="drop",
-                shuffle=True,
-                random_state=self._random_state,
+                node_features=node_features,
+                node_ids=node_ids,
+            ))
+
+        transformer = NodeTransformer(aligned_mapping=True)
+        transformer.fit(node_features)
+
+        def predict_batch(start: int) -> np.ndarray:
+            end = min(start + self._prediction_batch_size, number_of_nodes)
+            batch_node_ids = (
+                np.arange(start, end)
+                if node_ids is None
+                else node_ids[start:end]
             )
-        )
+            return predict(transformer.transform(batch_node_ids))
+
+        starts = range(0, number_of_nodes, self._prediction_batch_size)
+
+        if self._prediction_number_of_threads == 1:
+            return (predict_batch(start) for start in starts)
+
+        def predict_batches_concurrently() -> Iterator[np.ndarray]:
+            # We only submit as many batches as there are threads at once,
+            # so that the memory peak remains bounded by the batch size.
+            with ThreadPoolExecutor(max_workers=self._prediction_number_of_threads) as executor:
+                for window_start in range(0, len(starts), self._prediction_number_of_threads):
+                    yield from executor.map(
+                        predict_batch,
+                        starts[window_start:window_start + self._prediction_number_of_threads]
+                    )
+
+        return predict_batches_concurrently()
 
     def _predict_proba(
         self,
@@ -126,6 +277,7 @@ class SklearnLikeNodeLabelPredictionAdapter(AbstractNodeLabelPredictionModel):
         node_type_features: Optional[List[np.ndarray]] = None,
         edge_type_features: Optional[List[np.ndarray]] = None,
         edge_features: Optional[List[np.ndarray]] = None,
+        node_ids: Optional[np.ndarray] = None,
     ) -> Dict[str, float]:
         """Return evaluations of the model on the edge-label prediction task on the provided data.
 
@@ -149,47 +301,21 @@ class SklearnLikeNodeLabelPredictionAdapter(AbstractNodeLabelPredictionModel):
             Optional edge features to be used as input Concatenated
             to the obtained edge embedding. The shape must be equal
             to the number of directed edges in the provided graph.
+        node_ids: Optional[np.ndarray] = None
+            The IDs of the nodes to predict. By default, all of the nodes are predicted.
 
         Raises
         ------------------
         ValueError
             If the two graphs do not share the same node vocabulary.
         """
-        features = self._trasform_graph_into_node_embedding(
+        return self._predict_batch_wise(
             graph=graph,
             node_features=node_features,
+            node_ids=node_ids,
+            predict=self._predict_proba_from_features,
         )
 
-        if hasattr(self._model_instance, "predict_proba"):
-            predictions_probabilities = self._model_instance.predict_proba(features)
-        elif self.is_multilabel_prediction_task():
-            predictions_probabilities = self._model_instance.predict(features)
-        else:
-            predictions = self._model_instance.predict(features).astype(np.int32)
-            predictions_probabilities = np.zeros(
-                (predictions.shape[0], len(self._model_instance.classes_)),
-                dtype=np.float32,
-            )
-            predictions_probabilities[np.arange(predictions.size), predictions] = 1
-
-        if self.is_multilabel_prediction_task():
-            if isinstance(predictions_probabilities, np.ndarray):
-                return predictions_probabilities
-            if isinstance(predictions_probabilities, list):
-                return np.array(
-                    [
-                        class_predictions[:, 1]
-                        for class_predictions in predictions_probabilities
-                    ]
-                ).T
-            raise NotImplementedError(
-                f"The model {self.model_name()} from library {self.library_name()} "
-                f"returned an object of type {type(predictions_probabilities)} during "
-                "the execution of the predict proba method."
-            )
-
-        return predictions_probabilities
-
     def _predict(
         self,
         graph: Graph,
@@ -227,12 +353,30 @@ class SklearnLikeNodeLabelPredictionAdapter(AbstractNodeLabelPredictionModel):
         ValueError
             If the two graphs do not share the same node vocabulary.
         """
-        return self._model_instance.predict(
-            self._trasform_graph_into_node_embedding(
-                graph=graph,
-                node_features=node_features,
-            )
+        predictions = self._predict_batch_wise(
+            graph=graph,
+            node_features=node_features,
+            node_ids=None,
+            predict=lambda features: self._model_instance.predict(
+                densify_unsupported_sparse_features(
+                    features,
+                    self.can_use_sparse_features()
+                )
+            ),
         )
+        if isinstance(predictions, np.ndarray):
+            return predictions
+        return np.concatenate(list(predictions))
+
+    @classmethod
+    def can_predict_node_subsets(cls) -> bool:
+        """Returns whether the model can natively run predictions on a subset of the nodes."""
+        return True
+
+    @classmethod
+    def can_use_sparse_features(cls) -> bool:
+        """Returns whether the model accepts the features as scipy sparse matrices."""
+        return True
 
     @classmethod
     def can_use_edge_weights(cls) -> bool:
@@ -3,11 +3,13 @@ from typing import List, Optional, Tuple, Type, Union
 
 import numpy as np
 import tensorflow as tf
+from scipy.sparse import issparse
 from ensmallen import Graph  # pylint: disable=no-name-in-module
 from keras_mixed_sequence import Sequence
 
 from embiggen.sequences.generic_sequences import EdgePredictionSequence
 from embiggen.utils import AbstractEdgeFeature
+from embiggen.utils.tensorflow_utils import sparse_node_feature_to_tensor
 
 
 class GCNEdgePredictionSequence(Sequence):
@@ -139,6 +141,17 @@ class GCNEdgePredictionSequence(Sequence):
             for node_feature in node_features
         ]
 
+        # When running whole graph convolutions, the sparse node features
+        # are converted once into SparseTensors, so that the graph convolution
+        # layers can multiply them with sparse-dense matmuls.
+        if self.has_kernels():
+            self._node_features = [
+                sparse_node_feature_to_tensor(node_feature)
+                if issparse(node_feature)
+                else node_feature
+                for node_feature in self._node_features
+            ]
+
         # We need to reshape the node IDs into a column vector
         # so that they match exactly the shape expected by the
         # embedding layer of the model.
@@ -342,7 +355,9 @@ class GCNEdgePredictionSequence(Sequence):
             )
         
         return tuple([
-            node_feature[node_ids.flatten()]
+            node_feature[node_ids.flatten()].toarray()
+            if issparse(node_feature)
+            else node_feature[node_ids.flatten()]
             for node_ids in (sources, destinations)
             for node_feature in (
                 *self._node_features,
@@ -5,7 +5,7 @@ import numpy as np  # type: ignore
 from ensmallen import Graph  # pylint: disable=no-name-in-module
 from keras_mixed_sequence import Sequence
 import tensorflow as tf
-from embiggen.utils.tensorflow_utils import tensorflow_version_is_higher_or_equal_than
+from embiggen.utils.tensorflow_utils import batch_getter_into_parallel_dataset
 
 
 class Node2VecSequence(Sequence):
@@ -94,63 +94,51 @@ class Node2VecSequence(Sequence):
         self._current_index += 1
         return self[self._current_index]
 
-    def into_dataset(self) -> tf.data.Dataset:
+    def into_dataset(
+        self,
+        number_of_parallel_calls: Optional[int] = None,
+        number_of_skipped_batches: int = 0,
+    ) -> tf.data.Dataset:
         """Return dataset generated out of the current sequence instance.
 
+        Parameters
+        ---------------------------------
+        number_of_parallel_calls: Optional[int] = None
+            The number of batches of walks to sample concurrently.
+            By default, it is tuned automatically by TensorFlow.
+        number_of_skipped_batches: int = 0
+            The number of leading batches not to sample, as when
+            resuming the training after the completed epochs.
+
         Implementative details
         ---------------------------------
-        This method handles the conversion of this Keras Sequence into
-        a TensorFlow dataset, also handling the proper dispatching according
-        to what version of TensorFlow is installed in this system.
+        The batches are sampled by a parallel map over the batch indices,
+        with the random state of each batch derived from its index as
+        when using this sequence as an infinite generator, so that the
+        sampling of the walks is not bound to a single producer thread.
 
         Returns
         ----------------------------------
         Dataset to be used for the training of a model
         """
-
-        #################################################################
-        # Handling kernel creation when TensorFlow is a modern version. #
-        #################################################################
-
         number_of_skipgrams = self._batch_size * self._iterations * \
             (self._walk_length - self._window_size * 2)
-        
-        if tensorflow_version_is_higher_or_equal_than("2.5.0"):
-            input_tensor_specs = []
-
-            # Shapes of the source and destination node IDs
-            input_tensor_specs.append(tf.TensorSpec(
-                shape=(number_of_skipgrams, self._window_size*2),
-                dtype=tf.int32
-            ))
-            input_tensor_specs.append(tf.TensorSpec(
-                shape=(number_of_skipgrams, ),
-                dtype=tf.int32
-            ))
-
-            return tf.data.Dataset.from_generator(
-                self,
-                output_signature=(
-                    (
-                        *input_tensor_specs,
-                    ),
-                )
-            )
-
-        return tf.data.Dataset.from_generator(
-            self,
-            output_types=(
-                (
-                    tf.int32,
-                    tf.int32
+
+        return batch_getter_into_parallel_dataset(
+            lambda idx: self[idx][0][0],
+            output_signature=(
+                # Shapes of the contexts and words node IDs
+                tf.TensorSpec(
+                    shape=(number_of_skipgrams, self._window_size*2),
+                    dtype=tf.int32
                 ),
-            ),
-            output_shapes=(
-                (
-                    tf.TensorShape([number_of_skipgrams, self._window_size*2]),
-                    tf.TensorShape([number_of_skipgrams, ])
+                tf.TensorSpec(
+                    shape=(number_of_skipgrams, ),
+                    dtype=tf.int32
                 ),
-            )
+            ),
+            number_of_parallel_calls=number_of_parallel_calls,
+            number_of_skipped_batches=number_of_skipped_batches,
         )
 
     def __getitem__(self, idx: int) -> Tuple[Tuple[np.ndarray, np.ndarray], None]:
@@ -1,11 +1,11 @@
 """Keras Sequence for running Siamese Neural Network based on currupted triples sampling."""
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 import tensorflow as tf
 from ensmallen import Graph  # pylint: disable=no-name-in-module
 from keras_mixed_sequence import Sequence
-from embiggen.utils.tensorflow_utils import tensorflow_version_is_higher_or_equal_than
+from embiggen.utils.tensorflow_utils import batch_getter_into_parallel_dataset
 
 
 class SiameseSequence(Sequence):
@@ -45,28 +45,43 @@ class SiameseSequence(Sequence):
         self._current_index += 1
         return (tuple(self[self._current_index]),)
 
-    def into_dataset(self) -> tf.data.Dataset:
+    def into_dataset(
+        self,
+        number_of_parallel_calls: Optional[int] = None,
+        number_of_skipped_batches: int = 0,
+    ) -> tf.data.Dataset:
         """Return dataset generated out of the current sequence instance.
 
+        Parameters
+        ---------------------------------
+        number_of_parallel_calls: Optional[int] = None
+            The number of batches of triples to sample concurrently.
+            By default, it is tuned automatically by TensorFlow.
+        number_of_skipped_batches: int = 0
+            The number of leading batches not to sample, as when
+            resuming the training after the completed epochs.
+
         Implementative details
         ---------------------------------
-        This method handles the conversion of this Keras Sequence into
-        a TensorFlow dataset, also handling the proper dispatching according
-        to what version of TensorFlow is installed in this system.
+        The batches are sampled by a parallel map over the batch indices,
+        with the random state of each batch derived from its index as
+        when using this sequence as an infinite generator.
 
         Returns
         ----------------------------------
         Dataset to be used for the training of a model
         """
-        return tf.data.Dataset.from_generator(
-            self,
-            output_signature=(tuple([
+        return batch_getter_into_parallel_dataset(
+            lambda idx: self[idx][0],
+            output_signature=tuple([
                 tf.TensorSpec(
                     shape=(self._batch_size, ),
                     dtype=tf.uint32
                 )
                 for _ in range(4 + int(self._return_edge_types))
-            ]),)
+            ]),
+            number_of_parallel_calls=number_of_parallel_calls,
+            number_of_skipped_batches=number_of_skipped_batches,
         )
 
     def __getitem__(self, idx: int) -> List[np.ndarray]:
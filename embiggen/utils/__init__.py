@@ -15,10 +15,29 @@ from embiggen.utils.abstract_models import (
     format_list
 )
 from embiggen.utils.pipeline import classification_evaluation_pipeline
+from embiggen.utils.hyperparameter_search import (
+    hyperparameter_search,
+    get_hyperparameter_search_trials,
+)
 from embiggen.utils.number_to_ordinal import number_to_ordinal
 from embiggen.utils.normalize_kwargs import normalize_kwargs
 from embiggen.utils.abstract_edge_feature import AbstractEdgeFeature
 from embiggen.utils.abstract_feature import AbstractFeature
+from embiggen.utils.edge_feature_cache import EdgeFeatureCache
+from embiggen.utils.classification_metrics import (
+    get_multiclass_metrics,
+    get_multilabel_metrics,
+    get_one_vs_rest_auroc_and_auprc,
+)
+from embiggen.utils.alias_table import (
+    get_unigram_distribution,
+    get_alias_table,
+    get_unigram_alias_table,
+    sample_from_alias_table,
+)
+from embiggen.utils.results_sink import ResultsSink
+from embiggen.utils.profiler import Profiler
+from embiggen.utils.work_queue import WorkQueue
 
 __all__ = [
     "AbstractClassifierModel",
@@ -27,6 +46,8 @@ __all__ = [
     "EmbeddingResult",
     "AbstractModel",
     "classification_evaluation_pipeline",
+    "hyperparameter_search",
+    "get_hyperparameter_search_trials",
     "format_list",
     "get_models_dataframe",
     "get_available_models_for_node_label_prediction",
@@ -38,5 +59,16 @@ __all__ = [
     "number_to_ordinal",
     "normalize_kwargs",
     "AbstractEdgeFeature",
-    "AbstractFeature"
+    "AbstractFeature",
+    "EdgeFeatureCache",
+    "get_multiclass_metrics",
+    "get_multilabel_metrics",
+    "get_one_vs_rest_auroc_and_auprc",
+    "get_unigram_distribution",
+    "get_alias_table",
+    "get_unigram_alias_table",
+    "sample_from_alias_table",
+    "ResultsSink",
+    "Profiler",
+    "WorkQueue",
 ]
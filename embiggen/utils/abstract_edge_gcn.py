@@ -43,6 +43,7 @@ from embiggen.utils.normalize_model_structural_parameters import (
     normalize_model_list_parameter,
 )
 from embiggen.utils.number_to_ordinal import number_to_ordinal
+from embiggen.utils.tensorflow_optimizers import get_tensorflow_optimizer
 
 
 @abstract_class
@@ -900,7 +901,9 @@ class AbstractEdgeGCN(AbstractGCN):
         )
 
         model.compile(
-            loss=self.get_loss_name(), optimizer=self._optimizer, metrics="accuracy"
+            loss=self.get_loss_name(),
+            optimizer=get_tensorflow_optimizer(self._optimizer),
+            metrics="accuracy"
         )
 
         return model
@@ -1,12 +1,12 @@
 """Kipf GCN model for node-label prediction."""
 import copy
-import warnings
 from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 
 import compress_pickle
 import numpy as np
 import pandas as pd
 import tensorflow as tf
+from scipy.sparse import issparse
 from ensmallen import Graph
 from keras_mixed_sequence import Sequence
 from tensorflow.keras.callbacks import (  # pylint: disable=import-error,no-name-in-module
@@ -28,6 +28,7 @@ from embiggen.utils.abstract_models import (AbstractClassifierModel,
 from embiggen.utils.normalize_model_structural_parameters import \
     normalize_model_list_parameter
 from embiggen.utils.number_to_ordinal import number_to_ordinal
+from embiggen.utils.graph_kernels import get_kernel_coo_matrix
 
 
 def graph_to_sparse_tensor(
@@ -76,24 +77,6 @@ def graph_to_sparse_tensor(
     -------------------
     SparseTensor with (weighted) adjacency matrix.
     """
-    if "Weighted" in kernel:
-        use_weights = True
-        kernel = kernel.replace("Weighted ", "")
-    else:
-        use_weights = False
-
-    if "Transposed" in kernel:
-        transpose = True
-        kernel = kernel.replace("Transposed ", "")
-    else:
-        transpose = False
-
-    if use_weights and not graph.has_edge_weights():
-        raise ValueError(
-            "Edge weights were requested but the provided graph "
-            "does not contain any edge weight."
-        )
-
     if graph.has_singleton_nodes():
         raise ValueError(
             f"In the provided {graph.get_name()} graph there are "
@@ -105,55 +88,11 @@ def graph_to_sparse_tensor(
             "using the `graph.add_selfloops()` method."
         )
 
-    if graph.is_multigraph():
-        message = (
-            "The GCN model does not currently support convolutions on a multigraph. "
-            "We are dropping the parallel edges before computing the adjacency matrix."
-        )
-        if handling_multi_graph == "warn":
-            warnings.warn(message)
-        elif handling_multi_graph == "raise":
-            raise ValueError(message)
-
-        graph = graph.remove_parallel_edges()
-
-    # We transpose the graph if requested, though the operation is skipped
-    # if we are computing the transposed of an undirected graph. A warning
-    # is raised in this case.
-    if transpose:
-        if graph.is_directed():
-            graph = graph.to_transposed()
-        else:
-            warnings.warn(
-                "You are trying to compute the transposed of an undirected graph. "
-                "The transposed of an undirected graph is the same graph. "
-                "This operation is skipped."
-            )
-
-    if kernel == "Weights":
-        edge_node_ids = graph.get_directed_edge_node_ids()
-        kernel_weights = graph.get_directed_edge_weights()
-    elif kernel == "Left Normalized Laplacian":
-        edge_node_ids, kernel_weights = graph.get_left_normalized_laplacian_coo_matrix()
-    elif kernel == "Right Normalized Laplacian":
-        (
-            edge_node_ids,
-            kernel_weights,
-        ) = graph.get_right_normalized_laplacian_coo_matrix()
-    elif kernel == "Symmetric Normalized Laplacian":
-        (
-            edge_node_ids,
-            kernel_weights,
-        ) = graph.get_symmetric_normalized_laplacian_coo_matrix()
-    else:
-        raise ValueError(
-            f"Kernel {kernel} is not supported. "
-            "Supported kernels are: "
-            f"{', '.join(AbstractGCN.supported_kernels)}."
-        )
-    kernel_weights = np.abs(kernel_weights)
-    if use_weights and kernel != "Weights":
-        kernel_weights = kernel_weights * graph.get_directed_edge_weights()
+    edge_node_ids, kernel_weights = get_kernel_coo_matrix(
+        graph,
+        kernel=kernel,
+        handling_multi_graph=handling_multi_graph,
+    )
 
     # We check that no NaNs are present in the kernel weights.
     number_of_nans = np.isnan(kernel_weights).sum()
@@ -193,9 +132,9 @@ class AbstractGCN(AbstractClassifierModel):
         "Weighted Left Normalized Laplacian",
         "Weighted Right Normalized Laplacian",
         "Weighted Symmetric Normalized Laplacian",
-        "Trasposed Weighted Left Normalized Laplacian",
-        "Trasposed Weighted Right Normalized Laplacian",
-        "Trasposed Weighted Symmetric Normalized Laplacian",
+        "Transposed Weighted Left Normalized Laplacian",
+        "Transposed Weighted Right Normalized Laplacian",
+        "Transposed Weighted Symmetric Normalized Laplacian",
     ]
 
     def __init__(
@@ -275,6 +214,9 @@ class AbstractGCN(AbstractClassifierModel):
             Defaults to mean.
         optimizer: str = "Adam"
             The optimizer to use while training the model.
+            The names `sgd` and `adagrad` refer to the Keras optimizers, which
+            only update the rows of the embedding tables gathered in the batch,
+            as does `lazy_adam`, while the other Adam variants update all rows.
         early_stopping_min_delta: float
             Minimum delta of metric to stop the training.
         early_stopping_patience: int
@@ -704,6 +646,12 @@ class AbstractGCN(AbstractClassifierModel):
                         new_input_features.append(Input(
                             shape=node_feature.shape[1:],
                             name=node_feature_name,
+                            # Sparse node features are fed as SparseTensors,
+                            # except for the edge-level tasks without kernels
+                            # where the gathered rows are densified batch-wise.
+                            sparse=issparse(node_feature) and (
+                                self.has_kernels() or not self.is_edge_level_task()
+                            ),
                         ))
                     input_features.extend(new_input_features)
                     hidden.extend(new_input_features)
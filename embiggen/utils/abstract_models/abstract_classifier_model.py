@@ -1,30 +1,38 @@
 """Module providing abstract classes for classification models."""
 import functools
+import hashlib
 import json
 import os
 import platform
+import threading
 import time
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import pandas as pd
 from cache_decorator import Cache
+from scipy.sparse import issparse
+from scipy.stats import ttest_rel
 from ensmallen import Graph, express_measures
 from environments_utils import must_be_in_slurm_node
-from sklearn.metrics import (
-    accuracy_score,
-    balanced_accuracy_score,
-    f1_score,
-    hamming_loss,
-    precision_score,
-    recall_score,
-    roc_auc_score,
-)
 from tqdm.auto import tqdm, trange
 from userinput.utils import must_be_in_set
 from embiggen.__version__ import __version__ as __embiggen_version__
 
 from embiggen.utils.abstract_edge_feature import AbstractEdgeFeature
+from embiggen.utils.edge_feature_cache import EdgeFeatureCache
+from embiggen.utils.holdout_cache import HoldoutCache, MAXIMAL_PREDICTION_MEMORY
+from embiggen.utils.node_feature_alignment import align_node_feature
+from embiggen.utils.classification_metrics import (
+    get_multiclass_metrics,
+    get_multilabel_metrics,
+    get_one_vs_rest_auroc_and_auprc,
+)
+from embiggen.utils.results_sink import ResultsSink
+from embiggen.utils.profiler import Profiler
+from embiggen.utils.work_queue import WorkQueue
 from embiggen.utils.abstract_models.abstract_embedding_model import (
     AbstractEmbeddingModel,
     EmbeddingResult,
@@ -78,6 +86,142 @@ class AbstractClassifierModel(AbstractModel):
         # be required.
         self._training_graph_density: Optional[float] = None
 
+        # While the model is being trained and evaluated on a holdout, this
+        # cache is shared among all of the models evaluated on the same
+        # holdout, so that models with identical feature settings can reuse
+        # the matrices that the first of them has built.
+        self._holdout_cache: Optional[HoldoutCache] = None
+
+        # Likewise, while the model is being trained and evaluated on a holdout,
+        # the profiler of the evaluation records the phases of the model.
+        self._profiler: Optional[Profiler] = None
+
+    def _profile(self, name: str, **arguments: Dict[str, Any]) -> ContextManager:
+        """Return context manager recording the wrapped phase, if the model is being evaluated.
+
+        Parameters
+        ---------------
+        name: str
+            The name of the phase.
+        **arguments: Dict[str, Any]
+            Additional values describing the phase, reported in the trace.
+        """
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.span(name, **arguments)
+
+    def _get_from_holdout_cache(
+        self,
+        key: Tuple,
+        builder: Callable[[], Any],
+        referenced_objects: Tuple = (),
+        is_prediction_batch: bool = False,
+    ) -> Any:
+        """Return the value associated to the key in the holdout cache, building it if missing.
+
+        Parameters
+        ---------------
+        key: Tuple
+            The hashable key identifying the value.
+            It must include all of the settings that affect the value.
+        builder: Callable[[], Any]
+            Callback building the value when it is not already cached.
+        referenced_objects: Tuple = ()
+            The objects whose ids are used within the key. These are kept
+            alive together with the cached value, so that their ids cannot
+            be reused by other objects while the holdout cache exists.
+        is_prediction_batch: bool = False
+            Whether the value is a prediction batch, which is only
+            cached up to the memory cap of the holdout cache.
+
+        Implementation details
+        ---------------
+        When the model is not being evaluated on a holdout, the value is
+        simply built.
+        """
+        if self._holdout_cache is None:
+            return builder()
+        return self._holdout_cache.get(
+            key=key,
+            builder=builder,
+            referenced_objects=referenced_objects,
+            is_prediction_batch=is_prediction_batch,
+        )
+
+    def _get_edge_feature_cache(self) -> Optional[EdgeFeatureCache]:
+        """Return the edge feature cache of the current holdout, if any."""
+        if self._holdout_cache is None:
+            return None
+        return self._get_from_holdout_cache(
+            key=("edge_feature_cache",),
+            builder=EdgeFeatureCache,
+        )
+
+    def _get_edge_feature_from_graph(
+        self,
+        edge_feature: AbstractEdgeFeature,
+        graph: Graph,
+        support: Graph,
+    ) -> Dict[str, np.ndarray]:
+        """Return the edge feature for the given graph, reusing it within the current holdout.
+
+        Parameters
+        ---------------
+        edge_feature: AbstractEdgeFeature
+            The edge feature to rasterize.
+        graph: Graph,
+            The graph for which to compute the edge feature.
+        support: Graph,
+            The graph to use as base for the topological metrics.
+        """
+        edge_feature_cache = self._get_edge_feature_cache()
+        with self._profile("rasterizing_edge_features"):
+            if edge_feature_cache is None:
+                return edge_feature.get_edge_feature_from_graph(
+                    graph=graph,
+                    support=support,
+                )
+            return edge_feature_cache.get_edge_feature_from_graph(
+                edge_feature=edge_feature,
+                graph=graph,
+                support=support,
+            )
+
+    def _get_edge_feature_from_edge_node_ids(
+        self,
+        edge_feature: AbstractEdgeFeature,
+        support: Graph,
+        sources: np.ndarray,
+        destinations: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Return the edge feature for the given edges, reusing it within the current holdout.
+
+        Parameters
+        ---------------
+        edge_feature: AbstractEdgeFeature
+            The edge feature to rasterize.
+        support: Graph,
+            The graph to use as base for the topological metrics.
+        sources: np.ndarray,
+            The source node ids.
+        destinations: np.ndarray,
+            The destination node ids.
+        """
+        edge_feature_cache = self._get_edge_feature_cache()
+        with self._profile("rasterizing_edge_features"):
+            if edge_feature_cache is None:
+                return edge_feature.get_edge_feature_from_edge_node_ids(
+                    support=support,
+                    sources=sources,
+                    destinations=destinations,
+                )
+            return edge_feature_cache.get_edge_feature_from_edge_node_ids(
+                edge_feature=edge_feature,
+                support=support,
+                sources=sources,
+                destinations=destinations,
+            )
+
     def _check_feature_shapes(
         self,
         expected_feature_shapes: Optional[List[Optional[Tuple[int]]]],
@@ -102,7 +246,7 @@ class AbstractClassifierModel(AbstractModel):
         if expected_feature_shapes is None:
             return [
                 provided_feature.shape
-                if isinstance(provided_feature, np.ndarray)
+                if isinstance(provided_feature, np.ndarray) or issparse(provided_feature)
                 else None
                 for provided_feature in provided_features
             ]
@@ -118,14 +262,14 @@ class AbstractClassifierModel(AbstractModel):
             if expected_feature_shapes[i] is None:
                 expected_feature_shapes[i] = (
                     provided_feature.shape
-                    if isinstance(provided_feature, np.ndarray)
+                    if isinstance(provided_feature, np.ndarray) or issparse(provided_feature)
                     else None
                 )
             if expected_feature_shapes[i] is not None:
-                if not isinstance(provided_feature, np.ndarray):
+                if not isinstance(provided_feature, np.ndarray) and not issparse(provided_feature):
                     raise ValueError(
                         f"The provided {feature_name} features are of type `{type(provided_feature)}`, "
-                        "while we only currently support numpy arrays. "
+                        "while we only currently support numpy arrays and scipy sparse matrices. "
                         "What behaviour were you expecting with this feature? "
                         "Please do open an issue on Embiggen and let us know!"
                     )
@@ -183,6 +327,19 @@ class AbstractClassifierModel(AbstractModel):
     ):
         """Check that the provided features do not contain NaNs."""
         for feature in features:
+            # For sparse features we only check the explicitly stored
+            # values, as the implicit zeros cannot be NaNs.
+            if issparse(feature):
+                number_of_nans = np.isnan(feature.data).sum()
+                if number_of_nans > 0:
+                    raise ValueError(
+                        f"The provided {feature_kind} features contain {number_of_nans} NaNs "
+                        f"out or {feature.nnz} stored values of the sparse matrix "
+                        f"with shape {feature.shape}. "
+                        "Please remove them before fitting the model, "
+                        "either by dropping the rows or by imputing them."
+                    )
+                continue
             nan_mask = np.isnan(feature)
             number_of_nans = nan_mask.sum()
             if number_of_nans > 0:
@@ -258,10 +415,10 @@ class AbstractClassifierModel(AbstractModel):
 
         for feature in features:
             # If the feature is neither a numpy array nor a pandas dataframe, we raise an exception.
-            if not isinstance(feature, (np.ndarray, pd.DataFrame)):
+            if not isinstance(feature, (np.ndarray, pd.DataFrame)) and not issparse(feature):
                 raise ValueError(
                     f"The provided {expected_parameter_name} features are of type `{type(feature)}`, "
-                    "while we only currently support numpy arrays and pandas DataFrames. "
+                    "while we only currently support numpy arrays, scipy sparse matrices and pandas DataFrames. "
                     f"{graph_name_message}"
                     "What behaviour were you expecting with this feature? "
                     "Please do open an issue on Embiggen and let us know!"
@@ -269,9 +426,9 @@ class AbstractClassifierModel(AbstractModel):
 
             # We check whether the provided feature has the expected number of elements.
             if feature.shape[0] == expected_number_of_elements:
-                # If the feature is a numpy array, we cannot execute any more checks
-                # other than the number of elements and therefore we skip the rest.
-                if isinstance(feature, np.ndarray):
+                # If the feature is a numpy array or a sparse matrix, we cannot execute
+                # any more checks other than the number of elements and therefore we skip the rest.
+                if isinstance(feature, np.ndarray) or issparse(feature):
                     continue
 
                 # If the feature is a pandas dataframe, we check that the index is the same as the one
@@ -748,9 +905,13 @@ class AbstractClassifierModel(AbstractModel):
         )
 
         for nf in node_feature:
-            # If it is a dataframe we align it
+            # If it is a dataframe we align it to the nodes of the graph.
             if isinstance(nf, pd.DataFrame):
-                yield nf.loc[graph.get_node_names()].to_numpy()
+                yield align_node_feature(nf, graph)
+            elif issparse(nf):
+                # Sparse features are normalized to CSR, which supports
+                # the efficient row gathers used by the transformers.
+                yield nf.tocsr()
             else:
                 # And if it is a numpy array we must believe that the user knows what
                 # they are doing, as we cannot ensure alignment.
@@ -1910,6 +2071,58 @@ class AbstractClassifierModel(AbstractModel):
         edge_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None
             The edge features to use.
         """
+        return self._predict_proba_with_checks(
+            graph,
+            support=support,
+            node_features=node_features,
+            node_type_features=node_type_features,
+            edge_type_features=edge_type_features,
+            edge_features=edge_features,
+        )
+
+    def _predict_proba_with_checks(
+        self,
+        graph: Graph,
+        support: Optional[Graph] = None,
+        node_features: Optional[
+            Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]
+        ] = None,
+        node_type_features: Optional[
+            Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]
+        ] = None,
+        edge_type_features: Optional[
+            Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]
+        ] = None,
+        edge_features: Optional[
+            Union[
+                Type[AbstractEdgeFeature],
+                pd.DataFrame,
+                np.ndarray,
+                List[Union[pd.DataFrame, np.ndarray]],
+            ]
+        ] = None,
+        **predict_proba_kwargs,
+    ) -> Union[np.ndarray, Iterator[np.ndarray]]:
+        """Execute predictions on the provided graph after normalizing and checking the features.
+
+        Parameters
+        --------------------
+        graph: Graph
+            The graph to run predictions on.
+        support: Optional[Graph] = None
+            The graph describiding the topological structure that
+            includes also the above graph.
+        node_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None
+            The node features to use.
+        node_type_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None
+            The node type features to use.
+        edge_type_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None
+            The edge type features to use.
+        edge_features: Optional[Union[pd.DataFrame, np.ndarray, List[Union[pd.DataFrame, np.ndarray]]]] = None
+            The edge features to use.
+        **predict_proba_kwargs
+            Task-specific arguments forwarded to the `_predict_proba` method.
+        """
         if not graph.has_nodes():
             raise ValueError("The provided graph is empty.")
 
@@ -1978,6 +2191,7 @@ class AbstractClassifierModel(AbstractModel):
                     edge_features=edge_features,
                     allow_automatic_feature=False,
                 ),
+                **predict_proba_kwargs,
             )
             if isinstance(predictions, np.ndarray):
                 if np.isnan(predictions).any():
@@ -2029,30 +2243,10 @@ class AbstractClassifierModel(AbstractModel):
                 ground_truth.flatten(), predictions.flatten()
             )
 
-        return {
-            **{
-                metric.__name__: metric(ground_truth, predictions)
-                for metric in (
-                    accuracy_score,
-                    hamming_loss,
-                    *(
-                        ()
-                        if self.is_multilabel_prediction_task()
-                        else (balanced_accuracy_score,)
-                    ),
-                )
-            },
-            **{
-                metric.__name__: metric(
-                    ground_truth, predictions, average="macro", zero_division=0
-                )
-                for metric in (
-                    f1_score,
-                    precision_score,
-                    recall_score,
-                )
-            },
-        }
+        if self.is_multilabel_prediction_task():
+            return get_multilabel_metrics(ground_truth, predictions)
+
+        return get_multiclass_metrics(ground_truth, predictions)
 
     def evaluate_prediction_probabilities(
         self,
@@ -2078,11 +2272,9 @@ class AbstractClassifierModel(AbstractModel):
                 ),
             }
 
-        @functools.wraps(roc_auc_score)
-        def wrapper_roc_auc_score(*args, **kwargs):
-            return roc_auc_score(*args, **kwargs, multi_class="ovr")
-
-        return {"auroc": wrapper_roc_auc_score(ground_truth, prediction_probabilities)}
+        return get_one_vs_rest_auroc_and_auprc(
+            ground_truth, prediction_probabilities
+        )
 
     @classmethod
     def split_graph_following_evaluation_schema(
@@ -2114,6 +2306,154 @@ class AbstractClassifierModel(AbstractModel):
             f"evaluation schema for {cls.task_name()}",
         )
 
+    @classmethod
+    def can_cache_holdout_splits(cls) -> bool:
+        """Returns whether the holdouts of this task can be rebuilt from the edge ids of the original graph."""
+        return False
+
+    @classmethod
+    def _split_graph_following_evaluation_schema_with_cache(
+        cls,
+        graph: Graph,
+        evaluation_schema: str,
+        random_state: int,
+        holdout_number: int,
+        number_of_holdouts: int,
+        enable_cache: bool,
+        cache_dir: str = "experiments",
+        **holdouts_kwargs: Dict,
+    ) -> Tuple[Graph]:
+        """Return train and test graphs tuple, reusing the splits stored on disk.
+
+        Parameters
+        ----------------------
+        graph: Graph
+            The graph to split.
+        evaluation_schema: str
+            The evaluation schema to follow.
+        random_state: int
+            The random state for the evaluation
+        holdout_number: int
+            The current holdout number.
+        number_of_holdouts: int
+            The total number of holdouts.
+        enable_cache: bool
+            Whether to store and reuse the splits on disk.
+        cache_dir: str = "experiments"
+            The directory where to store the splits.
+        holdouts_kwargs: Dict[str, Any]
+            The kwargs to be forwarded to the holdout method.
+
+        Implementation details
+        ----------------------
+        The splits are stored as the sorted directed edge ids of the train
+        and test graphs within the original graph, using unsigned integers
+        of 32 bits whenever possible, and are identified by the hash of the
+        graph, the evaluation schema, the holdouts kwargs, the random state,
+        the holdout number and the number of holdouts. A split is only stored
+        if all of the edges of its graphs are found in the original graph,
+        which is then filtered by edge ids to rebuild them. Holdouts that
+        cannot be described by edge ids, such as those of multigraphs or
+        those dropping nodes, are always recomputed.
+        """
+        if not enable_cache or not cls.can_cache_holdout_splits():
+            return cls.split_graph_following_evaluation_schema(
+                graph=graph,
+                evaluation_schema=evaluation_schema,
+                random_state=random_state,
+                holdout_number=holdout_number,
+                number_of_holdouts=number_of_holdouts,
+                **holdouts_kwargs,
+            )
+
+        key = hashlib.sha256(
+            json.dumps(
+                dict(
+                    graph_hash=graph.hash(),
+                    evaluation_schema=evaluation_schema,
+                    random_state=random_state,
+                    holdout_number=holdout_number,
+                    number_of_holdouts=number_of_holdouts,
+                    holdouts_kwargs=holdouts_kwargs,
+                ),
+                sort_keys=True,
+                default=str,
+            ).encode("utf8")
+        ).hexdigest()
+
+        path = os.path.join(
+            cache_dir,
+            cls.task_name(),
+            graph.get_name(),
+            "holdout_splits",
+            f"{key}.npz",
+        )
+
+        if os.path.exists(path):
+            # Undirected graphs cannot be filtered by directed edge ids,
+            # so we filter their directed version and convert it back.
+            directed_graph = graph if graph.is_directed() else graph.to_directed()
+            partitions = []
+            with np.load(path) as split:
+                for partition_name in ("train", "test"):
+                    partition = directed_graph.filter_from_ids(
+                        edge_ids_to_keep=split[partition_name]
+                    )
+                    if not graph.is_directed():
+                        partition = partition.to_undirected()
+                    partition.set_name(str(split[f"{partition_name}_name"]))
+                    partitions.append(partition)
+            return tuple(partitions)
+
+        train, test = cls.split_graph_following_evaluation_schema(
+            graph=graph,
+            evaluation_schema=evaluation_schema,
+            random_state=random_state,
+            holdout_number=holdout_number,
+            number_of_holdouts=number_of_holdouts,
+            **holdouts_kwargs,
+        )
+
+        if graph.is_multigraph() or any(
+            partition.get_number_of_nodes() != graph.get_number_of_nodes()
+            for partition in (train, test)
+        ):
+            return train, test
+
+        # The edges of the graphs are sorted by source and destination,
+        # hence the edge ids of the partitions can be found with a binary search.
+        number_of_nodes = np.uint64(graph.get_number_of_nodes())
+        edge_keys = (
+            graph.get_directed_source_node_ids().astype(np.uint64) * number_of_nodes
+            + graph.get_directed_destination_node_ids()
+        )
+        dtype = np.uint32 if graph.get_number_of_directed_edges() < 2**32 else np.uint64
+
+        split = {}
+        for partition_name, partition in (("train", train), ("test", test)):
+            partition_edge_keys = (
+                partition.get_directed_source_node_ids().astype(np.uint64) * number_of_nodes
+                + partition.get_directed_destination_node_ids()
+            )
+            edge_ids = np.minimum(
+                np.searchsorted(edge_keys, partition_edge_keys),
+                edge_keys.size - 1
+            )
+            if not np.array_equal(edge_keys[edge_ids], partition_edge_keys):
+                return train, test
+            split[partition_name] = edge_ids.astype(dtype)
+            split[f"{partition_name}_name"] = np.array(partition.get_name())
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as file:
+            np.savez(file, **split)
+        # We rename the file once it is complete, so that concurrent
+        # evaluations never read a partially written split.
+        os.replace(temporary_path, path)
+
+        return train, test
+
     def _evaluate(
         self,
         graph: Graph,
@@ -2258,6 +2598,8 @@ class AbstractClassifierModel(AbstractModel):
             "test_of_interest",
             "train",
             "metadata",
+            "holdout_cache",
+            "profiler",
         ],
         capture_enable_cache_arg_name=True,
         use_approximated_hash=True,
@@ -2281,53 +2623,68 @@ class AbstractClassifierModel(AbstractModel):
         features_names: List[str],
         features_parameters: Dict[str, Any],
         metadata: Dict[str, Any],
+        holdout_cache: Optional[HoldoutCache] = None,
+        profiler: Optional[Profiler] = None,
         **validation_kwargs,
     ) -> pd.DataFrame:
         """Run inner training and evaluation."""
         if self.is_stocastic():
             self.set_random_state(random_state * (holdout_number + 1))
-        # Fit the model using the training graph
-        training_start = time.time()
-        self.fit(
-            graph=train_of_interest,
-            support=train_of_interest if use_subgraph_as_support else train,
-            node_features=node_features,
-            node_type_features=node_type_features,
-            edge_type_features=edge_type_features,
-            edge_features=edge_features,
-        )
-        time_required_for_training = time.time() - training_start
-
-        start_evaluation = time.time()
-
+        # The holdout cache is only available while training and evaluating
+        # the model on the current holdout.
+        self._holdout_cache = holdout_cache
+        # Similarly, the spans of the phases of the model are
+        # only recorded while training and evaluating the model.
+        if profiler is None:
+            profiler = Profiler()
+        self._profiler = profiler
         try:
-            # We add the newly computed performance.
-            model_performance = pd.DataFrame(
-                self._evaluate(
-                    graph=graph,
+            first_model_span = profiler.get_number_of_spans()
+            # Fit the model using the training graph
+            with profiler.span("training", model_name=self.model_name()) as span:
+                self.fit(
+                    graph=train_of_interest,
                     support=train_of_interest if use_subgraph_as_support else train,
-                    train=train_of_interest,
-                    test=test_of_interest,
                     node_features=node_features,
                     node_type_features=node_type_features,
                     edge_type_features=edge_type_features,
                     edge_features=edge_features,
-                    subgraph_of_interest=subgraph_of_interest,
-                    random_state=random_state * holdout_number,
-                    verbose=False,
-                    **validation_kwargs,
                 )
-            ).reset_index(drop=True)
-        except RuntimeError as exception:
-            raise exception
-        except Exception as exception:
-            raise RuntimeError(
-                f"An exception was raised while calling the `._evaluate` method of {self.model_name()} "
-                f"implemented using the {self.library_name()} for the {self.task_name()} task. "
-                f"Specifically, the class of the model is {self.__class__.__name__}. "
-            ) from exception
-
-        time_required_for_evaluation = time.time() - start_evaluation
+            time_required_for_training = span.wall_time
+
+            try:
+                # We add the newly computed performance.
+                with profiler.span("evaluation", model_name=self.model_name()) as span:
+                    evaluation_performance = self._evaluate(
+                        graph=graph,
+                        support=train_of_interest if use_subgraph_as_support else train,
+                        train=train_of_interest,
+                        test=test_of_interest,
+                        node_features=node_features,
+                        node_type_features=node_type_features,
+                        edge_type_features=edge_type_features,
+                        edge_features=edge_features,
+                        subgraph_of_interest=subgraph_of_interest,
+                        random_state=random_state * holdout_number,
+                        verbose=False,
+                        **validation_kwargs,
+                    )
+                model_performance = pd.DataFrame(
+                    evaluation_performance
+                ).reset_index(drop=True)
+            except RuntimeError as exception:
+                raise exception
+            except Exception as exception:
+                raise RuntimeError(
+                    f"An exception was raised while calling the `._evaluate` method of {self.model_name()} "
+                    f"implemented using the {self.library_name()} for the {self.task_name()} task. "
+                    f"Specifically, the class of the model is {self.__class__.__name__}. "
+                ) from exception
+
+            time_required_for_evaluation = span.wall_time
+        finally:
+            self._holdout_cache = None
+            self._profiler = None
 
         model_performance["time_required_for_training"] = time_required_for_training
         model_performance["time_required_for_evaluation"] = time_required_for_evaluation
@@ -2346,7 +2703,13 @@ class AbstractClassifierModel(AbstractModel):
         model_performance["node_type_feature_shapes"] = json.dumps([self._node_type_feature_shapes])
         model_performance["edge_type_feature_shapes"] = json.dumps([self._edge_type_feature_shapes])
 
-        for column_name, column_value in metadata.items():
+        for column_name, column_value in {
+            **metadata,
+            **profiler.get_metadata(
+                first_span=first_model_span,
+                thread_id=threading.get_ident(),
+            ),
+        }.items():
             model_performance[column_name] = column_value
 
         df_model_parameters = pd.DataFrame(dict(), index=model_performance.index)
@@ -2386,12 +2749,122 @@ class AbstractClassifierModel(AbstractModel):
 
         return model_performance
 
+    @classmethod
+    def _describe_feature_for_experiment_key(cls, feature: Any) -> Any:
+        """Return a JSON-serializable description of the provided feature.
+
+        Parameters
+        ----------------------
+        feature: Any
+            The feature to describe, as provided to the evaluate method.
+        """
+        if isinstance(feature, (list, tuple)):
+            return [cls._describe_feature_for_experiment_key(f) for f in feature]
+        if isinstance(feature, AbstractModel):
+            return dict(
+                model_name=feature.model_name(),
+                library_name=feature.library_name(),
+                parameters=feature.parameters(),
+            )
+        if isinstance(feature, pd.DataFrame):
+            return dict(
+                shape=feature.shape,
+                digest=hashlib.sha256(
+                    pd.util.hash_pandas_object(feature).values.tobytes()
+                ).hexdigest(),
+            )
+        if isinstance(feature, np.ndarray):
+            return dict(
+                shape=feature.shape,
+                digest=hashlib.sha256(
+                    np.ascontiguousarray(feature).tobytes()
+                ).hexdigest(),
+            )
+        if issparse(feature):
+            # We convert the matrix to CSR so that the same matrix
+            # has the same description whatever its sparse format.
+            feature = feature.tocsr()
+            digest = hashlib.sha256()
+            for array in (feature.data, feature.indices, feature.indptr):
+                digest.update(np.ascontiguousarray(array).tobytes())
+            return dict(
+                shape=feature.shape,
+                dtype=str(feature.dtype),
+                digest=digest.hexdigest(),
+            )
+        return str(feature)
+
+    @classmethod
+    def _get_unit_key(
+        cls,
+        experiment_key: str,
+        holdout_number: int,
+        classifier: "AbstractClassifierModel",
+    ) -> str:
+        """Return the key identifying the evaluation of a model on a holdout.
+
+        Parameters
+        ----------------------
+        experiment_key: str
+            The key identifying the evaluation.
+        holdout_number: int
+            The number of the holdout.
+        classifier: AbstractClassifierModel
+            The model evaluated on the holdout.
+        """
+        return hashlib.sha256(
+            json.dumps(
+                dict(
+                    experiment_key=experiment_key,
+                    holdout_number=holdout_number,
+                    model_name=classifier.model_name(),
+                    library_name=classifier.library_name(),
+                    parameters=classifier.parameters(),
+                ),
+                sort_keys=True,
+                default=str,
+            ).encode("utf8")
+        ).hexdigest()
+
+    @classmethod
+    def _get_subgraph_of_interest_node_ids(
+        cls,
+        graph: Graph,
+        subgraph_of_interest: Graph,
+    ) -> np.ndarray:
+        """Return the sorted node ids of the nodes of the subgraph of interest within the graph.
+
+        Parameters
+        ----------------------
+        graph: Graph
+            The graph containing the subgraph of interest.
+        subgraph_of_interest: Graph
+            The subgraph of interest, with a node vocabulary different
+            from the one of the graph.
+        """
+        node_ids = np.sort(
+            graph.get_node_ids_from_node_names(subgraph_of_interest.get_node_names())
+        )
+        node_ids.setflags(write=False)
+        return node_ids
+
     @classmethod
     @Cache(
         cache_path="{cache_dir}/{cls.task_name()}/{graph.get_name()}/holdout_{holdout_number}/{_hash}.csv.gz",
         cache_dir="experiments",
         enable_cache_arg_name="enable_cache",
-        args_to_ignore=["verbose", "smoke_test", "number_of_holdouts", "metadata"],
+        args_to_ignore=[
+            "verbose",
+            "smoke_test",
+            "number_of_holdouts",
+            "metadata",
+            "results_sink",
+            "resume",
+            "experiment_key",
+            "profiler",
+            "number_of_concurrent_models",
+            "subgraph_of_interest_node_ids",
+        ],
         capture_enable_cache_arg_name=False,
         use_approximated_hash=True,
     )
@@ -2426,86 +2899,118 @@ class AbstractClassifierModel(AbstractModel):
         features_parameters: Dict[str, Any],
         metadata: Dict[str, Any],
         verbose: bool,
+        results_sink: Optional[ResultsSink] = None,
+        resume: bool = False,
+        experiment_key: Optional[str] = None,
+        profiler: Optional[Profiler] = None,
+        number_of_concurrent_models: int = 1,
+        subgraph_of_interest_node_ids: Optional[np.ndarray] = None,
         **validation_kwargs,
     ) -> pd.DataFrame:
+        classifiers = list(cls.iterate_classifier_models(
+            models=models, library_names=library_names, smoke_test=smoke_test
+        ))
+
+        unit_keys = [
+            cls._get_unit_key(
+                experiment_key=experiment_key,
+                holdout_number=holdout_number,
+                classifier=classifier,
+            )
+            if results_sink is not None
+            else None
+            for classifier in classifiers
+        ]
+
+        if resume and results_sink is not None:
+            completed_unit_keys = [
+                unit_key
+                for unit_key in unit_keys
+                if results_sink.has_unit(unit_key)
+            ]
+            # If all of the models were already evaluated on this holdout,
+            # we do not even need to compute the holdout and its features.
+            if len(completed_unit_keys) == len(unit_keys):
+                return results_sink.query(unit_keys=completed_unit_keys)
+        else:
+            completed_unit_keys = []
+
+        if profiler is None:
+            profiler = Profiler()
+        first_holdout_span = profiler.get_number_of_spans()
+
         starting_setting_up_holdout = time.time()
 
         # We create the graph split using the provided schema.
-        train, test = cls.split_graph_following_evaluation_schema(
-            graph=graph,
-            evaluation_schema=evaluation_schema,
-            random_state=random_state,
-            holdout_number=holdout_number,
-            number_of_holdouts=number_of_holdouts,
-            **holdouts_kwargs,
-        )
+        with profiler.span("splitting_holdout", holdout_number=holdout_number):
+            train, test = cls._split_graph_following_evaluation_schema_with_cache(
+                graph=graph,
+                evaluation_schema=evaluation_schema,
+                random_state=random_state,
+                holdout_number=holdout_number,
+                number_of_holdouts=number_of_holdouts,
+                enable_cache=enable_cache,
+                **holdouts_kwargs,
+            )
 
         # We compute the remaining features
-        starting_to_compute_node_features = time.time()
-        holdout_node_features = cls.normalize_node_features(
-            graph=train,
-            support=train,
-            random_state=random_state * (holdout_number + 1),
-            node_features=node_features,
-            node_features_preprocessing_steps=node_features_preprocessing_steps,
-            allow_automatic_feature=True,
-            skip_evaluation_biased_feature=False,
-            smoke_test=smoke_test,
-            precompute_constant_stocastic_features=True,
-        )
-        time_required_to_compute_node_features = (
-            time.time() - starting_to_compute_node_features
-        )
+        with profiler.span("computing_node_features") as span:
+            holdout_node_features = cls.normalize_node_features(
+                graph=train,
+                support=train,
+                random_state=random_state * (holdout_number + 1),
+                node_features=node_features,
+                node_features_preprocessing_steps=node_features_preprocessing_steps,
+                allow_automatic_feature=True,
+                skip_evaluation_biased_feature=False,
+                smoke_test=smoke_test,
+                precompute_constant_stocastic_features=True,
+            )
+        time_required_to_compute_node_features = span.wall_time
 
         # We compute the remaining features
-        starting_to_compute_node_type_features = time.time()
-        holdout_node_type_features = cls.normalize_node_type_features(
-            graph=train,
-            support=train,
-            random_state=random_state * (holdout_number + 1),
-            node_type_features=node_type_features,
-            allow_automatic_feature=True,
-            skip_evaluation_biased_feature=False,
-            smoke_test=smoke_test,
-            precompute_constant_stocastic_features=True,
-        )
-        time_required_to_compute_node_type_features = (
-            time.time() - starting_to_compute_node_type_features
-        )
+        with profiler.span("computing_node_type_features") as span:
+            holdout_node_type_features = cls.normalize_node_type_features(
+                graph=train,
+                support=train,
+                random_state=random_state * (holdout_number + 1),
+                node_type_features=node_type_features,
+                allow_automatic_feature=True,
+                skip_evaluation_biased_feature=False,
+                smoke_test=smoke_test,
+                precompute_constant_stocastic_features=True,
+            )
+        time_required_to_compute_node_type_features = span.wall_time
 
         # We compute the remaining features
-        starting_to_compute_edge_type_features = time.time()
-        holdout_edge_type_features = cls.normalize_edge_type_features(
-            graph=train,
-            support=train,
-            random_state=random_state * (holdout_number + 1),
-            edge_type_features=edge_type_features,
-            allow_automatic_feature=True,
-            skip_evaluation_biased_feature=False,
-            smoke_test=smoke_test,
-            precompute_constant_stocastic_features=True,
-        )
-        time_required_to_compute_edge_type_features = (
-            time.time() - starting_to_compute_edge_type_features
-        )
+        with profiler.span("computing_edge_type_features") as span:
+            holdout_edge_type_features = cls.normalize_edge_type_features(
+                graph=train,
+                support=train,
+                random_state=random_state * (holdout_number + 1),
+                edge_type_features=edge_type_features,
+                allow_automatic_feature=True,
+                skip_evaluation_biased_feature=False,
+                smoke_test=smoke_test,
+                precompute_constant_stocastic_features=True,
+            )
+        time_required_to_compute_edge_type_features = span.wall_time
 
         # We execute the same thing as described above,
         # but now for the edge features instead that for
         # the node features.
-        starting_to_compute_edge_features = time.time()
-        holdout_edge_features = cls.normalize_edge_features(
-            graph=train,
-            support=train,
-            random_state=random_state * (holdout_number + 1),
-            edge_features=edge_features,
-            allow_automatic_feature=True,
-            skip_evaluation_biased_feature=False,
-            smoke_test=smoke_test,
-            precompute_constant_stocastic_features=True,
-        )
-        time_required_to_compute_edge_features = (
-            time.time() - starting_to_compute_edge_features
-        )
+        with profiler.span("computing_edge_features") as span:
+            holdout_edge_features = cls.normalize_edge_features(
+                graph=train,
+                support=train,
+                random_state=random_state * (holdout_number + 1),
+                edge_features=edge_features,
+                allow_automatic_feature=True,
+                skip_evaluation_biased_feature=False,
+                smoke_test=smoke_test,
+                precompute_constant_stocastic_features=True,
+            )
+        time_required_to_compute_edge_features = span.wall_time
 
         if subgraph_of_interest is not None:
             # First we align the train and test graph to have
@@ -2513,21 +3018,26 @@ class AbstractClassifierModel(AbstractModel):
             # when the subgraph of interest does not have
             # the same node dictionary as the original graph.
             if not subgraph_of_interest_has_compatible_nodes:
-                train = train.filter_from_names(
-                    node_names_to_keep_from_graph=subgraph_of_interest
+                if subgraph_of_interest_node_ids is None:
+                    subgraph_of_interest_node_ids = cls._get_subgraph_of_interest_node_ids(
+                        graph=graph,
+                        subgraph_of_interest=subgraph_of_interest,
+                    )
+                train = train.filter_from_ids(
+                    node_ids_to_keep=subgraph_of_interest_node_ids
                 )
-                test = test.filter_from_names(
-                    node_names_to_keep_from_graph=subgraph_of_interest
+                test = test.filter_from_ids(
+                    node_ids_to_keep=subgraph_of_interest_node_ids
                 )
 
                 # We adjust the node features to only include the node features
                 # that the subgraph of interest allows us to use.
                 if holdout_node_features is not None:
-                    # We obtain the mapping from the old to the new node IDs
-                    node_ids_mapping = train.get_node_ids_mapping_from_graph(graph)
-
+                    # As the filtered graphs keep the nodes in the same order,
+                    # the sorted node ids are also the mapping from the new
+                    # node ids to the old ones.
                     holdout_node_features = [
-                        holdout_node_feature[node_ids_mapping]
+                        holdout_node_feature[subgraph_of_interest_node_ids]
                         for holdout_node_feature in holdout_node_features
                     ]
 
@@ -2560,21 +3070,24 @@ class AbstractClassifierModel(AbstractModel):
             train_of_interest = train
             test_of_interest = test
 
-        additional_validation_kwargs = cls._prepare_evaluation(
-            graph=graph,
-            support=train,
-            train=train_of_interest,
-            test=test_of_interest,
-            subgraph_of_interest=subgraph_of_interest,
-            random_state=random_state * holdout_number,
-            verbose=verbose,
-            **validation_kwargs,
-        )
+        # For edge prediction, this is where the negative graphs are sampled.
+        with profiler.span("preparing_evaluation"):
+            additional_validation_kwargs = cls._prepare_evaluation(
+                graph=graph,
+                support=train,
+                train=train_of_interest,
+                test=test_of_interest,
+                subgraph_of_interest=subgraph_of_interest,
+                random_state=random_state * holdout_number,
+                verbose=verbose,
+                **validation_kwargs,
+            )
 
         time_required_for_setting_up_holdout = time.time() - starting_setting_up_holdout
 
         metadata = dict(
             **metadata,
+            **profiler.get_metadata(first_span=first_holdout_span),
             time_required_for_setting_up_holdout=time_required_for_setting_up_holdout,
             time_required_to_compute_node_features=time_required_to_compute_node_features,
             time_required_to_compute_node_type_features=time_required_to_compute_node_type_features,
@@ -2582,44 +3095,297 @@ class AbstractClassifierModel(AbstractModel):
             time_required_to_compute_edge_features=time_required_to_compute_edge_features,
         )
 
-        holdout_performance = pd.concat(
-            [
-                classifier._train_and_evaluate_model(
-                    graph=graph,
-                    train_of_interest=train_of_interest,
-                    test_of_interest=test_of_interest,
-                    train=train,
-                    subgraph_of_interest=subgraph_of_interest,
-                    use_subgraph_as_support=use_subgraph_as_support,
-                    node_features=holdout_node_features,
-                    node_type_features=holdout_node_type_features,
-                    edge_type_features=holdout_edge_type_features,
-                    edge_features=holdout_edge_features,
-                    random_state=random_state,
+        # The training matrices and prediction features built by a model
+        # are shared with the other models evaluated on this holdout. The
+        # prediction batches are only worth keeping when there are other
+        # models that may reuse them.
+        holdout_cache = HoldoutCache(
+            maximal_prediction_memory=(
+                MAXIMAL_PREDICTION_MEMORY if len(classifiers) > 1 else 0
+            )
+        )
+
+        def train_and_evaluate_classifier(
+            classifier: "AbstractClassifierModel",
+            unit_key: Optional[str],
+        ) -> pd.DataFrame:
+            performance = classifier._train_and_evaluate_model(
+                graph=graph,
+                train_of_interest=train_of_interest,
+                test_of_interest=test_of_interest,
+                train=train,
+                subgraph_of_interest=subgraph_of_interest,
+                use_subgraph_as_support=use_subgraph_as_support,
+                node_features=holdout_node_features,
+                node_type_features=holdout_node_type_features,
+                edge_type_features=holdout_edge_type_features,
+                edge_features=holdout_edge_features,
+                random_state=random_state,
+                holdout_number=holdout_number,
+                evaluation_schema=evaluation_schema,
+                holdouts_kwargs=holdouts_kwargs,
+                enable_cache=enable_cache,
+                features_names=features_names,
+                features_parameters=features_parameters,
+                metadata=metadata.copy(),
+                holdout_cache=holdout_cache,
+                profiler=profiler,
+                **additional_validation_kwargs,
+                **validation_kwargs,
+            )
+            # We store the performance as soon as it is available,
+            # so that it survives an interruption of the evaluation.
+            if results_sink is not None:
+                results_sink.append(
+                    unit_key=unit_key,
+                    experiment_key=experiment_key,
                     holdout_number=holdout_number,
-                    evaluation_schema=evaluation_schema,
-                    holdouts_kwargs=holdouts_kwargs,
-                    enable_cache=enable_cache,
-                    features_names=features_names,
-                    features_parameters=features_parameters,
-                    metadata=metadata.copy(),
-                    **additional_validation_kwargs,
-                    **validation_kwargs,
+                    performance=performance,
                 )
-                for classifier in cls.iterate_classifier_models(
-                    models=models, library_names=library_names, smoke_test=smoke_test
+            return performance
+
+        def evaluate_unit(
+            classifier: "AbstractClassifierModel",
+            unit_key: Optional[str],
+        ) -> pd.DataFrame:
+            if unit_key in completed_unit_keys:
+                return results_sink.query(unit_keys=[unit_key])
+            return train_and_evaluate_classifier(classifier, unit_key)
+
+        if number_of_concurrent_models > 1 and len(classifiers) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(number_of_concurrent_models, len(classifiers))
+            ) as executor:
+                models_performance = list(
+                    executor.map(evaluate_unit, classifiers, unit_keys)
                 )
+        else:
+            models_performance = [
+                evaluate_unit(classifier, unit_key)
+                for classifier, unit_key in zip(classifiers, unit_keys)
             ]
-        )
+
+        holdout_performance = pd.concat(models_performance)
 
         return holdout_performance
 
+    @classmethod
+    def get_available_racing_metrics(cls) -> List[str]:
+        """Return the metrics, where higher is better, supported by the racing of the models."""
+        return [
+            "auroc",
+            "auprc",
+            "accuracy",
+            "balanced_accuracy",
+            "balanced_accuracy_score",
+            "accuracy_score",
+            "f1_score",
+            "precision",
+            "precision_score",
+            "recall",
+            "recall_score",
+            "specificity",
+            "informedness",
+            "markedness",
+            "matthews_correlation_coefficient",
+            "fowlkes_mallows_index",
+            "threat_score",
+            "negative_predictive_value",
+        ]
+
+    @classmethod
+    def _get_rows_of_classifier(
+        cls,
+        performance: pd.DataFrame,
+        classifier: "AbstractClassifierModel",
+    ) -> np.ndarray:
+        """Return the mask of the rows of the performance of the provided model.
+
+        Parameters
+        ----------------------
+        performance: pd.DataFrame
+            The performance of one or more models.
+        classifier: AbstractClassifierModel
+            The model whose rows are to be found.
+
+        Implementation details
+        ----------------------
+        The rows are identified by the model name, the library name and the
+        model parameters, which are stored in the performance as they are
+        reported by the `parameters` method, with lists and tuples converted
+        to strings. As the parameters columns of different models are
+        concatenated, missing values may appear as NaN and integers as floats.
+        """
+
+        def is_same_parameter(stored_value: Any, parameter_value: Any) -> bool:
+            if parameter_value is None:
+                return stored_value is None or pd.isna(stored_value)
+            if isinstance(parameter_value, (list, tuple)):
+                parameter_value = str(parameter_value)
+            if isinstance(parameter_value, (bool, np.bool_, str)):
+                return stored_value == parameter_value
+            try:
+                return float(stored_value) == float(parameter_value)
+            except (TypeError, ValueError):
+                return str(stored_value) == str(parameter_value)
+
+        mask = (
+            (performance["model_name"] == classifier.model_name())
+            & (performance["library_name"] == classifier.library_name())
+        ).to_numpy(copy=True)
+        for parameter_name, parameter_value in classifier.parameters().items():
+            mask &= np.fromiter(
+                (
+                    is_same_parameter(stored_value, parameter_value)
+                    for stored_value in performance[("model_parameters", parameter_name)]
+                ),
+                dtype=bool,
+                count=len(performance),
+            )
+        return mask
+
+    @classmethod
+    def _race_models(
+        cls,
+        evaluate_on_single_holdout: Callable[..., pd.DataFrame],
+        classifiers: List["AbstractClassifierModel"],
+        number_of_holdouts: int,
+        racing_metric: str,
+        racing_minimum_holdouts: int,
+        racing_p_value_threshold: float,
+        verbose: bool,
+        description: str,
+    ) -> List[pd.DataFrame]:
+        """Return the performance of the models raced on the holdouts.
+
+        Parameters
+        ----------------------
+        evaluate_on_single_holdout: Callable[..., pd.DataFrame]
+            Callback evaluating the provided models on a holdout.
+        classifiers: List[AbstractClassifierModel]
+            The models to race.
+        number_of_holdouts: int
+            The number of holdouts to execute.
+        racing_metric: str
+            The metric on which the models are compared.
+        racing_minimum_holdouts: int
+            Number of holdouts on which all of the models are evaluated
+            before the first elimination.
+        racing_p_value_threshold: float
+            The p-value threshold below which a model is considered
+            dominated by the best model.
+        verbose: bool
+            Whether to show a loading bar while computing holdouts.
+        description: str
+            The description of the loading bar.
+
+        Implementation details
+        ----------------------
+        The eliminations happen at rungs whose number of holdouts doubles,
+        starting from the minimum number of holdouts. At each rung, the
+        per-holdout score of a model is the mean of the racing metric on
+        its test rows, and the model with the best mean score is compared
+        with every other survivor with a one-sided paired t-test across the
+        holdouts. The dominated models, at most half of the survivors and
+        starting from the worst ones, are then eliminated, and the following
+        holdouts are spent only on the remaining models.
+        """
+        scores: List[List[float]] = [[] for _ in classifiers]
+        survivors = list(range(len(classifiers)))
+        eliminated_after_holdouts: Dict[int, int] = {}
+        holdouts_performance = []
+        next_rung = racing_minimum_holdouts
+
+        for holdout_number in trange(
+            number_of_holdouts,
+            disable=not verbose,
+            leave=False,
+            dynamic_ncols=True,
+            desc=description,
+        ):
+            holdout_performance = evaluate_on_single_holdout(
+                models=[classifiers[index] for index in survivors],
+                library_names=None,
+                holdout_number=holdout_number,
+                verbose=verbose,
+            )
+            test_mask = (holdout_performance["evaluation_mode"] == "test").values
+            for index in survivors:
+                scores[index].append(
+                    holdout_performance.loc[
+                        test_mask
+                        & cls._get_rows_of_classifier(
+                            holdout_performance, classifiers[index]
+                        ),
+                        racing_metric,
+                    ].mean()
+                )
+            holdouts_performance.append(holdout_performance)
+
+            if holdout_number + 1 != next_rung or len(survivors) == 1:
+                continue
+            next_rung *= 2
+
+            best = max(survivors, key=lambda index: np.mean(scores[index]))
+            dominated = []
+            for index in survivors:
+                if index == best:
+                    continue
+                p_value = ttest_rel(
+                    scores[best], scores[index], alternative="greater"
+                ).pvalue
+                # When the differences are all equal the test is undefined,
+                # and the models are only considered dominated if these are
+                # all strictly positive.
+                if np.isnan(p_value):
+                    differences = np.array(scores[best]) - np.array(scores[index])
+                    p_value = 0.0 if (differences > 0).all() else 1.0
+                if p_value < racing_p_value_threshold:
+                    dominated.append(index)
+
+            dominated = sorted(dominated, key=lambda index: np.mean(scores[index]))
+            for index in dominated[: len(survivors) // 2]:
+                survivors.remove(index)
+                eliminated_after_holdouts[index] = holdout_number + 1
+
+        racing_holdouts_performance = []
+        for holdout_performance in holdouts_performance:
+            racing = pd.DataFrame(
+                dict(
+                    racing_metric=racing_metric,
+                    racing_eliminated=False,
+                    racing_eliminated_after_holdouts=np.nan,
+                ),
+                index=holdout_performance.index,
+            )
+            for index, number_of_holdouts_evaluated in eliminated_after_holdouts.items():
+                mask = cls._get_rows_of_classifier(
+                    holdout_performance, classifiers[index]
+                )
+                racing.loc[mask, "racing_eliminated"] = True
+                racing.loc[
+                    mask, "racing_eliminated_after_holdouts"
+                ] = number_of_holdouts_evaluated
+            racing_holdouts_performance.append(
+                pd.concat([holdout_performance, racing], axis=1)
+            )
+
+        return racing_holdouts_performance
+
     @classmethod
     @Cache(
         cache_path="{cache_dir}/{cls.task_name()}/{graph.get_name()}/{_hash}.csv.gz",
         cache_dir="experiments",
         enable_cache_arg_name="enable_top_layer_cache",
-        args_to_ignore=["verbose", "smoke_test"],
+        args_to_ignore=[
+            "verbose",
+            "smoke_test",
+            "results_sink",
+            "resume",
+            "chrome_trace_path",
+            "work_queue",
+            "number_of_concurrent_models",
+        ],
         capture_enable_cache_arg_name=True,
         use_approximated_hash=True,
     )
@@ -2674,6 +3440,14 @@ class AbstractClassifierModel(AbstractModel):
         smoke_test: bool = False,
         number_of_slurm_nodes: Optional[int] = None,
         slurm_node_id_variable: str = "SLURM_GRAPE_ID",
+        results_sink: Optional[Union[str, ResultsSink]] = None,
+        resume: bool = False,
+        chrome_trace_path: Optional[str] = None,
+        work_queue: Optional[Union[str, WorkQueue]] = None,
+        racing_metric: Optional[str] = None,
+        racing_minimum_holdouts: int = 2,
+        racing_p_value_threshold: float = 0.05,
+        number_of_concurrent_models: int = 1,
         **validation_kwargs: Dict,
     ) -> pd.DataFrame:
         """Execute evaluation on the provided graph.
@@ -2737,6 +3511,47 @@ class AbstractClassifierModel(AbstractModel):
         slurm_node_id_variable: str = "SLURM_GRAPE_ID"
             Name of the system variable to use as SLURM node id.
             It must be set in the slurm bash script.
+        results_sink: Optional[Union[str, ResultsSink]] = None
+            The results sink, or the path to the SQLite database of a results sink,
+            where to durably store the performance of each model on each holdout
+            as soon as it is computed.
+        resume: bool = False
+            Whether to skip the models and holdouts whose performance
+            is already stored in the results sink for this evaluation.
+        chrome_trace_path: Optional[str] = None
+            Path where to export the profiled phases of the evaluation as a
+            Chrome trace JSON, which can be inspected in `chrome://tracing`
+            or in Perfetto. The wall time, CPU time, peak RSS delta and number
+            of threads of each phase are anyhow reported in the metadata
+            columns of the results.
+        work_queue: Optional[Union[str, WorkQueue]] = None
+            The work queue, or the directory of a work queue on a shared
+            filesystem, from which to dynamically claim the models and holdouts
+            to evaluate, as an alternative to the static assignment of the
+            holdouts to the SLURM nodes. Any number of local processes or SLURM
+            tasks can run the same evaluation on the same queue, and each of them
+            returns the performance of the units it has completed. Enable the cache
+            to then collect the performance of all of the units in a single process.
+        racing_metric: Optional[str] = None
+            The metric on which to race the models. When provided, all of the
+            models are evaluated on the first holdouts, and then the models
+            that are statistically dominated on this metric by the best model,
+            paired across the holdouts, are eliminated and not evaluated on
+            the remaining holdouts. The eliminated models and the number of
+            holdouts after which they were eliminated are reported in the
+            `racing_eliminated` and `racing_eliminated_after_holdouts` columns.
+            By default, all of the models are evaluated on all of the holdouts.
+        racing_minimum_holdouts: int = 2
+            Number of holdouts on which all of the models are evaluated
+            before the first elimination. The following eliminations
+            happen when the number of executed holdouts doubles.
+        racing_p_value_threshold: float = 0.05
+            The p-value threshold of the one-sided paired t-test
+            below which a model is considered dominated.
+        number_of_concurrent_models: int = 1
+            Number of models to train and evaluate concurrently on each holdout,
+            using threads. The holdout split, its features and its negative
+            graphs are computed once and shared among all of the models.
         **validation_kwargs: Dict
             kwargs to be forwarded to the model `_evaluate` method.
         """
@@ -2775,6 +3590,17 @@ class AbstractClassifierModel(AbstractModel):
             subgraph_of_interest_has_compatible_nodes = (
                 graph.has_compatible_node_vocabularies(subgraph_of_interest)
             )
+
+            # Otherwise, the node ids of the subgraph of interest within the
+            # graph are computed once, rather than matching the node names
+            # of the subgraph of interest again for each of the holdouts.
+            if subgraph_of_interest_has_compatible_nodes:
+                subgraph_of_interest_node_ids = None
+            else:
+                subgraph_of_interest_node_ids = cls._get_subgraph_of_interest_node_ids(
+                    graph=graph,
+                    subgraph_of_interest=subgraph_of_interest,
+                )
         else:
             if use_subgraph_as_support:
                 raise ValueError(
@@ -2784,6 +3610,96 @@ class AbstractClassifierModel(AbstractModel):
                     "how to proceed."
                 )
             subgraph_of_interest_has_compatible_nodes = None
+            subgraph_of_interest_node_ids = None
+
+        if resume and results_sink is None:
+            raise ValueError(
+                "It has been requested to resume the evaluation, but "
+                "no results sink was provided to resume the evaluation from."
+            )
+
+        if work_queue is not None and number_of_slurm_nodes is not None:
+            raise ValueError(
+                "Both a work queue and a number of SLURM nodes were provided, "
+                "but the holdouts are either claimed dynamically from the work "
+                "queue or assigned statically to the SLURM nodes. "
+                "Please provide only one of the two."
+            )
+
+        if (
+            not isinstance(number_of_concurrent_models, int)
+            or number_of_concurrent_models <= 0
+        ):
+            raise ValueError(
+                "The number of concurrent models must be a strictly positive integer, "
+                f"but {number_of_concurrent_models} was provided."
+            )
+
+        if racing_metric is not None:
+            racing_metric = must_be_in_set(
+                racing_metric, cls.get_available_racing_metrics(), "racing metric"
+            )
+            if work_queue is not None or number_of_slurm_nodes is not None:
+                raise ValueError(
+                    "The racing of the models requires the performance of all "
+                    "of the models on the previous holdouts, and therefore it "
+                    "cannot be used together with a work queue or with SLURM nodes."
+                )
+            if (
+                not isinstance(racing_minimum_holdouts, int)
+                or racing_minimum_holdouts < 2
+            ):
+                raise ValueError(
+                    "The minimum number of holdouts before racing the models "
+                    "must be an integer of at least two, as the models are compared "
+                    f"with a paired test across the holdouts, but {racing_minimum_holdouts} was provided."
+                )
+            if not 0.0 < racing_p_value_threshold < 1.0:
+                raise ValueError(
+                    "The p-value threshold of the racing of the models must "
+                    f"be between zero and one, but {racing_p_value_threshold} was provided."
+                )
+
+        if isinstance(results_sink, str):
+            results_sink = ResultsSink(results_sink)
+
+        if isinstance(work_queue, str):
+            work_queue = WorkQueue(work_queue)
+
+        # The experiment key identifies the evaluation in the results sink
+        # and in the work queue, and is computed before the features are
+        # normalized so that it only depends on what was provided by the user.
+        if results_sink is not None or work_queue is not None:
+            experiment_key = hashlib.sha256(
+                json.dumps(
+                    dict(
+                        task_name=cls.task_name(),
+                        graph_name=graph.get_name(),
+                        graph_hash=graph.hash(),
+                        evaluation_schema=evaluation_schema,
+                        holdouts_kwargs=holdouts_kwargs,
+                        number_of_holdouts=number_of_holdouts,
+                        random_state=random_state,
+                        node_features=cls._describe_feature_for_experiment_key(node_features),
+                        node_type_features=cls._describe_feature_for_experiment_key(node_type_features),
+                        edge_type_features=cls._describe_feature_for_experiment_key(edge_type_features),
+                        edge_features=cls._describe_feature_for_experiment_key(edge_features),
+                        node_features_preprocessing_steps=cls._describe_feature_for_experiment_key(
+                            node_features_preprocessing_steps
+                        ),
+                        subgraph_of_interest_hash=None
+                        if subgraph_of_interest is None
+                        else subgraph_of_interest.hash(),
+                        use_subgraph_as_support=use_subgraph_as_support,
+                        smoke_test=smoke_test,
+                        validation_kwargs=validation_kwargs,
+                    ),
+                    sort_keys=True,
+                    default=str,
+                ).encode("utf8")
+            ).hexdigest()
+        else:
+            experiment_key = None
 
         if number_of_slurm_nodes is not None:
             must_be_in_slurm_node()
@@ -2844,62 +3760,58 @@ class AbstractClassifierModel(AbstractModel):
             }
         )
 
+        profiler = Profiler()
+
         # We normalize and/or compute the node features, having
         # the care of skipping the features that induce bias when
         # computed on the entire graph.
         # This way we compute only once the features that do not
         # cause biases for this task, while recomputing those
         # that cause biases at each holdout, avoiding said biases.
-        starting_to_compute_constant_node_features = time.time()
-        node_features = cls.normalize_node_features(
-            graph=graph,
-            support=graph,
-            random_state=random_state,
-            node_features=node_features,
-            allow_automatic_feature=True,
-            skip_evaluation_biased_feature=True,
-            precompute_constant_stocastic_features=precompute_constant_stocastic_features,
-            smoke_test=smoke_test,
-        )
-        time_required_to_compute_constant_node_features = (
-            time.time() - starting_to_compute_constant_node_features
-        )
+        with profiler.span("computing_constant_node_features") as span:
+            node_features = cls.normalize_node_features(
+                graph=graph,
+                support=graph,
+                random_state=random_state,
+                node_features=node_features,
+                allow_automatic_feature=True,
+                skip_evaluation_biased_feature=True,
+                precompute_constant_stocastic_features=precompute_constant_stocastic_features,
+                smoke_test=smoke_test,
+            )
+        time_required_to_compute_constant_node_features = span.wall_time
 
         # We execute the same thing as described above,
         # but now for the node type features instead that for
         # the node features.
-        starting_to_compute_constant_node_type_features = time.time()
-        node_type_features = cls.normalize_node_type_features(
-            graph=graph,
-            support=graph,
-            random_state=random_state,
-            node_type_features=node_type_features,
-            allow_automatic_feature=True,
-            skip_evaluation_biased_feature=True,
-            precompute_constant_stocastic_features=precompute_constant_stocastic_features,
-            smoke_test=smoke_test,
-        )
-        time_required_to_compute_constant_node_type_features = (
-            time.time() - starting_to_compute_constant_node_type_features
-        )
+        with profiler.span("computing_constant_node_type_features") as span:
+            node_type_features = cls.normalize_node_type_features(
+                graph=graph,
+                support=graph,
+                random_state=random_state,
+                node_type_features=node_type_features,
+                allow_automatic_feature=True,
+                skip_evaluation_biased_feature=True,
+                precompute_constant_stocastic_features=precompute_constant_stocastic_features,
+                smoke_test=smoke_test,
+            )
+        time_required_to_compute_constant_node_type_features = span.wall_time
 
         # We execute the same thing as described above,
         # but now for the edge features instead that for
         # the node features.
-        starting_to_compute_constant_edge_features = time.time()
-        edge_features = cls.normalize_edge_features(
-            graph=graph,
-            support=graph,
-            random_state=random_state,
-            edge_features=edge_features,
-            allow_automatic_feature=True,
-            skip_evaluation_biased_feature=True,
-            precompute_constant_stocastic_features=precompute_constant_stocastic_features,
-            smoke_test=smoke_test,
-        )
-        time_required_to_compute_constant_edge_features = (
-            time.time() - starting_to_compute_constant_edge_features
-        )
+        with profiler.span("computing_constant_edge_features") as span:
+            edge_features = cls.normalize_edge_features(
+                graph=graph,
+                support=graph,
+                random_state=random_state,
+                edge_features=edge_features,
+                allow_automatic_feature=True,
+                skip_evaluation_biased_feature=True,
+                precompute_constant_stocastic_features=precompute_constant_stocastic_features,
+                smoke_test=smoke_test,
+            )
+        time_required_to_compute_constant_edge_features = span.wall_time
 
         metadata = dict(
             number_of_threads=os.cpu_count(),
@@ -2912,6 +3824,7 @@ class AbstractClassifierModel(AbstractModel):
             time_required_to_compute_constant_node_features=time_required_to_compute_constant_node_features,
             time_required_to_compute_constant_node_type_features=time_required_to_compute_constant_node_type_features,
             time_required_to_compute_constant_edge_features=time_required_to_compute_constant_edge_features,
+            **profiler.get_metadata(),
         )
 
         if number_of_slurm_nodes is not None:
@@ -2935,34 +3848,82 @@ class AbstractClassifierModel(AbstractModel):
             metadata["slurm_node_id"] = slurm_node_id
             metadata["number_of_slurm_nodes"] = number_of_slurm_nodes
 
-        # We start to iterate on the holdouts.
-        performance = pd.concat(
-            [
-                cls._evaluate_on_single_holdout(
+        # The parameters shared by the evaluations of all of the holdouts.
+        evaluate_on_single_holdout = functools.partial(
+            cls._evaluate_on_single_holdout,
+            graph=graph,
+            subgraph_of_interest=subgraph_of_interest,
+            use_subgraph_as_support=use_subgraph_as_support,
+            node_features=node_features,
+            node_type_features=node_type_features,
+            edge_type_features=edge_type_features,
+            edge_features=edge_features,
+            node_features_preprocessing_steps=node_features_preprocessing_steps,
+            random_state=random_state,
+            number_of_holdouts=number_of_holdouts,
+            evaluation_schema=evaluation_schema,
+            enable_cache=enable_cache,
+            smoke_test=smoke_test,
+            holdouts_kwargs=holdouts_kwargs,
+            subgraph_of_interest_has_compatible_nodes=subgraph_of_interest_has_compatible_nodes,
+            subgraph_of_interest_node_ids=subgraph_of_interest_node_ids,
+            features_names=features_names,
+            features_parameters=features_parameters,
+            metadata=metadata,
+            results_sink=results_sink,
+            resume=resume,
+            experiment_key=experiment_key,
+            profiler=profiler,
+            number_of_concurrent_models=number_of_concurrent_models,
+            **validation_kwargs,
+        )
+
+        if work_queue is not None:
+            # Each model on each holdout is a unit of work of the queue,
+            # prefixed by the holdout number so that the workers tend to
+            # work on the same holdouts, whose splits are cached on disk.
+            units = {
+                f"holdout_{holdout_number}_{cls._get_unit_key(experiment_key=experiment_key, holdout_number=holdout_number, classifier=classifier)}": (
+                    holdout_number,
+                    classifier,
+                )
+                for holdout_number in range(number_of_holdouts)
+                for classifier in cls.iterate_classifier_models(
+                    models=models, library_names=library_names, smoke_test=smoke_test
+                )
+            }
+            work_queue.populate(units.keys())
+            holdouts_performance = [
+                evaluate_on_single_holdout(
+                    models=units[unit_key][1],
+                    library_names=None,
+                    holdout_number=units[unit_key][0],
+                    verbose=False,
+                )
+                for unit_key in work_queue.iterate_units(units.keys())
+            ]
+        elif racing_metric is not None:
+            holdouts_performance = cls._race_models(
+                evaluate_on_single_holdout=evaluate_on_single_holdout,
+                classifiers=list(cls.iterate_classifier_models(
+                    models=models, library_names=library_names, smoke_test=smoke_test
+                )),
+                number_of_holdouts=number_of_holdouts,
+                racing_metric=racing_metric,
+                racing_minimum_holdouts=racing_minimum_holdouts,
+                racing_p_value_threshold=racing_p_value_threshold,
+                verbose=verbose,
+                description=f"Racing models on {graph.get_name()}",
+            )
+        else:
+            # We start to iterate on the holdouts.
+            holdouts_performance = [
+                evaluate_on_single_holdout(
                     models=models,
                     library_names=library_names,
-                    graph=graph,
-                    subgraph_of_interest=subgraph_of_interest,
-                    use_subgraph_as_support=use_subgraph_as_support,
-                    node_features=node_features,
-                    node_type_features=node_type_features,
-                    edge_type_features=edge_type_features,
-                    edge_features=edge_features,
-                    node_features_preprocessing_steps=node_features_preprocessing_steps,
-                    random_state=random_state,
                     holdout_number=holdout_number,
-                    number_of_holdouts=number_of_holdouts,
-                    evaluation_schema=evaluation_schema,
-                    enable_cache=enable_cache,
-                    smoke_test=smoke_test,
-                    holdouts_kwargs=holdouts_kwargs,
-                    subgraph_of_interest_has_compatible_nodes=subgraph_of_interest_has_compatible_nodes,
                     verbose=verbose
                     and (number_of_slurm_nodes is None or slurm_node_id == 0),
-                    features_names=features_names,
-                    features_parameters=features_parameters,
-                    metadata=metadata.copy(),
-                    **validation_kwargs,
                 )
                 for holdout_number in trange(
                     number_of_holdouts,
@@ -2992,7 +3953,16 @@ class AbstractClassifierModel(AbstractModel):
                     )
                 )
             ]
-        )
+
+        # When the units of work were all completed by other
+        # workers, this worker has no performance to report.
+        if len(holdouts_performance) == 0:
+            performance = pd.DataFrame()
+        else:
+            performance = pd.concat(holdouts_performance)
+
+        if chrome_trace_path is not None:
+            profiler.export_chrome_trace(chrome_trace_path)
 
         # We save the constant values for this model
         # execution.
@@ -1,11 +1,26 @@
 """Module providing abstract classes for embedding models."""
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union
 from ensmallen import Graph
 from ensmallen.datasets import get_dataset
 import warnings
+import numpy as np
+import pandas as pd
+from userinput.utils import must_be_in_set
 from cache_decorator import Cache
 from embiggen.utils.abstract_models.abstract_model import AbstractModel, abstract_class
 from embiggen.utils.abstract_models.embedding_result import EmbeddingResult
+from embiggen.utils.checkpoints import get_checkpoint_path, validate_checkpoint_parameters
+from embiggen.utils.warm_start import align_previous_node_embedding
+from embiggen.utils.fold_in import (
+    FOLD_IN_METHODS,
+    Neighbourhoods,
+    fold_in_by_local_sgd,
+    fold_in_by_neighbours_average,
+    get_fold_in_context_index,
+    get_fold_in_node_embeddings,
+    get_fold_in_result,
+    get_new_node_ids,
+)
 
 
 @abstract_class
@@ -17,7 +32,10 @@ class AbstractEmbeddingModel(AbstractModel):
         embedding_size: Optional[int] = None,
         enable_cache: bool = False,
         ring_bell: bool = False,
-        random_state: Optional[int] = None
+        random_state: Optional[int] = None,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_frequency: int = 1,
+        checkpoint_retention: int = 1
     ):
         """Create new embedding model.
 
@@ -32,8 +50,20 @@ class AbstractEmbeddingModel(AbstractModel):
             Whether to play a sound when embedding completes.
         random_state: Optional[int] = None
             The random state to use if the model is stocastic.
+        checkpoint_directory: Optional[str] = None
+            Directory where to store the checkpoints of the training,
+            for the models supporting them. By default, no checkpoint is stored.
+        checkpoint_frequency: int = 1
+            The frequency of the checkpoints, whose unit depends on the model.
+        checkpoint_retention: int = 1
+            Number of the latest checkpoints to keep.
         """
         super().__init__(random_state=random_state)
+        validate_checkpoint_parameters(
+            checkpoint_directory,
+            checkpoint_frequency,
+            checkpoint_retention
+        )
         if embedding_size is not None and not isinstance(embedding_size, int) or embedding_size == 0:
             raise ValueError(
                 "The embedding size, if provided, should be a strictly positive integer "
@@ -41,6 +71,9 @@ class AbstractEmbeddingModel(AbstractModel):
             )
         self._embedding_size = embedding_size
         self._enable_cache = enable_cache
+        self._checkpoint_directory = checkpoint_directory
+        self._checkpoint_frequency = checkpoint_frequency
+        self._checkpoint_retention = checkpoint_retention
 
         try:
             from ringbell import RingBell
@@ -55,7 +88,38 @@ class AbstractEmbeddingModel(AbstractModel):
         """Returns parameters of the embedding model."""
         return dict(
             **super().parameters(),
-            **(dict(embedding_size=self._embedding_size) if self._embedding_size is not None else dict())
+            **(dict(embedding_size=self._embedding_size) if self._embedding_size is not None else dict()),
+            **(
+                dict(
+                    checkpoint_directory=self._checkpoint_directory,
+                    checkpoint_frequency=self._checkpoint_frequency,
+                    checkpoint_retention=self._checkpoint_retention,
+                )
+                if self._checkpoint_directory is not None
+                else dict()
+            )
+        )
+
+    def _get_checkpoint_path(self, graph: Graph) -> Optional[str]:
+        """Returns the directory of the checkpoints of the training on the provided graph.
+
+        Parameters
+        --------------------
+        graph: Graph
+            The graph the model is trained on.
+
+        Returns
+        --------------------
+        The directory of the checkpoints, or None if checkpoints are not enabled.
+        """
+        if self._checkpoint_directory is None:
+            return None
+        return get_checkpoint_path(
+            self._checkpoint_directory,
+            model_name=self.model_name(),
+            library_name=self.library_name(),
+            parameters=self.parameters(),
+            graph=graph,
         )
 
     @classmethod
@@ -88,28 +152,13 @@ class AbstractEmbeddingModel(AbstractModel):
             "in the child classes of abstract model."
         ))
 
-    @Cache(
-        cache_path="{cache_dir}/{self.model_name()}/{self.library_name()}/{graph.get_name()}/{_hash}.pkl.gz",
-        cache_dir="embedding",
-        enable_cache_arg_name="self._enable_cache",
-    )
-    def _cached_fit_transform(
-        self,
-        graph: Graph,
-        return_dataframe: bool = True,
-    ) -> EmbeddingResult:
-        """Execute embedding on the provided graph.
+    def _validate_graph(self, graph: Graph):
+        """Raises a ValueError if the provided graph cannot be embedded by this model.
 
         Parameters
         --------------------
         graph: Graph
             The graph to run embedding on.
-        return_dataframe: bool = True
-            Whether to return a pandas DataFrame with the embedding.
-
-        Returns
-        --------------------
-        An embedding result, wrapping the complexity of a generic embedding.
         """
         if not graph.has_nodes():
             raise ValueError(
@@ -179,6 +228,31 @@ class AbstractEmbeddingModel(AbstractModel):
                     )
                 )
 
+    @Cache(
+        cache_path="{cache_dir}/{self.model_name()}/{self.library_name()}/{graph.get_name()}/{_hash}.pkl.gz",
+        cache_dir="embedding",
+        enable_cache_arg_name="self._enable_cache",
+    )
+    def _cached_fit_transform(
+        self,
+        graph: Graph,
+        return_dataframe: bool = True,
+    ) -> EmbeddingResult:
+        """Execute embedding on the provided graph.
+
+        Parameters
+        --------------------
+        graph: Graph
+            The graph to run embedding on.
+        return_dataframe: bool = True
+            Whether to return a pandas DataFrame with the embedding.
+
+        Returns
+        --------------------
+        An embedding result, wrapping the complexity of a generic embedding.
+        """
+        self._validate_graph(graph)
+
         result = self._fit_transform(
             graph=graph,
             return_dataframe=return_dataframe,
@@ -249,6 +323,267 @@ class AbstractEmbeddingModel(AbstractModel):
             graph=graph,
             return_dataframe=return_dataframe,
         )
+
+    @classmethod
+    def can_warm_start(cls) -> bool:
+        """Returns whether the model can be warm-started from a previous embedding."""
+        return False
+
+    def _warm_start_fit_transform(
+        self,
+        graph: Graph,
+        initial_node_embedding: np.ndarray,
+        known_nodes: np.ndarray,
+        epochs: Optional[int],
+        return_dataframe: bool = True,
+    ) -> EmbeddingResult:
+        """Run embedding on the provided graph, starting from the provided node embedding.
+
+        Parameters
+        --------------------
+        graph: Graph
+            The graph to run embedding on.
+        initial_node_embedding: np.ndarray
+            The initial embedding of the nodes, aligned to the node ids.
+        known_nodes: np.ndarray
+            The mask of the nodes whose initial embedding is known.
+        epochs: Optional[int]
+            The number of epochs of the warm start, if requested.
+        return_dataframe: bool = True
+            Whether to return a pandas DataFrame with the embedding.
+        """
+        raise NotImplementedError((
+            "The `_warm_start_fit_transform` method must be implemented "
+            "in the child classes of abstract model that can be warm-started."
+        ))
+
+    def warm_start_fit_transform(
+        self,
+        graph: Graph,
+        previous_embedding: EmbeddingResult,
+        epochs: Optional[int] = None,
+        return_dataframe: bool = True,
+    ) -> EmbeddingResult:
+        """Execute embedding on the provided graph, warm-started from a previous embedding.
+
+        Parameters
+        --------------------
+        graph: Graph
+            The graph to run embedding on, such as a new version
+            of the graph the previous embedding was computed on.
+        previous_embedding: EmbeddingResult
+            The embedding computed by this model on a previous version of the
+            graph, with the node embedding as a DataFrame indexed by node name.
+        epochs: Optional[int] = None
+            The number of epochs of the warm start. By default,
+            a tenth of the epochs of the model, and at least one.
+        return_dataframe: bool = True
+            Whether to return a pandas DataFrame with the embedding.
+
+        Raises
+        --------------------
+        ValueError
+            If the model cannot be warm-started.
+
+        Implementation details
+        --------------------
+        The nodes of the graph that appear in the previous embedding are
+        initialized from their previous vectors, while the new nodes are
+        initialized as in a cold start. Where supported by the model, the
+        training focuses on the new nodes and on their neighbours. The
+        result is never cached, and no checkpoint is stored.
+        """
+        if not self.can_warm_start():
+            raise ValueError(
+                f"The {self.model_name()} model from the library {self.library_name()} "
+                "cannot be warm-started from a previous embedding."
+            )
+
+        self._validate_graph(graph)
+
+        initial_node_embedding, known_nodes = align_previous_node_embedding(
+            previous_embedding,
+            graph,
+            embedding_size=self._embedding_size,
+        )
+
+        result = self._warm_start_fit_transform(
+            graph=graph,
+            initial_node_embedding=initial_node_embedding,
+            known_nodes=known_nodes,
+            epochs=epochs,
+            return_dataframe=return_dataframe,
+        )
+
+        if self._ring_bell is not None:
+            self._ring_bell.play()
+
+        return result
+
+    @classmethod
+    def can_fold_in_by_projection(cls) -> bool:
+        """Returns whether the new nodes can be projected onto the embedding of the model."""
+        return False
+
+    @classmethod
+    def can_fold_in_by_local_sgd(cls) -> bool:
+        """Returns whether the model is trained with the skip-gram objective with negative sampling."""
+        return False
+
+    def _fold_in_by_projection(
+        self,
+        graph: Graph,
+        node_embeddings: List[pd.DataFrame],
+        new_node_ids: np.ndarray,
+    ) -> List[np.ndarray]:
+        """Returns the vectors of the new nodes projected onto the provided embeddings.
+
+        Parameters
+        --------------------
+        graph: Graph
+            The graph with the new nodes.
+        node_embeddings: List[pd.DataFrame]
+            The node embeddings computed by the model, indexed by node name.
+        new_node_ids: np.ndarray
+            The ids of the new nodes.
+        """
+        raise NotImplementedError((
+            "The `_fold_in_by_projection` method must be implemented "
+            "in the child classes of abstract model that can fold in "
+            "the new nodes by projection."
+        ))
+
+    def fold_in(
+        self,
+        graph: Graph,
+        embedding: EmbeddingResult,
+        method: str = "neighbours_average",
+        new_node_names: Optional[List[str]] = None,
+        epochs: int = 10,
+        learning_rate: float = 0.025,
+        number_of_negative_samples: int = 5,
+    ) -> EmbeddingResult:
+        """Returns the node embedding of the nodes of the graph missing from the provided embedding.
+
+        Parameters
+        --------------------
+        graph: Graph
+            The graph with the new nodes, such as a new version
+            of the graph the embedding was computed on.
+        embedding: EmbeddingResult
+            The embedding computed by this model on a previous version of the
+            graph, with the node embeddings as DataFrames indexed by node name.
+        method: str = "neighbours_average"
+            The method to compute the vectors of the new nodes. It can be:
+            - `neighbours_average`, the average of the vectors of the
+              neighbours, weighted by the edge weights if the model uses them.
+            - `local_sgd`, a few steps of SGD of the skip-gram objective with
+              negative sampling on the edges of the new nodes, starting from
+              the average of the neighbours, for the models trained with
+              this objective such as the SkipGram and LINE models.
+            - `projection`, the least-squares projection of the row of the
+              factorized matrix, for the models factorizing a matrix such
+              as HOPE and Laplacian Eigenmaps.
+        new_node_names: Optional[List[str]] = None
+            The names of the new nodes. By default, the nodes of the graph
+            missing from the embedding, which are found by looking up every
+            node of the graph in the index of the embedding: on large graphs,
+            please provide the names of the new nodes to avoid this scan.
+        epochs: int = 10
+            The number of SGD steps for each new node, with `local_sgd`.
+        learning_rate: float = 0.025
+            The initial learning rate, with `local_sgd`.
+        number_of_negative_samples: int = 5
+            The number of negatives for each neighbour, with `local_sgd`.
+
+        Raises
+        --------------------
+        ValueError
+            If the provided method is not supported by the model.
+
+        Implementation details
+        --------------------
+        The vectors of the existing nodes are kept frozen, and only the
+        neighbourhoods of the new nodes are visited, so when the names of
+        the new nodes are provided the cost is proportional to their
+        neighbourhoods rather than to the graph. The returned embedding
+        only has the new nodes.
+        """
+        method = must_be_in_set(method, FOLD_IN_METHODS, "fold-in method")
+
+        if method == "projection" and not self.can_fold_in_by_projection():
+            raise ValueError(
+                f"The {self.model_name()} model from the library {self.library_name()} "
+                "does not factorize a matrix, so the new nodes cannot be folded in "
+                "by projection. Please use the `neighbours_average` method."
+            )
+
+        if method == "local_sgd" and not self.can_fold_in_by_local_sgd():
+            raise ValueError(
+                f"The {self.model_name()} model from the library {self.library_name()} "
+                "is not trained with the skip-gram objective with negative sampling, "
+                "so the new nodes cannot be folded in by local SGD, which would "
+                "fit them to a different objective than the one of the model. "
+                "Please use the `neighbours_average` method."
+            )
+
+        node_embeddings = get_fold_in_node_embeddings(embedding, graph)
+        new_node_ids = get_new_node_ids(
+            graph,
+            node_embeddings[0],
+            new_node_names=new_node_names
+        )
+
+        if method == "projection":
+            new_node_embeddings = self._fold_in_by_projection(
+                graph,
+                node_embeddings,
+                new_node_ids
+            )
+        else:
+            neighbourhoods = Neighbourhoods(
+                graph,
+                node_embeddings[0],
+                new_node_ids,
+                use_edge_weights=graph.has_edge_weights() and self.can_use_edge_weights(),
+            )
+            new_node_embeddings = [
+                fold_in_by_neighbours_average(
+                    neighbourhoods,
+                    node_embedding.to_numpy()
+                )
+                for node_embedding in node_embeddings
+            ]
+            if method == "local_sgd":
+                new_node_embeddings = [
+                    fold_in_by_local_sgd(
+                        neighbourhoods,
+                        node_embedding=node_embedding.to_numpy(),
+                        context_embedding=node_embeddings[
+                            get_fold_in_context_index(node_embeddings, index)
+                        ].to_numpy(),
+                        initial_new_node_embedding=new_node_embeddings[index],
+                        new_context_embedding=new_node_embeddings[
+                            get_fold_in_context_index(node_embeddings, index)
+                        ],
+                        epochs=epochs,
+                        learning_rate=learning_rate,
+                        number_of_negative_samples=number_of_negative_samples,
+                        random_state=(
+                            42 if self._random_state is None
+                            else self._random_state
+                        ),
+                    )
+                    for index, node_embedding in enumerate(node_embeddings)
+                ]
+
+        return get_fold_in_result(
+            embedding,
+            graph,
+            new_node_ids,
+            new_node_embeddings,
+            node_embeddings
+        )
     
     @classmethod
     def can_use_edge_type_features(cls) -> bool:
@@ -11,6 +11,7 @@ when the model is loaded, the feature preprocessor is loaded as well.
 from typing import Optional, Union, List
 import pandas as pd
 import numpy as np
+from scipy.sparse import issparse
 import warnings
 from ensmallen import Graph
 from embiggen.utils.abstract_models.abstract_model import AbstractModel
@@ -86,6 +87,6 @@ class AbstractFeaturePreprocessor(AbstractModel):
             )
 
         for feature in node_features:
-            assert isinstance(feature, (pd.DataFrame, np.ndarray))
+            assert isinstance(feature, (pd.DataFrame, np.ndarray)) or issparse(feature)
 
         return self._transform(support=support, node_features=node_features)
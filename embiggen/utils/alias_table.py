@@ -0,0 +1,212 @@
+"""Module providing the alias tables used to sample from unigram distributions.
+
+An alias table allows to sample from a discrete distribution over `n`
+classes in constant time per draw: a column is picked uniformly at random,
+and a biased coin decides whether to return the column itself or its alias.
+The table is built with vectorized operations, and the tables of the unigram
+distributions are kept in a small cache, so that the models built on the same
+graph, such as the ones of the different holdouts, share the same table.
+"""
+from collections import OrderedDict
+from typing import Tuple
+import hashlib
+import threading
+
+import numpy as np
+
+# Maximal number of unigram alias tables kept in the cache.
+MAXIMAL_NUMBER_OF_CACHED_ALIAS_TABLES = 8
+
+_ALIAS_TABLE_CACHE: "OrderedDict[Tuple[str, float], Tuple[np.ndarray, np.ndarray, np.ndarray]]" = OrderedDict()
+_ALIAS_TABLE_CACHE_LOCK = threading.Lock()
+
+
+def get_unigram_distribution(
+    frequencies: np.ndarray,
+    distortion: float = 0.75
+) -> np.ndarray:
+    """Return the unigram distribution of the provided frequencies.
+
+    Parameters
+    ----------------
+    frequencies: np.ndarray
+        The frequency of each of the classes, such as the node degrees.
+    distortion: float = 0.75
+        The exponent the frequencies are raised to. The default value
+        is the one used in the original Word2Vec negative sampling.
+
+    Raises
+    ----------------
+    ValueError
+        If the frequencies are not a non-negative vector with a positive sum.
+    """
+    frequencies = np.asarray(frequencies, dtype=np.float64)
+
+    if frequencies.ndim != 1 or frequencies.size == 0:
+        raise ValueError(
+            "The frequencies should be a non-empty vector, but an array "
+            f"with shape {frequencies.shape} was provided."
+        )
+
+    if not np.isfinite(frequencies).all() or (frequencies < 0).any():
+        raise ValueError(
+            "The frequencies should be finite and non-negative values."
+        )
+
+    distribution = np.power(frequencies, distortion)
+    # Zero frequencies must not be sampled, whatever the distortion.
+    distribution[frequencies == 0] = 0.0
+    total = distribution.sum()
+
+    if total <= 0:
+        raise ValueError(
+            "The frequencies should have a positive sum, but all of "
+            f"the {frequencies.size} provided frequencies are zero."
+        )
+
+    return distribution / total
+
+
+def get_alias_table(distribution: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the alias table of the provided discrete distribution.
+
+    Parameters
+    ----------------
+    distribution: np.ndarray
+        The probability of each of the classes, summing to one.
+
+    Implementation details
+    ----------------
+    The probabilities are scaled by the number of classes, so that the
+    columns below one lack some mass and the ones above one have some in
+    excess. The deficits of the former and the excesses of the latter are
+    laid out one after the other on two lines of the same total length,
+    and each deficit is filled by the column whose excess contains its start.
+    A column whose excess ends within a deficit receives more mass than it
+    has in excess, so it is left with a deficit of its own up to the end of
+    that deficit, which is filled by the next column with some excess. As
+    with the method of Vose, every column is thus paired with at most one
+    alias, but the pairs are found with cumulative sums and binary searches
+    rather than with a loop over the columns.
+
+    Returns
+    ----------------
+    Tuple with the probability of keeping each of the columns
+    and the alias to return otherwise.
+    """
+    number_of_classes = distribution.size
+    scaled = np.asarray(distribution, dtype=np.float64) * number_of_classes
+    probabilities = np.ones(number_of_classes, dtype=np.float64)
+    aliases = np.arange(number_of_classes, dtype=np.int64)
+
+    small = np.flatnonzero(scaled < 1.0)
+    large = np.flatnonzero(scaled >= 1.0)
+
+    deficit_ends = np.cumsum(1.0 - scaled[small])
+    deficit_starts = np.concatenate(([0.0], deficit_ends))[:-1]
+    excess_ends = np.cumsum(scaled[large] - 1.0)
+
+    # The columns whose start lies beyond the last excess only
+    # differ from one because of the floating point rounding
+    # errors, and are left with a probability of one.
+    owners = np.searchsorted(excess_ends, deficit_starts, side="right")
+    filled = owners < large.size
+    probabilities[small[filled]] = scaled[small[filled]]
+    aliases[small[filled]] = large[owners[filled]]
+
+    # The columns whose excess ends within a deficit are left with
+    # the part of the deficit after the end of their excess.
+    overlapping = np.searchsorted(deficit_ends, excess_ends, side="left")
+    next_owners = np.searchsorted(excess_ends, excess_ends, side="right")
+    exceeded = (
+        (overlapping < small.size)
+        & (next_owners < large.size)
+        & (scaled[large] > 1.0)
+    )
+    remaining_deficits = (
+        deficit_ends[overlapping[exceeded]] - excess_ends[exceeded]
+    )
+    probabilities[large[exceeded]] = 1.0 - remaining_deficits
+    aliases[large[exceeded]] = large[next_owners[exceeded]]
+
+    return (
+        np.clip(probabilities, 0.0, 1.0).astype(np.float32),
+        aliases,
+    )
+
+
+def get_unigram_alias_table(
+    frequencies: np.ndarray,
+    distortion: float = 0.75
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the unigram distribution of the provided frequencies and its alias table.
+
+    Parameters
+    ----------------
+    frequencies: np.ndarray
+        The frequency of each of the classes, such as the node degrees.
+    distortion: float = 0.75
+        The exponent the frequencies are raised to.
+
+    Raises
+    ----------------
+    ValueError
+        If the frequencies are not a non-negative vector with a positive sum.
+
+    Implementation details
+    ----------------
+    The tables are cached by the digest of the frequencies and by the
+    distortion, so that the tables of the same graph are built only once
+    by the models sharing it. The cached arrays are shared among the
+    callers, and are therefore read-only.
+
+    Returns
+    ----------------
+    Tuple with the unigram distribution, the probability of keeping
+    each of the columns and the alias to return otherwise.
+    """
+    frequencies = np.ascontiguousarray(frequencies, dtype=np.float64)
+    key = (hashlib.sha256(frequencies.data).hexdigest(), float(distortion))
+
+    with _ALIAS_TABLE_CACHE_LOCK:
+        if key in _ALIAS_TABLE_CACHE:
+            _ALIAS_TABLE_CACHE.move_to_end(key)
+            return _ALIAS_TABLE_CACHE[key]
+
+    distribution = get_unigram_distribution(frequencies, distortion=distortion)
+    table = (distribution, *get_alias_table(distribution))
+    for array in table:
+        array.flags.writeable = False
+
+    with _ALIAS_TABLE_CACHE_LOCK:
+        table = _ALIAS_TABLE_CACHE.setdefault(key, table)
+        _ALIAS_TABLE_CACHE.move_to_end(key)
+        while len(_ALIAS_TABLE_CACHE) > MAXIMAL_NUMBER_OF_CACHED_ALIAS_TABLES:
+            _ALIAS_TABLE_CACHE.popitem(last=False)
+
+    return table
+
+
+def sample_from_alias_table(
+    probabilities: np.ndarray,
+    aliases: np.ndarray,
+    number_of_samples: int,
+    random_state: int = 42
+) -> np.ndarray:
+    """Return the classes sampled from the provided alias table.
+
+    Parameters
+    ----------------
+    probabilities: np.ndarray
+        The probability of keeping each of the columns.
+    aliases: np.ndarray
+        The alias of each of the columns.
+    number_of_samples: int
+        The number of classes to sample.
+    random_state: int = 42
+        The random state to reproduce the sampling.
+    """
+    random_state = np.random.RandomState(random_state)
+    columns = random_state.randint(probabilities.size, size=number_of_samples)
+    coins = random_state.uniform(size=number_of_samples)
+    return np.where(coins < probabilities[columns], columns, aliases[columns])
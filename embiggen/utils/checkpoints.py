@@ -0,0 +1,156 @@
+"""Module providing the directories of the checkpoints of the embedding models.
+
+The checkpoints of a training are stored in a directory keyed, as the
+embedding cache, by the name of the model, of its library and of the graph,
+and by the hash of the model parameters and of the graph. A training that is
+interrupted and then started again with the same model parameters and graph
+therefore finds its checkpoints and resumes from the latest one, while the
+trainings with different parameters or graphs never share checkpoints.
+"""
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from dict_hash import sha256
+from ensmallen import Graph
+
+# Parameters not affecting the training, and therefore excluded from the hash.
+CHECKPOINT_PARAMETERS = (
+    "checkpoint_directory",
+    "checkpoint_frequency",
+    "checkpoint_frequency_minutes",
+    "checkpoint_retention",
+    "verbose",
+    "ring_bell",
+    "enable_cache",
+)
+
+
+def validate_checkpoint_parameters(
+    checkpoint_directory: Optional[str],
+    checkpoint_frequency: int,
+    checkpoint_retention: int,
+):
+    """Raises a ValueError if the provided checkpoint parameters are not valid.
+
+    Parameters
+    ----------------
+    checkpoint_directory: Optional[str]
+        The directory where to store the checkpoints, if any.
+    checkpoint_frequency: int
+        The frequency of the checkpoints.
+    checkpoint_retention: int
+        The number of checkpoints to keep.
+    """
+    if checkpoint_directory is not None and not isinstance(checkpoint_directory, str):
+        raise ValueError(
+            "The checkpoint directory, if provided, should be a string, "
+            f"but an object of type {type(checkpoint_directory)} was provided."
+        )
+    if not isinstance(checkpoint_frequency, int) or checkpoint_frequency < 0:
+        raise ValueError(
+            "The checkpoint frequency should be a non-negative integer, "
+            f"but {checkpoint_frequency} was provided."
+        )
+    if not isinstance(checkpoint_retention, int) or checkpoint_retention < 1:
+        raise ValueError(
+            "The checkpoint retention should be a strictly positive integer, "
+            f"but {checkpoint_retention} was provided."
+        )
+
+
+def get_checkpoint_path(
+    checkpoint_directory: str,
+    model_name: str,
+    library_name: str,
+    parameters: Dict[str, Any],
+    graph: Graph,
+) -> str:
+    """Returns the directory of the checkpoints of the provided model and graph.
+
+    Parameters
+    ----------------
+    checkpoint_directory: str
+        The root directory of the checkpoints.
+    model_name: str
+        The name of the model.
+    library_name: str
+        The name of the library of the model.
+    parameters: Dict[str, Any]
+        The parameters of the model.
+    graph: Graph
+        The graph the model is trained on.
+    """
+    path = os.path.join(
+        checkpoint_directory,
+        model_name,
+        library_name,
+        graph.get_name(),
+        sha256(dict(
+            parameters={
+                key: value
+                for key, value in parameters.items()
+                if key not in CHECKPOINT_PARAMETERS
+            },
+            model_name=model_name,
+            library_name=library_name,
+            graph_hash=graph.hash(),
+        )),
+    )
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _get_epoch_checkpoint_pattern(extension: str) -> "re.Pattern":
+    """Returns the pattern of the names of the epoch checkpoints."""
+    return re.compile(r"^epoch_(\d+)" + re.escape(extension) + "$")
+
+
+def get_epoch_checkpoint_file_name(epoch: int, extension: str) -> str:
+    """Returns the name of the checkpoint of the provided epoch.
+
+    Parameters
+    ----------------
+    epoch: int
+        The number of epochs completed when the checkpoint is stored.
+    extension: str
+        The extension of the checkpoint files.
+    """
+    return f"epoch_{epoch:08d}{extension}"
+
+
+def get_epoch_checkpoints(path: str, extension: str) -> List[int]:
+    """Returns the sorted epochs of the checkpoints in the provided directory.
+
+    Parameters
+    ----------------
+    path: str
+        The directory of the checkpoints.
+    extension: str
+        The extension of the checkpoint files.
+    """
+    pattern = _get_epoch_checkpoint_pattern(extension)
+    return sorted(
+        int(match.group(1))
+        for match in (pattern.match(file_name) for file_name in os.listdir(path))
+        if match is not None
+    )
+
+
+def remove_old_epoch_checkpoints(path: str, extension: str, retention: int):
+    """Removes all but the latest checkpoints in the provided directory.
+
+    Parameters
+    ----------------
+    path: str
+        The directory of the checkpoints.
+    extension: str
+        The extension of the checkpoint files.
+    retention: int
+        The number of checkpoints to keep.
+    """
+    for epoch in get_epoch_checkpoints(path, extension)[:-retention]:
+        os.remove(os.path.join(
+            path,
+            get_epoch_checkpoint_file_name(epoch, extension)
+        ))
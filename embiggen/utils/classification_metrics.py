@@ -0,0 +1,322 @@
+"""Module providing single-pass metrics for multi-class and multi-label predictions.
+
+The metrics are derived from the per-class counts of a confusion matrix,
+that is its diagonal and its margins, which are computed with a single pass
+over the predictions. The full confusion matrix is never materialized, so
+that tasks with thousands of classes do not require a quadratic amount of
+memory. The one-vs-rest AUROC and AUPRC are computed from a single sort of
+each of the class columns of the prediction probabilities, and the columns
+are processed in parallel.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+def _macro_average(
+    true_positives: np.ndarray,
+    false_positives: np.ndarray,
+    false_negatives: np.ndarray,
+    mask: Optional[np.ndarray] = None,
+) -> Dict[str, float]:
+    """Return the macro-averaged F1 score, precision and recall.
+
+    Parameters
+    ----------------
+    true_positives: np.ndarray
+        The number of true positives of each class.
+    false_positives: np.ndarray
+        The number of false positives of each class.
+    false_negatives: np.ndarray
+        The number of false negatives of each class.
+    mask: Optional[np.ndarray] = None
+        The classes to include in the average. By default, all of them.
+
+    Implementation details
+    ----------------
+    As with the `zero_division=0` setting of scikit-learn, the metrics of
+    the classes whose denominator is zero are set to zero.
+    """
+    if mask is not None:
+        true_positives = true_positives[mask]
+        false_positives = false_positives[mask]
+        false_negatives = false_negatives[mask]
+
+    if true_positives.size == 0:
+        return dict(f1_score=0.0, precision_score=0.0, recall_score=0.0)
+
+    true_positives = true_positives.astype(np.float64)
+
+    def safe_mean_ratio(numerator: np.ndarray, denominator: np.ndarray) -> float:
+        ratios = np.zeros_like(numerator)
+        np.divide(numerator, denominator, out=ratios, where=denominator > 0)
+        return float(ratios.mean())
+
+    return dict(
+        f1_score=safe_mean_ratio(
+            2 * true_positives,
+            2 * true_positives + false_positives + false_negatives
+        ),
+        precision_score=safe_mean_ratio(
+            true_positives, true_positives + false_positives
+        ),
+        recall_score=safe_mean_ratio(
+            true_positives, true_positives + false_negatives
+        ),
+    )
+
+
+def get_multiclass_metrics(
+    ground_truth: np.ndarray,
+    predictions: np.ndarray,
+) -> Dict[str, float]:
+    """Return the metrics of the provided multi-class predictions.
+
+    Parameters
+    ----------------
+    ground_truth: np.ndarray
+        The class of each of the samples.
+    predictions: np.ndarray
+        The predicted class of each of the samples.
+
+    Implementation details
+    ----------------
+    The metrics match the ones of scikit-learn: the macro averages include
+    the classes appearing either in the ground truth or in the predictions,
+    while the balanced accuracy only includes the classes of the ground truth.
+    """
+    ground_truth = np.asarray(ground_truth).reshape(-1)
+    predictions = np.asarray(predictions).reshape(-1)
+
+    if ground_truth.shape != predictions.shape:
+        raise ValueError(
+            f"The ground truth has {ground_truth.size} samples, but "
+            f"{predictions.size} predictions were provided."
+        )
+
+    if ground_truth.size == 0:
+        raise ValueError("The provided ground truth is empty.")
+
+    if (
+        np.issubdtype(ground_truth.dtype, np.integer)
+        and np.issubdtype(predictions.dtype, np.integer)
+        and min(ground_truth.min(), predictions.min()) >= 0
+    ):
+        number_of_classes = int(max(ground_truth.max(), predictions.max())) + 1
+    else:
+        # Classes that are not non-negative integers are mapped to dense ids.
+        _, class_ids = np.unique(
+            np.concatenate((ground_truth, predictions)),
+            return_inverse=True
+        )
+        ground_truth = class_ids[:ground_truth.size]
+        predictions = class_ids[ground_truth.size:]
+        number_of_classes = int(class_ids.max()) + 1
+
+    correct = ground_truth == predictions
+    # The diagonal and the margins of the confusion matrix.
+    true_positives = np.bincount(
+        ground_truth[correct], minlength=number_of_classes
+    )
+    support = np.bincount(ground_truth, minlength=number_of_classes)
+    predicted = np.bincount(predictions, minlength=number_of_classes)
+
+    accuracy = float(correct.mean())
+    in_ground_truth = support > 0
+
+    return {
+        "accuracy_score": accuracy,
+        "hamming_loss": 1.0 - accuracy,
+        "balanced_accuracy_score": float(
+            (true_positives[in_ground_truth] / support[in_ground_truth]).mean()
+        ),
+        **_macro_average(
+            true_positives,
+            predicted - true_positives,
+            support - true_positives,
+            mask=in_ground_truth | (predicted > 0),
+        ),
+    }
+
+
+def get_multilabel_metrics(
+    ground_truth: np.ndarray,
+    predictions: np.ndarray,
+) -> Dict[str, float]:
+    """Return the metrics of the provided multi-label predictions.
+
+    Parameters
+    ----------------
+    ground_truth: np.ndarray
+        The boolean matrix of the labels of each of the samples.
+    predictions: np.ndarray
+        The boolean matrix of the predicted labels of each of the samples.
+
+    Implementation details
+    ----------------
+    As in scikit-learn, the accuracy is the subset accuracy, i.e. the rate
+    of samples whose labels are all predicted correctly, and the macro
+    averages include all of the labels.
+    """
+    ground_truth = np.asarray(ground_truth).astype(bool, copy=False)
+    predictions = np.asarray(predictions).astype(bool, copy=False)
+
+    if ground_truth.shape != predictions.shape or ground_truth.ndim != 2:
+        raise ValueError(
+            "The ground truth and the predictions should be matrices with "
+            f"the same shape, but they have shapes {ground_truth.shape} "
+            f"and {predictions.shape}."
+        )
+
+    if ground_truth.size == 0:
+        raise ValueError("The provided ground truth is empty.")
+
+    errors = ground_truth != predictions
+    true_positives = (ground_truth & predictions).sum(axis=0)
+
+    return {
+        "accuracy_score": float((~errors.any(axis=1)).mean()),
+        "hamming_loss": float(errors.mean()),
+        **_macro_average(
+            true_positives,
+            predictions.sum(axis=0) - true_positives,
+            ground_truth.sum(axis=0) - true_positives,
+        ),
+    }
+
+
+def _get_binary_auroc_and_auprc(
+    ground_truth: np.ndarray,
+    scores: np.ndarray,
+) -> Tuple[float, float]:
+    """Return the AUROC and AUPRC of a single class column, NaN when undefined.
+
+    Parameters
+    ----------------
+    ground_truth: np.ndarray
+        The boolean vector of the samples belonging to the class.
+    scores: np.ndarray
+        The scores of the samples for the class.
+
+    Implementation details
+    ----------------
+    Both the metrics are computed from a single sort of the scores.
+    The AUROC is the trapezoidal area under the curve, while the AUPRC is
+    the average precision, as in scikit-learn. When the class has no
+    positive or no negative samples the AUROC is undefined, and when it
+    has no positive samples the AUPRC is undefined as well.
+    """
+    number_of_positives = int(ground_truth.sum())
+    number_of_negatives = ground_truth.size - number_of_positives
+
+    if number_of_positives == 0:
+        return np.nan, np.nan
+
+    order = np.argsort(scores, kind="stable")[::-1]
+    sorted_scores = scores[order]
+    # The last sample of each group of tied scores.
+    thresholds = np.flatnonzero(np.diff(sorted_scores))
+    thresholds = np.append(thresholds, sorted_scores.size - 1)
+    true_positives = np.cumsum(ground_truth[order], dtype=np.float64)[thresholds]
+    false_positives = thresholds + 1 - true_positives
+
+    recall = true_positives / number_of_positives
+    precision = true_positives / (thresholds + 1)
+    auprc = float(np.sum(np.diff(recall, prepend=0.0) * precision))
+
+    if number_of_negatives == 0:
+        return np.nan, auprc
+
+    true_positive_rates = np.concatenate(([0.0], recall))
+    false_positive_rates = np.concatenate(
+        ([0.0], false_positives / number_of_negatives)
+    )
+    auroc = float(np.sum(
+        np.diff(false_positive_rates)
+        * (true_positive_rates[1:] + true_positive_rates[:-1])
+        / 2.0
+    ))
+
+    return auroc, auprc
+
+
+def get_one_vs_rest_auroc_and_auprc(
+    ground_truth: np.ndarray,
+    prediction_probabilities: np.ndarray,
+    number_of_threads: Optional[int] = None,
+) -> Dict[str, float]:
+    """Return the macro-averaged one-vs-rest AUROC and AUPRC.
+
+    Parameters
+    ----------------
+    ground_truth: np.ndarray
+        Either the class of each of the samples, or the boolean matrix
+        of the labels of each of the samples.
+    prediction_probabilities: np.ndarray
+        The matrix of the scores of each of the samples for each class.
+    number_of_threads: Optional[int] = None
+        Number of threads to use to process the class columns.
+        By default, as many as the available CPUs.
+
+    Implementation details
+    ----------------
+    The classes whose metrics are undefined, such as the ones without
+    samples in the ground truth, are excluded from the averages.
+    """
+    ground_truth = np.asarray(ground_truth)
+    prediction_probabilities = np.asarray(prediction_probabilities)
+
+    if prediction_probabilities.ndim != 2:
+        raise ValueError(
+            "The prediction probabilities should be a matrix with a column "
+            "for each class, but an array with shape "
+            f"{prediction_probabilities.shape} was provided."
+        )
+
+    number_of_classes = prediction_probabilities.shape[1]
+    multilabel = ground_truth.ndim == 2
+
+    if ground_truth.shape[0] != prediction_probabilities.shape[0] or (
+        multilabel and ground_truth.shape[1] != number_of_classes
+    ):
+        raise ValueError(
+            f"The ground truth has shape {ground_truth.shape}, which is not "
+            "compatible with the prediction probabilities, which have shape "
+            f"{prediction_probabilities.shape}."
+        )
+
+    def class_metrics(class_id: int) -> Tuple[float, float]:
+        return _get_binary_auroc_and_auprc(
+            ground_truth[:, class_id].astype(bool, copy=False)
+            if multilabel
+            else ground_truth == class_id,
+            prediction_probabilities[:, class_id],
+        )
+
+    if number_of_threads is None:
+        number_of_threads = os.cpu_count()
+
+    if number_of_threads > 1 and number_of_classes > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(number_of_threads, number_of_classes)
+        ) as executor:
+            metrics = np.array(
+                list(executor.map(class_metrics, range(number_of_classes))),
+                dtype=np.float64
+            )
+    else:
+        metrics = np.array(
+            [class_metrics(class_id) for class_id in range(number_of_classes)],
+            dtype=np.float64
+        )
+
+    return {
+        metric_name: (
+            float(np.nanmean(values))
+            if not np.isnan(values).all()
+            else np.nan
+        )
+        for metric_name, values in zip(("auroc", "auprc"), metrics.T)
+    }
@@ -0,0 +1,268 @@
+"""Module providing a memoization layer for the features of edge features.
+
+Edge features such as HyperSketching are queried for the same graphs several
+times within the evaluation of a holdout: for the positive and negative training
+graphs, the train and test graphs and every negative evaluation graph, and
+then again by every classifier using the same feature. This cache stores the
+rasterized feature dictionaries so that they are computed only once, spilling
+the least recently used ones to memory-mapped files when a memory cap is exceeded.
+"""
+from collections import OrderedDict
+from concurrent.futures import Future
+from tempfile import TemporaryDirectory
+from typing import Callable, Dict, Optional, Tuple
+import hashlib
+import os
+import threading
+
+import numpy as np
+from ensmallen import Graph
+
+from embiggen.utils.abstract_edge_feature import AbstractEdgeFeature
+
+
+class EdgeFeatureCache:
+    """Least recently used cache of rasterized edge features, spilling to disk."""
+
+    def __init__(
+        self,
+        maximal_memory: int = 2**30,
+        directory: Optional[str] = None,
+    ):
+        """Create a new edge feature cache.
+
+        Parameters
+        -----------------------
+        maximal_memory: int = 2**30
+            Maximal number of bytes of the edge features kept in main memory.
+            When the cap is exceeded, the least recently used edge features
+            are moved to memory-mapped files.
+        directory: Optional[str] = None
+            Directory where to create the memory-mapped files.
+            By default, the system temporary directory is used.
+            The files are removed once the cache is garbage collected.
+
+        Raises
+        -----------------------
+        ValueError
+            If the provided maximal memory is negative.
+        """
+        if not isinstance(maximal_memory, int) or maximal_memory < 0:
+            raise ValueError(
+                "The maximal memory of the edge feature cache should be a "
+                f"non-negative integer, but you have provided {maximal_memory}."
+            )
+        self._maximal_memory = maximal_memory
+        self._directory = TemporaryDirectory(dir=directory)
+        self._entries: "OrderedDict[Tuple, Tuple[Dict[str, np.ndarray], AbstractEdgeFeature]]" = OrderedDict()
+        self._in_memory_keys = set()
+        self._memory_usage = 0
+        self._number_of_spilled_arrays = 0
+        self._pending: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_memory_usage(self) -> int:
+        """Return the number of bytes of the edge features kept in main memory."""
+        return self._memory_usage
+
+    def get_number_of_entries(self) -> int:
+        """Return the number of cached edge feature dictionaries."""
+        return len(self._entries)
+
+    def get_number_of_spilled_entries(self) -> int:
+        """Return the number of edge feature dictionaries moved to memory-mapped files."""
+        return len(self._entries) - len(self._in_memory_keys)
+
+    def _spill(self, key: Tuple):
+        """Move the edge feature dictionary with the provided key to memory-mapped files.
+
+        Parameters
+        -----------------------
+        key: Tuple
+            The key of the entry to spill.
+        """
+        features, edge_feature = self._entries[key]
+        spilled_features = {}
+        for name, feature in features.items():
+            path = os.path.join(
+                self._directory.name,
+                f"{self._number_of_spilled_arrays}.npy"
+            )
+            self._number_of_spilled_arrays += 1
+            memmap = np.lib.format.open_memmap(
+                path,
+                mode="w+",
+                dtype=feature.dtype,
+                shape=feature.shape,
+            )
+            memmap[:] = feature
+            memmap.flush()
+            del memmap
+            spilled_features[name] = np.load(path, mmap_mode="r")
+            self._memory_usage -= feature.nbytes
+        self._entries[key] = (spilled_features, edge_feature)
+        self._in_memory_keys.remove(key)
+
+    def _get(
+        self,
+        key: Tuple,
+        edge_feature: AbstractEdgeFeature,
+        compute: Callable[[], Dict[str, np.ndarray]],
+    ) -> Dict[str, np.ndarray]:
+        """Return the cached edge feature dictionary with the provided key, computing it if missing.
+
+        Parameters
+        -----------------------
+        key: Tuple
+            The key identifying the edge feature dictionary.
+        edge_feature: AbstractEdgeFeature
+            The edge feature whose id is part of the key, kept
+            alive with the entry so that its id cannot be reused.
+        compute: Callable[[], Dict[str, np.ndarray]]
+            Callback computing the edge feature dictionary.
+
+        Implementation details
+        -----------------------
+        The lock of the cache is only held to look up, insert and spill the
+        entries, while each edge feature is computed outside of it: requests
+        for an entry being computed wait on its future rather than computing
+        it again, while those for other entries are not blocked.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+            future = self._pending.get(key)
+            is_builder = future is None
+            if is_builder:
+                future = Future()
+                self._pending[key] = future
+
+        if not is_builder:
+            return future.result()
+
+        try:
+            features = {}
+            for name, feature in compute().items():
+                if isinstance(feature, np.ndarray):
+                    feature.flags.writeable = False
+                features[name] = feature
+        except BaseException as exception:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(exception)
+            raise
+
+        with self._lock:
+            del self._pending[key]
+            self._store(key, edge_feature, features)
+        future.set_result(features)
+        return features
+
+    def _store(
+        self,
+        key: Tuple,
+        edge_feature: AbstractEdgeFeature,
+        features: Dict[str, np.ndarray],
+    ):
+        """Store the provided edge feature dictionary, spilling entries past the memory cap.
+
+        Parameters
+        -----------------------
+        key: Tuple
+            The key identifying the edge feature dictionary.
+        edge_feature: AbstractEdgeFeature
+            The edge feature whose id is part of the key.
+        features: Dict[str, np.ndarray]
+            The edge feature dictionary to store.
+        """
+        for feature in features.values():
+            if isinstance(feature, np.ndarray):
+                self._memory_usage += feature.nbytes
+
+        self._entries[key] = (features, edge_feature)
+        self._in_memory_keys.add(key)
+
+        # We spill the least recently used entries, but never the one
+        # we are about to return, until we are back under the memory cap.
+        for spill_key in list(self._entries.keys()):
+            if self._memory_usage <= self._maximal_memory or spill_key == key:
+                break
+            if spill_key in self._in_memory_keys and all(
+                isinstance(feature, np.ndarray)
+                for feature in self._entries[spill_key][0].values()
+            ):
+                self._spill(spill_key)
+
+    def get_edge_feature_from_graph(
+        self,
+        edge_feature: AbstractEdgeFeature,
+        graph: Graph,
+        support: Graph,
+    ) -> Dict[str, np.ndarray]:
+        """Return the edge feature for the given graph, computing it only if not cached.
+
+        Parameters
+        -----------------------
+        edge_feature: AbstractEdgeFeature
+            The edge feature to rasterize.
+        graph: Graph,
+            The graph for which to compute the edge feature.
+        support: Graph,
+            The graph to use as base for the topological metrics.
+
+        Implementation details
+        -----------------------
+        The graphs are identified by their hash, so that graphs with the same
+        edges, such as the negative graphs sampled with the same random state
+        by different models, share their features. The returned arrays are
+        read-only, as they are shared.
+        """
+        return self._get(
+            key=("graph", id(edge_feature), graph.hash(), support.hash()),
+            edge_feature=edge_feature,
+            compute=lambda: edge_feature.get_edge_feature_from_graph(
+                graph=graph,
+                support=support,
+            ),
+        )
+
+    def get_edge_feature_from_edge_node_ids(
+        self,
+        edge_feature: AbstractEdgeFeature,
+        support: Graph,
+        sources: np.ndarray,
+        destinations: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Return the edge feature for the given edges, computing it only if not cached.
+
+        Parameters
+        -----------------------
+        edge_feature: AbstractEdgeFeature
+            The edge feature to rasterize.
+        support: Graph,
+            The graph to use as base for the topological metrics.
+        sources: np.ndarray,
+            The source node ids.
+        destinations: np.ndarray,
+            The destination node ids.
+
+        Implementation details
+        -----------------------
+        The edges are identified by a digest of the node ids, which is
+        considerably cheaper to compute than most edge features.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for node_ids in (sources, destinations):
+            node_ids = np.ascontiguousarray(node_ids)
+            digest.update(str((node_ids.dtype, node_ids.shape)).encode("utf8"))
+            digest.update(node_ids.tobytes())
+        return self._get(
+            key=("edges", id(edge_feature), support.hash(), digest.hexdigest()),
+            edge_feature=edge_feature,
+            compute=lambda: edge_feature.get_edge_feature_from_edge_node_ids(
+                support=support,
+                sources=sources,
+                destinations=destinations,
+            ),
+        )
@@ -0,0 +1,398 @@
+"""Module providing the utilities to fold new nodes into a trained embedding.
+
+The fold-in computes the vectors of the nodes of a graph that are missing from
+an embedding computed on a previous version of the graph, without training the
+model again. The vectors of the existing nodes are kept frozen, and only the
+neighbourhoods of the new nodes are visited, so that, when the names of the new
+nodes are provided, the cost of the fold-in is proportional to the
+neighbourhoods of the new nodes rather than to the graph.
+"""
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+
+from embiggen.utils.abstract_models.embedding_result import EmbeddingResult
+
+FOLD_IN_METHODS = ("neighbours_average", "local_sgd", "projection")
+
+
+def get_fold_in_node_embeddings(
+    embedding: EmbeddingResult,
+    graph: Graph,
+) -> List[pd.DataFrame]:
+    """Returns the node embeddings of the provided result, checking they are indexed by name.
+
+    Parameters
+    ----------------
+    embedding: EmbeddingResult
+        The embedding computed on a previous version of the graph.
+    graph: Graph
+        The graph with the new nodes.
+
+    Raises
+    ----------------
+    ValueError
+        If any of the node embeddings is not a DataFrame.
+    """
+    node_embeddings = embedding.get_all_node_embedding()
+    for node_embedding in node_embeddings:
+        if not isinstance(node_embedding, pd.DataFrame):
+            raise ValueError(
+                "The node embeddings to fold the new nodes into should be DataFrames "
+                "indexed by the node names, so that they can be aligned to the nodes "
+                f"of the graph {graph.get_name()}, but an object of type "
+                f"{type(node_embedding)} was provided. Please compute the "
+                "embedding with `return_dataframe=True`."
+            )
+    return node_embeddings
+
+
+def get_new_node_ids(
+    graph: Graph,
+    node_embedding: pd.DataFrame,
+    new_node_names: Optional[List[str]] = None,
+) -> np.ndarray:
+    """Returns the ids of the nodes of the graph missing from the provided embedding.
+
+    Parameters
+    ----------------
+    graph: Graph
+        The graph with the new nodes.
+    node_embedding: pd.DataFrame
+        The node embedding indexed by the node names.
+    new_node_names: Optional[List[str]] = None
+        The names of the new nodes, if known. Otherwise, every node of
+        the graph is looked up in the embedding index, which takes
+        time proportional to the number of nodes of the graph.
+
+    Raises
+    ----------------
+    ValueError
+        If any of the provided new nodes is already in the embedding.
+    """
+    if new_node_names is None:
+        return np.flatnonzero(
+            node_embedding.index.get_indexer(graph.get_node_names()) == -1
+        )
+
+    new_node_names = list(new_node_names)
+    already_embedded = node_embedding.index.intersection(new_node_names)
+    if len(already_embedded) > 0:
+        raise ValueError(
+            f"The provided new nodes {list(already_embedded)[:5]} are already "
+            "in the embedding, so they cannot be folded in."
+        )
+    return np.array(
+        [graph.get_node_id_from_node_name(node_name) for node_name in new_node_names],
+        dtype=np.int64
+    )
+
+
+class Neighbourhoods:
+    """The neighbourhoods of the new nodes, split into the existing and the new neighbours."""
+
+    def __init__(
+        self,
+        graph: Graph,
+        node_embedding: pd.DataFrame,
+        new_node_ids: np.ndarray,
+        use_edge_weights: bool,
+    ):
+        """Create the neighbourhoods of the provided new nodes.
+
+        Parameters
+        ----------------
+        graph: Graph
+            The graph with the new nodes.
+        node_embedding: pd.DataFrame
+            The node embedding indexed by the node names.
+        new_node_ids: np.ndarray
+            The ids of the new nodes.
+        use_edge_weights: bool
+            Whether to weight the neighbours by the edge weights.
+        """
+        self.new_node_ids = new_node_ids
+        new_node_positions = {
+            node_id: position
+            for position, node_id in enumerate(new_node_ids.tolist())
+        }
+        self.known_rows: List[np.ndarray] = []
+        self.known_weights: List[np.ndarray] = []
+        self.new_positions: List[np.ndarray] = []
+        self.new_weights: List[np.ndarray] = []
+
+        for node_id in new_node_ids.tolist():
+            neighbour_ids = graph.get_neighbour_node_ids_from_node_id(node_id)
+            if use_edge_weights:
+                minimum_edge_id, _ = graph.get_minmax_edge_ids_from_source_node_id(node_id)
+                weights = np.fromiter(
+                    (
+                        graph.get_unchecked_edge_weight_from_edge_id(edge_id)
+                        for edge_id in range(minimum_edge_id, minimum_edge_id + len(neighbour_ids))
+                    ),
+                    dtype=np.float64,
+                    count=len(neighbour_ids)
+                )
+            else:
+                weights = np.ones(len(neighbour_ids), dtype=np.float64)
+
+            not_selfloop = neighbour_ids != node_id
+            neighbour_ids = neighbour_ids[not_selfloop]
+            weights = weights[not_selfloop]
+
+            rows = node_embedding.index.get_indexer(
+                graph.get_node_names_from_node_ids(neighbour_ids)
+            )
+            known = rows != -1
+            self.known_rows.append(rows[known])
+            self.known_weights.append(weights[known])
+
+            # The neighbours missing from the embedding that are not
+            # among the new nodes to fold in are ignored.
+            new_positions = np.array(
+                [
+                    new_node_positions.get(neighbour_id, -1)
+                    for neighbour_id in neighbour_ids[~known].tolist()
+                ],
+                dtype=np.int64
+            )
+            new = new_positions != -1
+            self.new_positions.append(new_positions[new])
+            self.new_weights.append(weights[~known][new])
+
+    def __len__(self) -> int:
+        """Returns the number of new nodes."""
+        return len(self.new_node_ids)
+
+
+def fold_in_by_neighbours_average(
+    neighbourhoods: Neighbourhoods,
+    node_embedding: np.ndarray,
+) -> np.ndarray:
+    """Returns the vectors of the new nodes as the weighted average of their neighbours.
+
+    Parameters
+    ----------------
+    neighbourhoods: Neighbourhoods
+        The neighbourhoods of the new nodes.
+    node_embedding: np.ndarray
+        The embedding of the existing nodes.
+
+    Implementation details
+    ----------------
+    The new nodes with existing neighbours are averaged first, and the new
+    nodes whose neighbours are all new are averaged in the following rounds
+    from the new neighbours already folded in, as a breadth-first visit from
+    the existing nodes. The new nodes that cannot reach any existing node
+    are left at zero.
+    """
+    new_node_embedding = np.zeros(
+        (len(neighbourhoods), node_embedding.shape[1]),
+        dtype=node_embedding.dtype
+    )
+    folded_in = np.zeros(len(neighbourhoods), dtype=bool)
+
+    while not folded_in.all():
+        updates = []
+        for position in np.flatnonzero(~folded_in).tolist():
+            known_rows = neighbourhoods.known_rows[position]
+            known_weights = neighbourhoods.known_weights[position]
+            new_positions = neighbourhoods.new_positions[position]
+            new_weights = neighbourhoods.new_weights[position]
+            new_folded_in = folded_in[new_positions]
+            total_weight = known_weights.sum() + new_weights[new_folded_in].sum()
+            if total_weight <= 0:
+                continue
+            updates.append((
+                position,
+                (
+                    known_weights @ node_embedding[known_rows]
+                    + new_weights[new_folded_in] @ new_node_embedding[new_positions[new_folded_in]]
+                ) / total_weight
+            ))
+
+        if not updates:
+            break
+
+        # The vectors of each round are only used in the following one,
+        # so the result does not depend on the order of the new nodes.
+        for position, vector in updates:
+            new_node_embedding[position] = vector
+            folded_in[position] = True
+
+    return new_node_embedding
+
+
+def _sigmoid(values: np.ndarray) -> np.ndarray:
+    """Returns the logistic sigmoid of the provided values."""
+    return 1.0 / (1.0 + np.exp(-np.clip(values, -30, 30)))
+
+
+def fold_in_by_local_sgd(
+    neighbourhoods: Neighbourhoods,
+    node_embedding: np.ndarray,
+    context_embedding: np.ndarray,
+    initial_new_node_embedding: np.ndarray,
+    new_context_embedding: np.ndarray,
+    epochs: int = 10,
+    learning_rate: float = 0.025,
+    number_of_negative_samples: int = 5,
+    random_state: int = 42,
+) -> np.ndarray:
+    """Returns the vectors of the new nodes fitted with a few local steps of SGD.
+
+    Parameters
+    ----------------
+    neighbourhoods: Neighbourhoods
+        The neighbourhoods of the new nodes.
+    node_embedding: np.ndarray
+        The embedding of the existing nodes, whose new rows are fitted.
+    context_embedding: np.ndarray
+        The frozen context embedding of the existing nodes, which is the
+        node embedding itself for the models without a context embedding.
+    initial_new_node_embedding: np.ndarray
+        The initial vectors of the new nodes.
+    new_context_embedding: np.ndarray
+        The context vectors of the new nodes.
+    epochs: int = 10
+        The number of steps for each of the new nodes.
+    learning_rate: float = 0.025
+        The initial learning rate, decayed linearly to zero.
+    number_of_negative_samples: int = 5
+        The number of negative contexts for each of the neighbours.
+    random_state: int = 42
+        The random state of the negative sampling.
+
+    Implementation details
+    ----------------
+    The objective is the skip-gram objective with negative sampling of the
+    shallow embedding models, on the edges of the new nodes: the vector of
+    each new node is pulled towards the contexts of its neighbours and pushed
+    away from the contexts of random existing nodes. The negative contexts
+    are drawn uniformly, so that no statistic over the whole graph is needed.
+    The rows of the existing nodes are never updated.
+    """
+    random_state = np.random.RandomState(random_state)
+    new_node_embedding = initial_new_node_embedding.astype(np.float64, copy=True)
+    number_of_existing_nodes = context_embedding.shape[0]
+
+    for epoch in range(epochs):
+        alpha = learning_rate * (1.0 - epoch / epochs)
+        for position in random_state.permutation(len(neighbourhoods)).tolist():
+            known_weights = neighbourhoods.known_weights[position]
+            new_weights = neighbourhoods.new_weights[position]
+            weights = np.concatenate((known_weights, new_weights))
+            if weights.size == 0:
+                continue
+            contexts = np.vstack((
+                context_embedding[neighbourhoods.known_rows[position]],
+                new_context_embedding[neighbourhoods.new_positions[position]],
+            ))
+            negative_contexts = context_embedding[random_state.randint(
+                number_of_existing_nodes,
+                size=weights.size * number_of_negative_samples
+            )]
+            vector = new_node_embedding[position]
+            # Each neighbour counts proportionally to its edge weight,
+            # normalized so that the step size does not depend on the weights.
+            weights = weights / weights.mean()
+            gradient = (
+                (weights * (1.0 - _sigmoid(contexts @ vector))) @ contexts
+                - _sigmoid(negative_contexts @ vector) @ negative_contexts
+            ) / weights.size
+            new_node_embedding[position] += alpha * gradient
+
+    return new_node_embedding.astype(node_embedding.dtype)
+
+
+def get_fold_in_context_index(node_embeddings: List[pd.DataFrame], index: int) -> int:
+    """Returns the index of the context embedding of the provided node embedding.
+
+    Parameters
+    ----------------
+    node_embeddings: List[pd.DataFrame]
+        The node embeddings of the model.
+    index: int
+        The index of the node embedding.
+
+    Implementation details
+    ----------------
+    The models with exactly two node embeddings of the same shape, such as
+    the second order LINE or HOPE, use each of them as the context of the
+    other one, while the models with a single node embedding use the node
+    embedding itself as context, as in the first order LINE.
+    """
+    if (
+        len(node_embeddings) == 2
+        and node_embeddings[0].shape == node_embeddings[1].shape
+    ):
+        return 1 - index
+    return index
+
+
+def get_projection(
+    context_gram: np.ndarray,
+    context_rows: np.ndarray,
+    values: np.ndarray,
+) -> np.ndarray:
+    """Returns the least-squares vector whose products with the contexts approximate the values.
+
+    Parameters
+    ----------------
+    context_gram: np.ndarray
+        The Gram matrix of the context embedding of the existing nodes.
+    context_rows: np.ndarray
+        The rows of the context embedding of the existing nodes with a non-zero value.
+    values: np.ndarray
+        The non-zero values of the row of the factorized matrix.
+
+    Implementation details
+    ----------------
+    The vector solves the least-squares problem on the whole row of the
+    factorized matrix, whose other values are zero, so it only requires
+    the contexts of the non-zero values and the Gram matrix of the contexts,
+    which is computed once for all of the new nodes.
+    """
+    return np.linalg.lstsq(
+        context_gram,
+        values @ context_rows,
+        rcond=None
+    )[0]
+
+
+def get_fold_in_result(
+    embedding: EmbeddingResult,
+    graph: Graph,
+    new_node_ids: np.ndarray,
+    new_node_embeddings: List[np.ndarray],
+    node_embeddings: List[pd.DataFrame],
+) -> EmbeddingResult:
+    """Returns the embedding result with the vectors of the new nodes.
+
+    Parameters
+    ----------------
+    embedding: EmbeddingResult
+        The embedding computed on a previous version of the graph.
+    graph: Graph
+        The graph with the new nodes.
+    new_node_ids: np.ndarray
+        The ids of the new nodes.
+    new_node_embeddings: List[np.ndarray]
+        The vectors of the new nodes, for each of the node embeddings.
+    node_embeddings: List[pd.DataFrame]
+        The node embeddings of the previous result.
+    """
+    new_node_names = graph.get_node_names_from_node_ids(new_node_ids)
+    return EmbeddingResult(
+        embedding_method_name=embedding.embedding_method_name,
+        node_embeddings=[
+            pd.DataFrame(
+                new_node_embedding,
+                index=new_node_names,
+                columns=node_embedding.columns
+            )
+            for new_node_embedding, node_embedding in zip(new_node_embeddings, node_embeddings)
+        ]
+    )
@@ -0,0 +1,112 @@
+"""Module providing the sparse kernels of the graph convolutions."""
+import warnings
+from typing import Tuple
+
+import numpy as np
+from ensmallen import Graph
+
+
+def get_kernel_coo_matrix(
+    graph: Graph,
+    kernel: str,
+    handling_multi_graph: str = "warn",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the node ids and the weights of the provided kernel in COO format.
+
+    Parameters
+    -------------------
+    graph: Graph,
+        The graph to convert.
+    kernel: str
+        The type of normalization to use. It can either be:
+        * "Weights", to just use the graph weights themselves.
+        * "Left Normalized Laplacian", for the left normalized Laplacian.
+        * "Right Normalized Laplacian", for the right normalized Laplacian.
+        * "Symmetric Normalized Laplacian", for the symmetric normalized Laplacian.
+        Any of the normalized laplacians can be prefixed by "Weighted" and/or
+        "Transposed", as in "Transposed Weighted Symmetric Normalized Laplacian".
+        The laplacians are used in absolute value, i.e. with the self-loops and
+        the normalized adjacency both carrying positive weights, and the weighted
+        laplacians are obtained by multiplying the entries of the edges by
+        the edge weights.
+    handling_multi_graph: str = "warn"
+        How to behave when dealing with multigraphs.
+        Possible behaviours are:
+        - "warn", which warns the user and drops the multi-edges.
+        - "raise"
+        - "drop"
+
+    Raises
+    -------------------
+    ValueError,
+        If the weights are requested but the graph does not contain any.
+    ValueError,
+        If the graph is a multigraph and `handling_multi_graph` is "raise".
+    ValueError,
+        If the requested kernel is not supported.
+    """
+    use_weights = "Weighted" in kernel or kernel == "Weights"
+    transpose = "Transposed" in kernel
+    kernel = kernel.replace("Weighted ", "").replace("Transposed ", "")
+
+    if use_weights and not graph.has_edge_weights():
+        raise ValueError(
+            "Edge weights were requested but the provided graph "
+            f"{graph.get_name()} does not contain any edge weight."
+        )
+
+    if graph.is_multigraph():
+        message = (
+            "The graph convolutions are not currently supported on a multigraph. "
+            "We are dropping the parallel edges before computing the adjacency matrix."
+        )
+        if handling_multi_graph == "warn":
+            warnings.warn(message)
+        elif handling_multi_graph == "raise":
+            raise ValueError(message)
+
+        graph = graph.remove_parallel_edges()
+
+    # We transpose the graph if requested, though the operation is skipped
+    # if we are computing the transposed of an undirected graph. A warning
+    # is raised in this case.
+    if transpose:
+        if graph.is_directed():
+            graph = graph.to_transposed()
+        else:
+            warnings.warn(
+                "You are trying to compute the transposed of an undirected graph. "
+                "The transposed of an undirected graph is the same graph. "
+                "This operation is skipped."
+            )
+
+    if kernel == "Weights":
+        return graph.get_directed_edge_node_ids(), graph.get_directed_edge_weights()
+
+    if kernel == "Left Normalized Laplacian":
+        edge_node_ids, kernel_weights = graph.get_left_normalized_laplacian_coo_matrix()
+    elif kernel == "Right Normalized Laplacian":
+        (
+            edge_node_ids,
+            kernel_weights,
+        ) = graph.get_right_normalized_laplacian_coo_matrix()
+    elif kernel == "Symmetric Normalized Laplacian":
+        (
+            edge_node_ids,
+            kernel_weights,
+        ) = graph.get_symmetric_normalized_laplacian_coo_matrix()
+    else:
+        raise ValueError(
+            f"Kernel {kernel} is not supported. "
+            "Supported kernels are Weights and the Left, Right and Symmetric "
+            "Normalized Laplacian, optionally prefixed by Weighted and/or Transposed."
+        )
+
+    kernel_weights = np.abs(kernel_weights)
+    if use_weights:
+        # The laplacians list the edges, in the same order as the directed
+        # edges of the graph, before the entries of the diagonal.
+        number_of_edges = graph.get_number_of_directed_edges()
+        kernel_weights[:number_of_edges] *= graph.get_directed_edge_weights()
+
+    return edge_node_ids, kernel_weights
@@ -0,0 +1,110 @@
+"""Module providing the serialization of graphs into CSV files that Ensmallen can load back.
+
+The Ensmallen graphs cannot be pickled, so they cannot be sent as they are to
+other processes. They are instead written to TSV files using the numeric ids
+of the nodes, node types and edge types, and the other processes load them
+back with the arguments returned alongside, obtaining a graph with the same
+node ids, names, types and weights as the original one.
+"""
+import os
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+
+
+def dump_graph_to_csv(graph: Graph, directory: str) -> Dict[str, Any]:
+    """Writes the graph to the directory and returns the arguments of `Graph.from_csv` to load it.
+
+    Parameters
+    ----------------
+    graph: Graph
+        The graph to write.
+    directory: str
+        The existing directory where to write the files of the graph.
+
+    Implementation details
+    ----------------
+    The node list is written in the order of the node ids, and the edges,
+    node types and edge types are written with their numeric ids, so that the
+    loaded graph has the same ids as the original one. Nodes and edges whose
+    type is unknown are written with an empty type, and the multiple types
+    of a node are separated by a pipe. Of the edges of undirected graphs,
+    only the ones with the source not greater than the destination are
+    written, as the loader adds the opposite directions back.
+    """
+    node_path = os.path.join(directory, "nodes.tsv")
+    edge_path = os.path.join(directory, "edges.tsv")
+    nodes = dict(name=graph.get_node_names())
+    graph_kwargs = dict(
+        node_path=node_path,
+        nodes_column_number=0,
+        number_of_nodes=graph.get_number_of_nodes(),
+        edge_path=edge_path,
+        sources_column_number=0,
+        destinations_column_number=1,
+        edge_list_numeric_node_ids=True,
+        directed=graph.is_directed(),
+        name=graph.get_name(),
+        verbose=False,
+    )
+
+    if graph.has_node_types():
+        node_type_path = os.path.join(directory, "node_types.tsv")
+        pd.DataFrame(dict(name=graph.get_unique_node_type_names())).to_csv(
+            node_type_path, sep="\t", index=False
+        )
+        nodes["node_types"] = [
+            "" if node_type_ids is None else "|".join(
+                str(node_type_id) for node_type_id in node_type_ids
+            )
+            for node_type_ids in graph.get_node_type_ids()
+        ]
+        graph_kwargs.update(
+            node_type_path=node_type_path,
+            node_types_column_number=0,
+            number_of_node_types=graph.get_number_of_node_types(),
+            node_list_node_types_column_number=1,
+            node_types_separator="|",
+            node_list_numeric_node_type_ids=True,
+        )
+
+    pd.DataFrame(nodes).to_csv(node_path, sep="\t", index=False)
+
+    sources = graph.get_directed_source_node_ids()
+    destinations = graph.get_directed_destination_node_ids()
+    if graph.is_directed():
+        mask = np.ones(sources.size, dtype=bool)
+    else:
+        mask = sources <= destinations
+    edges = dict(subject=sources[mask], object=destinations[mask])
+    column_number = 2
+
+    if graph.has_edge_types():
+        edge_type_path = os.path.join(directory, "edge_types.tsv")
+        pd.DataFrame(dict(name=graph.get_unique_edge_type_names())).to_csv(
+            edge_type_path, sep="\t", index=False
+        )
+        edges["edge_type"] = [
+            "" if edge_type_id is None else str(edge_type_id)
+            for edge_type_id in np.array(
+                graph.get_directed_edge_type_ids(), dtype=object
+            )[mask]
+        ]
+        graph_kwargs.update(
+            edge_type_path=edge_type_path,
+            edge_types_column_number=0,
+            number_of_edge_types=graph.get_number_of_edge_types(),
+            edge_list_edge_types_column_number=column_number,
+            edge_list_numeric_edge_type_ids=True,
+        )
+        column_number += 1
+
+    if graph.has_edge_weights():
+        edges["weight"] = graph.get_directed_edge_weights()[mask]
+        graph_kwargs.update(weights_column_number=column_number)
+
+    pd.DataFrame(edges).to_csv(edge_path, sep="\t", index=False)
+
+    return graph_kwargs
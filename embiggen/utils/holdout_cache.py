@@ -0,0 +1,196 @@
+"""Module providing the cache of the matrices shared among the models evaluated on a holdout.
+
+Within the evaluation of a holdout, models with the same feature settings
+build the very same training matrices and prediction features. This cache
+stores them so that they are only built by the first model that needs them.
+The training matrices are always kept, while the prediction batches, which
+together amount to the features of the whole evaluation graphs, are only kept
+up to a memory cap, dropping the least recently used ones.
+"""
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Tuple
+import threading
+
+import numpy as np
+from scipy.sparse import issparse
+
+# Default number of bytes of the prediction batches kept in the cache.
+MAXIMAL_PREDICTION_MEMORY = 2**30
+
+
+def _make_read_only(value: Any) -> Any:
+    """Return the provided value after marking its arrays as read-only.
+
+    Parameters
+    ---------------
+    value: Any
+        Numpy array, sparse matrix or tuple or list of them.
+    """
+    if isinstance(value, (tuple, list)):
+        for element in value:
+            _make_read_only(element)
+    elif isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif issparse(value) and hasattr(value, "data"):
+        value.data.flags.writeable = False
+    return value
+
+
+def _get_number_of_bytes(value: Any) -> int:
+    """Return the number of bytes of the arrays in the provided value.
+
+    Parameters
+    ---------------
+    value: Any
+        Numpy array, sparse matrix or tuple or list of them.
+    """
+    if isinstance(value, (tuple, list)):
+        return sum(_get_number_of_bytes(element) for element in value)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if issparse(value):
+        return sum(
+            getattr(value, attribute).nbytes
+            for attribute in ("data", "indices", "indptr", "row", "col")
+            if isinstance(getattr(value, attribute, None), np.ndarray)
+        )
+    return 0
+
+
+class HoldoutCache:
+    """Cache of the matrices shared among the models evaluated on the same holdout."""
+
+    def __init__(self, maximal_prediction_memory: int = MAXIMAL_PREDICTION_MEMORY):
+        """Create a new holdout cache.
+
+        Parameters
+        -----------------------
+        maximal_prediction_memory: int = MAXIMAL_PREDICTION_MEMORY
+            Maximal number of bytes of the prediction batches kept in the cache.
+            When the cap is exceeded, the least recently used prediction
+            batches are dropped, and are built again if requested.
+            Use zero to never cache the prediction batches, as when only
+            one model is evaluated on the holdout.
+
+        Raises
+        -----------------------
+        ValueError
+            If the provided maximal memory is negative.
+        """
+        if not isinstance(maximal_prediction_memory, int) or maximal_prediction_memory < 0:
+            raise ValueError(
+                "The maximal memory of the prediction batches should be a "
+                f"non-negative integer, but you have provided {maximal_prediction_memory}."
+            )
+        self._maximal_prediction_memory = maximal_prediction_memory
+        self._entries: Dict[Tuple, Tuple[Any, Tuple]] = {}
+        self._prediction_sizes: "OrderedDict[Tuple, int]" = OrderedDict()
+        self._prediction_memory_usage = 0
+        self._pending: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_keys(self) -> Tuple[Tuple, ...]:
+        """Return the keys of the cached values."""
+        with self._lock:
+            return tuple(self._entries.keys())
+
+    def get_prediction_memory_usage(self) -> int:
+        """Return the number of bytes of the cached prediction batches."""
+        return self._prediction_memory_usage
+
+    def get(
+        self,
+        key: Tuple,
+        builder: Callable[[], Any],
+        referenced_objects: Tuple = (),
+        is_prediction_batch: bool = False,
+    ) -> Any:
+        """Return the value associated to the key, building it if missing.
+
+        Parameters
+        ---------------
+        key: Tuple
+            The hashable key identifying the value.
+            It must include all of the settings that affect the value.
+        builder: Callable[[], Any]
+            Callback building the value when it is not already cached.
+        referenced_objects: Tuple = ()
+            The objects whose ids are used within the key. These are kept
+            alive together with the cached value, so that their ids cannot
+            be reused by other objects while the holdout cache exists.
+        is_prediction_batch: bool = False
+            Whether the value is a prediction batch, which is subject
+            to the memory cap of the prediction batches.
+
+        Implementation details
+        ---------------
+        The cached arrays are shared among different models, and are therefore
+        made read-only. The lock of the cache is only held to look up and to
+        insert the values, while each value is built outside of it: models
+        trained concurrently on the same holdout that need a value being built
+        wait on its future rather than building it again, while those needing
+        other values are not blocked.
+        """
+        with self._lock:
+            if key in self._entries:
+                if key in self._prediction_sizes:
+                    self._prediction_sizes.move_to_end(key)
+                return self._entries[key][0]
+            future = self._pending.get(key)
+            is_builder = future is None
+            if is_builder:
+                future = Future()
+                self._pending[key] = future
+
+        if not is_builder:
+            return future.result()
+
+        try:
+            value = _make_read_only(builder())
+        except BaseException as exception:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(exception)
+            raise
+
+        with self._lock:
+            del self._pending[key]
+            self._store(key, value, referenced_objects, is_prediction_batch)
+        future.set_result(value)
+        return value
+
+    def _store(
+        self,
+        key: Tuple,
+        value: Any,
+        referenced_objects: Tuple,
+        is_prediction_batch: bool,
+    ):
+        """Store the provided value, enforcing the memory cap of the prediction batches.
+
+        Parameters
+        ---------------
+        key: Tuple
+            The hashable key identifying the value.
+        value: Any
+            The value to store.
+        referenced_objects: Tuple
+            The objects whose ids are used within the key.
+        is_prediction_batch: bool
+            Whether the value is a prediction batch.
+        """
+        if is_prediction_batch:
+            number_of_bytes = _get_number_of_bytes(value)
+            if number_of_bytes > self._maximal_prediction_memory:
+                return
+            self._prediction_sizes[key] = number_of_bytes
+            self._prediction_memory_usage += number_of_bytes
+            # We drop the least recently used prediction batches
+            # until we are back under the memory cap.
+            while self._prediction_memory_usage > self._maximal_prediction_memory:
+                dropped_key, dropped_bytes = self._prediction_sizes.popitem(last=False)
+                self._prediction_memory_usage -= dropped_bytes
+                del self._entries[dropped_key]
+
+        self._entries[key] = (value, referenced_objects)
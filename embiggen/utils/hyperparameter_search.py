@@ -0,0 +1,247 @@
+"""Submodule providing hyperparameter search on top of the classification evaluation pipeline."""
+import inspect
+import itertools
+import os
+from typing import Any, Dict, List, Optional, Type, Union
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+from userinput.utils import must_be_in_set
+
+from embiggen.utils.abstract_models import AbstractClassifierModel
+from embiggen.utils.pipeline import classification_evaluation_pipeline
+
+
+def get_hyperparameter_search_trials(
+    parameter_space: Dict[str, List[Any]],
+    search_strategy: str = "grid",
+    number_of_trials: Optional[int] = None,
+    random_state: int = 42,
+) -> List[Dict[str, Any]]:
+    """Return the parameters of the trials of the hyperparameter search.
+
+    Parameters
+    ---------------------
+    parameter_space: Dict[str, List[Any]]
+        The candidate values of each of the parameters to search.
+    search_strategy: str = "grid"
+        The search strategy, one of grid, random and successive halving.
+        With the grid strategy all of the combinations of the values are
+        tried, while with the random strategy only a sample of them.
+        The successive halving strategy tries all of the combinations, or
+        a sample of them when the number of trials is provided, eliminating
+        the dominated ones after the first holdouts.
+    number_of_trials: Optional[int] = None
+        The number of combinations to sample.
+        It is required by the random strategy, and it is not supported by the grid one.
+    random_state: int = 42
+        The random state to use to sample the combinations.
+
+    Raises
+    ---------------------
+    ValueError
+        If the parameter space is empty or it has parameters without values.
+    ValueError
+        If the number of trials is not compatible with the search strategy.
+    """
+    search_strategy = must_be_in_set(
+        search_strategy,
+        ("grid", "random", "successive halving"),
+        "search strategy"
+    )
+
+    if len(parameter_space) == 0:
+        raise ValueError("An empty parameter space was provided.")
+
+    for parameter_name, values in parameter_space.items():
+        if not isinstance(values, (list, tuple)) or len(values) == 0:
+            raise ValueError(
+                f"The values of the parameter {parameter_name} should be "
+                f"provided as a non-empty list, but you provided {values}."
+            )
+
+    parameter_names = sorted(parameter_space.keys())
+    trials = [
+        dict(zip(parameter_names, values))
+        for values in itertools.product(*(
+            parameter_space[parameter_name]
+            for parameter_name in parameter_names
+        ))
+    ]
+
+    if search_strategy == "grid":
+        if number_of_trials is not None:
+            raise ValueError(
+                "The grid search tries all of the combinations of the "
+                "parameters, but a number of trials was provided. "
+                "Maybe you intended to use the random search strategy?"
+            )
+        return trials
+
+    if number_of_trials is None:
+        if search_strategy == "random":
+            raise ValueError(
+                "The random search strategy requires the number of trials."
+            )
+        return trials
+
+    if not isinstance(number_of_trials, int) or not 0 < number_of_trials <= len(trials):
+        raise ValueError(
+            "The number of trials should be a strictly positive integer not "
+            f"larger than the {len(trials)} combinations of the parameter space, "
+            f"but {number_of_trials} was provided."
+        )
+
+    return [
+        trials[trial_number]
+        for trial_number in sorted(
+            np.random.RandomState(random_state).choice(
+                len(trials),
+                size=number_of_trials,
+                replace=False,
+            )
+        )
+    ]
+
+
+def hyperparameter_search(
+    model_class: Type[AbstractClassifierModel],
+    parameter_space: Dict[str, List[Any]],
+    evaluation_schema: str,
+    holdouts_kwargs: Dict[str, Any],
+    graphs: Union[str, Graph, List[Graph], List[str]],
+    search_strategy: str = "grid",
+    number_of_trials: Optional[int] = None,
+    racing_metric: str = "auroc",
+    number_of_threads: Optional[int] = None,
+    number_of_concurrent_trials: Optional[int] = None,
+    random_state: int = 42,
+    **pipeline_kwargs: Dict[str, Any],
+) -> pd.DataFrame:
+    """Return the performance of the trials of a hyperparameter search of the provided model.
+
+    Parameters
+    ---------------------
+    model_class: Type[AbstractClassifierModel]
+        The class of the model whose parameters are to be searched.
+    parameter_space: Dict[str, List[Any]]
+        The candidate values of each of the parameters to search.
+        The parameters not in the space are left to their default values.
+    evaluation_schema: str
+        The evaluation schema to follow.
+    holdouts_kwargs: Dict[str, Any]
+        The parameters for the selected holdouts method.
+    graphs: Union[str, Graph, List[Graph], List[str]]
+        The graphs or graph names to run the search on.
+    search_strategy: str = "grid"
+        The search strategy, one of grid, random and successive halving.
+    number_of_trials: Optional[int] = None
+        The number of combinations of the parameters to sample.
+        It is required by the random strategy, and it is not supported by the grid one.
+    racing_metric: str = "auroc"
+        The metric on which the trials are raced with the successive halving strategy.
+    number_of_threads: Optional[int] = None
+        The number of CPUs the search may use, split evenly among the
+        trials evaluated concurrently. By default, all of the available CPUs.
+    number_of_concurrent_trials: Optional[int] = None
+        Number of trials to train and evaluate concurrently on each holdout.
+        It cannot exceed the number of threads. By default, as many as the
+        trials, up to the number of threads.
+    random_state: int = 42
+        Random state to reproduce the search.
+    **pipeline_kwargs: Dict[str, Any]
+        Keyword arguments to forward to the classification evaluation pipeline,
+        such as the node features, the number of holdouts and the cache settings.
+
+    Implementation details
+    ---------------------
+    All of the trials are evaluated as the models of a single evaluation, so
+    that the constant features are computed once, and the holdout splits, their
+    features, the negative evaluation graphs and the training matrices of the
+    trials sharing the same feature settings are computed once per holdout.
+    The returned table has a row for each trial, holdout and evaluation mode,
+    with the number of the trial in the `trial_number` column.
+
+    When the model has an `n_jobs` parameter, each trial receives its share
+    of the threads through it, so that the concurrent trials do not run more
+    threads than the available CPUs. The threads of models without such a
+    parameter, and those of the Ensmallen thread pool, are not limited.
+
+    Raises
+    ---------------------
+    ValueError
+        If the number of threads or of concurrent trials is not a strictly
+        positive integer, or the latter exceeds the former.
+    ValueError
+        If the `n_jobs` parameter of the model is part of the parameter space.
+    """
+    trials = get_hyperparameter_search_trials(
+        parameter_space=parameter_space,
+        search_strategy=search_strategy,
+        number_of_trials=number_of_trials,
+        random_state=random_state,
+    )
+
+    if number_of_threads is None:
+        number_of_threads = os.cpu_count()
+
+    if number_of_concurrent_trials is None:
+        number_of_concurrent_trials = min(len(trials), number_of_threads)
+
+    for parameter_name, value in (
+        ("number_of_threads", number_of_threads),
+        ("number_of_concurrent_trials", number_of_concurrent_trials),
+    ):
+        if not isinstance(value, int) or value <= 0:
+            raise ValueError(
+                f"The parameter `{parameter_name}` should be a strictly "
+                f"positive integer, but {value} was provided."
+            )
+
+    if number_of_concurrent_trials > number_of_threads:
+        raise ValueError(
+            f"The {number_of_concurrent_trials} concurrent trials cannot share "
+            f"the {number_of_threads} threads of the search, as each trial "
+            "requires at least one thread."
+        )
+
+    if "n_jobs" in inspect.signature(model_class.__init__).parameters:
+        if "n_jobs" in parameter_space:
+            raise ValueError(
+                "The `n_jobs` parameter of the model is set by the hyperparameter "
+                "search, splitting the number of threads among the concurrent "
+                "trials, and therefore it cannot be part of the parameter space."
+            )
+        trials = [
+            dict(**trial, n_jobs=number_of_threads // number_of_concurrent_trials)
+            for trial in trials
+        ]
+
+    models = [model_class(**trial) for trial in trials]
+
+    if search_strategy == "successive halving":
+        pipeline_kwargs["racing_metric"] = racing_metric
+
+    performance = classification_evaluation_pipeline(
+        evaluation_schema=evaluation_schema,
+        holdouts_kwargs=holdouts_kwargs,
+        graphs=graphs,
+        models=models,
+        expected_parent_class=model_class,
+        random_state=random_state,
+        number_of_concurrent_models=number_of_concurrent_trials,
+        **pipeline_kwargs,
+    ).reset_index(drop=True)
+
+    trial_numbers = np.full(len(performance), np.nan)
+    for trial_number, model in enumerate(models):
+        trial_numbers[
+            model_class._get_rows_of_classifier(performance, model)
+        ] = trial_number
+    performance.insert(0, "trial_number", trial_numbers)
+
+    return performance.sort_values(
+        ["trial_number", "graph_name", "holdout_number"],
+        kind="stable",
+    ).reset_index(drop=True)
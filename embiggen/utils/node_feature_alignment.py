@@ -0,0 +1,73 @@
+"""Module providing the alignment of DataFrame node features to the graph nodes.
+
+Aligning a DataFrame to the nodes of a graph with a label lookup requires
+matching every node name against the index of the DataFrame, which on
+graphs with millions of nodes takes longer than most of the models to train.
+The rows of the DataFrame corresponding to each node id are instead found
+with a single hash lookup of the index, and then gathered with an integer take.
+Within the evaluation pipelines, each DataFrame is aligned only once: the
+constant node features are aligned to the whole graph before the holdouts,
+and the node features computed for a holdout are aligned to its train graph,
+so that the models only ever receive the aligned arrays.
+"""
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+
+
+def _format_names(names: np.ndarray, number_of_names: int = 5) -> str:
+    """Return a short description of the first provided names."""
+    return ", ".join(f"`{name}`" for name in names[:number_of_names])
+
+
+def get_node_feature_alignment(index: pd.Index, graph: Graph) -> np.ndarray:
+    """Return the rows of the index corresponding to each of the nodes of the graph.
+
+    Parameters
+    ----------------
+    index: pd.Index
+        The index of the node features, containing the node names.
+    graph: Graph
+        The graph whose nodes are to be aligned.
+
+    Raises
+    ----------------
+    ValueError
+        If the index contains duplicated node names.
+    ValueError
+        If some of the nodes of the graph are not in the index.
+    """
+    if not index.is_unique:
+        raise ValueError(
+            "The index of the provided node features contains duplicated "
+            f"node names, such as {_format_names(index[index.duplicated()])}, "
+            "so it is not clear which of the rows should be used."
+        )
+
+    alignment = index.get_indexer(graph.get_node_names())
+    missing = alignment == -1
+    if missing.any():
+        raise ValueError(
+            f"The index of the provided node features does not contain {missing.sum()} "
+            f"of the nodes of the graph {graph.get_name()}, such as "
+            f"{_format_names(np.array(graph.get_node_names())[missing])}."
+        )
+
+    return alignment
+
+
+def align_node_feature(node_feature: pd.DataFrame, graph: Graph) -> np.ndarray:
+    """Return the rows of the node features aligned to the nodes of the graph.
+
+    Parameters
+    ----------------
+    node_feature: pd.DataFrame
+        The node features, indexed by the node names.
+    graph: Graph
+        The graph whose nodes are to be aligned.
+    """
+    return np.take(
+        node_feature.to_numpy(),
+        get_node_feature_alignment(node_feature.index, graph),
+        axis=0,
+    )
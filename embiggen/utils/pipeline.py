@@ -227,8 +227,14 @@ def classification_evaluation_pipeline(
             # also the SLURM node ids and avoid this issue, but then the cache
             # would only be valid for that specific cluster and it would
             # not be possible to reuse it in other settings such as during
-            # a reproduction using cache on a notebook.
-            enable_top_layer_cache=enable_cache and number_of_slurm_nodes is None,
+            # a reproduction using cache on a notebook. The same holds for
+            # the workers sharing a work queue, each of which only returns
+            # the performance of the units of work it has completed.
+            enable_top_layer_cache=(
+                enable_cache
+                and number_of_slurm_nodes is None
+                and evaluation_kwargs.get("work_queue") is None
+            ),
             precompute_constant_stocastic_features=precompute_constant_stocastic_features,
             smoke_test=smoke_test,
             number_of_slurm_nodes=number_of_slurm_nodes,
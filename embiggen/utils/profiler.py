@@ -0,0 +1,255 @@
+"""Module providing a lightweight profiler of the phases of the evaluation pipelines.
+
+Each phase is wrapped in a span recording its wall time, the CPU time of the
+process, the peak increase of the resident set size of the process during
+the phase and the number of threads of the process. The spans are reported
+in the metadata columns of the evaluation results, and can be exported as a
+Chrome trace, which can be inspected in `chrome://tracing` or in Perfetto.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+
+def _get_current_rss() -> Optional[int]:
+    """Return the current resident set size of the process in bytes, if available.
+
+    Implementation details
+    ----------------------
+    The resident set size is read from the proc filesystem, and is therefore
+    only available on Linux. Differently from the peak resident set size
+    reported by `getrusage`, which only ever increases, the current one also
+    decreases when memory is released, so that the peak of each phase can be
+    measured even after the earlier phases allocated more memory.
+    """
+    try:
+        with open("/proc/self/statm", encoding="utf8") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _get_number_of_threads() -> int:
+    """Return the number of threads of the process.
+
+    Implementation details
+    ----------------------
+    Where available, the threads are counted from the proc filesystem, so
+    that the threads spawned by the native libraries, such as the Rayon
+    thread pool of Ensmallen, are included. Elsewhere, only the Python
+    threads are counted.
+    """
+    try:
+        return len(os.listdir("/proc/self/task"))
+    except OSError:
+        return threading.active_count()
+
+
+class ProfilingSpan:
+    """Measurements of a phase of the evaluation pipeline."""
+
+    def __init__(self, name: str, arguments: Dict[str, Any]):
+        """Create a new span, starting its measurements.
+
+        Parameters
+        ----------------
+        name: str
+            The name of the phase.
+        arguments: Dict[str, Any]
+            Additional values describing the phase, reported in the trace.
+        """
+        self.name = name
+        self.arguments = arguments
+        self.thread_id = threading.get_ident()
+        self.start = time.perf_counter()
+        self.wall_time: Optional[float] = None
+        self.cpu_time: Optional[float] = None
+        self.peak_rss_delta: Optional[int] = None
+        self.number_of_threads = _get_number_of_threads()
+        self._start_cpu_time = time.process_time()
+        self._start_rss = _get_current_rss()
+        self._peak_rss = self._start_rss
+
+    def _sample_rss(self, rss: Optional[int]):
+        """Update the peak resident set size of the span with the provided sample.
+
+        Parameters
+        ----------------
+        rss: Optional[int]
+            The current resident set size of the process in bytes.
+        """
+        if rss is not None and self._peak_rss is not None:
+            self._peak_rss = max(self._peak_rss, rss)
+
+    def _stop(self):
+        """Complete the measurements of the span."""
+        self.wall_time = time.perf_counter() - self.start
+        self.cpu_time = time.process_time() - self._start_cpu_time
+        self._sample_rss(_get_current_rss())
+        if self._start_rss is not None:
+            self.peak_rss_delta = self._peak_rss - self._start_rss
+        self.number_of_threads = max(
+            self.number_of_threads, _get_number_of_threads()
+        )
+
+
+class Profiler:
+    """Collector of the spans of the phases of an evaluation."""
+
+    def __init__(self, rss_sampling_interval: float = 0.01):
+        """Create a new profiler.
+
+        Parameters
+        ----------------
+        rss_sampling_interval: float = 0.01
+            Number of seconds between the samples of the resident set size
+            taken while any span is open, used to measure the peak increase
+            of the resident set size of each phase.
+
+        Raises
+        ----------------
+        ValueError
+            If the provided sampling interval is not strictly positive.
+        """
+        if rss_sampling_interval <= 0:
+            raise ValueError(
+                "The sampling interval of the resident set size should be "
+                f"strictly positive, but you have provided {rss_sampling_interval}."
+            )
+        self._spans: List[ProfilingSpan] = []
+        self._open_spans: Set[ProfilingSpan] = set()
+        self._rss_sampling_interval = rss_sampling_interval
+        self._rss_sampler: Optional[threading.Thread] = None
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def _sample_rss(self):
+        """Sample the resident set size into the open spans until all of them are closed."""
+        while True:
+            time.sleep(self._rss_sampling_interval)
+            rss = _get_current_rss()
+            with self._lock:
+                if not self._open_spans:
+                    self._rss_sampler = None
+                    return
+                for span in self._open_spans:
+                    span._sample_rss(rss)
+
+    @contextmanager
+    def span(self, name: str, **arguments: Dict[str, Any]) -> Iterator[ProfilingSpan]:
+        """Return context manager measuring the wrapped phase.
+
+        Parameters
+        ----------------
+        name: str
+            The name of the phase.
+        **arguments: Dict[str, Any]
+            Additional values describing the phase, reported in the trace.
+        """
+        span = ProfilingSpan(name, arguments)
+        with self._lock:
+            self._open_spans.add(span)
+            # The sampler thread stops by itself once no span is open,
+            # hence it is only started when it is not already running.
+            if self._rss_sampler is None and span._start_rss is not None:
+                self._rss_sampler = threading.Thread(
+                    target=self._sample_rss,
+                    name="embiggen-rss-sampler",
+                    daemon=True,
+                )
+                self._rss_sampler.start()
+        try:
+            yield span
+        finally:
+            with self._lock:
+                self._open_spans.discard(span)
+            span._stop()
+            with self._lock:
+                self._spans.append(span)
+
+    def get_number_of_spans(self) -> int:
+        """Return the number of completed spans."""
+        return len(self._spans)
+
+    def get_metadata(
+        self,
+        first_span: int = 0,
+        thread_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Return the measurements of the completed spans, aggregated by phase.
+
+        Parameters
+        ----------------
+        first_span: int = 0
+            The number of completed spans to skip, so that only the spans
+            completed after a given moment are reported.
+        thread_id: Optional[int] = None
+            The identifier of the thread whose spans are to be reported,
+            so that the phases of work running concurrently are not mixed.
+            By default, the spans of all of the threads are reported.
+
+        Implementation details
+        ----------------
+        The wall and CPU times of the spans of the same phase are summed,
+        while for the peak resident set size delta and the number of
+        threads the maximum is reported.
+        """
+        metadata = {}
+        for span in self._spans[first_span:]:
+            if thread_id is not None and span.thread_id != thread_id:
+                continue
+            for measure, value, aggregate in (
+                ("wall_time", span.wall_time, sum),
+                ("cpu_time", span.cpu_time, sum),
+                ("peak_rss_delta", span.peak_rss_delta, max),
+                ("number_of_threads", span.number_of_threads, max),
+            ):
+                key = f"{span.name}_{measure}"
+                if value is None:
+                    metadata.setdefault(key, None)
+                elif metadata.get(key) is None:
+                    metadata[key] = value
+                else:
+                    metadata[key] = aggregate((metadata[key], value))
+        return metadata
+
+    def export_chrome_trace(self, path: str):
+        """Write the completed spans to the provided path as a Chrome trace.
+
+        Parameters
+        ----------------
+        path: str
+            The path where to write the JSON trace.
+        """
+        process_id = os.getpid()
+        trace_events = [
+            dict(
+                name=span.name,
+                cat="embiggen",
+                ph="X",
+                ts=(span.start - self._origin) * 1e6,
+                dur=span.wall_time * 1e6,
+                pid=process_id,
+                tid=span.thread_id,
+                args=dict(
+                    cpu_time=span.cpu_time,
+                    peak_rss_delta=span.peak_rss_delta,
+                    number_of_threads=span.number_of_threads,
+                    **span.arguments,
+                ),
+            )
+            for span in sorted(self._spans, key=lambda span: span.start)
+        ]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf8") as trace:
+            json.dump(
+                dict(traceEvents=trace_events, displayTimeUnit="ms"),
+                trace,
+                default=str,
+            )
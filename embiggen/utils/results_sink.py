@@ -0,0 +1,216 @@
+"""Module providing a durable sink for the results of the evaluation pipelines.
+
+Each unit of work of an evaluation, that is the training and evaluation of a
+model on a holdout, is appended to a SQLite table as soon as it is completed.
+If a long evaluation is interrupted, the completed units are not lost and, when
+the evaluation is run again in resume mode, they are skipped.
+"""
+import json
+import sqlite3
+from contextlib import closing
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _to_json_serializable(value: Any) -> Any:
+    """Return the provided value converted into a JSON-serializable object."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+class ResultsSink:
+    """Append-only SQLite store of the performance of the evaluated models."""
+
+    KEY_COLUMNS = (
+        "experiment_key",
+        "task_name",
+        "graph_name",
+        "model_name",
+        "library_name",
+        "holdout_number",
+    )
+
+    def __init__(self, path: str, timeout: float = 60.0):
+        """Create a new results sink.
+
+        Parameters
+        ----------------
+        path: str
+            The path to the SQLite database where to store the results.
+            The database and its table are created if they do not exist.
+        timeout: float = 60.0
+            Number of seconds to wait for the database to be unlocked
+            when multiple processes are writing to it.
+        """
+        self._path = path
+        self._timeout = timeout
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "unit_key TEXT PRIMARY KEY, "
+                "experiment_key TEXT NOT NULL, "
+                "task_name TEXT NOT NULL, "
+                "graph_name TEXT NOT NULL, "
+                "model_name TEXT NOT NULL, "
+                "library_name TEXT NOT NULL, "
+                "holdout_number INTEGER NOT NULL, "
+                "performance TEXT NOT NULL"
+                ")"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_experiment "
+                "ON results (experiment_key, holdout_number)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return a new connection to the database."""
+        return sqlite3.connect(self._path, timeout=self._timeout)
+
+    def get_path(self) -> str:
+        """Return the path to the SQLite database."""
+        return self._path
+
+    def has_unit(self, unit_key: str) -> bool:
+        """Return whether the unit with the provided key was already stored.
+
+        Parameters
+        ----------------
+        unit_key: str
+            The key of the unit of work.
+        """
+        with closing(self._connect()) as connection, connection:
+            return connection.execute(
+                "SELECT 1 FROM results WHERE unit_key = ?",
+                (unit_key,)
+            ).fetchone() is not None
+
+    def append(
+        self,
+        unit_key: str,
+        experiment_key: str,
+        holdout_number: int,
+        performance: pd.DataFrame,
+    ):
+        """Durably store the performance of a unit of work.
+
+        Parameters
+        ----------------
+        unit_key: str
+            The key of the unit of work.
+        experiment_key: str
+            The key of the evaluation the unit of work belongs to.
+        holdout_number: int
+            The holdout the unit of work was executed on.
+        performance: pd.DataFrame
+            The performance of the model on the holdout.
+        """
+        first_row = performance.iloc[0]
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    unit_key,
+                    experiment_key,
+                    str(first_row["task_name"]),
+                    str(first_row["graph_name"]),
+                    str(first_row["model_name"]),
+                    str(first_row["library_name"]),
+                    int(holdout_number),
+                    json.dumps(
+                        dict(
+                            columns=[
+                                list(column) if isinstance(column, tuple) else column
+                                for column in performance.columns
+                            ],
+                            data=performance.values.tolist(),
+                        ),
+                        default=_to_json_serializable,
+                    ),
+                ),
+            )
+
+    def iterate(
+        self,
+        unit_keys: Optional[List[str]] = None,
+        **filters: Dict[str, Any],
+    ) -> Iterator[pd.DataFrame]:
+        """Return iterator over the stored performance matching the provided filters.
+
+        Parameters
+        ----------------
+        unit_keys: Optional[List[str]] = None
+            The keys of the units of work to retrieve.
+            By default, all of the units matching the filters are retrieved.
+        **filters: Dict[str, Any]
+            Values that the stored units must have. The supported filters are
+            the experiment key, the task name, the graph name, the model name,
+            the library name and the holdout number.
+
+        Raises
+        ----------------
+        ValueError
+            If an unsupported filter is provided.
+
+        Implementation details
+        ----------------
+        The units are retrieved lazily one at a time, so that
+        large databases are never loaded entirely in memory.
+        """
+        for column in filters:
+            if column not in self.KEY_COLUMNS:
+                raise ValueError(
+                    f"The provided filter {column} is not supported. "
+                    f"The supported filters are {', '.join(self.KEY_COLUMNS)}."
+                )
+
+        conditions = [f"{column} = ?" for column in filters]
+        parameters = list(filters.values())
+
+        if unit_keys is not None:
+            if len(unit_keys) == 0:
+                return
+            conditions.append(f"unit_key IN ({', '.join('?' * len(unit_keys))})")
+            parameters.extend(unit_keys)
+
+        query = "SELECT performance FROM results"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY holdout_number, rowid"
+
+        with closing(self._connect()) as connection:
+            for (performance,) in connection.execute(query, parameters):
+                performance = json.loads(performance)
+                yield pd.DataFrame(
+                    performance["data"],
+                    columns=[
+                        tuple(column) if isinstance(column, list) else column
+                        for column in performance["columns"]
+                    ],
+                )
+
+    def query(
+        self,
+        unit_keys: Optional[List[str]] = None,
+        **filters: Dict[str, Any],
+    ) -> pd.DataFrame:
+        """Return the stored performance matching the provided filters.
+
+        Parameters
+        ----------------
+        unit_keys: Optional[List[str]] = None
+            The keys of the units of work to retrieve.
+            By default, all of the units matching the filters are retrieved.
+        **filters: Dict[str, Any]
+            Values that the stored units must have. The supported filters are
+            the experiment key, the task name, the graph name, the model name,
+            the library name and the holdout number.
+        """
+        performance = list(self.iterate(unit_keys=unit_keys, **filters))
+        if len(performance) == 0:
+            return pd.DataFrame()
+        return pd.concat(performance)
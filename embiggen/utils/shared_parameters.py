@@ -0,0 +1,167 @@
+"""Module providing the parameters shared in memory among worker processes.
+
+The worker processes of the CPU data-parallel training each train their own
+copy of the model on separate batches. At the end of every epoch, each of them
+writes its parameters into its own slot of a shared memory block, and all of
+them read back the average of the slots, so that the parameters are exchanged
+without serializing them through pipes.
+"""
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Alignment in bytes of the arrays within the shared memory block.
+ALIGNMENT = 64
+
+
+class SharedParameters:
+    """Slots of parameter arrays in shared memory, one for each worker process."""
+
+    def __init__(
+        self,
+        shapes: Sequence[Tuple[int, ...]],
+        dtypes: Sequence[str],
+        number_of_slots: int,
+        name: Optional[str] = None,
+    ):
+        """Create new shared parameters, or attach to existing ones.
+
+        Parameters
+        ----------------
+        shapes: Sequence[Tuple[int, ...]]
+            The shapes of the parameter arrays.
+        dtypes: Sequence[str]
+            The dtypes of the parameter arrays.
+        number_of_slots: int
+            The number of slots, that is of worker processes.
+        name: Optional[str] = None
+            The name of the shared memory block to attach to.
+            By default, a new block is created.
+
+        Raises
+        ----------------
+        ValueError
+            If the number of slots is not a strictly positive integer.
+        ValueError
+            If the number of shapes and dtypes do not match.
+        """
+        if not isinstance(number_of_slots, int) or number_of_slots < 1:
+            raise ValueError(
+                "The number of slots should be a strictly positive integer, "
+                f"but {number_of_slots} was provided."
+            )
+        if len(shapes) != len(dtypes):
+            raise ValueError(
+                f"{len(shapes)} shapes and {len(dtypes)} dtypes were provided, "
+                "but each of the parameter arrays requires both."
+            )
+        self._shapes = [tuple(shape) for shape in shapes]
+        self._dtypes = [np.dtype(dtype).str for dtype in dtypes]
+        self._number_of_slots = number_of_slots
+        self._offsets = []
+        slot_size = 0
+        for shape, dtype in zip(self._shapes, self._dtypes):
+            self._offsets.append(slot_size)
+            number_of_bytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            slot_size += -(-number_of_bytes // ALIGNMENT) * ALIGNMENT
+        self._slot_size = slot_size
+        self._shared_memory = SharedMemory(
+            name=name,
+            create=name is None,
+            size=max(slot_size * number_of_slots, 1) if name is None else 0,
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays: Sequence[np.ndarray], number_of_slots: int) -> "SharedParameters":
+        """Return new shared parameters with every slot set to the provided arrays.
+
+        Parameters
+        ----------------
+        arrays: Sequence[np.ndarray]
+            The initial parameter arrays.
+        number_of_slots: int
+            The number of slots, that is of worker processes.
+        """
+        shared_parameters = cls(
+            shapes=[array.shape for array in arrays],
+            dtypes=[array.dtype.str for array in arrays],
+            number_of_slots=number_of_slots,
+        )
+        for slot in range(number_of_slots):
+            shared_parameters.write(slot, arrays)
+        return shared_parameters
+
+    def get_attach_kwargs(self) -> dict:
+        """Return the arguments to attach to these shared parameters from another process."""
+        return dict(
+            shapes=self._shapes,
+            dtypes=self._dtypes,
+            number_of_slots=self._number_of_slots,
+            name=self._shared_memory.name,
+        )
+
+    def _get_views(self, slot: int) -> List[np.ndarray]:
+        """Return the arrays of the provided slot, as views of the shared memory."""
+        if slot < 0 or slot >= self._number_of_slots:
+            raise ValueError(
+                f"The slot {slot} was requested, but there are "
+                f"only {self._number_of_slots} slots."
+            )
+        return [
+            np.ndarray(
+                shape,
+                dtype=dtype,
+                buffer=self._shared_memory.buf,
+                offset=slot * self._slot_size + offset,
+            )
+            for shape, dtype, offset in zip(self._shapes, self._dtypes, self._offsets)
+        ]
+
+    def write(self, slot: int, arrays: Sequence[np.ndarray]):
+        """Write the provided parameter arrays into the provided slot.
+
+        Parameters
+        ----------------
+        slot: int
+            The slot to write into.
+        arrays: Sequence[np.ndarray]
+            The parameter arrays, with the shapes of the shared parameters.
+        """
+        for view, array in zip(self._get_views(slot), arrays):
+            view[...] = array
+
+    def read(self, slot: int) -> List[np.ndarray]:
+        """Return a copy of the parameter arrays of the provided slot.
+
+        Parameters
+        ----------------
+        slot: int
+            The slot to read from.
+        """
+        return [view.copy() for view in self._get_views(slot)]
+
+    def average(self) -> List[np.ndarray]:
+        """Return the average over the slots of each of the parameter arrays."""
+        averages = [
+            view.astype(np.result_type(view.dtype, np.float32))
+            for view in self._get_views(0)
+        ]
+        for slot in range(1, self._number_of_slots):
+            for average, view in zip(averages, self._get_views(slot)):
+                average += view
+        for average in averages:
+            average /= self._number_of_slots
+        return [
+            average.astype(dtype, copy=False)
+            for average, dtype in zip(averages, self._dtypes)
+        ]
+
+    def close(self):
+        """Close the access of this process to the shared memory."""
+        self._shared_memory.close()
+
+    def unlink(self):
+        """Close and release the shared memory, once every process has closed it."""
+        self._shared_memory.close()
+        self._shared_memory.unlink()
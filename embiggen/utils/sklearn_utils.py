@@ -1,4 +1,8 @@
 """Submodule with utils for interface with Sklearn models."""
+from typing import Union
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse
 from sklearn.base import ClassifierMixin
 from sklearn.linear_model._base import LinearClassifierMixin
 
@@ -29,3 +33,21 @@ def must_be_an_sklearn_classifier_model(candidate_model):
             "that can be adapted for this class as it is not a subclass of `ClassifierMixin` "
             "nor `LinearClassifierMixin`."
         )
+
+
+def densify_unsupported_sparse_features(
+    features: Union[np.ndarray, csr_matrix],
+    can_use_sparse_features: bool
+) -> Union[np.ndarray, csr_matrix]:
+    """Returns the provided features, densified if they are sparse and the model cannot use them.
+
+    Parameters
+    ------------------
+    features: Union[np.ndarray, csr_matrix]
+        The features to feed to the model.
+    can_use_sparse_features: bool
+        Whether the model accepts scipy sparse matrices.
+    """
+    if issparse(features) and not can_use_sparse_features:
+        return features.toarray()
+    return features
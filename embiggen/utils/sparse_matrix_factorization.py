@@ -0,0 +1,243 @@
+"""Module providing the sparse approximations of the random walk matrices factorized by NetMF and GraRep.
+
+The matrices factorized by NetMF and GraRep are built from the powers of the
+transition matrix of the graph, which are dense even for sparse graphs. These
+utilities approximate them within O(edges x rank) time and memory: the
+symmetric normalized adjacency matrix is replaced by its truncated
+eigen-decomposition, as in NetMF for large windows, and the entries of the
+matrices are only evaluated on a sparse support of node pairs sampled by
+random walks on the edges, as in the path sampling of NetSMF.
+"""
+from typing import Tuple
+
+import numpy as np
+from ensmallen import Graph
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import eigsh
+from sklearn.utils.extmath import randomized_svd
+
+# Number of node pairs whose low-rank entries are evaluated at once.
+PAIRS_CHUNK_SIZE = 2**16
+
+
+def get_adjacency_matrix(graph: Graph) -> csr_matrix:
+    """Returns the unweighted sparse adjacency matrix of the provided graph.
+
+    Parameters
+    ----------------
+    graph: Graph
+        The graph whose adjacency matrix is returned.
+    """
+    edge_node_ids = graph.get_directed_edge_node_ids()
+    number_of_nodes = graph.get_number_of_nodes()
+    adjacency = csr_matrix(
+        (
+            np.ones(edge_node_ids.shape[0], dtype=np.float64),
+            (edge_node_ids[:, 0], edge_node_ids[:, 1])
+        ),
+        shape=(number_of_nodes, number_of_nodes)
+    )
+    # The parallel edges of multigraphs are counted once.
+    adjacency.sum_duplicates()
+    adjacency.data[:] = 1.0
+    return adjacency
+
+
+def get_reciprocal_sqrt_degrees(adjacency: csr_matrix) -> np.ndarray:
+    """Returns the reciprocal square roots of the node degrees, zero for the singletons.
+
+    Parameters
+    ----------------
+    adjacency: csr_matrix
+        The sparse adjacency matrix.
+    """
+    degrees = np.asarray(adjacency.sum(axis=1)).ravel()
+    reciprocal_sqrt_degrees = np.zeros_like(degrees)
+    reciprocal_sqrt_degrees[degrees > 0] = 1.0 / np.sqrt(degrees[degrees > 0])
+    return reciprocal_sqrt_degrees
+
+
+def get_top_eigenpairs(
+    adjacency: csr_matrix,
+    reciprocal_sqrt_degrees: np.ndarray,
+    rank: int,
+    random_state: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the eigenpairs of the symmetric normalized adjacency matrix with largest magnitude.
+
+    Parameters
+    ----------------
+    adjacency: csr_matrix
+        The sparse adjacency matrix.
+    reciprocal_sqrt_degrees: np.ndarray
+        The reciprocal square roots of the node degrees.
+    rank: int
+        The number of eigenpairs to compute.
+        It is capped to the number of nodes minus one.
+    random_state: int
+        The random state of the starting vector of the Lanczos iterations.
+
+    Implementation details
+    ----------------
+    The eigenvalues are selected by magnitude rather than by value, since the
+    negative ones close to minus one, as in nearly bipartite graphs, dominate
+    the even powers of the transition matrix just as much as the positive ones.
+    """
+    normalized_adjacency = adjacency.multiply(
+        reciprocal_sqrt_degrees[:, None]
+    ).multiply(
+        reciprocal_sqrt_degrees[None, :]
+    ).tocsr()
+    return eigsh(
+        normalized_adjacency,
+        k=min(rank, adjacency.shape[0] - 1),
+        which="LM",
+        v0=np.random.RandomState(random_state).uniform(
+            -1.0,
+            1.0,
+            size=adjacency.shape[0]
+        ),
+    )
+
+
+def sample_walk_pairs(
+    adjacency: csr_matrix,
+    number_of_samples: int,
+    minimum_length: int,
+    maximum_length: int,
+    random_state: int,
+    include_edges: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the unique pairs of nodes joined by random walks starting with a random edge.
+
+    Parameters
+    ----------------
+    adjacency: csr_matrix
+        The sparse adjacency matrix.
+    number_of_samples: int
+        The number of walks to sample.
+    minimum_length: int
+        The minimum length of the walks, in edges.
+    maximum_length: int
+        The maximum length of the walks, in edges.
+    random_state: int
+        The random state of the walks.
+    include_edges: bool = False
+        Whether to also return all of the edges of the graph.
+
+    Implementation details
+    ----------------
+    Each walk starts from an edge drawn uniformly, and continues from its
+    destination for a number of steps drawn uniformly, so that each pair
+    is reached with the probability of the walks of that length on the
+    undirected graph. The walks reaching a node without neighbours stop there.
+    """
+    random_state = np.random.RandomState(random_state)
+    indptr, indices = adjacency.indptr, adjacency.indices
+    degrees = np.diff(indptr)
+
+    edge_ids = random_state.randint(indices.size, size=number_of_samples)
+    sources = np.searchsorted(indptr, edge_ids, side="right") - 1
+    destinations = indices[edge_ids].astype(np.int64)
+    remaining_steps = random_state.randint(
+        minimum_length - 1,
+        maximum_length,
+        size=number_of_samples
+    )
+
+    while True:
+        walking = np.flatnonzero((remaining_steps > 0) & (degrees[destinations] > 0))
+        if walking.size == 0:
+            break
+        current_nodes = destinations[walking]
+        destinations[walking] = indices[
+            indptr[current_nodes]
+            + (random_state.random_sample(walking.size) * degrees[current_nodes]).astype(np.int64)
+        ]
+        remaining_steps[walking] -= 1
+
+    # The matrices are symmetric, so both directions of the pairs are kept.
+    number_of_nodes = adjacency.shape[0]
+    pairs = [
+        sources * number_of_nodes + destinations,
+        destinations * number_of_nodes + sources,
+    ]
+    if include_edges:
+        pairs.append(
+            np.repeat(np.arange(number_of_nodes, dtype=np.int64), degrees) * number_of_nodes
+            + indices
+        )
+    pairs = np.unique(np.concatenate(pairs))
+    return pairs // number_of_nodes, pairs % number_of_nodes
+
+
+def get_low_rank_entries(
+    left: np.ndarray,
+    right: np.ndarray,
+    rows: np.ndarray,
+    columns: np.ndarray,
+) -> np.ndarray:
+    """Returns the entries of the product of the provided factors on the provided pairs.
+
+    Parameters
+    ----------------
+    left: np.ndarray
+        The left factor, with a row for each node.
+    right: np.ndarray
+        The right factor, with a row for each node.
+    rows: np.ndarray
+        The rows of the entries.
+    columns: np.ndarray
+        The columns of the entries.
+    """
+    entries = np.empty(rows.size, dtype=np.float64)
+    for start in range(0, rows.size, PAIRS_CHUNK_SIZE):
+        end = start + PAIRS_CHUNK_SIZE
+        entries[start:end] = np.einsum(
+            "ij,ij->i",
+            left[rows[start:end]],
+            right[columns[start:end]]
+        )
+    return entries
+
+
+def factorize_sparse_matrix(
+    rows: np.ndarray,
+    columns: np.ndarray,
+    values: np.ndarray,
+    number_of_nodes: int,
+    embedding_size: int,
+    iterations: int,
+    random_state: int,
+) -> np.ndarray:
+    """Returns the node embedding factorizing the provided sparse matrix with randomized SVD.
+
+    Parameters
+    ----------------
+    rows: np.ndarray
+        The rows of the non-zero values.
+    columns: np.ndarray
+        The columns of the non-zero values.
+    values: np.ndarray
+        The non-zero values.
+    number_of_nodes: int
+        The number of rows and columns of the matrix.
+    embedding_size: int
+        The size of the embedding.
+    iterations: int
+        The number of power iterations of the randomized SVD.
+    random_state: int
+        The random state of the randomized SVD.
+    """
+    nonzero = values > 0
+    matrix = csr_matrix(
+        (values[nonzero], (rows[nonzero], columns[nonzero])),
+        shape=(number_of_nodes, number_of_nodes)
+    )
+    U, sigmas, _ = randomized_svd(
+        matrix,
+        n_components=embedding_size,
+        n_iter=iterations,
+        random_state=random_state
+    )
+    return (U * np.sqrt(sigmas)).astype(np.float32)
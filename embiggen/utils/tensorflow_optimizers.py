@@ -0,0 +1,147 @@
+"""Submodule providing the optimizers with sparse updates of the embedding tables.
+
+The gradients of the embedding tables are `IndexedSlices`, which only have
+the rows of the nodes gathered in the batch. The Keras SGD optimizer without
+momentum and the Adagrad optimizer already update only these rows, while the
+Adam optimizers decay the moments of all the rows at every step, which makes
+each step linear in the number of nodes. The lazy variant of Adam provided
+here only updates the moments and the weights of the rows in the batch.
+"""
+from typing import Union
+
+import tensorflow as tf
+from tensorflow.keras.optimizers import \
+    Optimizer  # pylint: disable=import-error,no-name-in-module
+
+from embiggen.utils.tensorflow_utils import must_have_tensorflow_version_higher_or_equal_than
+
+
+class LazyAdam(tf.keras.optimizers.Adam):
+    """Adam optimizer updating only the rows of the sparse gradients.
+
+    The dense gradients are handled as in Adam, while for the sparse ones
+    the moments of the rows not in the batch are left unchanged, rather than
+    decayed, as in the LazyAdam optimizer of TensorFlow Addons.
+
+    Implementation details
+    ----------------------
+    The sparse update accesses the moments of the variables, which are not
+    exposed by the public API of the Keras optimizers. They are looked up
+    through the variable index of Keras 3, which is the Keras of TensorFlow
+    2.16 onwards, or through the variable keys of the optimizers of Keras
+    2.11 to 2.15, which are also the ones of `tf_keras`. Keras 3 passes the
+    learning rate to the update step and provides the methods to assign
+    the variables, which are used when available.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Create new LazyAdam optimizer, with the same parameters of Adam.
+
+        Raises
+        ----------------------
+        ValueError
+            If the installed version of TensorFlow is older than 2.11.
+        ValueError
+            If the installed version of Keras exposes neither of the
+            supported ways to access the moments of the variables.
+        ValueError
+            If the AMSGrad variant is requested.
+        """
+        must_have_tensorflow_version_higher_or_equal_than(
+            "2.11.0",
+            feature_name="LazyAdam"
+        )
+        super().__init__(*args, **kwargs)
+        if not any(
+            hasattr(tf.keras.optimizers.Adam, method_name)
+            for method_name in ("_get_variable_index", "_var_key")
+        ):
+            raise ValueError(
+                "The LazyAdam optimizer supports the optimizers of Keras from "
+                "version 2.11 to 2.15 and of Keras 3, but the installed Keras "
+                f"{getattr(tf.keras, '__version__', 'unknown')} does not provide "
+                "access to the moments of the variables of its optimizers."
+            )
+        if self.amsgrad:
+            raise ValueError(
+                "The LazyAdam optimizer does not support the AMSGrad variant."
+            )
+
+    def _get_moments_index(self, variable) -> int:
+        """Returns the index of the moments of the provided variable."""
+        if hasattr(tf.keras.optimizers.Adam, "_get_variable_index"):
+            return self._get_variable_index(variable)
+        return self._index_dict[self._var_key(variable)]
+
+    def _scatter_update(self, variable, gradient: tf.IndexedSlices):
+        """Assigns the rows of the provided slices to the variable."""
+        if hasattr(tf.keras.optimizers.Adam, "assign"):
+            self.assign(variable, gradient)
+        else:
+            variable.scatter_update(gradient)
+
+    def update_step(self, gradient, variable, learning_rate=None):
+        """Update the provided variable with the provided gradient.
+
+        Parameters
+        ----------------------
+        gradient
+            The gradient of the variable, either dense or sparse.
+        variable
+            The variable to update.
+        learning_rate = None
+            The learning rate of the step, which Keras 3 provides.
+            By default, the learning rate of the optimizer is used.
+        """
+        if not isinstance(gradient, tf.IndexedSlices):
+            if learning_rate is None:
+                return super().update_step(gradient, variable)
+            return super().update_step(gradient, variable, learning_rate)
+
+        if learning_rate is None:
+            learning_rate = self.learning_rate
+
+        learning_rate = tf.cast(learning_rate, variable.dtype)
+        local_step = tf.cast(self.iterations + 1, variable.dtype)
+        beta_1 = tf.cast(self.beta_1, variable.dtype)
+        beta_2 = tf.cast(self.beta_2, variable.dtype)
+        alpha = learning_rate * tf.sqrt(
+            1 - tf.pow(beta_2, local_step)
+        ) / (1 - tf.pow(beta_1, local_step))
+
+        variable_index = self._get_moments_index(variable)
+        momentum = self._momentums[variable_index]
+        velocity = self._velocities[variable_index]
+
+        # The gradients of the rows appearing more than once are summed.
+        indices, positions = tf.unique(gradient.indices)
+        values = tf.math.unsorted_segment_sum(
+            gradient.values,
+            positions,
+            tf.shape(indices)[0]
+        )
+
+        momentum_rows = beta_1 * tf.gather(momentum, indices) + (1 - beta_1) * values
+        velocity_rows = beta_2 * tf.gather(velocity, indices) + \
+            (1 - beta_2) * tf.square(values)
+        variable_rows = tf.gather(variable, indices) - \
+            alpha * momentum_rows / (tf.sqrt(velocity_rows) + self.epsilon)
+
+        self._scatter_update(momentum, tf.IndexedSlices(momentum_rows, indices))
+        self._scatter_update(velocity, tf.IndexedSlices(velocity_rows, indices))
+        self._scatter_update(variable, tf.IndexedSlices(variable_rows, indices))
+
+
+def get_tensorflow_optimizer(optimizer: Union[str, Optimizer]) -> Union[str, Optimizer]:
+    """Returns the optimizer to compile the models with.
+
+    Parameters
+    ----------------------
+    optimizer: Union[str, Optimizer]
+        Either the name of the optimizer or the optimizer itself.
+        The names `lazy_adam` and `lazyadam` refer to the LazyAdam optimizer,
+        while the other names are left to Keras.
+    """
+    if isinstance(optimizer, str) and optimizer.lower() in ("lazy_adam", "lazyadam"):
+        return LazyAdam()
+    return optimizer
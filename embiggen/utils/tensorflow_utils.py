@@ -1,5 +1,6 @@
 """Submodule with utilities on TensorFlow versions."""
-from typing import List
+from typing import Callable, List, Optional, Sequence, Tuple
+import numpy as np
 from packaging import version
 from validate_version_code import validate_version_code
 from ensmallen import Graph
@@ -116,6 +117,138 @@ def must_have_tensorflow_version_higher_or_equal_than(
             )
         )
 
+def sparse_node_feature_to_tensor(node_feature) -> "tf.SparseTensor":
+    """Returns the provided scipy sparse node feature as a TensorFlow SparseTensor.
+
+    Parameters
+    ----------------------
+    node_feature: scipy.sparse.spmatrix
+        The sparse node feature to convert.
+
+    Returns
+    ----------------------
+    Reordered SparseTensor with single precision values.
+    """
+    import tensorflow as tf
+    node_feature = node_feature.tocoo()
+    return tf.sparse.reorder(tf.SparseTensor(
+        indices=np.vstack((node_feature.row, node_feature.col)).T.astype(np.int64),
+        values=node_feature.data.astype(np.float32),
+        dense_shape=node_feature.shape
+    ))
+
+
+# Worker number and number of workers among which the batch indices of the
+# datasets of this process are split. It is only changed within the worker
+# processes of the CPU data-parallel training, which are dedicated to it.
+_BATCH_INDEX_SHARD = (0, 1)
+
+
+def set_batch_index_shard(worker_number: int, number_of_workers: int):
+    """Sets the share of the batch indices produced by the datasets of this process.
+
+    Parameters
+    ----------------------
+    worker_number: int
+        The number of the worker process, from zero.
+    number_of_workers: int
+        The number of worker processes.
+
+    Raises
+    ----------------------
+    ValueError
+        If the worker number is not among the workers.
+    """
+    global _BATCH_INDEX_SHARD
+    if worker_number < 0 or worker_number >= number_of_workers:
+        raise ValueError(
+            f"The worker number {worker_number} is not valid "
+            f"with {number_of_workers} workers."
+        )
+    _BATCH_INDEX_SHARD = (worker_number, number_of_workers)
+
+
+def batch_getter_into_parallel_dataset(
+    get_batch: Callable[[int], Tuple[np.ndarray]],
+    output_signature: Sequence["tf.TensorSpec"],
+    number_of_parallel_calls: Optional[int] = None,
+    number_of_skipped_batches: int = 0,
+) -> "tf.data.Dataset":
+    """Returns infinite dataset producing the batches of the provided getter in parallel.
+
+    Parameters
+    ----------------------
+    get_batch: Callable[[int], Tuple[np.ndarray]]
+        Callback returning the input arrays of the batch with the provided index.
+        The batch indices start from one, as the ones of the Keras sequences
+        used as infinite generators, so that the same batches are produced.
+    output_signature: Sequence[tf.TensorSpec]
+        The specs of the input arrays of the batches.
+    number_of_parallel_calls: Optional[int] = None
+        The number of batches to produce concurrently.
+        By default, it is tuned automatically by TensorFlow.
+    number_of_skipped_batches: int = 0
+        The number of leading batches of this process not to produce,
+        as when resuming the training after the completed epochs.
+
+    Implementation details
+    ----------------------
+    Each batch is produced by a numpy function called on its own index,
+    so that its random state depends only on the index rather than on
+    a counter shared by a single producer thread. The batches can thus be
+    produced concurrently by the threads of the TensorFlow runtime, as
+    the Ensmallen batch generators release the GIL, while their order
+    remains deterministic. As the models using these datasets have no
+    outputs, each element of the dataset is a tuple with the inputs only.
+    Within the worker processes of the CPU data-parallel training, the
+    dataset only produces the batch indices of the worker, so that
+    the workers train on disjoint batches. The skipped batches are
+    skipped in the range of the batch indices rather than in the produced
+    dataset, so that they are never sampled.
+    """
+    import tensorflow as tf
+    try:
+        AUTOTUNE = tf.data.AUTOTUNE
+    except AttributeError:
+        AUTOTUNE = tf.data.experimental.AUTOTUNE
+
+    if number_of_parallel_calls is None:
+        number_of_parallel_calls = AUTOTUNE
+
+    if number_of_skipped_batches < 0:
+        raise ValueError(
+            "The number of skipped batches should be a non-negative integer, "
+            f"but {number_of_skipped_batches} was provided."
+        )
+
+    def get_numpy_batch(batch_index: np.ndarray) -> List[np.ndarray]:
+        return [
+            np.asarray(array, dtype=spec.dtype.as_numpy_dtype)
+            for array, spec in zip(get_batch(int(batch_index)), output_signature)
+        ]
+
+    def get_tensor_batch(batch_index: "tf.Tensor") -> Tuple[Tuple["tf.Tensor"]]:
+        tensors = tf.numpy_function(
+            get_numpy_batch,
+            [batch_index],
+            [spec.dtype for spec in output_signature],
+        )
+        for tensor, spec in zip(tensors, output_signature):
+            tensor.set_shape(spec.shape)
+        return (tuple(tensors),)
+
+    worker_number, number_of_workers = _BATCH_INDEX_SHARD
+
+    return tf.data.Dataset.range(
+        1 + worker_number + number_of_skipped_batches * number_of_workers,
+        np.iinfo(np.int64).max,
+        number_of_workers
+    ).map(
+        get_tensor_batch,
+        num_parallel_calls=number_of_parallel_calls,
+    ).prefetch(AUTOTUNE)
+
+
 def get_available_gpus() -> List[str]:
     """Return list with IDs of available GPU devices."""
     try:
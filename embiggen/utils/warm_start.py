@@ -0,0 +1,122 @@
+"""Module providing the utilities to warm-start an embedding from a previous one.
+
+When a graph grows by a small fraction of nodes and edges, most of the nodes
+keep their neighbourhood, and their previous embedding is a good starting
+point for the new one. The warm start initializes the known nodes from their
+previous vectors, aligned by node name, and trains for a reduced number of
+epochs, focusing where supported on the new nodes and their neighbours.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+
+from embiggen.utils.abstract_models.embedding_result import EmbeddingResult
+
+# Default fraction of the epochs of the model used to warm-start an embedding.
+WARM_START_EPOCHS_RATIO = 0.1
+
+
+def align_previous_node_embedding(
+    previous_embedding: EmbeddingResult,
+    graph: Graph,
+    embedding_size: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the previous node embedding aligned to the nodes of the graph.
+
+    Parameters
+    ----------------
+    previous_embedding: EmbeddingResult
+        The embedding computed on a previous version of the graph.
+        Its first node embedding must be a DataFrame indexed by the node names.
+    graph: Graph
+        The graph to embed.
+    embedding_size: int
+        The embedding size of the model to warm-start.
+
+    Raises
+    ----------------
+    ValueError
+        If the previous node embedding is not a DataFrame.
+    ValueError
+        If the previous node embedding has a different size.
+
+    Returns
+    ----------------
+    Tuple with the node embedding aligned to the node ids of the graph,
+    whose rows of the new nodes are zero, and the mask of the known nodes.
+    """
+    node_embedding = previous_embedding.get_node_embedding_from_index(0)
+
+    if not isinstance(node_embedding, pd.DataFrame):
+        raise ValueError(
+            "The previous node embedding should be a DataFrame indexed by "
+            "the node names, so that it can be aligned to the nodes of the "
+            f"graph {graph.get_name()}, but an object of type "
+            f"{type(node_embedding)} was provided. Please compute the "
+            "previous embedding with `return_dataframe=True`."
+        )
+
+    if node_embedding.shape[1] != embedding_size:
+        raise ValueError(
+            f"The previous node embedding has size {node_embedding.shape[1]}, "
+            f"but the model to warm-start has embedding size {embedding_size}."
+        )
+
+    if not node_embedding.index.is_unique:
+        raise ValueError(
+            "The index of the previous node embedding contains duplicated node names."
+        )
+
+    alignment = node_embedding.index.get_indexer(graph.get_node_names())
+    known_nodes = alignment != -1
+
+    aligned_node_embedding = np.zeros(
+        (graph.get_number_of_nodes(), embedding_size),
+        dtype=np.float32
+    )
+    aligned_node_embedding[known_nodes] = node_embedding.to_numpy()[
+        alignment[known_nodes]
+    ]
+
+    return aligned_node_embedding, known_nodes
+
+
+def get_warm_start_node_ids(graph: Graph, known_nodes: np.ndarray) -> np.ndarray:
+    """Returns the sorted ids of the new nodes and of their neighbours.
+
+    Parameters
+    ----------------
+    graph: Graph
+        The graph to embed.
+    known_nodes: np.ndarray
+        The mask of the nodes with a previous embedding.
+    """
+    new_nodes = ~known_nodes
+    edge_node_ids = graph.get_directed_edge_node_ids()
+    touching_new_nodes = new_nodes[edge_node_ids[:, 0]]
+    touched_nodes = np.zeros_like(new_nodes)
+    touched_nodes[edge_node_ids[touching_new_nodes, 1]] = True
+    return np.flatnonzero(new_nodes | touched_nodes)
+
+
+def get_warm_start_epochs(epochs: int, warm_start_epochs: Optional[int] = None) -> int:
+    """Returns the number of epochs of the warm start.
+
+    Parameters
+    ----------------
+    epochs: int
+        The number of epochs of the model when trained from scratch.
+    warm_start_epochs: Optional[int] = None
+        The number of epochs requested for the warm start. By default,
+        a tenth of the epochs of the model, and at least one.
+    """
+    if warm_start_epochs is None:
+        return max(1, int(np.ceil(epochs * WARM_START_EPOCHS_RATIO)))
+    if not isinstance(warm_start_epochs, int) or warm_start_epochs < 1:
+        raise ValueError(
+            "The number of epochs of the warm start should be a strictly "
+            f"positive integer, but {warm_start_epochs} was provided."
+        )
+    return warm_start_epochs
@@ -0,0 +1,271 @@
+"""Module providing a work queue on a shared filesystem for distributed evaluations.
+
+The units of work of an evaluation, that is the evaluation of a model on
+a holdout of a graph, are stored as files moving between the `pending`,
+`claimed` and `done` directories of the queue. Any number of workers, be
+them local processes or SLURM tasks on different nodes sharing the filesystem,
+claim the pending units as soon as they are free, so that no worker sits idle
+while others are still running long units. The claimed units are kept alive
+by a heartbeat, and the units whose worker has stopped sending heartbeats,
+for instance because the node crashed or the job was preempted, are re-queued.
+"""
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # The fcntl module is not available on Windows.
+    fcntl = None
+
+
+class WorkQueue:
+    """Work queue of evaluation units backed by a shared filesystem."""
+
+    STATES = ("pending", "claimed", "done")
+
+    def __init__(
+        self,
+        directory: str,
+        heartbeat_interval: float = 30.0,
+        stale_after: float = 300.0,
+        polling_interval: float = 5.0,
+    ):
+        """Create a new work queue, or connect to an existing one.
+
+        Parameters
+        ----------------
+        directory: str
+            The directory of the queue, which must be on a filesystem
+            shared by all of the workers.
+        heartbeat_interval: float = 30.0
+            Number of seconds between two heartbeats of a claimed unit.
+        stale_after: float = 300.0
+            Number of seconds since the last heartbeat after which
+            a claimed unit is considered abandoned and is re-queued.
+        polling_interval: float = 5.0
+            Number of seconds to wait before checking again the queue
+            when there are no pending units, but some are still claimed
+            by other workers and may be re-queued.
+
+        Raises
+        ----------------
+        ValueError
+            If the stale timeout is not larger than the heartbeat interval.
+        NotImplementedError
+            If the file locks are not available on the current platform.
+        """
+        if fcntl is None:
+            raise NotImplementedError(
+                "The work queue requires the fcntl file locks, "
+                "which are not available on the current platform."
+            )
+        if heartbeat_interval <= 0 or stale_after <= heartbeat_interval:
+            raise ValueError(
+                "The heartbeat interval must be strictly positive and the "
+                "time after which a claimed unit is considered stale must be "
+                f"larger than it, but you have provided a heartbeat interval of {heartbeat_interval} "
+                f"seconds and a stale timeout of {stale_after} seconds."
+            )
+        self._directory = directory
+        self._heartbeat_interval = heartbeat_interval
+        self._stale_after = stale_after
+        self._polling_interval = polling_interval
+        self._worker_name = f"{socket.gethostname()}:{os.getpid()}"
+        for state in self.STATES:
+            os.makedirs(os.path.join(directory, state), exist_ok=True)
+
+    def _get_path(self, state: str, unit_key: str) -> str:
+        """Return the path of the file of the unit in the provided state."""
+        return os.path.join(self._directory, state, unit_key)
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Return context manager holding the exclusive lock of the queue.
+
+        Implementation details
+        ----------------
+        POSIX record locks are used as, differently from flock, they
+        are also honoured by most network filesystems such as NFS.
+        """
+        with open(os.path.join(self._directory, "lock"), "a") as lock:
+            fcntl.lockf(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.lockf(lock, fcntl.LOCK_UN)
+
+    def get_unit_keys(self, state: str) -> List[str]:
+        """Return the sorted keys of the units in the provided state.
+
+        Parameters
+        ----------------
+        state: str
+            The state of the units, one of pending, claimed and done.
+        """
+        if state not in self.STATES:
+            raise ValueError(
+                f"The provided state {state} is not supported. "
+                f"The supported states are {', '.join(self.STATES)}."
+            )
+        return sorted(os.listdir(os.path.join(self._directory, state)))
+
+    def populate(self, unit_keys: Iterable[str]):
+        """Add to the queue the provided units that are not already in it.
+
+        Parameters
+        ----------------
+        unit_keys: Iterable[str]
+            The keys of the units, which must be valid file names.
+
+        Implementation details
+        ----------------
+        Every worker of an evaluation populates the queue with the same units,
+        and only the units that are not pending, claimed or done are added.
+        """
+        with self._lock():
+            for unit_key in unit_keys:
+                if any(
+                    os.path.exists(self._get_path(state, unit_key))
+                    for state in self.STATES
+                ):
+                    continue
+                with open(self._get_path("pending", unit_key), "w", encoding="utf8"):
+                    pass
+
+    def requeue_stale_units(self) -> List[str]:
+        """Move back to the pending units the claimed units without recent heartbeats.
+
+        Returns
+        ----------------
+        The keys of the re-queued units.
+        """
+        requeued_unit_keys = []
+        with self._lock():
+            now = time.time()
+            for unit_key in self.get_unit_keys("claimed"):
+                path = self._get_path("claimed", unit_key)
+                try:
+                    if now - os.path.getmtime(path) <= self._stale_after:
+                        continue
+                    os.rename(path, self._get_path("pending", unit_key))
+                except FileNotFoundError:
+                    # The unit was completed in the meantime.
+                    continue
+                requeued_unit_keys.append(unit_key)
+        return requeued_unit_keys
+
+    def claim(self, unit_keys: Optional[Iterable[str]] = None) -> Optional[str]:
+        """Return the key of a pending unit claimed by this worker, if any.
+
+        Parameters
+        ----------------
+        unit_keys: Optional[Iterable[str]] = None
+            The keys of the units that this worker may claim.
+            By default, any pending unit may be claimed.
+        """
+        if unit_keys is not None:
+            unit_keys = set(unit_keys)
+        with self._lock():
+            for unit_key in self.get_unit_keys("pending"):
+                if unit_keys is not None and unit_key not in unit_keys:
+                    continue
+                path = self._get_path("claimed", unit_key)
+                try:
+                    os.rename(self._get_path("pending", unit_key), path)
+                except FileNotFoundError:
+                    continue
+                # The rename preserves the modification time of the pending
+                # file, so we refresh it before anyone can deem the unit stale.
+                with open(path, "w", encoding="utf8") as claimed:
+                    claimed.write(self._worker_name)
+                return unit_key
+        return None
+
+    def heartbeat(self, unit_key: str):
+        """Signal that the unit with the provided key is still being processed.
+
+        Parameters
+        ----------------
+        unit_key: str
+            The key of the claimed unit.
+        """
+        try:
+            os.utime(self._get_path("claimed", unit_key))
+        except FileNotFoundError:
+            # The unit was deemed stale and re-queued, its
+            # results will be written twice but are identical.
+            pass
+
+    def complete(self, unit_key: str):
+        """Mark the unit with the provided key as done.
+
+        Parameters
+        ----------------
+        unit_key: str
+            The key of the claimed unit.
+        """
+        try:
+            os.rename(
+                self._get_path("claimed", unit_key),
+                self._get_path("done", unit_key),
+            )
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def _heartbeating(self, unit_key: str) -> Iterator[None]:
+        """Return context manager sending heartbeats for the unit from a background thread."""
+        stop = threading.Event()
+
+        def send_heartbeats():
+            while not stop.wait(self._heartbeat_interval):
+                self.heartbeat(unit_key)
+
+        thread = threading.Thread(target=send_heartbeats, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def iterate_units(self, unit_keys: Optional[Iterable[str]] = None) -> Iterator[str]:
+        """Return iterator over the units claimed by this worker until the queue is empty.
+
+        Parameters
+        ----------------
+        unit_keys: Optional[Iterable[str]] = None
+            The keys of the units that this worker may claim, so that
+            the same queue can be shared by different evaluations.
+            By default, any unit may be claimed.
+
+        Implementation details
+        ----------------
+        Each unit is marked as done when the next one is requested, and
+        heartbeats are sent while it is being processed. If the processing
+        raises an exception, the unit is left claimed and is re-queued once
+        it becomes stale. When there are no more pending units, but some are
+        still claimed by other workers, this worker waits for them to either
+        be completed or to become stale and be re-queued.
+        """
+        if unit_keys is not None:
+            unit_keys = set(unit_keys)
+        while True:
+            self.requeue_stale_units()
+            unit_key = self.claim(unit_keys)
+            if unit_key is None:
+                if not any(
+                    unit_keys is None or claimed_unit_key in unit_keys
+                    for claimed_unit_key in self.get_unit_keys("claimed")
+                ):
+                    return
+                time.sleep(self._polling_interval)
+                continue
+            with self._heartbeating(unit_key):
+                yield unit_key
+            self.complete(unit_key)
@@ -0,0 +1,102 @@
+"""Unit test class for the alias tables of the unigram negative sampling."""
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.utils import (
+    get_unigram_distribution,
+    get_alias_table,
+    get_unigram_alias_table,
+    sample_from_alias_table,
+)
+
+
+class TestAliasTable(TestCase):
+    """Unit test class for the alias tables of the unigram negative sampling."""
+
+    def setUp(self):
+        """Setup objects for running tests on the alias tables."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+
+    def test_alias_table_distribution(self):
+        """Test that the alias table encodes the unigram distribution."""
+        degrees = self.graph.get_node_degrees()
+        distribution = get_unigram_distribution(degrees)
+        self.assertTrue(np.isclose(distribution.sum(), 1.0))
+        self.assertTrue(np.allclose(
+            distribution,
+            degrees ** 0.75 / (degrees ** 0.75).sum()
+        ))
+
+        probabilities, aliases = get_alias_table(distribution)
+        # Each column contributes 1/n, split between itself and its alias.
+        reconstructed = probabilities / distribution.size
+        np.add.at(
+            reconstructed,
+            aliases,
+            (1.0 - probabilities) / distribution.size
+        )
+        self.assertTrue(np.allclose(reconstructed, distribution, atol=1e-6))
+
+        samples = sample_from_alias_table(
+            probabilities,
+            aliases,
+            number_of_samples=200_000
+        )
+        frequencies = np.bincount(samples, minlength=distribution.size)
+        self.assertTrue(np.abs(
+            frequencies / samples.size - distribution
+        ).max() < 5e-3)
+
+    def test_zero_frequencies(self):
+        """Test that the classes with zero frequency are never sampled."""
+        frequencies = np.array([0, 3, 0, 1, 5])
+        probabilities, aliases = get_alias_table(
+            get_unigram_distribution(frequencies, distortion=0.0)
+        )
+        samples = sample_from_alias_table(probabilities, aliases, 10_000)
+        self.assertEqual(set(np.unique(samples)), {1, 3, 4})
+        for frequencies in (np.zeros(3), np.array([]), np.array([1, -1])):
+            with self.assertRaises(ValueError):
+                get_unigram_distribution(frequencies)
+
+    def test_alias_table_random_distributions(self):
+        """Test that the alias table encodes distributions with many ties and zeros."""
+        random_state = np.random.RandomState(42)
+        for _ in range(200):
+            frequencies = random_state.choice(
+                [0.0, 1.0, 2.0, 10.0, 100.0],
+                size=random_state.randint(1, 100)
+            )
+            frequencies[0] += 1.0
+            distribution = get_unigram_distribution(frequencies, distortion=1.0)
+            probabilities, aliases = get_alias_table(distribution)
+            self.assertTrue(((probabilities >= 0) & (probabilities <= 1)).all())
+            reconstructed = probabilities / distribution.size
+            np.add.at(
+                reconstructed,
+                aliases,
+                (1.0 - probabilities) / distribution.size
+            )
+            self.assertTrue(np.allclose(reconstructed, distribution, atol=1e-6))
+
+    def test_unigram_alias_table_cache(self):
+        """Test that the alias tables of the same frequencies are built once."""
+        degrees = self.graph.get_node_degrees()
+        distribution, probabilities, aliases = get_unigram_alias_table(degrees)
+        self.assertTrue(np.allclose(distribution, get_unigram_distribution(degrees)))
+        cached = get_unigram_alias_table(degrees.copy())
+        self.assertIs(cached[1], probabilities)
+        self.assertIs(cached[2], aliases)
+        self.assertFalse(probabilities.flags.writeable)
+        self.assertIsNot(
+            get_unigram_alias_table(degrees, distortion=0.5)[1],
+            probabilities
+        )
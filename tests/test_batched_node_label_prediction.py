@@ -0,0 +1,94 @@
+"""Unit test class for batched node-label predictions."""
+import os
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+from embiggen.node_label_prediction import DecisionTreeNodeLabelPrediction
+
+
+class TestBatchedNodeLabelPrediction(TestCase):
+    """Unit test class for batched node-label predictions."""
+
+    def setUp(self):
+        """Setup a small labelled graph with random node features."""
+        edges = pd.read_csv("tests/data/small_ppi.tsv", sep="\t")
+        node_names = np.unique(edges.iloc[:, :2].values.astype(str))
+        random_state = np.random.RandomState(42)
+        self.node_path = "batched_node_label_prediction_nodes.tsv"
+        self.predictions_path = "batched_node_label_predictions.csv"
+        pd.DataFrame({
+            "name": node_names,
+            "type": random_state.choice(["red", "blue", "green"], size=node_names.size),
+        }).to_csv(self.node_path, sep="\t", index=False)
+        self.graph = Graph.from_csv(
+            node_path=self.node_path,
+            nodes_column="name",
+            node_list_node_types_column="type",
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            directed=False,
+            name="PPI",
+        )
+        self.features = random_state.uniform(
+            size=(self.graph.get_number_of_nodes(), 10)
+        )
+        self.model = DecisionTreeNodeLabelPrediction()
+        self.model.fit(self.graph, node_features=self.features)
+        self.batched_model = DecisionTreeNodeLabelPrediction(
+            prediction_batch_size=100,
+            prediction_number_of_threads=2,
+        )
+        self.batched_model.fit(self.graph, node_features=self.features)
+
+    def tearDown(self):
+        """Remove the node list and the predictions."""
+        os.remove(self.node_path)
+        if os.path.exists(self.predictions_path):
+            os.remove(self.predictions_path)
+
+    def test_batched_predictions(self):
+        """Test that the batched predictions match the unbatched ones."""
+        self.assertTrue(np.allclose(
+            self.batched_model.predict_proba(self.graph, node_features=self.features),
+            self.model.predict_proba(self.graph, node_features=self.features),
+        ))
+        self.assertTrue(np.array_equal(
+            self.batched_model.predict(self.graph, node_features=self.features),
+            self.model.predict(self.graph, node_features=self.features),
+        ))
+        node_ids = np.arange(self.graph.get_number_of_nodes())[::-3]
+        self.assertTrue(np.allclose(
+            self.batched_model.predict_proba(
+                self.graph, node_features=self.features, node_ids=node_ids
+            ),
+            self.model.predict_proba(self.graph, node_features=self.features)[node_ids],
+        ))
+        with self.assertRaises(ValueError):
+            DecisionTreeNodeLabelPrediction(prediction_batch_size=0)
+
+    def test_streamed_predictions(self):
+        """Test that the consumed predictions are written to disk."""
+        self.assertIsNone(self.batched_model.predict_proba(
+            self.graph,
+            node_features=self.features,
+            path=self.predictions_path,
+            consume_predictions=True,
+        ))
+        predictions = pd.read_csv(self.predictions_path, index_col="node_name")
+        self.assertEqual(
+            list(predictions.index),
+            self.graph.get_node_names(),
+        )
+        self.assertTrue(np.allclose(
+            predictions.values,
+            self.model.predict_proba(self.graph, node_features=self.features),
+        ))
+        with self.assertRaises(ValueError):
+            self.batched_model.predict_proba(
+                self.graph,
+                node_features=self.features,
+                consume_predictions=True,
+            )
@@ -0,0 +1,75 @@
+"""Unit test class for the directories of the checkpoints of the embedding models."""
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from ensmallen import Graph
+from embiggen.utils.checkpoints import (
+    get_checkpoint_path,
+    get_epoch_checkpoint_file_name,
+    get_epoch_checkpoints,
+    remove_old_epoch_checkpoints,
+    validate_checkpoint_parameters,
+)
+
+
+class TestCheckpoints(TestCase):
+    """Unit test class for the directories of the checkpoints of the embedding models."""
+
+    def setUp(self):
+        """Setup objects for running tests on the checkpoints."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+
+    def test_checkpoint_path(self):
+        """Test that the checkpoints are keyed by the parameters and the graph."""
+        with TemporaryDirectory() as directory:
+            def get_path(graph: Graph, **parameters) -> str:
+                return get_checkpoint_path(
+                    directory,
+                    model_name="Model",
+                    library_name="Library",
+                    parameters=parameters,
+                    graph=graph,
+                )
+
+            path = get_path(self.graph, epochs=10)
+            self.assertTrue(os.path.isdir(path))
+            self.assertEqual(
+                path,
+                get_path(self.graph, epochs=10, verbose=True, checkpoint_frequency=5)
+            )
+            self.assertEqual(
+                path,
+                get_path(self.graph, epochs=10, checkpoint_frequency_minutes=30)
+            )
+            self.assertNotEqual(path, get_path(self.graph, epochs=20))
+            self.assertNotEqual(
+                path,
+                get_path(self.graph.remove_disconnected_nodes().sort_by_decreasing_outbound_node_degree(), epochs=10)
+            )
+
+    def test_epoch_checkpoints(self):
+        """Test that only the latest checkpoints are kept."""
+        with TemporaryDirectory() as directory:
+            for epoch in (1, 2, 10, 3):
+                with open(os.path.join(directory, get_epoch_checkpoint_file_name(epoch, ".pt")), "w"):
+                    pass
+            with open(os.path.join(directory, "epoch_00000004.pt.tmp"), "w"):
+                pass
+            self.assertEqual(get_epoch_checkpoints(directory, ".pt"), [1, 2, 3, 10])
+            remove_old_epoch_checkpoints(directory, ".pt", retention=2)
+            self.assertEqual(get_epoch_checkpoints(directory, ".pt"), [3, 10])
+
+    def test_validation(self):
+        """Test the validation of the checkpoint parameters."""
+        validate_checkpoint_parameters(None, 0, 1)
+        for arguments in ((3, 1, 1), ("path", -1, 1), ("path", 1, 0), ("path", 1.5, 1)):
+            with self.assertRaises(ValueError):
+                validate_checkpoint_parameters(*arguments)
@@ -0,0 +1,135 @@
+"""Unit test class for the single-pass classification metrics."""
+from unittest import TestCase
+
+import numpy as np
+from sklearn.metrics import (
+    accuracy_score,
+    average_precision_score,
+    balanced_accuracy_score,
+    f1_score,
+    hamming_loss,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+)
+from embiggen.utils import (
+    get_multiclass_metrics,
+    get_multilabel_metrics,
+    get_one_vs_rest_auroc_and_auprc,
+)
+
+
+class TestClassificationMetrics(TestCase):
+    """Unit test class for the single-pass classification metrics."""
+
+    def setUp(self):
+        """Setup random predictions to evaluate."""
+        random_state = np.random.RandomState(42)
+        self.ground_truth = random_state.randint(7, size=1000)
+        # The class 7 is predicted but never appears in the ground truth.
+        self.predictions = np.where(
+            random_state.uniform(size=1000) < 0.6,
+            self.ground_truth,
+            random_state.randint(8, size=1000),
+        )
+        # Rounded scores, so that there are ties.
+        self.prediction_probabilities = np.round(
+            random_state.uniform(size=(1000, 7)), 2
+        )
+        self.prediction_probabilities[
+            np.arange(1000), self.ground_truth
+        ] += 0.3
+        self.multilabel_ground_truth = random_state.uniform(size=(500, 5)) < 0.3
+        self.multilabel_predictions = np.where(
+            random_state.uniform(size=(500, 5)) < 0.7,
+            self.multilabel_ground_truth,
+            random_state.uniform(size=(500, 5)) < 0.5,
+        )
+        # The last label is never predicted.
+        self.multilabel_predictions[:, -1] = False
+
+    def test_multiclass_metrics(self):
+        """Test that the multi-class metrics match the scikit-learn ones."""
+        metrics = get_multiclass_metrics(self.ground_truth, self.predictions)
+        expected = {
+            **{
+                metric.__name__: metric(self.ground_truth, self.predictions)
+                for metric in (accuracy_score, hamming_loss, balanced_accuracy_score)
+            },
+            **{
+                metric.__name__: metric(
+                    self.ground_truth, self.predictions,
+                    average="macro", zero_division=0
+                )
+                for metric in (f1_score, precision_score, recall_score)
+            }
+        }
+        self.assertEqual(set(metrics), set(expected))
+        for metric_name, value in expected.items():
+            self.assertAlmostEqual(metrics[metric_name], value, msg=metric_name)
+        # Labels that are not integers are supported as well.
+        string_metrics = get_multiclass_metrics(
+            self.ground_truth.astype(str), self.predictions.astype(str)
+        )
+        for metric_name, value in metrics.items():
+            self.assertAlmostEqual(string_metrics[metric_name], value)
+
+    def test_multilabel_metrics(self):
+        """Test that the multi-label metrics match the scikit-learn ones."""
+        metrics = get_multilabel_metrics(
+            self.multilabel_ground_truth, self.multilabel_predictions
+        )
+        expected = {
+            **{
+                metric.__name__: metric(
+                    self.multilabel_ground_truth, self.multilabel_predictions
+                )
+                for metric in (accuracy_score, hamming_loss)
+            },
+            **{
+                metric.__name__: metric(
+                    self.multilabel_ground_truth, self.multilabel_predictions,
+                    average="macro", zero_division=0
+                )
+                for metric in (f1_score, precision_score, recall_score)
+            }
+        }
+        self.assertEqual(set(metrics), set(expected))
+        for metric_name, value in expected.items():
+            self.assertAlmostEqual(metrics[metric_name], value, msg=metric_name)
+
+    def test_one_vs_rest_auroc_and_auprc(self):
+        """Test that the one-vs-rest metrics match the scikit-learn ones."""
+        one_hot = np.eye(7, dtype=bool)[self.ground_truth]
+        for number_of_threads in (1, 3):
+            metrics = get_one_vs_rest_auroc_and_auprc(
+                self.ground_truth,
+                self.prediction_probabilities,
+                number_of_threads=number_of_threads
+            )
+            self.assertAlmostEqual(
+                metrics["auroc"],
+                roc_auc_score(one_hot, self.prediction_probabilities, average="macro")
+            )
+            self.assertAlmostEqual(
+                metrics["auprc"],
+                average_precision_score(
+                    one_hot, self.prediction_probabilities, average="macro"
+                )
+            )
+        # A class without samples is excluded from the averages.
+        metrics = get_one_vs_rest_auroc_and_auprc(
+            self.ground_truth[self.ground_truth != 0],
+            self.prediction_probabilities[self.ground_truth != 0],
+        )
+        self.assertAlmostEqual(
+            metrics["auroc"],
+            roc_auc_score(
+                one_hot[self.ground_truth != 0, 1:],
+                self.prediction_probabilities[self.ground_truth != 0, 1:],
+            )
+        )
+        with self.assertRaises(ValueError):
+            get_one_vs_rest_auroc_and_auprc(
+                self.ground_truth, self.prediction_probabilities[:, 0]
+            )
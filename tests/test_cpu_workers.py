@@ -0,0 +1,46 @@
+"""Unit test class for the training of the TensorFlow embedders on multiple CPU workers."""
+try:
+    from unittest import TestCase
+
+    from ensmallen import Graph
+    from embiggen.embedders.tensorflow_embedders.first_order_line import FirstOrderLINETensorFlow
+    from embiggen.embedders.tensorflow_embedders.skipgram import SkipGramTensorFlow
+
+    class TestCPUWorkers(TestCase):
+        """Unit test class for the training of the TensorFlow embedders on multiple CPU workers."""
+
+        def setUp(self):
+            """Setup objects for running tests on the CPU workers."""
+            self.graph = Graph.from_csv(
+                edge_path="tests/data/small_ppi.tsv",
+                sources_column_number=0,
+                destinations_column_number=1,
+                weights_column_number=2,
+                directed=False,
+                name="PPI",
+            )
+
+        def test_cpu_workers(self):
+            """Test that the models are trained on worker processes after other models."""
+            for model_class in (SkipGramTensorFlow, FirstOrderLINETensorFlow):
+                # A model trained in this process before the workers are used.
+                model_class(embedding_size=5, epochs=1).fit_transform(self.graph)
+                model = model_class(embedding_size=5, epochs=2, number_of_cpu_workers=2)
+                embedding = model.fit_transform(self.graph)
+                self.assertEqual(
+                    embedding.get_all_node_embedding()[0].shape,
+                    (self.graph.get_number_of_nodes(), 5)
+                )
+                self.assertGreater(model.get_training_throughput_of_last_embedding(), 0)
+
+        def test_invalid_cpu_workers(self):
+            """Test that the CPU workers cannot be combined with the checkpoints."""
+            with self.assertRaises(ValueError):
+                SkipGramTensorFlow(number_of_cpu_workers=0)
+            with self.assertRaises(ValueError):
+                SkipGramTensorFlow(
+                    number_of_cpu_workers=2,
+                    checkpoint_directory="checkpoints"
+                )
+except ModuleNotFoundError:
+    pass
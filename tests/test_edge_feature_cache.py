@@ -0,0 +1,139 @@
+"""Unit test class for the edge feature cache."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction
+from embiggen.embedders.ensmallen_embedders.hyper_sketching import HyperSketching
+from embiggen.utils import EdgeFeatureCache
+from embiggen.utils.holdout_cache import HoldoutCache
+
+
+class CountingHyperSketching(HyperSketching):
+    """HyperSketching counting how many times the sketches are computed."""
+
+    number_of_calls = 0
+
+    def get_edge_feature_from_graph(self, graph, support):
+        CountingHyperSketching.number_of_calls += 1
+        return super().get_edge_feature_from_graph(graph=graph, support=support)
+
+    def get_edge_feature_from_edge_node_ids(self, support, sources, destinations):
+        CountingHyperSketching.number_of_calls += 1
+        return super().get_edge_feature_from_edge_node_ids(
+            support=support, sources=sources, destinations=destinations
+        )
+
+
+class TestEdgeFeatureCache(TestCase):
+    """Unit test class for the edge feature cache."""
+
+    def setUp(self):
+        """Setup objects for running tests on the edge feature cache."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        self.train, self.test = self.graph.connected_holdout(
+            train_size=0.8, random_state=42, verbose=False
+        )
+        self.sketching = CountingHyperSketching(number_of_hops=2)
+        self.sketching.fit(self.train)
+        CountingHyperSketching.number_of_calls = 0
+
+    def test_memoization_and_spill(self):
+        """Test that the features are computed once and spilled past the cap."""
+        cache = EdgeFeatureCache(maximal_memory=0)
+        expected = self.sketching.get_edge_feature_from_graph(
+            graph=self.test, support=self.train
+        )
+        for _ in range(2):
+            for graph in (self.test, self.train):
+                features = cache.get_edge_feature_from_graph(
+                    edge_feature=self.sketching, graph=graph, support=self.train
+                )
+        self.assertEqual(CountingHyperSketching.number_of_calls, 3)
+        self.assertEqual(cache.get_number_of_entries(), 2)
+        # With a null memory cap, all but the last used entry are on disk.
+        self.assertEqual(cache.get_number_of_spilled_entries(), 1)
+        features = cache.get_edge_feature_from_graph(
+            edge_feature=self.sketching, graph=self.test, support=self.train
+        )
+        for name, feature in expected.items():
+            self.assertIsInstance(features[name], np.memmap)
+            self.assertFalse(features[name].flags.writeable)
+            self.assertTrue(np.array_equal(features[name], feature))
+
+        sources = self.test.get_directed_source_node_ids()
+        destinations = self.test.get_directed_destination_node_ids()
+        for _ in range(2):
+            cache.get_edge_feature_from_edge_node_ids(
+                edge_feature=self.sketching,
+                support=self.train,
+                sources=sources,
+                destinations=destinations,
+            )
+        self.assertEqual(CountingHyperSketching.number_of_calls, 4)
+
+        with self.assertRaises(ValueError):
+            EdgeFeatureCache(maximal_memory=-1)
+
+    def test_shared_among_models(self):
+        """Test that models evaluated on the same holdout share the features."""
+        holdout_cache = HoldoutCache()
+        for edge_embedding_methods in ("Hadamard", "Average"):
+            model = DecisionTreeEdgePrediction(
+                edge_embedding_methods=edge_embedding_methods
+            )
+            model._holdout_cache = holdout_cache
+            model.fit(self.train, edge_features=self.sketching)
+            model._holdout_cache = None
+        # The positive and negative training graphs are sketched only once.
+        self.assertEqual(CountingHyperSketching.number_of_calls, 2)
+
+    def test_concurrent_computations(self):
+        """Test that concurrent requests compute each entry once, without blocking the other keys."""
+        cache = EdgeFeatureCache()
+        first_computation_started = threading.Event()
+        release_first_computation = threading.Event()
+        number_of_computations = []
+
+        def slow_compute():
+            number_of_computations.append("slow")
+            first_computation_started.set()
+            release_first_computation.wait()
+            return dict(feature=np.zeros(4))
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            slow_features = [
+                executor.submit(cache._get, ("slow",), self.sketching, slow_compute)
+                for _ in range(2)
+            ]
+            first_computation_started.wait()
+            # Another key is computed while the slow one is still being computed.
+            fast_features = cache._get(
+                ("fast",), self.sketching, lambda: dict(feature=np.ones(4))
+            )
+            self.assertTrue((fast_features["feature"] == 1).all())
+            release_first_computation.set()
+            features = [feature.result() for feature in slow_features]
+
+        self.assertEqual(number_of_computations, ["slow"])
+        self.assertIs(features[0], features[1])
+
+        def failing_compute():
+            raise RuntimeError("Computation failed.")
+
+        with self.assertRaises(RuntimeError):
+            cache._get(("failing",), self.sketching, failing_compute)
+        # A failed computation is not cached, so it can be retried.
+        self.assertEqual(
+            cache._get(("failing",), self.sketching, lambda: dict(feature=np.ones(1)))["feature"][0],
+            1
+        )
@@ -1,6 +1,16 @@
 """Test to ensure that the fastnode2vec integration works as expected."""
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
 from ensmallen.datasets.kgobo import CIO
-from embiggen.embedders.fastnode2vec_embedders.node2vec import Node2VecFastNode2Vec
+from fastnode2vec import Graph as FNGraph
+from embiggen.embedders.fastnode2vec_embedders.node2vec import (
+    Node2VecFastNode2Vec,
+    _build_fastnode2vec_graph,
+)
 
 
 def test_fastnode2vec():
@@ -8,3 +18,81 @@ def test_fastnode2vec():
     graph = CIO()
     model = Node2VecFastNode2Vec()
     _embedding = model.fit_transform(graph)
+
+
+def get_transition_matrix(fn_graph: FNGraph) -> np.ndarray:
+    """Return the dense transition matrix of the walks on the provided graph, indexed by node id."""
+    degrees = np.diff(fn_graph.indptr)
+    sources = np.repeat(np.arange(degrees.size), degrees)
+    if fn_graph.weighted:
+        # The weights are stored as cumulative probabilities.
+        previous = np.concatenate(([0.0], fn_graph.data[:-1]))
+        previous[fn_graph.indptr[:-1][degrees > 0]] = 0.0
+        probabilities = fn_graph.data - previous
+    else:
+        probabilities = 1.0 / degrees[sources]
+    node_ids = fn_graph.node_names.astype(int)
+    transitions = np.zeros((degrees.size, degrees.size))
+    transitions[node_ids[sources], node_ids[fn_graph.indices]] = probabilities
+    return transitions
+
+
+def test_fastnode2vec_graph_conversion():
+    """Test that the graph handed off to fastnode2vec matches the one of its constructor."""
+    graph = Graph.from_csv(
+        edge_path="tests/data/small_ppi.tsv",
+        sources_column_number=0,
+        destinations_column_number=1,
+        weights_column_number=2,
+        directed=False,
+        name="PPI",
+    ).add_selfloops(weight=1.0)
+    for weighted_graph in (graph, graph.remove_edge_weights()):
+        expected = FNGraph(
+            (
+                (*weighted_graph.get_node_ids_from_edge_id(edge_id), 1.0)
+                if not weighted_graph.has_edge_weights()
+                else (
+                    *weighted_graph.get_node_ids_from_edge_id(edge_id),
+                    weighted_graph.get_edge_weight_from_edge_id(edge_id)
+                )
+                for edge_id in range(weighted_graph.get_number_of_directed_edges())
+            ),
+            directed=True,
+            weighted=True,
+            verbose=False,
+        )
+        assert np.allclose(
+            get_transition_matrix(_build_fastnode2vec_graph(weighted_graph)),
+            get_transition_matrix(expected)
+        )
+
+
+def test_fastnode2vec_singletons():
+    """Test that the singleton nodes receive a null embedding."""
+    edges = pd.read_csv("tests/data/small_ppi.tsv", sep="\t")
+    with TemporaryDirectory() as directory:
+        node_path = os.path.join(directory, "nodes.tsv")
+        pd.DataFrame({
+            "node_name": [
+                *pd.unique(pd.concat((edges.subject, edges.object))),
+                "singleton"
+            ]
+        }).to_csv(node_path, sep="\t", index=False)
+        graph = Graph.from_csv(
+            node_path=node_path,
+            nodes_column="node_name",
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            directed=False,
+            name="PPI",
+        )
+    assert graph.has_singleton_nodes()
+    embedding = Node2VecFastNode2Vec(
+        **Node2VecFastNode2Vec.smoke_test_parameters(),
+        number_of_workers=1,
+    ).fit_transform(graph).get_node_embedding_from_index(0)
+    assert embedding.shape == (graph.get_number_of_nodes(), 5)
+    assert (embedding.loc["singleton"] == 0).all()
+    assert (embedding.abs().sum(axis=1) > 0).sum() == graph.get_number_of_nodes() - 1
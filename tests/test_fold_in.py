@@ -0,0 +1,129 @@
+"""Unit test class for the fold-in of new nodes into the embedding models."""
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+from embiggen.utils import EmbeddingResult
+from embiggen.embedders.ensmallen_embedders.hope import HOPEEnsmallen
+from embiggen.embedders.ensmallen_embedders.laplacian_eigenmaps import LaplacianEigenmapsEnsmallen
+from embiggen.embedders.fastnode2vec_embedders.node2vec import Node2VecFastNode2Vec
+
+
+def get_cosine_similarities(first: pd.DataFrame, second: pd.DataFrame) -> np.ndarray:
+    """Returns the cosine similarities of the rows of the provided embeddings."""
+    first = first.to_numpy()
+    second = second.to_numpy()
+    return (first * second).sum(axis=1) / (
+        np.linalg.norm(first, axis=1) * np.linalg.norm(second, axis=1)
+    )
+
+
+class TestFoldIn(TestCase):
+    """Unit test class for the fold-in of new nodes into the embedding models."""
+
+    def setUp(self):
+        """Setup objects for running tests on the fold-in."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        ).remove_disconnected_nodes()
+        self.new_node_names = self.graph.get_node_names()[:5]
+
+    def drop_new_nodes(self, embedding: EmbeddingResult) -> EmbeddingResult:
+        """Returns the provided embedding without the new nodes."""
+        return EmbeddingResult(
+            embedding_method_name=embedding.embedding_method_name,
+            node_embeddings=[
+                node_embedding.drop(index=self.new_node_names)
+                for node_embedding in embedding.get_all_node_embedding()
+            ]
+        )
+
+    def test_neighbours_average(self):
+        """Test that the new nodes are the average of their existing neighbours."""
+        node_names = self.graph.get_node_names()
+        node_embedding = pd.DataFrame(
+            np.random.RandomState(42).normal(size=(len(node_names), 4)),
+            index=node_names,
+        ).drop(index=self.new_node_names)
+        model = LaplacianEigenmapsEnsmallen(embedding_size=4)
+        new_node_embedding = model.fold_in(
+            self.graph,
+            EmbeddingResult(
+                embedding_method_name=model.model_name(),
+                node_embeddings=node_embedding
+            ),
+        ).get_node_embedding_from_index(0)
+
+        self.assertEqual(list(new_node_embedding.index), self.new_node_names)
+        for node_name in self.new_node_names:
+            neighbour_names = self.graph.get_neighbour_node_names_from_node_name(node_name)
+            known_neighbour_names = [
+                neighbour_name
+                for neighbour_name in neighbour_names
+                if neighbour_name in node_embedding.index
+            ]
+            self.assertTrue(np.allclose(
+                new_node_embedding.loc[node_name].values,
+                node_embedding.loc[known_neighbour_names].mean().values,
+            ))
+
+    def test_projection(self):
+        """Test that the projection recovers the vectors of the spectral models."""
+        for model in (
+            HOPEEnsmallen(embedding_size=20, metric="Adjacency"),
+            HOPEEnsmallen(embedding_size=20, metric="Jaccard"),
+            LaplacianEigenmapsEnsmallen(embedding_size=10),
+        ):
+            embedding = model.fit_transform(self.graph)
+            new_node_embeddings = model.fold_in(
+                self.graph,
+                self.drop_new_nodes(embedding),
+                method="projection",
+            ).get_all_node_embedding()
+            for node_embedding, new_node_embedding in zip(
+                embedding.get_all_node_embedding(),
+                new_node_embeddings
+            ):
+                self.assertTrue((get_cosine_similarities(
+                    node_embedding.loc[self.new_node_names],
+                    new_node_embedding.loc[self.new_node_names],
+                ) > 0.95).all())
+
+    def test_local_sgd(self):
+        """Test that the local SGD only computes the vectors of the new nodes."""
+        model = Node2VecFastNode2Vec(
+            embedding_size=8,
+            epochs=2,
+            walk_length=8,
+            window_size=2,
+            number_of_workers=1,
+        )
+        embedding = self.drop_new_nodes(model.fit_transform(self.graph))
+        new_node_embedding = model.fold_in(
+            self.graph,
+            embedding,
+            method="local_sgd",
+            new_node_names=self.new_node_names,
+        ).get_node_embedding_from_index(0)
+        self.assertEqual(list(new_node_embedding.index), self.new_node_names)
+        self.assertEqual(new_node_embedding.shape, (len(self.new_node_names), 8))
+        self.assertTrue(np.isfinite(new_node_embedding.to_numpy()).all())
+
+        with self.assertRaises(ValueError):
+            model.fold_in(self.graph, embedding, method="projection")
+
+        # The models not trained with the skip-gram objective cannot use it.
+        model = LaplacianEigenmapsEnsmallen(embedding_size=4)
+        self.assertFalse(model.can_fold_in_by_local_sgd())
+        with self.assertRaises(ValueError):
+            model.fold_in(
+                self.graph,
+                self.drop_new_nodes(model.fit_transform(self.graph)),
+                method="local_sgd",
+            )
@@ -0,0 +1,102 @@
+"""Unit test class for the Graph Convolution feature preprocessor."""
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.feature_preprocessors import GraphConvolution
+from embiggen.feature_preprocessors.graph_convolution import graph_to_sparse_kernel
+
+
+class TestGraphConvolution(TestCase):
+    """Unit test class for the Graph Convolution feature preprocessor."""
+
+    def setUp(self):
+        """Setup objects for running tests on the Graph Convolution preprocessor."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        random_state = np.random.RandomState(42)
+        self.features = random_state.uniform(
+            size=(self.graph.get_number_of_nodes(), 10)
+        )
+
+    def test_all_hops_in_one_pass(self):
+        """Test that the hops are computed for all kernels and chunks."""
+        kernels = ["Symmetric Normalized Laplacian", "Weighted Left Normalized Laplacian"]
+        preprocessor = GraphConvolution(
+            number_of_convolutions=3,
+            concatenate_features=True,
+            kernels=kernels,
+            number_of_columns_per_chunk=3,
+        )
+        convolved = preprocessor.transform(
+            support=self.graph, node_features=self.features
+        ).get_all_node_embedding()[0]
+
+        self.assertEqual(convolved.dtype, np.float32)
+        self.assertEqual(convolved.shape, (self.graph.get_number_of_nodes(), 10 * 7))
+        self.assertTrue(np.allclose(convolved[:, :10], self.features))
+
+        block = 1
+        for kernel_name in kernels:
+            kernel = graph_to_sparse_kernel(self.graph, kernel_name, dtype=np.float64)
+            hop = self.features
+            for _ in range(3):
+                hop = kernel @ hop
+                self.assertTrue(np.allclose(
+                    convolved[:, block * 10:(block + 1) * 10],
+                    hop,
+                    rtol=1e-4
+                ))
+                block += 1
+
+    def test_last_hop_to_memmap(self):
+        """Test that only the last hop is returned and stored on disk."""
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph_convolution_test.npy")
+            preprocessor = GraphConvolution(
+                number_of_convolutions=2,
+                path=path,
+            )
+            convolved = preprocessor.transform(
+                support=self.graph, node_features=self.features
+            ).get_all_node_embedding()[0]
+            kernel = graph_to_sparse_kernel(self.graph, "Symmetric Normalized Laplacian")
+            self.assertEqual(convolved.shape, self.features.shape)
+            self.assertTrue(np.allclose(
+                np.load(path),
+                kernel @ (kernel @ self.features.astype(np.float32)),
+                rtol=1e-4
+            ))
+            del convolved
+
+    def test_weighted_kernels(self):
+        """Test that the weighted kernels scale the edges of the laplacians by their weights."""
+        kernel = graph_to_sparse_kernel(self.graph, "Left Normalized Laplacian")
+        weighted_kernel = graph_to_sparse_kernel(
+            self.graph,
+            "Weighted Left Normalized Laplacian"
+        )
+        weights = graph_to_sparse_kernel(self.graph, "Weights")
+        self.assertTrue(np.allclose(weighted_kernel.diagonal(), kernel.diagonal()))
+        kernel.setdiag(0)
+        weighted_kernel.setdiag(0)
+        self.assertTrue(np.allclose(
+            weighted_kernel.toarray(),
+            kernel.multiply(weights).toarray()
+        ))
+
+    def test_transposition_is_not_repeated(self):
+        """Test that the transposed kernels cannot be transposed again."""
+        with self.assertRaises(ValueError):
+            GraphConvolution(
+                transpose=True,
+                kernels="Transposed Left Normalized Laplacian"
+            )
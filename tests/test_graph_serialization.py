@@ -0,0 +1,71 @@
+"""Unit test class for the serialization of graphs into CSV files."""
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import pandas as pd
+from ensmallen import Graph
+from embiggen.utils.graph_serialization import dump_graph_to_csv
+
+
+class TestGraphSerialization(TestCase):
+    """Unit test class for the serialization of graphs into CSV files."""
+
+    def setUp(self):
+        """Setup objects for running tests on the serialization of graphs."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        with TemporaryDirectory() as directory:
+            node_path = os.path.join(directory, "nodes.tsv")
+            edge_path = os.path.join(directory, "edges.tsv")
+            pd.DataFrame(dict(
+                name=["a", "b", "c", "d", "e"],
+                node_types=["x|y", "x", "", "z", ""],
+            )).to_csv(node_path, sep="\t", index=False)
+            pd.DataFrame(dict(
+                subject=["a", "b", "c", "a"],
+                object=["b", "c", "a", "d"],
+                edge_type=["k", "", "j", "k"],
+            )).to_csv(edge_path, sep="\t", index=False)
+            self.typed_graph = Graph.from_csv(
+                node_path=node_path,
+                nodes_column_number=0,
+                node_list_node_types_column_number=1,
+                node_types_separator="|",
+                edge_path=edge_path,
+                sources_column_number=0,
+                destinations_column_number=1,
+                edge_list_edge_types_column_number=2,
+                directed=False,
+                name="Typed",
+                verbose=False,
+            )
+
+    def assert_round_trip(self, graph: Graph):
+        """Asserts that the graph loaded back is the same as the provided one."""
+        with TemporaryDirectory() as directory:
+            loaded = Graph.from_csv(**dump_graph_to_csv(graph, directory))
+        self.assertEqual(loaded.hash(), graph.hash())
+        self.assertEqual(loaded.get_name(), graph.get_name())
+        self.assertEqual(loaded.get_node_names(), graph.get_node_names())
+        if graph.has_node_types():
+            self.assertEqual(loaded.get_node_type_names(), graph.get_node_type_names())
+        if graph.has_edge_types():
+            self.assertEqual(
+                loaded.get_unique_edge_type_names(),
+                graph.get_unique_edge_type_names()
+            )
+
+    def test_round_trip(self):
+        """Test that the graphs are loaded back with the same ids, types and weights."""
+        self.assert_round_trip(self.graph)
+        self.assert_round_trip(self.graph.sort_by_decreasing_outbound_node_degree())
+        self.assert_round_trip(self.graph.to_directed())
+        self.assert_round_trip(self.typed_graph)
+        self.assert_round_trip(self.typed_graph.to_directed())
@@ -0,0 +1,145 @@
+"""Unit test class for the matrices shared among the models evaluated on a holdout."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction
+from embiggen.utils.holdout_cache import HoldoutCache
+
+
+class CountingDecisionTreeEdgePrediction(DecisionTreeEdgePrediction):
+    """Decision tree counting how many times the edge embeddings are computed."""
+
+    number_of_calls = 0
+
+    def _trasform_graph_into_edge_embedding(self, *args, **kwargs):
+        CountingDecisionTreeEdgePrediction.number_of_calls += 1
+        return super()._trasform_graph_into_edge_embedding(*args, **kwargs)
+
+
+class TestHoldoutCache(TestCase):
+    """Unit test class for the matrices shared among the models evaluated on a holdout."""
+
+    def setUp(self):
+        """Setup objects for running tests on the holdout cache."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        self.features = np.random.RandomState(42).uniform(
+            size=(self.graph.get_number_of_nodes(), 10)
+        )
+        CountingDecisionTreeEdgePrediction.number_of_calls = 0
+
+    def evaluate(self, models):
+        """Returns the performance of the provided models and the number of embeddings computed."""
+        CountingDecisionTreeEdgePrediction.number_of_calls = 0
+        performance = CountingDecisionTreeEdgePrediction.evaluate(
+            models=models,
+            graph=self.graph,
+            evaluation_schema="Connected Monte Carlo",
+            holdouts_kwargs=dict(train_size=0.8),
+            node_features=self.features,
+            number_of_holdouts=1,
+            verbose=False,
+            enable_top_layer_cache=False,
+        )
+        return performance, CountingDecisionTreeEdgePrediction.number_of_calls
+
+    def test_shared_matrices(self):
+        """Test that models with the same feature settings share the matrices."""
+        single_performance, single_calls = self.evaluate([
+            CountingDecisionTreeEdgePrediction(edge_embedding_methods="Hadamard"),
+        ])
+        shared_performance, shared_calls = self.evaluate([
+            CountingDecisionTreeEdgePrediction(edge_embedding_methods="Hadamard"),
+            CountingDecisionTreeEdgePrediction(
+                edge_embedding_methods="Hadamard",
+                max_depth=3
+            ),
+        ])
+        # The second model only reuses the matrices of the first one.
+        self.assertEqual(single_calls, shared_calls)
+        self.assertEqual(len(shared_performance), 2 * len(single_performance))
+        self.assertTrue(np.allclose(
+            single_performance.auroc.to_numpy(),
+            shared_performance[
+                shared_performance[("model_parameters", "max_depth")] != 3
+            ].auroc.to_numpy()
+        ))
+
+        # Models with different feature settings cannot share the matrices.
+        _, distinct_calls = self.evaluate([
+            CountingDecisionTreeEdgePrediction(edge_embedding_methods="Hadamard"),
+            CountingDecisionTreeEdgePrediction(edge_embedding_methods="Average"),
+        ])
+        self.assertEqual(distinct_calls, 2 * single_calls)
+
+    def test_prediction_memory_cap(self):
+        """Test that the prediction batches are only kept up to the memory cap."""
+        batches = [np.zeros(16) for _ in range(3)]
+        holdout_cache = HoldoutCache(maximal_prediction_memory=2 * batches[0].nbytes)
+        for key, batch in enumerate(batches):
+            value = holdout_cache.get(
+                ("predict", key),
+                lambda: batch,
+                is_prediction_batch=True
+            )
+            self.assertFalse(value.flags.writeable)
+        # The least recently used batch is dropped.
+        self.assertEqual(holdout_cache.get_keys(), (("predict", 1), ("predict", 2)))
+        self.assertEqual(holdout_cache.get_prediction_memory_usage(), 2 * batches[0].nbytes)
+
+        # The training matrices are not subject to the cap.
+        holdout_cache.get(("fit",), lambda: np.zeros(1024))
+        self.assertIn(("fit",), holdout_cache.get_keys())
+
+        # With a zero cap, the prediction batches are never cached.
+        holdout_cache = HoldoutCache(maximal_prediction_memory=0)
+        holdout_cache.get(("predict", 0), lambda: batches[0], is_prediction_batch=True)
+        self.assertEqual(holdout_cache.get_keys(), ())
+
+        with self.assertRaises(ValueError):
+            HoldoutCache(maximal_prediction_memory=-1)
+
+    def test_concurrent_builds(self):
+        """Test that concurrent requests build each value once, without blocking the other keys."""
+        holdout_cache = HoldoutCache()
+        first_build_started = threading.Event()
+        release_first_build = threading.Event()
+        number_of_builds = []
+
+        def slow_builder():
+            number_of_builds.append("slow")
+            first_build_started.set()
+            release_first_build.wait()
+            return np.zeros(4)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            slow_values = [
+                executor.submit(holdout_cache.get, ("slow",), slow_builder)
+                for _ in range(2)
+            ]
+            first_build_started.wait()
+            # Another key is built while the slow one is still being built.
+            fast_value = holdout_cache.get(("fast",), lambda: np.ones(4))
+            self.assertTrue((fast_value == 1).all())
+            release_first_build.set()
+            values = [value.result() for value in slow_values]
+
+        self.assertEqual(number_of_builds, ["slow"])
+        self.assertIs(values[0], values[1])
+
+        def failing_builder():
+            raise RuntimeError("Build failed.")
+
+        with self.assertRaises(RuntimeError):
+            holdout_cache.get(("failing",), failing_builder)
+        # A failed build is not cached, so it can be retried.
+        self.assertTrue((holdout_cache.get(("failing",), lambda: np.ones(1)) == 1).all())
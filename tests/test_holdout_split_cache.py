@@ -0,0 +1,64 @@
+"""Unit test class for the holdout split cache."""
+import os
+from glob import glob
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction
+
+
+class TestHoldoutSplitCache(TestCase):
+    """Unit test class for the holdout split cache."""
+
+    def setUp(self):
+        """Setup objects for running tests on the holdout split cache."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+
+    def test_splits_are_rebuilt_from_disk(self):
+        """Test that the cached splits match the ones computed from scratch."""
+        with TemporaryDirectory() as cache_dir:
+            for graph, evaluation_schema, holdouts_kwargs in (
+                (self.graph, "Connected Monte Carlo", dict(train_size=0.8)),
+                (self.graph, "Monte Carlo", dict(train_size=0.7)),
+                (self.graph, "Kfold", dict()),
+                (self.graph.to_directed(), "Monte Carlo", dict(train_size=0.7)),
+            ):
+                splits = [
+                    DecisionTreeEdgePrediction._split_graph_following_evaluation_schema_with_cache(
+                        graph=graph,
+                        evaluation_schema=evaluation_schema,
+                        random_state=42,
+                        holdout_number=1,
+                        number_of_holdouts=3,
+                        enable_cache=True,
+                        cache_dir=cache_dir,
+                        **holdouts_kwargs,
+                    )
+                    for _ in range(2)
+                ]
+                expected = DecisionTreeEdgePrediction.split_graph_following_evaluation_schema(
+                    graph=graph,
+                    evaluation_schema=evaluation_schema,
+                    random_state=42,
+                    holdout_number=1,
+                    number_of_holdouts=3,
+                    **holdouts_kwargs,
+                )
+                for split in splits:
+                    for partition, expected_partition in zip(split, expected):
+                        self.assertEqual(partition.hash(), expected_partition.hash())
+                        self.assertEqual(partition.get_name(), expected_partition.get_name())
+
+            paths = glob(os.path.join(cache_dir, "**", "*.npz"), recursive=True)
+            self.assertEqual(len(paths), 4)
+            with np.load(paths[0]) as split:
+                self.assertEqual(split["train"].dtype, np.uint32)
@@ -0,0 +1,114 @@
+"""Unit test class for the hyperparameter search."""
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction, RandomForestEdgePrediction
+from embiggen.utils import hyperparameter_search, get_hyperparameter_search_trials
+
+
+class TestHyperparameterSearch(TestCase):
+    """Unit test class for the hyperparameter search."""
+
+    def setUp(self):
+        """Setup objects for running tests on the hyperparameter search."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        self.kwargs = dict(
+            model_class=DecisionTreeEdgePrediction,
+            parameter_space=dict(
+                max_depth=[1, 5],
+                edge_embedding_methods=["Hadamard", "Average"],
+            ),
+            evaluation_schema="Connected Monte Carlo",
+            holdouts_kwargs=dict(train_size=0.8),
+            graphs=self.graph,
+            node_features=np.random.RandomState(42).uniform(
+                size=(self.graph.get_number_of_nodes(), 10)
+            ),
+            number_of_holdouts=2,
+            verbose=False,
+        )
+
+    def test_trials(self):
+        """Test the parameters of the trials of the search strategies."""
+        space = dict(a=[1, 2, 3], b=["x", "y"])
+        self.assertEqual(len(get_hyperparameter_search_trials(space)), 6)
+        self.assertEqual(
+            get_hyperparameter_search_trials(space)[1], dict(a=1, b="y")
+        )
+        random_trials = get_hyperparameter_search_trials(
+            space, search_strategy="random", number_of_trials=4
+        )
+        self.assertEqual(len(random_trials), 4)
+        self.assertEqual(
+            random_trials,
+            get_hyperparameter_search_trials(
+                space, search_strategy="random", number_of_trials=4
+            )
+        )
+        for kwargs in (
+            dict(parameter_space=dict()),
+            dict(parameter_space=dict(a=[])),
+            dict(parameter_space=space, number_of_trials=2),
+            dict(parameter_space=space, search_strategy="random"),
+            dict(parameter_space=space, search_strategy="random", number_of_trials=7),
+        ):
+            with self.assertRaises(ValueError):
+                get_hyperparameter_search_trials(**kwargs)
+
+    def test_grid_search(self):
+        """Test that concurrent trials match the sequential ones."""
+        sequential = hyperparameter_search(number_of_threads=1, **self.kwargs)
+        concurrent = hyperparameter_search(number_of_threads=4, **self.kwargs)
+        self.assertEqual(sorted(set(sequential.trial_number)), [0, 1, 2, 3])
+        self.assertEqual(len(sequential), 4 * 2 * 2)
+        for performance in (sequential, concurrent):
+            self.assertEqual(
+                list(performance.trial_number),
+                sorted(performance.trial_number)
+            )
+        self.assertTrue(np.allclose(sequential.auroc, concurrent.auroc))
+        trial = sequential[sequential.trial_number == 1]
+        self.assertTrue((trial[("model_parameters", "max_depth")] == 5).all())
+
+    def test_successive_halving(self):
+        """Test that the successive halving races the trials."""
+        performance = hyperparameter_search(
+            search_strategy="successive halving",
+            number_of_trials=2,
+            **{**self.kwargs, "number_of_holdouts": 4}
+        )
+        self.assertIn("racing_eliminated", performance.columns)
+        self.assertEqual(sorted(set(performance.trial_number)), [0, 1])
+
+    def test_thread_budget(self):
+        """Test that the threads are split among the concurrent trials."""
+        kwargs = dict(
+            self.kwargs,
+            model_class=RandomForestEdgePrediction,
+            parameter_space=dict(n_estimators=[2, 4]),
+            number_of_holdouts=1,
+        )
+        performance = hyperparameter_search(number_of_threads=4, **kwargs)
+        self.assertTrue((performance[("model_parameters", "n_jobs")] == 2).all())
+        performance = hyperparameter_search(
+            number_of_threads=4,
+            number_of_concurrent_trials=1,
+            **kwargs
+        )
+        self.assertTrue((performance[("model_parameters", "n_jobs")] == 4).all())
+
+        for invalid_kwargs in (
+            dict(number_of_threads=0),
+            dict(number_of_threads=2, number_of_concurrent_trials=3),
+            dict(parameter_space=dict(n_estimators=[2], n_jobs=[1, 2])),
+        ):
+            with self.assertRaises(ValueError):
+                hyperparameter_search(**{**kwargs, **invalid_kwargs})
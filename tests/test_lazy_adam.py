@@ -0,0 +1,56 @@
+"""Unit test class for the LazyAdam optimizer."""
+try:
+    from unittest import TestCase
+
+    import numpy as np
+    import tensorflow as tf
+    from embiggen.utils.tensorflow_optimizers import LazyAdam, get_tensorflow_optimizer
+
+    class TestLazyAdam(TestCase):
+        """Unit test class for the LazyAdam optimizer."""
+
+        def test_lazy_adam(self):
+            """Test that only the rows in the batch are updated."""
+            self.assertIsInstance(get_tensorflow_optimizer("lazy_adam"), LazyAdam)
+            self.assertEqual(get_tensorflow_optimizer("adam"), "adam")
+
+            initial = np.random.RandomState(42).normal(size=(10, 4)).astype(np.float32)
+            lazy = tf.Variable(initial)
+            dense = tf.Variable(initial)
+            lazy_optimizer = LazyAdam(learning_rate=0.1)
+            dense_optimizer = tf.keras.optimizers.Adam(learning_rate=0.1)
+            indices = tf.constant([1, 3, 3])
+
+            for variable, optimizer in ((lazy, lazy_optimizer), (dense, dense_optimizer)):
+                with tf.GradientTape() as tape:
+                    loss = tf.reduce_sum(tf.gather(variable, indices) ** 2)
+                optimizer.apply_gradients(
+                    [(tape.gradient(loss, variable), variable)]
+                )
+
+            # On the first step the moments of the other rows are zero,
+            # so the two optimizers must agree.
+            self.assertTrue(np.allclose(lazy.numpy(), dense.numpy(), atol=1e-6))
+            untouched = [0, 2, 4, 5, 6, 7, 8, 9]
+            self.assertTrue(np.allclose(lazy.numpy()[untouched], initial[untouched]))
+
+        def test_lazy_adam_later_steps(self):
+            """Test that the rows out of the batch are not updated by the later steps."""
+            variable = tf.Variable(
+                np.random.RandomState(42).normal(size=(10, 4)).astype(np.float32)
+            )
+            optimizer = LazyAdam(learning_rate=0.1)
+            for indices in ([1, 3], [5, 7], [5]):
+                before = variable.numpy()
+                with tf.GradientTape() as tape:
+                    loss = tf.reduce_sum(tf.gather(variable, indices) ** 2)
+                optimizer.apply_gradients(
+                    [(tape.gradient(loss, variable), variable)]
+                )
+                untouched = [i for i in range(10) if i not in indices]
+                # With Adam, the rows 1 and 3 would keep moving on their
+                # decayed moments during the second and third steps.
+                self.assertTrue(np.allclose(variable.numpy()[untouched], before[untouched]))
+                self.assertFalse(np.allclose(variable.numpy()[indices], before[indices]))
+except ModuleNotFoundError:
+    pass
@@ -0,0 +1,67 @@
+"""Unit test class for the racing of the models during the evaluation."""
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction
+
+
+class TestModelRacing(TestCase):
+    """Unit test class for the racing of the models during the evaluation."""
+
+    def setUp(self):
+        """Setup objects for running tests on the racing of the models."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        self.kwargs = dict(
+            models=[
+                DecisionTreeEdgePrediction(use_edge_metrics=True),
+                DecisionTreeEdgePrediction(max_depth=1),
+            ],
+            graph=self.graph,
+            evaluation_schema="Connected Monte Carlo",
+            holdouts_kwargs=dict(train_size=0.8),
+            node_features=np.random.RandomState(42).uniform(
+                size=(self.graph.get_number_of_nodes(), 10)
+            ),
+            number_of_holdouts=4,
+            verbose=False,
+            enable_top_layer_cache=False,
+        )
+
+    def test_dominated_models_are_eliminated(self):
+        """Test that the dominated model is only evaluated on the first holdouts."""
+        performance = DecisionTreeEdgePrediction.evaluate(
+            racing_metric="auroc",
+            **self.kwargs
+        )
+        holdouts = {
+            max_depth: sorted(set(model_performance.holdout_number))
+            for max_depth, model_performance in performance.groupby(
+                performance[("model_parameters", "max_depth")]
+            )
+        }
+        # One of the two models is clearly dominated after the first rung.
+        self.assertEqual(sorted(holdouts.values()), [[0, 1], [0, 1, 2, 3]])
+        eliminated = performance[performance.racing_eliminated]
+        self.assertEqual(sorted(set(eliminated.holdout_number)), [0, 1])
+        self.assertTrue((eliminated.racing_eliminated_after_holdouts == 2).all())
+        survivor = performance[~performance.racing_eliminated]
+        self.assertEqual(sorted(set(survivor.holdout_number)), [0, 1, 2, 3])
+        self.assertTrue(survivor.racing_eliminated_after_holdouts.isna().all())
+
+    def test_invalid_racing_parameters(self):
+        """Test that invalid racing parameters are rejected."""
+        for kwargs in (
+            dict(racing_metric="hamming_loss"),
+            dict(racing_metric="auroc", racing_minimum_holdouts=1),
+            dict(racing_metric="auroc", racing_p_value_threshold=0.0),
+        ):
+            with self.assertRaises(ValueError):
+                DecisionTreeEdgePrediction.evaluate(**kwargs, **self.kwargs)
@@ -0,0 +1,103 @@
+"""Unit test class for the nested negative sampling in edge prediction evaluation."""
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction, edge_prediction_evaluation
+
+
+class TestNestedNegativeSampling(TestCase):
+    """Unit test class for the nested negative sampling in edge prediction evaluation."""
+
+    def setUp(self):
+        """Setup a trained model on a holdout of a small graph."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        self.train, self.test = self.graph.connected_holdout(
+            train_size=0.8, random_state=42, verbose=False
+        )
+        self.features = np.random.RandomState(42).uniform(
+            size=(self.graph.get_number_of_nodes(), 10)
+        )
+        self.model = DecisionTreeEdgePrediction(edge_embedding_methods="Hadamard")
+        self.model.fit(self.train, node_features=self.features)
+
+    def evaluate(self, **kwargs):
+        """Return the performance of the model on the holdout."""
+        return self.model._evaluate(
+            graph=self.graph,
+            train=self.train,
+            test=self.test,
+            support=self.train,
+            node_features=self.features,
+            verbose=False,
+            **kwargs
+        )
+
+    def test_nested_negative_sampling(self):
+        """Test that the smaller unbalance rates are evaluated on prefixes."""
+        negative_graphs = DecisionTreeEdgePrediction._prepare_evaluation(
+            graph=self.graph,
+            train=self.train,
+            test=self.test,
+            support=self.train,
+            verbose=False,
+            validation_unbalance_rates=(1.0, 3.0),
+            nested_negative_sampling=True,
+        )["negative_graphs"]
+        self.assertEqual(len(negative_graphs), 1)
+
+        nested_performance = self.evaluate(
+            negative_graphs=negative_graphs,
+            validation_unbalance_rates=(1.0, 3.0),
+            nested_negative_sampling=True,
+        )
+        self.assertEqual(
+            [
+                (performance["evaluation_mode"], performance["validation_unbalance_rate"])
+                for performance in nested_performance
+            ],
+            [("train", 1.0), ("test", 1.0), ("train", 3.0), ("test", 3.0)]
+        )
+
+        # The largest unbalance rate uses all of the negative edges.
+        performance = self.evaluate(
+            negative_graphs=negative_graphs,
+            validation_unbalance_rates=(3.0,),
+        )
+        for nested, expected in zip(nested_performance[2:], performance):
+            for metric in ("accuracy", "f1_score", "prevalence"):
+                self.assertAlmostEqual(nested[metric], expected[metric])
+
+        # While the smaller ones use a third of them.
+        number_of_positives = self.test.get_number_of_directed_edges()
+        number_of_negatives = int(np.ceil(
+            negative_graphs[0][1].get_number_of_directed_edges() / 3
+        ))
+        self.assertAlmostEqual(
+            nested_performance[1]["prevalence"],
+            number_of_positives / (number_of_positives + number_of_negatives)
+        )
+
+    def test_nested_negative_sampling_evaluation(self):
+        """Test that the evaluation pipeline forwards the nested negative sampling."""
+        holdouts = edge_prediction_evaluation(
+            holdouts_kwargs=dict(train_size=0.8),
+            graphs=self.graph,
+            models=DecisionTreeEdgePrediction(edge_embedding_methods="Hadamard"),
+            node_features=self.features,
+            number_of_holdouts=1,
+            validation_unbalance_rates=(1.0, 3.0),
+            nested_negative_sampling=True,
+            verbose=False,
+        )
+        self.assertEqual(
+            sorted(zip(holdouts.evaluation_mode, holdouts.validation_unbalance_rate)),
+            [("test", 1.0), ("test", 3.0), ("train", 1.0), ("train", 3.0)]
+        )
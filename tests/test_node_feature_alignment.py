@@ -0,0 +1,102 @@
+"""Unit test class for the alignment of the node features."""
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction
+from embiggen.utils.node_feature_alignment import (
+    align_node_feature,
+    get_node_feature_alignment,
+)
+
+
+class TestNodeFeatureAlignment(TestCase):
+    """Unit test class for the alignment of the node features."""
+
+    def setUp(self):
+        """Setup shuffled node features of a small graph."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        node_names = self.graph.get_node_names()
+        self.node_features = pd.DataFrame(
+            np.random.RandomState(42).uniform(size=(len(node_names), 5)),
+            index=node_names,
+        ).sample(frac=1.0, random_state=42)
+
+    def test_alignment(self):
+        """Test that the shuffled node features are aligned to the holdouts."""
+        expected = self.node_features.loc[self.graph.get_node_names()].to_numpy()
+        self.assertTrue(np.array_equal(
+            align_node_feature(self.node_features, self.graph), expected
+        ))
+        train, _ = self.graph.connected_holdout(
+            train_size=0.8, random_state=42, verbose=False
+        )
+        self.assertTrue(np.array_equal(
+            DecisionTreeEdgePrediction.normalize_node_features(
+                graph=train,
+                support=train,
+                random_state=42,
+                node_features=self.node_features,
+            )[0],
+            expected
+        ))
+
+    def test_evaluation(self):
+        """Test that the evaluation aligns the shuffled node features."""
+        performance = [
+            DecisionTreeEdgePrediction.evaluate(
+                models=DecisionTreeEdgePrediction(),
+                graph=self.graph,
+                evaluation_schema="Connected Monte Carlo",
+                holdouts_kwargs=dict(train_size=0.8),
+                node_features=node_features,
+                number_of_holdouts=2,
+                verbose=False,
+                enable_top_layer_cache=False,
+            ).auroc.to_numpy()
+            for node_features in (
+                self.node_features,
+                self.node_features.loc[self.graph.get_node_names()].to_numpy(),
+            )
+        ]
+        self.assertTrue(np.allclose(*performance))
+
+    def test_invalid_index(self):
+        """Test that the indices not matching the nodes are rejected."""
+        with self.assertRaises(ValueError):
+            get_node_feature_alignment(self.node_features.index[1:], self.graph)
+        with self.assertRaises(ValueError):
+            get_node_feature_alignment(
+                self.node_features.index.append(self.node_features.index[:1]),
+                self.graph
+            )
+
+    def test_subgraph_of_interest_node_ids(self):
+        """Test that the node ids of the subgraph of interest match its mapping."""
+        subgraph = self.graph.filter_from_ids(
+            node_ids_to_remove=list(range(0, self.graph.get_number_of_nodes(), 3))
+        )
+        node_ids = DecisionTreeEdgePrediction._get_subgraph_of_interest_node_ids(
+            graph=self.graph,
+            subgraph_of_interest=subgraph,
+        )
+        train, _ = self.graph.connected_holdout(
+            train_size=0.8, random_state=42, verbose=False
+        )
+        filtered_train = train.filter_from_ids(node_ids_to_keep=node_ids)
+        self.assertEqual(
+            filtered_train.get_node_names(),
+            train.filter_from_names(node_names_to_keep_from_graph=subgraph).get_node_names()
+        )
+        self.assertTrue(np.array_equal(
+            filtered_train.get_node_ids_mapping_from_graph(self.graph),
+            node_ids
+        ))
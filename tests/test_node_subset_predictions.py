@@ -0,0 +1,85 @@
+"""Unit test class for node-label predictions on a subset of the nodes."""
+import os
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+from embiggen.node_label_prediction import DecisionTreeNodeLabelPrediction
+
+
+class TestNodeSubsetPredictions(TestCase):
+    """Unit test class for node-label predictions on a subset of the nodes."""
+
+    def setUp(self):
+        """Setup a small labelled graph with random node features."""
+        edges = pd.read_csv("tests/data/small_ppi.tsv", sep="\t")
+        node_names = np.unique(edges.iloc[:, :2].values.astype(str))
+        random_state = np.random.RandomState(42)
+        self.node_path = "node_subset_predictions_nodes.tsv"
+        pd.DataFrame({
+            "name": node_names,
+            "type": random_state.choice(["red", "blue", "green"], size=node_names.size),
+        }).to_csv(self.node_path, sep="\t", index=False)
+        self.graph = Graph.from_csv(
+            node_path=self.node_path,
+            nodes_column="name",
+            node_list_node_types_column="type",
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            directed=False,
+            name="PPI",
+        )
+        self.features = random_state.uniform(
+            size=(self.graph.get_number_of_nodes(), 10)
+        )
+
+    def tearDown(self):
+        """Remove the node list."""
+        os.remove(self.node_path)
+
+    def test_predict_proba_on_node_subset(self):
+        """Test that the subset predictions match the full ones."""
+        model = DecisionTreeNodeLabelPrediction()
+        model.fit(self.graph, node_features=self.features)
+        node_ids = np.array([10, 3, 500, 3])
+        self.assertTrue(np.allclose(
+            model.predict_proba(self.graph, node_features=self.features, node_ids=node_ids),
+            model.predict_proba(self.graph, node_features=self.features)[node_ids],
+        ))
+        with self.assertRaises(ValueError):
+            model.predict_proba(
+                self.graph,
+                node_features=self.features,
+                node_ids=np.array([self.graph.get_number_of_nodes()])
+            )
+
+    def test_evaluation_on_labelled_nodes(self):
+        """Test that the evaluation scores the known nodes of each partition."""
+        train, test = self.graph.get_node_label_holdout_graphs(train_size=0.7)
+        model = DecisionTreeNodeLabelPrediction()
+        model.fit(train, node_features=self.features)
+        performance = model._evaluate(
+            graph=self.graph,
+            train=train,
+            test=test,
+            node_features=self.features,
+        )
+        self.assertEqual(
+            [(p["evaluation_mode"], p["known_nodes_number"]) for p in performance],
+            [
+                ("train", train.get_number_of_known_node_types()),
+                ("test", test.get_number_of_known_node_types()),
+            ]
+        )
+        labels = self.graph.get_single_label_node_type_ids()
+        for evaluation_graph, evaluation in zip((train, test), performance):
+            mask = evaluation_graph.get_known_node_types_mask()
+            predictions = model.predict_proba(
+                evaluation_graph, node_features=self.features
+            ).argmax(axis=-1)[mask]
+            self.assertEqual(
+                evaluation["accuracy_score"],
+                (predictions == labels[mask]).mean()
+            )
@@ -0,0 +1,104 @@
+"""Unit test class for the profiling of the evaluation pipelines."""
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction
+from embiggen.utils import Profiler
+
+
+class TestProfiler(TestCase):
+    """Unit test class for the profiling of the evaluation pipelines."""
+
+    def setUp(self):
+        """Setup objects for running tests on the profiler."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+
+    def test_spans(self):
+        """Test that the spans are measured and aggregated by phase."""
+        profiler = Profiler()
+        for _ in range(2):
+            with profiler.span("allocating", size=2**20) as span:
+                np.ones(2**20)
+        self.assertGreaterEqual(span.wall_time, 0.0)
+        self.assertGreaterEqual(span.number_of_threads, 1)
+        first_span = profiler.get_number_of_spans()
+        with profiler.span("sleeping"):
+            pass
+        self.assertEqual(set(profiler.get_metadata(first_span=first_span)), {
+            "sleeping_wall_time",
+            "sleeping_cpu_time",
+            "sleeping_peak_rss_delta",
+            "sleeping_number_of_threads",
+        })
+        metadata = profiler.get_metadata()
+        self.assertGreaterEqual(metadata["allocating_wall_time"], span.wall_time)
+
+        # The increase is measured even after an earlier phase reached a higher peak.
+        expected_names = ["allocating", "allocating", "sleeping"]
+        if span.peak_rss_delta is not None:
+            array = np.ones(2**24)
+            del array
+            with profiler.span("allocating_again") as span:
+                array = np.ones(2**23)
+            del array
+            self.assertGreaterEqual(span.peak_rss_delta, 2**25)
+            expected_names.append("allocating_again")
+
+        with self.assertRaises(ValueError):
+            Profiler(rss_sampling_interval=0.0)
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "traces", "trace.json")
+            profiler.export_chrome_trace(path)
+            with open(path, encoding="utf8") as trace:
+                events = json.load(trace)["traceEvents"]
+        self.assertEqual(
+            [event["name"] for event in events],
+            expected_names
+        )
+        self.assertEqual(events[0]["ph"], "X")
+        self.assertEqual(events[0]["args"]["size"], 2**20)
+
+    def test_evaluation_phases(self):
+        """Test that the phases of an evaluation are reported."""
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            performance = DecisionTreeEdgePrediction.evaluate(
+                models=DecisionTreeEdgePrediction(),
+                graph=self.graph,
+                evaluation_schema="Connected Monte Carlo",
+                holdouts_kwargs=dict(train_size=0.8),
+                node_features=np.random.RandomState(42).uniform(
+                    size=(self.graph.get_number_of_nodes(), 10)
+                ),
+                number_of_holdouts=1,
+                verbose=False,
+                enable_top_layer_cache=False,
+                chrome_trace_path=path,
+            )
+            with open(path, encoding="utf8") as trace:
+                names = {event["name"] for event in json.load(trace)["traceEvents"]}
+
+        for phase in (
+            "splitting_holdout",
+            "preparing_evaluation",
+            "training",
+            "evaluation",
+            "predicting_positive_edges",
+            "predicting_negative_edges_at_unbalance_rate_1",
+            "computing_metrics",
+        ):
+            self.assertIn(phase, names)
+            for measure in ("wall_time", "cpu_time", "peak_rss_delta", "number_of_threads"):
+                self.assertIn(f"{phase}_{measure}", performance.columns)
@@ -0,0 +1,102 @@
+"""Unit test class for the streaming results sink."""
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction
+from embiggen.utils import ResultsSink
+
+
+class CountingDecisionTreeEdgePrediction(DecisionTreeEdgePrediction):
+    """Decision tree counting how many times it is trained."""
+
+    number_of_fits = 0
+
+    def _fit(self, *args, **kwargs):
+        CountingDecisionTreeEdgePrediction.number_of_fits += 1
+        return super()._fit(*args, **kwargs)
+
+
+class TestResultsSink(TestCase):
+    """Unit test class for the streaming results sink."""
+
+    def setUp(self):
+        """Setup objects for running tests on the results sink."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        self.features = np.random.RandomState(42).uniform(
+            size=(self.graph.get_number_of_nodes(), 10)
+        )
+
+    def test_append_and_query(self):
+        """Test that the stored performance is retrieved and filtered."""
+        with TemporaryDirectory() as directory:
+            sink = ResultsSink(os.path.join(directory, "results.db"))
+            self.assertTrue(sink.query().empty)
+            for holdout_number in range(3):
+                sink.append(
+                    unit_key=f"unit_{holdout_number}",
+                    experiment_key="experiment",
+                    holdout_number=holdout_number,
+                    performance=pd.DataFrame(
+                        dict(
+                            task_name=["Edge Prediction"] * 2,
+                            graph_name=["PPI"] * 2,
+                            model_name=["Decision Tree"] * 2,
+                            library_name=["scikit-learn"] * 2,
+                            accuracy=[0.5, np.float32(0.75)],
+                            edge_embedding_methods=[("Hadamard",), ("Average",)],
+                        )
+                    ),
+                )
+            self.assertTrue(sink.has_unit("unit_1"))
+            self.assertFalse(sink.has_unit("unit_3"))
+            self.assertEqual(len(sink.query()), 6)
+            performance = sink.query(holdout_number=2, model_name="Decision Tree")
+            self.assertEqual(len(performance), 2)
+            self.assertEqual(list(performance.accuracy), [0.5, 0.75])
+            self.assertTrue(sink.query(graph_name="Cora").empty)
+            self.assertEqual(len(sink.query(unit_keys=["unit_0", "unit_2"])), 4)
+            with self.assertRaises(ValueError):
+                sink.query(accuracy=0.5)
+
+    def test_resume_evaluation(self):
+        """Test that a resumed evaluation skips the stored units."""
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.db")
+            kwargs = dict(
+                models=CountingDecisionTreeEdgePrediction(),
+                graph=self.graph,
+                evaluation_schema="Connected Monte Carlo",
+                holdouts_kwargs=dict(train_size=0.8),
+                node_features=self.features,
+                number_of_holdouts=2,
+                verbose=False,
+                results_sink=path,
+                resume=True,
+                enable_top_layer_cache=False,
+            )
+            performance = CountingDecisionTreeEdgePrediction.evaluate(**kwargs)
+            self.assertEqual(CountingDecisionTreeEdgePrediction.number_of_fits, 2)
+            self.assertEqual(len(ResultsSink(path).query()), len(performance))
+
+            resumed_performance = CountingDecisionTreeEdgePrediction.evaluate(**kwargs)
+            self.assertEqual(CountingDecisionTreeEdgePrediction.number_of_fits, 2)
+            self.assertEqual(
+                list(resumed_performance.accuracy),
+                list(performance.accuracy)
+            )
+
+            with self.assertRaises(ValueError):
+                CountingDecisionTreeEdgePrediction.evaluate(
+                    **{**kwargs, "results_sink": None}
+                )
@@ -0,0 +1,49 @@
+"""Unit test class for the parameters shared in memory among worker processes."""
+from unittest import TestCase
+
+import numpy as np
+from embiggen.utils.shared_parameters import SharedParameters
+
+
+class TestSharedParameters(TestCase):
+    """Unit test class for the parameters shared in memory among worker processes."""
+
+    def test_average(self):
+        """Test that the slots are written independently and averaged."""
+        random_state = np.random.RandomState(42)
+        arrays = [
+            random_state.normal(size=(7, 3)).astype(np.float32),
+            np.arange(5, dtype=np.int64),
+        ]
+        shared_parameters = SharedParameters.from_arrays(arrays, number_of_slots=3)
+        try:
+            # A second handle attached by name sees the same memory,
+            # as the one of a worker process would.
+            attached = SharedParameters(**shared_parameters.get_attach_kwargs())
+            other_arrays = [array * 4 for array in arrays]
+            attached.write(2, other_arrays)
+            attached.close()
+
+            self.assertTrue(all(
+                np.array_equal(read, array)
+                for read, array in zip(shared_parameters.read(0), arrays)
+            ))
+            self.assertTrue(all(
+                np.array_equal(read, array)
+                for read, array in zip(shared_parameters.read(2), other_arrays)
+            ))
+            average = shared_parameters.average()
+            self.assertEqual(average[0].dtype, np.float32)
+            self.assertEqual(average[1].dtype, np.int64)
+            self.assertTrue(np.allclose(average[0], arrays[0] * 2))
+            self.assertTrue(np.array_equal(average[1], arrays[1] * 2))
+
+            with self.assertRaises(ValueError):
+                shared_parameters.read(3)
+        finally:
+            shared_parameters.unlink()
+
+        with self.assertRaises(ValueError):
+            SharedParameters(shapes=[(2,)], dtypes=["<f4"], number_of_slots=0)
+        with self.assertRaises(ValueError):
+            SharedParameters(shapes=[(2,)], dtypes=[], number_of_slots=1)
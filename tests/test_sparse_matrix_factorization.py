@@ -0,0 +1,185 @@
+"""Unit test class for the sparse randomized NetMF and GraRep embedders."""
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.embedders.ensmallen_embedders.grarep import GraRepEnsmallen
+from embiggen.embedders.ensmallen_embedders.netmf import NetMFEnsmallen
+from embiggen.utils.sparse_matrix_factorization import (
+    get_adjacency_matrix,
+    get_low_rank_entries,
+    get_reciprocal_sqrt_degrees,
+    get_top_eigenpairs,
+    sample_walk_pairs,
+)
+
+
+def get_dense_embedding(matrix: np.ndarray, embedding_size: int) -> np.ndarray:
+    """Returns the embedding factorizing the provided dense matrix with exact SVD."""
+    U, sigmas, _ = np.linalg.svd(matrix)
+    return U[:, :embedding_size] * np.sqrt(sigmas[:embedding_size])
+
+
+def get_gram_correlation(first: np.ndarray, second: np.ndarray) -> float:
+    """Returns the correlation of the dot products of the provided embeddings."""
+    return np.corrcoef(
+        (first @ first.T).ravel(),
+        (second @ second.T).ravel()
+    )[0, 1]
+
+
+class TestSparseMatrixFactorization(TestCase):
+    """Unit test class for the sparse randomized NetMF and GraRep embedders."""
+
+    def setUp(self):
+        """Setup objects for running tests on the sparse matrix factorizations."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        ).remove_disconnected_nodes()
+        self.adjacency = get_adjacency_matrix(self.graph)
+        dense_adjacency = self.adjacency.toarray()
+        self.degrees = dense_adjacency.sum(axis=1)
+        self.transition = dense_adjacency / self.degrees[:, None]
+
+    def get_dense_netmf_embedding(self, embedding_size: int, order: int) -> np.ndarray:
+        """Returns the exact NetMF embedding, computed with dense matrices."""
+        powers_sum = np.zeros_like(self.transition)
+        power = np.eye(self.transition.shape[0])
+        for _ in range(order):
+            power = power @ self.transition
+            powers_sum += power
+        return get_dense_embedding(
+            np.log(np.maximum(
+                self.degrees.sum() / order * powers_sum / self.degrees[None, :],
+                1.0
+            )),
+            embedding_size
+        )
+
+    def get_dense_grarep_embedding(self, embedding_size: int, order: int) -> np.ndarray:
+        """Returns the exact GraRep embedding, computed with dense matrices."""
+        number_of_nodes = self.transition.shape[0]
+        power = np.eye(number_of_nodes)
+        embeddings = []
+        for _ in range(order):
+            power = power @ self.transition
+            embeddings.append(get_dense_embedding(
+                np.log(np.maximum(
+                    number_of_nodes * power / power.sum(axis=0)[None, :],
+                    1.0
+                )),
+                embedding_size // order
+            ))
+        return np.hstack(embeddings)
+
+    def test_low_rank_powers(self):
+        """Test that the eigenpairs reproduce the powers of the transition matrix on the walk pairs."""
+        reciprocal_sqrt_degrees = get_reciprocal_sqrt_degrees(self.adjacency)
+        # The normalized adjacency matrix of this graph has rank 60.
+        eigenvalues, eigenvectors = get_top_eigenpairs(
+            self.adjacency,
+            reciprocal_sqrt_degrees,
+            rank=64,
+            random_state=42
+        )
+        order = 3
+        rows, columns = sample_walk_pairs(
+            self.adjacency,
+            number_of_samples=1000,
+            minimum_length=order,
+            maximum_length=order,
+            random_state=42
+        )
+        power = np.linalg.matrix_power(self.transition, order)
+        self.assertTrue((power[rows, columns] > 0).all())
+        self.assertTrue(np.allclose(
+            get_low_rank_entries(
+                eigenvectors * reciprocal_sqrt_degrees[:, None] * eigenvalues**order,
+                eigenvectors / reciprocal_sqrt_degrees[:, None],
+                rows,
+                columns
+            ),
+            power[rows, columns]
+        ))
+
+    def test_walk_pairs(self):
+        """Test that the walk pairs are symmetric and optionally include the edges."""
+        rows, columns = sample_walk_pairs(
+            self.adjacency,
+            number_of_samples=1000,
+            minimum_length=1,
+            maximum_length=4,
+            random_state=42,
+            include_edges=True
+        )
+        pairs = set(zip(rows.tolist(), columns.tolist()))
+        self.assertEqual(len(pairs), rows.size)
+        self.assertTrue(all((column, row) in pairs for row, column in pairs))
+        edge_rows, edge_columns = self.adjacency.nonzero()
+        self.assertTrue(pairs.issuperset(zip(edge_rows.tolist(), edge_columns.tolist())))
+
+    def test_against_dense_models(self):
+        """Test that the sparse models approximate the exact dense ones."""
+        for model, dense_embedding in (
+            (
+                NetMFEnsmallen(embedding_size=32, order=10),
+                self.get_dense_netmf_embedding(embedding_size=32, order=10)
+            ),
+            (
+                GraRepEnsmallen(embedding_size=30, order=5),
+                self.get_dense_grarep_embedding(embedding_size=30, order=5)
+            ),
+        ):
+            embedding = model.fit_transform(self.graph).get_node_embedding_from_index(0)
+            self.assertEqual(embedding.shape, dense_embedding.shape)
+            self.assertEqual(list(embedding.index), self.graph.get_node_names())
+            self.assertTrue(np.allclose(
+                embedding.to_numpy(),
+                model.fit_transform(self.graph).get_node_embedding_from_index(0).to_numpy()
+            ))
+            self.assertGreater(
+                get_gram_correlation(embedding.to_numpy(), dense_embedding),
+                0.4
+            )
+
+    def test_against_karateclub(self):
+        """Test that the sparse models approximate the dense Karate Club ones, when available.
+
+        The timings of the two implementations are compared by the script
+        `benchmarks/sparse_matrix_factorization.py`.
+        """
+        try:
+            import karateclub
+        except ModuleNotFoundError:
+            self.skipTest("The Karate Club library is not installed.")
+
+        from embiggen.embedders.karateclub_embedders import (
+            GraRepKarateClub,
+            NetMFKarateClub,
+        )
+        for sparse_model, dense_model in (
+            (
+                NetMFEnsmallen(embedding_size=32, order=2),
+                NetMFKarateClub(embedding_size=32, order=2)
+            ),
+            (
+                GraRepEnsmallen(embedding_size=30, order=5),
+                GraRepKarateClub(embedding_size=30, order=5)
+            ),
+        ):
+            sparse_embedding, dense_embedding = [
+                model.fit_transform(
+                    self.graph
+                ).get_node_embedding_from_index(0).loc[self.graph.get_node_names()].to_numpy()
+                for model in (sparse_model, dense_model)
+            ]
+            self.assertEqual(sparse_embedding.shape, dense_embedding.shape)
+            self.assertGreater(
+                get_gram_correlation(sparse_embedding, dense_embedding),
+                0.4
+            )
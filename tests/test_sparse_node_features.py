@@ -0,0 +1,114 @@
+"""Unit test class for sparse node features support."""
+from unittest import TestCase
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse, random as sparse_random
+from ensmallen import Graph
+from embiggen.embedding_transformers import EdgeTransformer, NodeTransformer
+from embiggen.edge_prediction import (
+    DecisionTreeEdgePrediction,
+    HistGradientBoostingEdgePrediction,
+)
+from embiggen.feature_preprocessors import GraphConvolution
+
+
+class TestSparseNodeFeatures(TestCase):
+    """Unit test class for sparse node features support."""
+
+    def setUp(self):
+        """Setup objects for running tests on sparse node features."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        self.sparse_features = sparse_random(
+            self.graph.get_number_of_nodes(),
+            50,
+            density=0.05,
+            format="csr",
+            random_state=42,
+            dtype=np.float32,
+        )
+        self.dense_features = self.sparse_features.toarray()
+
+    def test_node_transformer(self):
+        """Test that the node transformer keeps the features sparse."""
+        transformer = NodeTransformer(aligned_mapping=True)
+        transformer.fit([self.sparse_features, self.dense_features])
+        nodes = np.array([0, 5, 3, 5])
+        node_features = transformer.transform(nodes)
+        self.assertTrue(issparse(node_features))
+        self.assertTrue(np.allclose(
+            node_features.toarray(),
+            np.hstack([self.dense_features, self.dense_features])[nodes]
+        ))
+
+    def test_edge_transformer(self):
+        """Test that every edge embedding method matches its dense counterpart."""
+        sources = self.graph.get_directed_source_node_ids()
+        destinations = self.graph.get_directed_destination_node_ids()
+        for method in EdgeTransformer.methods:
+            sparse_transformer = EdgeTransformer(methods=method, aligned_mapping=True)
+            sparse_transformer.fit(self.sparse_features)
+            dense_transformer = EdgeTransformer(methods=method, aligned_mapping=True)
+            dense_transformer.fit(self.dense_features)
+            sparse_embedding = sparse_transformer.transform(sources, destinations)
+            dense_embedding = dense_transformer.transform(sources, destinations)
+            if issparse(sparse_embedding):
+                sparse_embedding = sparse_embedding.toarray()
+            self.assertTrue(
+                np.allclose(sparse_embedding, dense_embedding, atol=1e-6),
+                method
+            )
+
+    def test_sklearn_edge_prediction(self):
+        """Test that the CSR features are fed to the sklearn models."""
+        model = DecisionTreeEdgePrediction(edge_embedding_methods="Hadamard")
+        model.fit(self.graph, node_features=self.sparse_features)
+        predictions = model.predict_proba(
+            self.graph, node_features=self.sparse_features
+        )
+        self.assertEqual(predictions.shape[0], self.graph.get_number_of_directed_edges())
+
+    def test_dense_only_sklearn_edge_prediction(self):
+        """Test that the CSR features are densified for the models that cannot use them."""
+        self.assertFalse(HistGradientBoostingEdgePrediction.can_use_sparse_features())
+        model = HistGradientBoostingEdgePrediction(
+            edge_embedding_methods="Hadamard",
+            max_iter=2,
+        )
+        model.fit(self.graph, node_features=self.sparse_features)
+        predictions = model.predict_proba(
+            self.graph, node_features=self.sparse_features
+        )
+        self.assertEqual(predictions.shape[0], self.graph.get_number_of_directed_edges())
+
+    def test_experiment_key(self):
+        """Test that the sparse features are described by their content."""
+        describe = DecisionTreeEdgePrediction._describe_feature_for_experiment_key
+        other_features = self.sparse_features.copy()
+        other_features.data[0] += 1.0
+        self.assertEqual(
+            describe(self.sparse_features),
+            describe(self.sparse_features.tocoo())
+        )
+        self.assertNotEqual(
+            describe(self.sparse_features),
+            describe(other_features)
+        )
+
+    def test_graph_convolution(self):
+        """Test that convolving sparse features matches the dense ones."""
+        preprocessor = GraphConvolution(number_of_convolutions=2, normalize_rows=True)
+        self.assertTrue(np.allclose(
+            preprocessor.transform(
+                support=self.graph, node_features=csr_matrix(self.sparse_features)
+            ).get_all_node_embedding()[0],
+            preprocessor.transform(
+                support=self.graph, node_features=self.dense_features
+            ).get_all_node_embedding()[0],
+        ))
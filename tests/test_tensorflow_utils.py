@@ -1,10 +1,12 @@
+import numpy as np
 import pytest
 try:
     from embiggen.utils.tensorflow_utils import (
         tensorflow_version_is_higher_or_equal_than,
         tensorflow_version_is_less_or_equal_than,
         must_have_tensorflow_version_higher_or_equal_than,
-        has_single_gpu
+        has_single_gpu,
+        batch_getter_into_parallel_dataset
     )
     from embiggen.utils.normalize_model_structural_parameters import normalize_model_list_parameter, normalize_model_ragged_list_parameter
     from unittest import TestCase
@@ -61,5 +63,33 @@ try:
             except (ValueError):
                 pass
             has_single_gpu()
+
+        def test_batch_getter_into_parallel_dataset_skipped_batches(self):
+            tf = pytest.importorskip("tensorflow")
+            requested_indices = []
+
+            def get_batch(idx):
+                requested_indices.append(idx)
+                return (np.array([idx], dtype=np.int64), )
+
+            dataset = batch_getter_into_parallel_dataset(
+                get_batch,
+                output_signature=(tf.TensorSpec(shape=(1, ), dtype=tf.int64), ),
+                number_of_parallel_calls=1,
+                number_of_skipped_batches=6,
+            )
+            self.assertEqual(
+                [int(batch[0][0].numpy()[0]) for batch in dataset.take(2)],
+                [7, 8]
+            )
+            # The skipped batches are never produced.
+            self.assertTrue(all(idx > 6 for idx in requested_indices))
+
+            with pytest.raises(ValueError):
+                batch_getter_into_parallel_dataset(
+                    get_batch,
+                    output_signature=(tf.TensorSpec(shape=(1, ), dtype=tf.int64), ),
+                    number_of_skipped_batches=-1,
+                )
 except (ModuleNotFoundError):
     pass
\ No newline at end of file
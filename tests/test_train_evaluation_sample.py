@@ -0,0 +1,89 @@
+"""Unit test class for the subsampled train evaluation in edge prediction."""
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction
+
+
+class TestTrainEvaluationSample(TestCase):
+    """Unit test class for the subsampled train evaluation in edge prediction."""
+
+    def setUp(self):
+        """Setup a trained model on a holdout of a small graph."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        self.train, self.test = self.graph.connected_holdout(
+            train_size=0.8, random_state=42, verbose=False
+        )
+        self.features = np.random.RandomState(42).uniform(
+            size=(self.graph.get_number_of_nodes(), 10)
+        )
+        self.model = DecisionTreeEdgePrediction(edge_embedding_methods="Hadamard")
+        self.model.fit(self.train, node_features=self.features)
+
+    def evaluate(self, **kwargs):
+        """Return the performance of the model on the holdout."""
+        holdout_kwargs = dict(
+            graph=self.graph,
+            train=self.train,
+            test=self.test,
+            support=self.train,
+            verbose=False,
+            validation_unbalance_rates=(1.0, 2.0),
+            **kwargs
+        )
+        return self.model._evaluate(
+            node_features=self.features,
+            **DecisionTreeEdgePrediction._prepare_evaluation(**holdout_kwargs),
+            **holdout_kwargs
+        )
+
+    def test_train_evaluation_sample(self):
+        """Test that the train metrics are estimated on a stratified sample."""
+        performance = self.evaluate()
+        sampled_performance = self.evaluate(train_evaluation_sample_size=500)
+        self.assertEqual(sampled_performance, self.evaluate(train_evaluation_sample_size=500))
+
+        for full, sampled in zip(performance, sampled_performance):
+            self.assertIsNone(full["train_evaluation_sample_size"])
+            self.assertEqual(sampled["train_evaluation_sample_size"], 500)
+            if sampled["evaluation_mode"] == "test":
+                self.assertEqual(
+                    full["number_of_positive_edges"],
+                    sampled["number_of_positive_edges"]
+                )
+                self.assertAlmostEqual(
+                    full["number_of_negative_edges"],
+                    sampled["number_of_negative_edges"],
+                    delta=2
+                )
+            else:
+                # The scored edges are directed, hence twice the undirected sample.
+                self.assertEqual(sampled["number_of_positive_edges"], 2 * 500)
+                # The negative train graph is sampled with the same proportion.
+                self.assertAlmostEqual(
+                    sampled["number_of_negative_edges"]
+                    / sampled["number_of_positive_edges"],
+                    full["number_of_negative_edges"]
+                    / full["number_of_positive_edges"],
+                    places=2
+                )
+                self.assertAlmostEqual(
+                    full["prevalence"], sampled["prevalence"], places=2
+                )
+            self.assertAlmostEqual(full["auroc"], sampled["auroc"], delta=0.1)
+
+        # Samples larger than the train graph use the whole graph.
+        self.assertEqual(
+            self.evaluate(train_evaluation_sample_size=10**6), performance
+        )
+
+        with self.assertRaises(ValueError):
+            self.evaluate(train_evaluation_sample_size=0)
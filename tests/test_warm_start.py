@@ -0,0 +1,127 @@
+"""Unit test class for the warm start of the embedding models."""
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from ensmallen import Graph
+from embiggen.utils import EmbeddingResult
+from embiggen.utils.warm_start import (
+    align_previous_node_embedding,
+    get_warm_start_epochs,
+    get_warm_start_node_ids,
+)
+from embiggen.embedders.fastnode2vec_embedders.node2vec import Node2VecFastNode2Vec
+from embiggen.embedders.ensmallen_embedders.hope import HOPEEnsmallen
+
+
+class TestWarmStart(TestCase):
+    """Unit test class for the warm start of the embedding models."""
+
+    def setUp(self):
+        """Setup objects for running tests on the warm start."""
+        self.graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        ).remove_disconnected_nodes()
+        self.new_node_names = self.graph.get_node_names()[:10]
+        self.previous_graph = self.graph.filter_from_names(
+            node_names_to_remove=self.new_node_names
+        )
+
+    def test_align_previous_node_embedding(self):
+        """Test that the previous embedding is aligned by node name."""
+        node_names = self.previous_graph.get_node_names()
+        previous_embedding = EmbeddingResult(
+            embedding_method_name="Test",
+            node_embeddings=pd.DataFrame(
+                np.arange(len(node_names) * 3, dtype=np.float32).reshape(-1, 3),
+                index=node_names[::-1],
+            ),
+        )
+        aligned, known_nodes = align_previous_node_embedding(
+            previous_embedding,
+            self.graph,
+            embedding_size=3,
+        )
+        self.assertEqual(aligned.shape, (self.graph.get_number_of_nodes(), 3))
+        self.assertEqual(known_nodes.sum(), len(node_names))
+        for node_name in self.new_node_names:
+            node_id = self.graph.get_node_id_from_node_name(node_name)
+            self.assertFalse(known_nodes[node_id])
+            self.assertTrue((aligned[node_id] == 0).all())
+        node_id = self.graph.get_node_id_from_node_name(node_names[0])
+        self.assertTrue(np.array_equal(
+            aligned[node_id],
+            previous_embedding.get_node_embedding_from_index(0).loc[node_names[0]].values
+        ))
+
+        with self.assertRaises(ValueError):
+            align_previous_node_embedding(previous_embedding, self.graph, embedding_size=4)
+
+    def test_warm_start_node_ids(self):
+        """Test that the warm start focuses on the new nodes and their neighbours."""
+        known_nodes = np.ones(self.graph.get_number_of_nodes(), dtype=bool)
+        self.assertEqual(get_warm_start_node_ids(self.graph, known_nodes).size, 0)
+
+        node_id = self.graph.get_node_id_from_node_name(self.new_node_names[0])
+        known_nodes[node_id] = False
+        self.assertEqual(
+            set(get_warm_start_node_ids(self.graph, known_nodes)),
+            {node_id, *self.graph.get_neighbour_node_ids_from_node_id(node_id)}
+        )
+
+    def test_warm_start_epochs(self):
+        """Test the number of epochs of the warm start."""
+        self.assertEqual(get_warm_start_epochs(100), 10)
+        self.assertEqual(get_warm_start_epochs(5), 1)
+        self.assertEqual(get_warm_start_epochs(100, 3), 3)
+        with self.assertRaises(ValueError):
+            get_warm_start_epochs(100, 0)
+
+    def test_fastnode2vec_warm_start(self):
+        """Test that FastNode2Vec keeps the embedding of the nodes far from the new ones."""
+        model = Node2VecFastNode2Vec(
+            embedding_size=8,
+            epochs=2,
+            walk_length=8,
+            window_size=2,
+            number_of_workers=1,
+        )
+        previous_embedding = model.fit_transform(self.previous_graph)
+        embedding = model.warm_start_fit_transform(
+            self.graph,
+            previous_embedding
+        ).get_node_embedding_from_index(0)
+        previous_node_embedding = previous_embedding.get_node_embedding_from_index(0)
+
+        self.assertEqual(embedding.shape, (self.graph.get_number_of_nodes(), 8))
+        self.assertTrue((embedding.loc[self.new_node_names].abs().sum(axis=1) > 0).all())
+
+        # The walks only start from the new nodes and their neighbours,
+        # so the nodes far from them keep their previous embedding.
+        node_names = previous_node_embedding.index
+        unchanged_nodes = np.isclose(
+            embedding.loc[node_names].values,
+            previous_node_embedding.values,
+        ).all(axis=1)
+        self.assertTrue(unchanged_nodes.any())
+        self.assertFalse(unchanged_nodes.all())
+
+    def test_unsupported_warm_start(self):
+        """Test that the models without warm start raise an error."""
+        self.assertFalse(HOPEEnsmallen.can_warm_start())
+        with self.assertRaises(ValueError):
+            HOPEEnsmallen(embedding_size=5).warm_start_fit_transform(
+                self.graph,
+                EmbeddingResult(
+                    embedding_method_name="Test",
+                    node_embeddings=pd.DataFrame(
+                        np.zeros((self.graph.get_number_of_nodes(), 5)),
+                        index=self.graph.get_node_names(),
+                    ),
+                ),
+            )
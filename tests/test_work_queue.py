@@ -0,0 +1,128 @@
+"""Unit test class for the work queue distributing the evaluation units."""
+import multiprocessing
+import os
+import time
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction
+from embiggen.utils import WorkQueue
+
+
+def process_units(directory: str, unit_keys: list):
+    """Process the units of the queue, recording which worker processed them."""
+    work_queue = WorkQueue(directory, heartbeat_interval=0.1, stale_after=10.0)
+    for unit_key in work_queue.iterate_units(unit_keys):
+        with open(os.path.join(directory, f"processed_{unit_key}_{os.getpid()}"), "w"):
+            pass
+        time.sleep(0.05)
+
+
+class TestWorkQueue(TestCase):
+    """Unit test class for the work queue distributing the evaluation units."""
+
+    def test_claim_and_requeue(self):
+        """Test that the units are claimed once and stale ones are re-queued."""
+        with TemporaryDirectory() as directory:
+            work_queue = WorkQueue(directory, heartbeat_interval=0.05, stale_after=0.2)
+            work_queue.populate(["a", "b"])
+            work_queue.populate(["a", "b", "c"])
+            self.assertEqual(work_queue.get_unit_keys("pending"), ["a", "b", "c"])
+
+            self.assertEqual(work_queue.claim(["b", "c"]), "b")
+            work_queue.complete("b")
+            self.assertEqual(work_queue.get_unit_keys("done"), ["b"])
+            # Units that are done are not added back.
+            work_queue.populate(["b"])
+            self.assertEqual(work_queue.get_unit_keys("pending"), ["a", "c"])
+
+            # A unit whose worker stopped sending heartbeats is re-queued.
+            self.assertEqual(work_queue.claim(), "a")
+            self.assertEqual(work_queue.requeue_stale_units(), [])
+            time.sleep(0.3)
+            self.assertEqual(work_queue.requeue_stale_units(), ["a"])
+
+            # A unit whose processing raises is left claimed.
+            with self.assertRaises(KeyError):
+                for unit_key in work_queue.iterate_units(["a"]):
+                    raise KeyError(unit_key)
+            self.assertEqual(work_queue.get_unit_keys("claimed"), ["a"])
+            # While the heartbeats keep alive the units being processed.
+            processed = list(work_queue.iterate_units(["c"]))
+            self.assertEqual(processed, ["c"])
+            self.assertEqual(work_queue.get_unit_keys("done"), ["b", "c"])
+            # Until it becomes stale and it is claimed again.
+            self.assertEqual(list(work_queue.iterate_units(["a"])), ["a"])
+
+            with self.assertRaises(ValueError):
+                WorkQueue(directory, heartbeat_interval=1.0, stale_after=1.0)
+
+    def test_multiple_processes(self):
+        """Test that the units are split among multiple local processes."""
+        unit_keys = [f"unit_{i}" for i in range(20)]
+        with TemporaryDirectory() as directory:
+            WorkQueue(directory).populate(unit_keys)
+            context = multiprocessing.get_context("spawn")
+            processes = [
+                context.Process(target=process_units, args=(directory, unit_keys))
+                for _ in range(3)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+                self.assertEqual(process.exitcode, 0)
+            processed = [
+                path for path in os.listdir(directory)
+                if path.startswith("processed_")
+            ]
+            self.assertEqual(
+                sorted("_".join(path.split("_")[1:3]) for path in processed),
+                sorted(unit_keys)
+            )
+            self.assertEqual(WorkQueue(directory).get_unit_keys("done"), sorted(unit_keys))
+
+    def test_evaluation(self):
+        """Test that an evaluation runs all of its units from the queue."""
+        graph = Graph.from_csv(
+            edge_path="tests/data/small_ppi.tsv",
+            sources_column_number=0,
+            destinations_column_number=1,
+            weights_column_number=2,
+            directed=False,
+            name="PPI",
+        )
+        with TemporaryDirectory() as directory:
+            kwargs = dict(
+                models=[
+                    DecisionTreeEdgePrediction(edge_embedding_methods="Hadamard"),
+                    DecisionTreeEdgePrediction(edge_embedding_methods="Average"),
+                ],
+                graph=graph,
+                evaluation_schema="Connected Monte Carlo",
+                holdouts_kwargs=dict(train_size=0.8),
+                node_features=np.random.RandomState(42).uniform(
+                    size=(graph.get_number_of_nodes(), 10)
+                ),
+                number_of_holdouts=2,
+                verbose=False,
+                enable_top_layer_cache=False,
+                work_queue=directory,
+            )
+            performance = DecisionTreeEdgePrediction.evaluate(**kwargs)
+            self.assertEqual(len(WorkQueue(directory).get_unit_keys("done")), 4)
+            self.assertEqual(
+                set(zip(
+                    performance.holdout_number,
+                    performance[("model_parameters", "edge_embedding_methods")],
+                )),
+                {
+                    (holdout_number, method)
+                    for holdout_number in range(2)
+                    for method in ("Hadamard", "Average")
+                }
+            )
+            # All of the units were already completed.
+            self.assertTrue(DecisionTreeEdgePrediction.evaluate(**kwargs).empty)